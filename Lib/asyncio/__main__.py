@@ -157,6 +157,10 @@ def interrupt(self) -> None:
         "pstree", help="Display a tree of all pending tasks in a process"
     )
     pstree.add_argument("pid", type=int, help="Process ID to inspect")
+    stats = subparsers.add_parser(
+        "stats", help="Display the statistics of the tasks in a process"
+    )
+    stats.add_argument("pid", type=int, help="Process ID to inspect")
     args = parser.parse_args()
     match args.command:
         case "ps":
@@ -165,6 +169,9 @@ def interrupt(self) -> None:
         case "pstree":
             asyncio.tools.display_awaited_by_tasks_tree(args.pid)
             sys.exit(0)
+        case "stats":
+            asyncio.tools.display_task_stats_table(args.pid)
+            sys.exit(0)
         case None:
             pass  # continue to the interactive shell
         case _:
@@ -18,6 +18,7 @@
 import concurrent.futures
 import errno
 import heapq
+import io
 import itertools
 import os
 import socket
@@ -67,6 +68,32 @@
 # Maximum timeout passed to select to avoid OS limitations
 MAXIMUM_SELECT_TIMEOUT = 24 * 3600
 
+# Statistics recorded for each task when loop.set_task_stats() is enabled.
+_TaskStats = collections.namedtuple(
+    'TaskStats', ['steps', 'run_time', 'cpu_time', 'wait_time',
+                  'max_wait_time'])
+
+# Event loops recording task statistics, see _get_task_stats_rows().
+_task_stats_loops = weakref.WeakSet()
+
+
+def _get_task_stats_rows():
+    """Return the task statistics of all event loops recording them.
+
+    Each row is a tuple (thread id, task id, task name, coroutine name,
+    steps, run time, CPU time, total wait time, maximum wait time), where
+    the task id is the id() of the task.  This is used by asyncio.tools to
+    query the statistics of another process.
+    """
+    rows = []
+    for loop in list(_task_stats_loops):
+        for task, stats in loop.get_task_stats().items():
+            coro = task.get_coro()
+            coro_name = getattr(coro, '__qualname__', None) or repr(coro)
+            rows.append((loop._thread_id, id(task), task.get_name(),
+                         coro_name, *stats))
+    return rows
+
 
 def _format_handle(handle):
     cb = handle._callback
@@ -204,6 +231,73 @@ def _check_ssl_socket(sock):
         raise TypeError("Socket cannot be of type SSLSocket")
 
 
+if hasattr(os, 'pread'):
+    _pread = os.pread
+    _pwrite = os.pwrite
+else:  # pragma: no cover
+    # Without positional I/O (Windows), seek and restore the file position.
+    def _pread(fd, size, offset):
+        pos = os.lseek(fd, 0, os.SEEK_CUR)
+        try:
+            os.lseek(fd, offset, os.SEEK_SET)
+            return os.read(fd, size)
+        finally:
+            os.lseek(fd, pos, os.SEEK_SET)
+
+    def _pwrite(fd, data, offset):
+        pos = os.lseek(fd, 0, os.SEEK_CUR)
+        try:
+            os.lseek(fd, offset, os.SEEK_SET)
+            return os.write(fd, data)
+        finally:
+            os.lseek(fd, pos, os.SEEK_SET)
+
+
+def _file_fileno(file):
+    if isinstance(file, int):
+        return file
+    try:
+        return file.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        raise TypeError(
+            f'expected a file descriptor or a file object, got {file!r}'
+        ) from None
+
+
+def _pread_all(fd, nbytes, offset):
+    """Read nbytes bytes from fd at offset, or up to the end of the file if
+    nbytes is None.  The result is short only at the end of the file."""
+    if nbytes is None:
+        # Read the current size of the file, and one more byte to see its end.
+        size = max(os.fstat(fd).st_size - offset, 0) + 1
+    else:
+        size = nbytes
+    chunks = []
+    while size > 0:
+        data = _pread(fd, size, offset)
+        if not data:
+            break
+        chunks.append(data)
+        offset += len(data)
+        if nbytes is None:
+            # The file has grown, read it in chunks.
+            size = 64 * 1024
+        else:
+            size -= len(data)
+    if len(chunks) == 1:
+        return chunks[0]
+    return b''.join(chunks)
+
+
+def _pwrite_all(fd, data, offset):
+    """Write all of data to fd at offset, and return its size."""
+    with memoryview(data) as view, view.cast('B') as view:
+        total = 0
+        while total < len(view):
+            total += _pwrite(fd, view[total:], offset + total)
+    return total
+
+
 class _SendfileFallbackProtocol(protocols.Protocol):
     def __init__(self, transp):
         if not isinstance(transp, transports._FlowControlMixin):
@@ -436,6 +530,9 @@ def __init__(self):
         # exceed this duration in seconds, the slow callback/task is logged.
         self.slow_callback_duration = 0.1
         self._current_handle = None
+        # Statistics of the tasks, if enabled by set_task_stats(): a weak
+        # dictionary mapping tasks to lists of _TaskStats fields.
+        self._task_stats = None
         self._task_factory = None
         self._coroutine_origin_tracking_enabled = False
         self._coroutine_origin_tracking_saved_depth = None
@@ -847,6 +944,8 @@ def _call_soon(self, callback, args, context):
         handle = events.Handle(callback, args, self, context)
         if handle._source_traceback:
             del handle._source_traceback[-1]
+        if self._task_stats is not None:
+            handle._ready_time = self.time()
         self._ready.append(handle)
         return handle
 
@@ -873,6 +972,8 @@ def call_soon_threadsafe(self, callback, *args, context=None):
         if self._debug:
             self._check_callback(callback, 'call_soon_threadsafe')
         handle = events._ThreadSafeHandle(callback, args, self, context)
+        if self._task_stats is not None:
+            handle._ready_time = self.time()
         self._ready.append(handle)
         if handle._source_traceback:
             del handle._source_traceback[-1]
@@ -940,6 +1041,44 @@ async def getnameinfo(self, sockaddr, flags=0):
         return await self.run_in_executor(
             None, socket.getnameinfo, sockaddr, flags)
 
+    async def read_file(self, file, nbytes=-1, offset=0):
+        """Read from a file at the given offset.
+
+        Return a bytes object of nbytes bytes, or less if the end of the
+        file is reached.  If nbytes is negative, read up to the end of
+        the file.  The file position is not used nor changed.
+
+        The read runs in the default executor, unless the event loop can
+        read the data without blocking.
+        """
+        fd = _file_fileno(file)
+        if offset < 0:
+            raise ValueError(f"offset must be a non-negative integer, "
+                             f"got {offset!r}")
+        if nbytes < 0:
+            nbytes = None
+        data = self._read_file_nowait(fd, nbytes, offset)
+        if data is None:
+            data = await self.run_in_executor(None, _pread_all,
+                                              fd, nbytes, offset)
+        return data
+
+    def _read_file_nowait(self, fd, nbytes, offset):
+        # Return the data if it can be read without blocking, else None.
+        return None
+
+    async def write_file(self, file, data, offset=0):
+        """Write all of data to a file at the given offset.
+
+        Return the number of bytes written.  The file position is not used
+        nor changed.  The write runs in the default executor.
+        """
+        fd = _file_fileno(file)
+        if offset < 0:
+            raise ValueError(f"offset must be a non-negative integer, "
+                             f"got {offset!r}")
+        return await self.run_in_executor(None, _pwrite_all, fd, data, offset)
+
     async def sock_sendfile(self, sock, file, offset=0, count=None,
                             *, fallback=True):
         if self._debug and sock.gettimeout() != 0:
@@ -2019,10 +2158,23 @@ def _run_once(self):
         # they will be run the next time (after another I/O poll).
         # Use an idiom that is thread-safe without using locks.
         ntodo = len(self._ready)
+        task_stats = self._task_stats
+        task = None
         for i in range(ntodo):
             handle = self._ready.popleft()
             if handle._cancelled:
                 continue
+            if task_stats is not None:
+                # Record the statistics of the steps of tasks.  This is done
+                # here rather than in a helper method, whose frame could be
+                # kept alive (with the handle and the task) by the traceback
+                # of an exception raised by the step.
+                task = getattr(handle._callback, '__self__', None)
+                if isinstance(task, tasks.Task):
+                    start = self.time()
+                    cpu_start = time.thread_time()
+                else:
+                    task = None
             if self._debug:
                 try:
                     self._current_handle = handle
@@ -2036,8 +2188,31 @@ def _run_once(self):
                     self._current_handle = None
             else:
                 handle._run()
+            if task is not None:
+                self._add_task_step_stats(task, handle, start, cpu_start)
+                task = None
         handle = None  # Needed to break cycles when an exception occurs.
 
+    def _add_task_step_stats(self, task, handle, start, cpu_start):
+        cpu_time = time.thread_time() - cpu_start
+        end = self.time()
+        task_stats = self._task_stats
+        if task_stats is None:
+            # The step disabled the statistics.
+            return
+        stats = task_stats.get(task)
+        if stats is None:
+            stats = task_stats[task] = [0, 0.0, 0.0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += end - start
+        stats[2] += cpu_time
+        ready_time = getattr(handle, '_ready_time', None)
+        if ready_time is not None:
+            wait_time = start - ready_time
+            stats[3] += wait_time
+            if wait_time > stats[4]:
+                stats[4] = wait_time
+
     def _set_coroutine_origin_tracking(self, enabled):
         if bool(enabled) == bool(self._coroutine_origin_tracking_enabled):
             return
@@ -2053,6 +2228,40 @@ def _set_coroutine_origin_tracking(self, enabled):
 
         self._coroutine_origin_tracking_enabled = enabled
 
+    def get_task_stats(self):
+        """Return the statistics recorded for each task.
+
+        Return a dictionary mapping tasks to named tuples (steps, run_time,
+        cpu_time, wait_time, max_wait_time).  It is empty if the statistics
+        are not enabled, see set_task_stats().
+        """
+        task_stats = self._task_stats
+        if task_stats is None:
+            return {}
+        # Copy the underlying dictionary at once: this may be called from
+        # another thread, see _get_task_stats_rows().
+        result = {}
+        for ref, stats in list(task_stats.data.items()):
+            task = ref()
+            if task is not None:
+                result[task] = _TaskStats(*stats)
+        return result
+
+    def set_task_stats(self, enabled):
+        """Enable or disable recording statistics for each task.
+
+        When enabled, the event loop records the number of steps of each
+        task, the time and the CPU time spent running them, and the time
+        they spent waiting in the ready queue.  Enabling the statistics
+        resets them.
+        """
+        if enabled:
+            self._task_stats = weakref.WeakKeyDictionary()
+            _task_stats_loops.add(self)
+        else:
+            self._task_stats = None
+            _task_stats_loops.discard(self)
+
     def get_debug(self):
         return self._debug
 
@@ -39,7 +39,7 @@ class Handle:
 
     __slots__ = ('_callback', '_args', '_cancelled', '_loop',
                  '_source_traceback', '_repr', '__weakref__',
-                 '_context')
+                 '_context', '_ready_time')
 
     def __init__(self, callback, args, loop, context=None):
         if context is None:
@@ -626,6 +626,14 @@ async def sock_sendfile(self, sock, file, offset=0, count=None,
                             *, fallback=None):
         raise NotImplementedError
 
+    # File I/O methods.
+
+    async def read_file(self, file, nbytes=-1, offset=0):
+        raise NotImplementedError
+
+    async def write_file(self, file, data, offset=0):
+        raise NotImplementedError
+
     # Signal handling.
 
     def add_signal_handler(self, sig, callback, *args):
@@ -664,6 +672,14 @@ def get_debug(self):
     def set_debug(self, enabled):
         raise NotImplementedError
 
+    # Task statistics.
+
+    def get_task_stats(self):
+        raise NotImplementedError
+
+    def set_task_stats(self, enabled):
+        raise NotImplementedError
+
 
 class _AbstractEventLoopPolicy:
     """Abstract policy for accessing the event loop."""
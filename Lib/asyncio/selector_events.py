@@ -39,6 +39,12 @@
         # Fallback to send
         _HAS_SENDMSG = False
 
+_HAS_MMSG = hasattr(socket.socket, 'recvmmsg')
+
+# Maximum number of datagrams received or sent with a single
+# recvmmsg() or sendmmsg() call.
+_MMSG_MAX_COUNT = 32
+
 def _test_selector_event(selector, fd, event):
     # Test if the selector is monitoring 'event' events
     # for the file descriptor 'fd'.
@@ -1212,12 +1218,23 @@ def close(self):
 class _SelectorDatagramTransport(_SelectorTransport, transports.DatagramTransport):
 
     _buffer_factory = collections.deque
+    # Buffer size per datagram passed to recvmmsg(), which allocates one
+    # such buffer for each datagram of a batch.  No UDP datagram is larger.
+    max_datagram_size = 64 * 1024
 
     def __init__(self, loop, sock, protocol, address=None,
                  waiter=None, extra=None):
         super().__init__(loop, sock, protocol, extra)
         self._address = address
         self._buffer_size = 0
+        # Number of datagrams to receive with the next read.  It grows
+        # while the socket has datagrams waiting and shrinks back to 1
+        # (a plain recvfrom()) when it does not.  Datagrams of other
+        # families may be larger than max_datagram_size, so they are
+        # always received one at a time.
+        self._recv_count = 1
+        self._recv_mmsg = (_HAS_MMSG and
+                           sock.family in (socket.AF_INET, socket.AF_INET6))
         self._loop.call_soon(self._protocol.connection_made, self)
         # only start reading when connection_made() has been called
         self._loop.call_soon(self._add_reader,
@@ -1233,6 +1250,9 @@ def get_write_buffer_size(self):
     def _read_ready(self):
         if self._conn_lost:
             return
+        if self._recv_count > 1:
+            self._read_ready__mmsg()
+            return
         try:
             data, addr = self._sock.recvfrom(self.max_size)
         except (BlockingIOError, InterruptedError):
@@ -1244,6 +1264,37 @@ def _read_ready(self):
         except BaseException as exc:
             self._fatal_error(exc, 'Fatal read error on datagram transport')
         else:
+            if self._recv_mmsg:
+                # More datagrams may be queued: try to receive a batch
+                # of them with a single call next time.
+                self._recv_count = 2
+            self._protocol.datagram_received(data, addr)
+
+    def _read_ready__mmsg(self):
+        count = self._recv_count
+        try:
+            datagrams = self._sock.recvmmsg(self.max_datagram_size, count,
+                                            socket.MSG_WAITFORONE)
+        except (BlockingIOError, InterruptedError):
+            self._recv_count = 1
+            return
+        except OSError as exc:
+            self._recv_count = 1
+            self._protocol.error_received(exc)
+            return
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as exc:
+            self._fatal_error(exc, 'Fatal read error on datagram transport')
+            return
+        if len(datagrams) == count:
+            self._recv_count = min(count * 2, _MMSG_MAX_COUNT)
+        else:
+            self._recv_count = max(count // 2, 1)
+        for data, addr in datagrams:
+            if self._conn_lost:
+                # The protocol closed the transport.
+                break
             self._protocol.datagram_received(data, addr)
 
     def sendto(self, data, addr=None):
@@ -1290,6 +1341,31 @@ def sendto(self, data, addr=None):
 
     def _sendto_ready(self):
         while self._buffer:
+            if _HAS_MMSG and len(self._buffer) > 1:
+                # Send a batch of datagrams with a single call.
+                batch = list(itertools.islice(self._buffer, _MMSG_MAX_COUNT))
+                if self._extra['peername']:
+                    batch = [data for data, addr in batch]
+                try:
+                    sent = self._sock.sendmmsg(batch)
+                except (BlockingIOError, InterruptedError):
+                    break  # Try again later.
+                except OSError as exc:
+                    # Drop the datagram which failed, like sendto() below.
+                    data, addr = self._buffer.popleft()
+                    self._buffer_size -= len(data)
+                    self._protocol.error_received(exc)
+                    return
+                except (SystemExit, KeyboardInterrupt):
+                    raise
+                except BaseException as exc:
+                    self._fatal_error(
+                        exc, 'Fatal write error on datagram transport')
+                    return
+                for _ in range(sent):
+                    data, addr = self._buffer.popleft()
+                    self._buffer_size -= len(data)
+                continue
             data, addr = self._buffer.popleft()
             self._buffer_size -= len(data)
             try:
@@ -21,6 +21,7 @@
 
 
 _DEFAULT_LIMIT = 2 ** 16  # 64 KiB
+_RECV_BUFFER_SIZE = 2 ** 16  # 64 KiB
 
 
 async def open_connection(host=None, port=None, *,
@@ -44,7 +45,7 @@ async def open_connection(host=None, port=None, *,
     """
     loop = events.get_running_loop()
     reader = StreamReader(limit=limit, loop=loop)
-    protocol = StreamReaderProtocol(reader, loop=loop)
+    protocol = _BufferedStreamReaderProtocol(reader, loop=loop)
     transport, _ = await loop.create_connection(
         lambda: protocol, host, port, **kwds)
     writer = StreamWriter(transport, protocol, reader, loop)
@@ -77,8 +78,8 @@ async def start_server(client_connected_cb, host=None, port=None, *,
 
     def factory():
         reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                        loop=loop)
+        protocol = _BufferedStreamReaderProtocol(reader, client_connected_cb,
+                                                 loop=loop)
         return protocol
 
     return await loop.create_server(factory, host, port, **kwds)
@@ -93,7 +94,7 @@ async def open_unix_connection(path=None, *,
         loop = events.get_running_loop()
 
         reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, loop=loop)
+        protocol = _BufferedStreamReaderProtocol(reader, loop=loop)
         transport, _ = await loop.create_unix_connection(
             lambda: protocol, path, **kwds)
         writer = StreamWriter(transport, protocol, reader, loop)
@@ -106,8 +107,8 @@ async def start_unix_server(client_connected_cb, path=None, *,
 
         def factory():
             reader = StreamReader(limit=limit, loop=loop)
-            protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                            loop=loop)
+            protocol = _BufferedStreamReaderProtocol(
+                reader, client_connected_cb, loop=loop)
             return protocol
 
         return await loop.create_unix_server(factory, path, **kwds)
@@ -306,6 +307,28 @@ def __del__(self):
                 closed.exception()
 
 
+class _BufferedStreamReaderProtocol(StreamReaderProtocol,
+                                    protocols.BufferedProtocol):
+    """StreamReaderProtocol receiving data directly into the reader.
+
+    The transport receives data into a buffer owned by the StreamReader,
+    or into the buffer passed to a pending StreamReader.readinto() call,
+    instead of creating a new bytes object for every chunk.
+    """
+
+    def get_buffer(self, sizehint):
+        reader = self._stream_reader
+        if reader is None:
+            # The data is discarded.
+            return bytearray(_RECV_BUFFER_SIZE)
+        return reader._get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes):
+        reader = self._stream_reader
+        if reader is not None:
+            reader._buffer_updated(nbytes)
+
+
 class StreamWriter:
     """Wraps a Transport.
 
@@ -428,6 +451,14 @@ def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
         self._buffer = bytearray()
         self._eof = False    # Whether we're done.
         self._waiter = None  # A future used by _wait_for_data()
+        # The buffer of a readinto() call waiting for data, and the number
+        # of bytes received into it by _buffer_updated().
+        self._into = None
+        self._into_nbytes = 0
+        # The buffer returned by the last _get_buffer() call.  It is only
+        # kept between calls while data keeps coming in.
+        self._recv_buffer = None
+        self._recv_view = None
         self._exception = None
         self._transport = None
         self._paused = False
@@ -498,7 +529,49 @@ def feed_data(self, data):
 
         self._buffer.extend(data)
         self._wakeup_waiter()
+        self._maybe_pause_transport()
+
+    def _get_buffer(self, sizehint):
+        into = self._into
+        if (into is not None and not self._buffer and
+                self._into_nbytes < len(into)):
+            # A readinto() call waits for data: receive it directly into
+            # the buffer of the caller.
+            self._recv_view = into[self._into_nbytes:]
+        else:
+            size = _RECV_BUFFER_SIZE
+            if sizehint > 0:
+                size = min(sizehint, size)
+            if self._recv_buffer is None or len(self._recv_buffer) < size:
+                self._recv_buffer = bytearray(size)
+            self._recv_view = memoryview(self._recv_buffer)
+        return self._recv_view
+
+    def _buffer_updated(self, nbytes):
+        assert not self._eof, 'buffer_updated after feed_eof'
+
+        view = self._recv_view
+        self._recv_view = None
+        if view.obj is not self._recv_buffer:
+            self._into_nbytes += nbytes
+        elif not self._buffer and nbytes >= len(self._recv_buffer) // 2:
+            # Adopt the receive buffer rather than copying a large chunk
+            # into an empty buffer.
+            view.release()
+            self._buffer = self._recv_buffer
+            self._recv_buffer = None
+            del self._buffer[nbytes:]
+        else:
+            self._buffer += view[:nbytes]
+            if nbytes < len(self._recv_buffer):
+                # No more data is available for now, and the connection
+                # may stay idle for long: don't hold on to the receive
+                # buffer meanwhile.
+                self._recv_buffer = None
+        self._wakeup_waiter()
+        self._maybe_pause_transport()
 
+    def _maybe_pause_transport(self):
         if (self._transport is not None and
                 not self._paused and
                 len(self._buffer) > 2 * self._limit):
@@ -512,10 +585,13 @@ def feed_data(self, data):
             else:
                 self._paused = True
 
-    async def _wait_for_data(self, func_name):
+    async def _wait_for_data(self, func_name, into=None):
         """Wait until feed_data() or feed_eof() is called.
 
         If stream was paused, automatically resume it.
+
+        If *into* is given, the protocol may receive data directly into this
+        memoryview; self._into_nbytes is then the number of bytes received.
         """
         # StreamReader uses a future to link the protocol feed_data() method
         # to a read coroutine. Running two read coroutines at the same time
@@ -535,10 +611,20 @@ async def _wait_for_data(self, func_name):
             self._transport.resume_reading()
 
         self._waiter = self._loop.create_future()
+        self._into = into
+        self._into_nbytes = 0
         try:
             await self._waiter
+        except BaseException:
+            if self._into_nbytes:
+                # Keep the data already received for the next read.
+                self._buffer[:0] = into[:self._into_nbytes]
+                self._into_nbytes = 0
+            raise
         finally:
             self._waiter = None
+            self._into = None
+            self._recv_view = None
 
     async def readline(self):
         """Read chunk of data from the stream until newline (b'\n') is found.
@@ -777,6 +863,86 @@ async def readexactly(self, n):
         self._maybe_resume_transport()
         return data
 
+    async def readinto(self, buffer):
+        """Read up to len(buffer) bytes from the stream into buffer.
+
+        Return the number of bytes read, as soon as at least 1 byte is
+        available.  If EOF was received and the internal buffer is empty,
+        return 0.
+
+        When the internal buffer is empty, the data is received directly
+        into buffer, without intermediate copies.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        with memoryview(buffer) as m, m.cast('B') as view:
+            if view.readonly:
+                raise TypeError('readinto() argument must be read-write '
+                                f'bytes-like object, not '
+                                f'{type(buffer).__name__}')
+            return await self._readinto(view, 'readinto')
+
+    async def readexactly_into(self, buffer):
+        """Read exactly len(buffer) bytes from the stream into buffer.
+
+        Raise an IncompleteReadError if EOF is reached before buffer is
+        filled.  The IncompleteReadError.partial attribute of the exception
+        will contain the partial read bytes, which are also stored at the
+        beginning of buffer.
+
+        If the call is cancelled, the bytes already read are kept in the
+        internal buffer, as with readexactly().
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        with memoryview(buffer) as m, m.cast('B') as view:
+            if view.readonly:
+                raise TypeError('readexactly_into() argument must be '
+                                f'read-write bytes-like object, not '
+                                f'{type(buffer).__name__}')
+            n = len(view)
+            offset = 0
+            try:
+                while offset < n:
+                    nbytes = await self._readinto(view[offset:],
+                                                  'readexactly_into')
+                    if not nbytes:
+                        raise exceptions.IncompleteReadError(
+                            bytes(view[:offset]), n)
+                    offset += nbytes
+            except exceptions.IncompleteReadError:
+                raise
+            except BaseException:
+                if offset:
+                    self._buffer[:0] = view[:offset]
+                raise
+        return n
+
+    async def _readinto(self, view, func_name):
+        if not view:
+            return 0
+
+        if not self._buffer and not self._eof:
+            await self._wait_for_data(func_name, view)
+            nbytes = self._into_nbytes
+            if nbytes:
+                self._into_nbytes = 0
+                return nbytes
+
+        nbytes = min(len(view), len(self._buffer))
+        view[:nbytes] = memoryview(self._buffer)[:nbytes]
+        del self._buffer[:nbytes]
+        self._maybe_resume_transport()
+        return nbytes
+
     def __aiter__(self):
         return self
 
@@ -4,7 +4,11 @@
 from collections import defaultdict
 from itertools import count
 from enum import Enum
+import json
+import os
 import sys
+import tempfile
+import time
 from _remote_debugging import get_all_awaited_by
 
 
@@ -176,6 +180,90 @@ def build_task_table(result):
 
     return table
 
+def build_task_stats_table(result):
+    table = []
+    rows = sorted(result, key=lambda row: row[6], reverse=True)
+    for (tid, task_id, task_name, coro_name, steps, run_time, cpu_time,
+         wait_time, max_wait_time) in rows:
+        table.append(
+            [
+                tid,
+                hex(task_id),
+                task_name,
+                coro_name,
+                steps,
+                f"{cpu_time * 1e3:.3f}",
+                f"{run_time * 1e3:.3f}",
+                f"{wait_time / steps * 1e3:.3f}" if steps else "0.000",
+                f"{max_wait_time * 1e3:.3f}",
+            ]
+        )
+    return table
+
+
+# Script run in the inspected process by sys.remote_exec().
+_TASK_STATS_SCRIPT = """\
+import json, os
+from asyncio import base_events
+with open({tmp_path!r}, 'w') as f:
+    json.dump(base_events._get_task_stats_rows(), f)
+os.replace({tmp_path!r}, {path!r})
+"""
+
+
+def _process_owner(pid: int) -> tuple[int, int] | None:
+    # Return the (uid, gid) of process `pid`, or None where it is unknown.
+    try:
+        st = os.stat(f"/proc/{pid}")
+    except OSError:
+        return None
+    return st.st_uid, st.st_gid
+
+
+def get_task_stats(pid: int, *, timeout: float = 2.0) -> list:
+    """Return the task statistics recorded by the event loops of `pid`.
+
+    The statistics are only recorded by event loops on which
+    loop.set_task_stats(True) was called.  Return a list of tuples
+    (thread id, task id, task name, coroutine name, steps, run time,
+    CPU time, total wait time, maximum wait time).
+
+    The statistics are collected by a script run with sys.remote_exec(),
+    which writes them to a temporary directory of the caller.  The target
+    only runs the script when it next executes Python code: raise
+    TimeoutError if it did not within `timeout` seconds, for example
+    because its event loop is idle.  Raise PermissionError if the process
+    runs as another user and the directory cannot be handed over to it.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "stats.json")
+        script = os.path.join(tmpdir, "script.py")
+        with open(script, "w") as f:
+            f.write(_TASK_STATS_SCRIPT.format(tmp_path=path + ".tmp",
+                                              path=path))
+        # The directory is only accessible by its owner.
+        owner = _process_owner(pid)
+        if owner is not None and owner[0] != os.geteuid():
+            try:
+                os.chown(tmpdir, *owner)
+                os.chown(script, *owner)
+            except OSError as e:
+                raise PermissionError(
+                    f"process {pid} runs as another user and cannot write "
+                    f"its task statistics to {tmpdir}") from e
+        sys.remote_exec(pid, script)
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(path):
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"process {pid} did not report its task statistics "
+                    f"within {timeout} seconds; it only does so when it "
+                    f"runs Python code, so its event loops may be idle")
+            time.sleep(0.01)
+        with open(path) as f:
+            return [tuple(row) for row in json.load(f)]
+
+
 def _print_cycle_exception(exception: CycleFoundException):
     print("ERROR: await-graph contains cycles - cannot print a tree!", file=sys.stderr)
     print("", file=sys.stderr)
@@ -208,6 +296,23 @@ def display_awaited_by_tasks_table(pid: int) -> None:
         print(f"{row[0]:<10} {row[1]:<20} {row[2]:<20} {row[3]:<50} {row[4]:<20} {row[5]:<15}")
 
 
+def display_task_stats_table(pid: int) -> None:
+    """Build and print a table of the task statistics of `pid`."""
+
+    try:
+        stats = get_task_stats(pid)
+    except (OSError, RuntimeError) as e:
+        print(f"Error retrieving task statistics: {e}")
+        sys.exit(1)
+    table = build_task_stats_table(stats)
+    print(
+        f"{'tid':<16} {'task id':<20} {'task name':<20} {'coroutine':<30} {'steps':>8} {'cpu ms':>10} {'run ms':>10} {'avg wait ms':>12} {'max wait ms':>12}"
+    )
+    print("-" * 144)
+    for row in table:
+        print(f"{row[0]:<16} {row[1]:<20} {row[2]:<20} {row[3]:<30} {row[4]:>8} {row[5]:>10} {row[6]:>10} {row[7]:>12} {row[8]:>12}")
+
+
 def display_awaited_by_tasks_tree(pid: int) -> None:
     """Build and print a tree of all pending tasks under `pid`."""
 
@@ -52,6 +52,11 @@ def waitstatus_to_exitcode(status):
         return status
 
 
+# Reads up to this size are first tried from the page cache on the event
+# loop thread, see _UnixSelectorEventLoop._read_file_nowait().
+_NOWAIT_READ_MAX_SIZE = 256 * 1024
+
+
 class _UnixSelectorEventLoop(selector_events.BaseSelectorEventLoop):
     """Unix event loop.
 
@@ -460,6 +465,45 @@ def cb(fut):
                     self.remove_writer(fd)
         fut.add_done_callback(cb)
 
+    def _read_file_nowait(self, fd, nbytes, offset):
+        # Try to read all the data with RWF_NOWAIT, which fails instead of
+        # blocking when the data is not in the page cache.  Return None
+        # if the data could not all be read this way.
+        try:
+            flags = os.RWF_NOWAIT
+        except AttributeError:
+            return None
+        if nbytes is None:
+            try:
+                st = os.fstat(fd)
+            except OSError:
+                return None
+            if not stat.S_ISREG(st.st_mode):
+                return None
+            # Read one more byte than the file size to see its end.
+            size = max(st.st_size - offset, 0) + 1
+        else:
+            size = nbytes
+        if size > _NOWAIT_READ_MAX_SIZE:
+            return None
+        buf = bytearray(size)
+        try:
+            n = os.preadv(fd, [buf], offset, flags)
+            if n == size:
+                if nbytes is None:
+                    # The file has grown.
+                    return None
+            # A short read happens at the end of the file, or when only
+            # part of the data is cached: tell them apart.
+            elif os.preadv(fd, [bytearray(1)], offset + n, flags):
+                return None
+        except OSError:
+            # Not cached, or not supported by the file system.  A real
+            # error is raised again by the executor.
+            return None
+        del buf[n:]
+        return bytes(buf)
+
     def _stop_serving(self, sock):
         # Is this a unix socket that needs cleanup?
         if sock in self._unix_server_sockets:
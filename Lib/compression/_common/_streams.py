@@ -1,10 +1,21 @@
 """Internal classes used by compression modules"""
 
+import bisect
 import io
+import operator
 import sys
 
 BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE  # Compressed data read chunk size
 
+# Minimum distance in decompressed data between two seek checkpoints
+CHECKPOINT_INTERVAL = 1024 * 1024
+# Minimum distance before a checkpoint that holds a copy of the decompressor
+# state, which takes some memory (about 40 KiB for zlib)
+STATE_CHECKPOINT_INTERVAL = 8 * 1024 * 1024
+# Maximum number of checkpoints that hold a copy of the decompressor state;
+# when it is reached, every other one is dropped and the interval doubled
+MAX_STATE_CHECKPOINTS = 64
+
 
 class BaseStream(io.BufferedIOBase):
     """Mode-checking helper functions."""
@@ -29,6 +40,27 @@ def _check_can_seek(self):
             raise io.UnsupportedOperation("The underlying file object "
                                           "does not support seeking")
 
+    def get_seek_index(self):
+        """Return the seek checkpoints found so far as a list of
+        (decompressed offset, compressed offset) pairs.
+
+        Checkpoints are recorded at the start of the compressed streams
+        (members or frames) of the file while it is read.  Checkpoints
+        inside a stream, which hold a copy of the decompressor state, are
+        kept in memory only and are not included.
+        """
+        self._check_not_closed()
+        self._check_can_read()
+        return self._buffer.raw.get_seek_index()
+
+    def set_seek_index(self, index):
+        """Replace the seek checkpoints with index, as previously returned
+        by get_seek_index() for the same file.
+        """
+        self._check_not_closed()
+        self._check_can_read()
+        self._buffer.raw.set_seek_index(index)
+
 
 class DecompressReader(io.RawIOBase):
     """Adapts the decompressor API to a RawIOBase reader API"""
@@ -40,6 +72,17 @@ def __init__(self, fp, decomp_factory, trailing_error=(), **decomp_args):
         self._fp = fp
         self._eof = False
         self._pos = 0  # Current offset in decompressed stream
+        self._fp_pos = 0  # Current offset in compressed stream
+
+        # Sorted list of (decompressed offset, compressed offset) pairs of
+        # stream starts, from which decompression can resume after a seek.
+        # Subclasses may also add (decompressed offset, compressed offset,
+        # state) triples for positions inside a stream.
+        self._checkpoints = []
+        # Distance between the state checkpoints, or None until random
+        # access is requested, to not keep them for a sequential read.
+        self._state_interval = None
+        self._state_count = 0
 
         # Set to size of decompressed stream once it is known, for SEEK_END
         self._size = -1
@@ -80,8 +123,11 @@ def read(self, size=-1):
         # return any data. In this case, try again after reading another block.
         while True:
             if self._decompressor.eof:
-                rawblock = (self._decompressor.unused_data or
-                            self._fp.read(BUFFER_SIZE))
+                rawblock = self._decompressor.unused_data
+                stream_start = self._fp_pos - len(rawblock)
+                if not rawblock:
+                    rawblock = self._fp.read(BUFFER_SIZE)
+                    self._fp_pos += len(rawblock)
                 if not rawblock:
                     break
                 # Continue to next stream.
@@ -92,9 +138,12 @@ def read(self, size=-1):
                 except self._trailing_error:
                     # Trailing data isn't a valid compressed stream; ignore it.
                     break
+                if self._checkpoint_due():
+                    self._add_checkpoint(stream_start)
             else:
                 if self._decompressor.needs_input:
                     rawblock = self._fp.read(BUFFER_SIZE)
+                    self._fp_pos += len(rawblock)
                     if not rawblock:
                         raise EOFError("Compressed file ended before the "
                                        "end-of-stream marker was reached")
@@ -125,8 +174,85 @@ def _rewind(self):
         self._fp.seek(0)
         self._eof = False
         self._pos = 0
+        self._fp_pos = 0
         self._decompressor = self._decomp_factory(**self._decomp_args)
 
+    def _checkpoint_due(self, interval=None):
+        # Return whether the current position is at least interval (by
+        # default CHECKPOINT_INTERVAL) past the last checkpoint.
+        if interval is None:
+            interval = CHECKPOINT_INTERVAL
+        checkpoints = self._checkpoints
+        last = checkpoints[-1][0] if checkpoints else 0
+        return self._pos - last >= interval
+
+    def _state_checkpoint_due(self):
+        # Return whether a checkpoint that holds the decompressor state
+        # should be taken at the current position.
+        return (self._state_interval is not None and
+                self._checkpoint_due(self._state_interval))
+
+    def _enable_state_checkpoints(self):
+        if self._state_interval is None:
+            self._state_interval = STATE_CHECKPOINT_INTERVAL
+
+    def _add_checkpoint(self, fp_pos, state=None):
+        # Record that decompression can resume at fp_pos in the compressed
+        # file for the current position in the decompressed file, either
+        # at the start of a new stream, or with the decompressor state
+        # saved in state, which _restore_checkpoint() must then handle.
+        if state is None:
+            self._checkpoints.append((self._pos, fp_pos))
+        else:
+            self._checkpoints.append((self._pos, fp_pos, state))
+            self._state_count += 1
+            if self._state_count >= MAX_STATE_CHECKPOINTS:
+                self._drop_state_checkpoints()
+
+    def _drop_state_checkpoints(self):
+        # Drop every other state checkpoint, keeping the most recent one,
+        # and take the next ones twice as far apart.
+        checkpoints = []
+        keep = self._state_count % 2 == 0
+        for checkpoint in self._checkpoints:
+            if len(checkpoint) > 2:
+                if keep:
+                    checkpoints.append(checkpoint)
+                keep = not keep
+            else:
+                checkpoints.append(checkpoint)
+        self._checkpoints = checkpoints
+        self._state_count -= self._state_count // 2
+        self._state_interval *= 2
+
+    def _restore_checkpoint(self, pos, fp_pos, state=None):
+        # Resume decompression at the start of a stream.
+        self._rewind()
+        if pos:
+            self._fp.seek(fp_pos)
+            self._pos = pos
+            self._fp_pos = fp_pos
+
+    def get_seek_index(self):
+        self._enable_state_checkpoints()
+        return [(pos, fp_pos) for pos, fp_pos, *state in self._checkpoints
+                if not state]
+
+    def set_seek_index(self, index):
+        checkpoints = []
+        last = 0
+        for pos, fp_pos in index:
+            pos = operator.index(pos)
+            fp_pos = operator.index(fp_pos)
+            if pos <= last or fp_pos < 0:
+                raise ValueError("seek index must contain positive "
+                                 "offsets sorted in increasing order")
+            checkpoints.append((pos, fp_pos))
+            last = pos
+        self._checkpoints = checkpoints
+        self._state_count = 0
+        self._enable_state_checkpoints()
+
     def seek(self, offset, whence=io.SEEK_SET):
         # Recalculate offset as an absolute file position.
         if whence == io.SEEK_SET:
@@ -142,11 +268,17 @@ def seek(self, offset, whence=io.SEEK_SET):
         else:
             raise ValueError("Invalid value for whence: {}".format(whence))
 
-        # Make it so that offset is the number of bytes to skip forward.
+        # Resume from the closest checkpoint before offset if we would
+        # otherwise decompress more data from the current position.
+        i = bisect.bisect_right(self._checkpoints, (offset, sys.maxsize))
+        checkpoint = self._checkpoints[i - 1] if i else (0, 0)
         if offset < self._pos:
-            self._rewind()
-        else:
-            offset -= self._pos
+            self._enable_state_checkpoints()
+        if offset < self._pos or checkpoint[0] > self._pos:
+            self._restore_checkpoint(*checkpoint)
+
+        # Make it so that offset is the number of bytes to skip forward.
+        offset -= self._pos
 
         # Read and discard data until we reach the desired position.
         while offset > 0:
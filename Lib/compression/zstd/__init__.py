@@ -4,8 +4,10 @@
     # compression.zstd
     'COMPRESSION_LEVEL_DEFAULT',
     'compress',
+    'compress_batch',
     'CompressionParameter',
     'decompress',
+    'decompress_batch',
     'DecompressionParameter',
     'finalize_dict',
     'get_frame_info',
@@ -133,7 +135,18 @@ def finalize_dict(zstd_dict, /, samples, dict_size, level):
     return ZstdDict(dict_content)
 
 
-def compress(data, level=None, options=None, zstd_dict=None):
+def _prepared_dict(zstd_dict, options):
+    # ZstdDict caches its digested form for each compression level, while an
+    # undigested dictionary is digested again by every new compressor.  The
+    # digested form overrides some compression parameters, so only use it
+    # when no advanced options are given.
+    if options is None and isinstance(zstd_dict, ZstdDict):
+        return zstd_dict.as_digested_dict
+    return zstd_dict
+
+
+def compress(data, level=None, options=None, zstd_dict=None, *,
+             threads=None):
     """Return Zstandard compressed *data* as bytes.
 
     *level* is an int specifying the compression level to use, defaulting to
@@ -142,10 +155,16 @@ def compress(data, level=None, options=None, zstd_dict=None):
     parameters. See CompressionParameter for more on options.
     *zstd_dict* is a ZstdDict object, a pre-trained Zstandard dictionary. See
     the function train_dict for how to train a ZstdDict on sample data.
+    Unless *options* is given, its digested form, which the ZstdDict caches
+    for each compression level, is used.
+    *threads* is the number of threads to compress with, or 0 to use one
+    thread per usable CPU.
 
     For incremental compression, use a ZstdCompressor instead.
     """
-    comp = ZstdCompressor(level=level, options=options, zstd_dict=zstd_dict)
+    comp = ZstdCompressor(level=level, options=options,
+                          zstd_dict=_prepared_dict(zstd_dict, options),
+                          threads=threads)
     return comp.compress(data, mode=ZstdCompressor.FLUSH_FRAME)
 
 
@@ -172,6 +191,36 @@ def decompress(data, zstd_dict=None, options=None):
     return b''.join(results)
 
 
+def compress_batch(buffers, level=None, options=None, zstd_dict=None):
+    """Compress each of *buffers* into its own Zstandard frame.
+
+    Return a tuple (compressed, offsets), where compressed holds all frames
+    back to back and frame i is compressed[offsets[i]:offsets[i+1]].  All
+    buffers are compressed in a single call sharing one compression context,
+    which makes this much faster than calling compress() for each of many
+    small buffers.
+
+    *level*, *options* and *zstd_dict* have the same meaning as for
+    compress().
+    """
+    comp = ZstdCompressor(level=level, options=options,
+                          zstd_dict=_prepared_dict(zstd_dict, options))
+    return comp.compress_batch(buffers)
+
+
+def decompress_batch(data, offsets, zstd_dict=None, options=None):
+    """Decompress the items of *data* delimited by *offsets*.
+
+    Item i is data[offsets[i]:offsets[i+1]], as returned by compress_batch().
+    Return a tuple (decompressed, offsets) in the same layout.  Each item must
+    record its decompressed size in its frame header.
+
+    *zstd_dict* and *options* have the same meaning as for decompress().
+    """
+    decomp = ZstdDecompressor(zstd_dict=zstd_dict, options=options)
+    return decomp.decompress_batch(data, offsets)
+
+
 class CompressionParameter(enum.IntEnum):
     """Compression parameters."""
 
@@ -32,7 +32,7 @@ class ZstdFile(_streams.BaseStream):
     FLUSH_FRAME = ZstdCompressor.FLUSH_FRAME
 
     def __init__(self, file, /, mode='r', *,
-                 level=None, options=None, zstd_dict=None):
+                 level=None, options=None, zstd_dict=None, threads=None):
         """Open a Zstandard compressed file in binary mode.
 
         *file* can be either an file-like object, or a file name to open.
@@ -50,6 +50,10 @@ def __init__(self, file, /, mode='r', *,
 
         *zstd_dict* is an optional ZstdDict object, a pre-trained Zstandard
         dictionary. See train_dict() to train ZstdDict on sample data.
+
+        *threads* is an optional int specifying the number of threads used
+        for compression, or 0 to use one thread per usable CPU.  It takes
+        precedence over CompressionParameter.nb_workers in *options*.
         """
         self._fp = None
         self._close_fp = False
@@ -64,13 +68,16 @@ def __init__(self, file, /, mode='r', *,
         if mode == 'r':
             if level is not None:
                 raise TypeError('level is illegal in read mode')
+            if threads is not None:
+                raise TypeError('threads is illegal in read mode')
             self._mode = _MODE_READ
         elif mode in {'w', 'a', 'x'}:
             if level is not None and not isinstance(level, int):
                 raise TypeError('level must be int or None')
             self._mode = _MODE_WRITE
             self._compressor = ZstdCompressor(level=level, options=options,
-                                              zstd_dict=zstd_dict)
+                                              zstd_dict=zstd_dict,
+                                              threads=threads)
             self._pos = 0
         else:
             raise ValueError(f'Invalid mode: {mode!r}')
@@ -294,7 +301,7 @@ def writable(self):
 
 
 def open(file, /, mode='rb', *, level=None, options=None, zstd_dict=None,
-         encoding=None, errors=None, newline=None):
+         threads=None, encoding=None, errors=None, newline=None):
     """Open a Zstandard compressed file in binary or text mode.
 
     file can be either a file name (given as a str, bytes, or PathLike object),
@@ -304,8 +311,8 @@ def open(file, /, mode='rb', *, level=None, options=None, zstd_dict=None,
     The mode parameter can be 'r', 'rb' (default), 'w', 'wb', 'x', 'xb', 'a',
     'ab' for binary mode, or 'rt', 'wt', 'xt', 'at' for text mode.
 
-    The level, options, and zstd_dict parameters specify the settings the same
-    as ZstdFile.
+    The level, options, zstd_dict and threads parameters specify the settings
+    the same as ZstdFile.
 
     When using read mode (decompression), the options parameter is a dict
     representing advanced decompression options. The level parameter is not
@@ -338,7 +345,7 @@ def open(file, /, mode='rb', *, level=None, options=None, zstd_dict=None,
             raise ValueError('Argument "newline" not supported in binary mode')
 
     binary_file = ZstdFile(file, mode, level=level, options=options,
-                           zstd_dict=zstd_dict)
+                           zstd_dict=zstd_dict, threads=threads)
 
     if text_mode:
         return io.TextIOWrapper(binary_file, encoding, errors, newline)
@@ -5,6 +5,7 @@
 
 import collections
 import logging
+import queue
 import threading
 import time
 import types
@@ -601,7 +602,8 @@ def submit(self, fn, /, *args, **kwargs):
         """
         raise NotImplementedError()
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None,
+            unordered=False):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -618,10 +620,13 @@ def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
                 iterables pauses until a result is yielded from the buffer.
                 If None, all input elements are eagerly collected, and a task is
                 submitted for each.
+            unordered: If true, results are yielded as soon as they are
+                available instead of in the order of the iterables.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
-            be evaluated out-of-order.
+            be evaluated out-of-order, and the results are yielded
+            out-of-order if unordered is true.
 
         Raises:
             TimeoutError: If the entire result iterator could not be generated
@@ -669,7 +674,45 @@ def result_iterator():
             finally:
                 for future in fs:
                     future.cancel()
-        return result_iterator()
+
+        if not unordered:
+            return result_iterator()
+
+        # The futures are put in done_queue as they complete.
+        done_queue = queue.SimpleQueue()
+        pending = set(fs)
+        for f in fs:
+            f.add_done_callback(done_queue.put)
+
+        def next_done():
+            try:
+                if timeout is None:
+                    future = done_queue.get()
+                else:
+                    future = done_queue.get(
+                        timeout=max(0, end_time - time.monotonic()))
+            except queue.Empty:
+                raise TimeoutError from None
+            pending.remove(future)
+            if (
+                buffersize
+                and (executor := executor_weakref())
+                and (args := next(zipped_iterables, None))
+            ):
+                new_future = executor.submit(fn, *args)
+                pending.add(new_future)
+                new_future.add_done_callback(done_queue.put)
+            return future
+
+        def unordered_result_iterator():
+            try:
+                while pending:
+                    # Careful not to keep a reference to the done future
+                    yield _result_or_cancel(next_done())
+            finally:
+                for future in pending:
+                    future.cancel()
+        return unordered_result_iterator()
 
     def shutdown(self, wait=True, *, cancel_futures=False):
         """Clean-up the resources associated with the Executor.
@@ -1,8 +1,11 @@
 """Implements InterpreterPoolExecutor."""
 
+import array
 import contextlib
+import os
 import pickle
 import textwrap
+import threading
 from . import thread as _thread
 import _interpreters
 import _interpqueues
@@ -39,10 +42,126 @@ def __str__(self):
 UNBOUND = 2  # error; this should not happen.
 
 
+# Buffer arguments at least this large are sent to the worker interpreter
+# through a queue rather than being pickled.  Memoryviews are always sent
+# that way, since they can't be pickled.
+_SHARED_BUFFER_MIN_SIZE = 1024
+
+
+class _BufferArg:
+    """Stands in for a buffer argument sent alongside a pickled task."""
+
+    def __init__(self, index, kind):
+        self.index = index
+        # 'bytes', 'bytearray', 'memoryview' or an array typecode.
+        self.kind = kind
+
+    def __reduce__(self):
+        return (type(self), (self.index, self.kind))
+
+    def resolve(self, buffers):
+        buf = buffers[self.index]
+        if self.kind == 'bytearray':
+            return bytearray(buf)
+        elif len(self.kind) == 1:
+            arr = array.array(self.kind)
+            arr.frombytes(buf)
+            return arr
+        # Shared bytes are copied and memoryviews are shared as-is.
+        return buf
+
+
+def _extract_buffers(args, kwargs):
+    buffers = []
+    def extract(obj):
+        cls = type(obj)
+        if cls is memoryview:
+            kind = 'memoryview'
+        elif cls is bytes or cls is bytearray or cls is array.array:
+            if len(obj) * getattr(obj, 'itemsize', 1) < _SHARED_BUFFER_MIN_SIZE:
+                return obj
+            kind = obj.typecode if cls is array.array else cls.__name__
+            if cls is not bytes:
+                # Take a snapshot now: the caller may change or resize
+                # the object before the worker gets to it.
+                obj = bytes(obj)
+        else:
+            return obj
+        buffers.append(obj)
+        return _BufferArg(len(buffers) - 1, kind)
+    args = tuple(extract(arg) for arg in args)
+    kwargs = {name: extract(arg) for name, arg in kwargs.items()}
+    return args, kwargs, tuple(buffers)
+
+
+def _resolve_buffers(args, kwargs, buffers):
+    def resolve(obj):
+        return obj.resolve(buffers) if type(obj) is _BufferArg else obj
+    args = tuple(resolve(arg) for arg in args)
+    kwargs = {name: resolve(arg) for name, arg in kwargs.items()}
+    return args, kwargs
+
+
+# Idle worker interpreters, kept for reuse by executors created with
+# reuse_interpreters=True.  They are keyed by the worker configuration
+# (preloaded modules, initializer and shared objects), and each entry
+# is an (interpid, resultsid, argsid) tuple.
+_idle_interpreters = {}
+_idle_interpreters_lock = threading.Lock()
+_idle_interpreters_closed = False
+_MAX_IDLE_INTERPRETERS = 32
+
+
+def _destroy_interpreter(interpid, *queueids):
+    for qid in queueids:
+        if qid is not None:
+            try:
+                _interpqueues.destroy(qid)
+            except _interpqueues.QueueNotFoundError:
+                pass
+    if interpid is not None:
+        try:
+            _interpreters.decref(interpid)
+        except _interpreters.InterpreterNotFoundError:
+            pass
+
+
+def _clear_idle_interpreters(close=False):
+    global _idle_interpreters_closed
+    with _idle_interpreters_lock:
+        if close:
+            _idle_interpreters_closed = True
+        idle = [entry for entries in _idle_interpreters.values()
+                for entry in entries]
+        _idle_interpreters.clear()
+    for entry in idle:
+        _destroy_interpreter(*entry)
+
+# Pooled interpreters are idle, so they can be destroyed as soon as
+# the interpreter starts shutting down.  Interpreters released by the
+# workers after this point are destroyed rather than pooled.
+threading._register_atexit(_clear_idle_interpreters, True)
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_idle_interpreters.clear)
+
+
 class WorkerContext(_thread.WorkerContext):
 
     @classmethod
-    def prepare(cls, initializer, initargs, shared):
+    def prepare(cls, initializer, initargs, shared, preload=(),
+                reuse_interpreters=False):
+        if isinstance(preload, str):
+            raise TypeError('preload must be an iterable of module names, '
+                            'not a string')
+        preload = tuple(preload)
+        for name in preload:
+            if not isinstance(name, str):
+                raise TypeError(f'module names must be strings, '
+                                f'got {name!r}')
+            if not all(part.isidentifier() for part in name.split('.')):
+                raise ValueError(f'invalid module name {name!r}')
+
         def resolve_task(fn, args, kwargs):
             if isinstance(fn, str):
                 # XXX Circle back to this later.
@@ -61,8 +180,13 @@ def resolve_task(fn, args, kwargs):
                 # Functions defined in the __main__ module can't be pickled,
                 # so they can't be used here.  In the future, we could possibly
                 # borrow from multiprocessing to work around this.
+                # Large buffers are sent separately, so that they don't
+                # have to be pickled (or embedded in the script).
+                args, kwargs, buffers = _extract_buffers(args, kwargs)
                 data = pickle.dumps((fn, args, kwargs))
                 kind = 'function'
+                if buffers:
+                    return (data, kind, buffers)
             return (data, kind)
 
         if initializer is not None:
@@ -74,8 +198,19 @@ def resolve_task(fn, args, kwargs):
                 raise  # re-raise
         else:
             initdata = None
+
+        poolkey = None
+        if reuse_interpreters:
+            poolkey = (preload, initdata,
+                       tuple(sorted(shared.items())) if shared else None)
+            try:
+                hash(poolkey)
+            except (TypeError, ValueError):
+                # Interpreters can only be matched up by configuration
+                # if all of it is hashable.
+                poolkey = None
         def create_context():
-            return cls(initdata, shared)
+            return cls(initdata, shared, preload, poolkey)
         return create_context, resolve_task
 
     @classmethod
@@ -106,16 +241,25 @@ def _call(cls, func, args, kwargs, resultsid):
             _interpqueues.put(resultsid, (res, None), 1, UNBOUND)
 
     @classmethod
-    def _call_pickled(cls, pickled, resultsid):
+    def _call_pickled(cls, pickled, resultsid, argsid=None):
         with cls._capture_exc(resultsid):
+            if argsid is not None:
+                buffers, _, _ = _interpqueues.get(argsid)
             fn, args, kwargs = pickle.loads(pickled)
+            if argsid is not None:
+                args, kwargs = _resolve_buffers(args, kwargs, buffers)
+                del buffers
         cls._call(fn, args, kwargs, resultsid)
 
-    def __init__(self, initdata, shared=None):
+    def __init__(self, initdata, shared=None, preload=(), poolkey=None):
         self.initdata = initdata
         self.shared = dict(shared) if shared else None
+        self.preload = tuple(preload)
+        self.poolkey = poolkey
         self.interpid = None
         self.resultsid = None
+        self.argsid = None
+        self._initialized = False
 
     def __del__(self):
         if self.interpid is not None:
@@ -129,6 +273,14 @@ def _exec(self, script):
 
     def initialize(self):
         assert self.interpid is None, self.interpid
+        if self.poolkey is not None:
+            with _idle_interpreters_lock:
+                idle = _idle_interpreters.get(self.poolkey)
+                if idle:
+                    (self.interpid, self.resultsid, self.argsid
+                     ) = idle.pop()
+                    self._initialized = True
+                    return
         self.interpid = _interpreters.create(reqrefs=True)
         try:
             _interpreters.incref(self.interpid)
@@ -136,9 +288,14 @@ def initialize(self):
             maxsize = 0
             fmt = 0
             self.resultsid = _interpqueues.create(maxsize, fmt, UNBOUND)
+            self.argsid = _interpqueues.create(maxsize, fmt, UNBOUND)
 
             self._exec(f'from {__name__} import WorkerContext')
 
+            if self.preload:
+                self._exec(''.join(f'import {name}\n'
+                                   for name in self.preload))
+
             if self.shared:
                 _interpreters.set___main___attrs(
                                     self.interpid, self.shared, restrict=True)
@@ -148,25 +305,30 @@ def initialize(self):
         except BaseException:
             self.finalize()
             raise  # re-raise
+        self._initialized = True
 
     def finalize(self):
         interpid = self.interpid
         resultsid = self.resultsid
+        argsid = self.argsid
         self.resultsid = None
+        self.argsid = None
         self.interpid = None
-        if resultsid is not None:
-            try:
-                _interpqueues.destroy(resultsid)
-            except _interpqueues.QueueNotFoundError:
-                pass
+        if interpid is not None and self._initialized and self.poolkey:
+            # Keep the fully initialized interpreter for later reuse.
+            with _idle_interpreters_lock:
+                if (not _idle_interpreters_closed and
+                        sum(map(len, _idle_interpreters.values()))
+                            < _MAX_IDLE_INTERPRETERS):
+                    idle = _idle_interpreters.setdefault(self.poolkey, [])
+                    idle.append((interpid, resultsid, argsid))
+                    interpid = None
+        self._initialized = False
         if interpid is not None:
-            try:
-                _interpreters.decref(interpid)
-            except _interpreters.InterpreterNotFoundError:
-                pass
+            _destroy_interpreter(interpid, resultsid, argsid)
 
     def run(self, task):
-        data, kind = task
+        data, kind, *buffers = task
         if kind == 'script':
             raise NotImplementedError('script kind disabled')
             script = f"""
@@ -174,7 +336,13 @@ def run(self, task):
 {textwrap.indent(data, '    ')}
 WorkerContext._send_script_result({self.resultsid})"""
         elif kind == 'function':
-            script = f'WorkerContext._call_pickled({data!r}, {self.resultsid})'
+            if buffers:
+                _interpqueues.put(self.argsid, buffers[0], 0, UNBOUND)
+                script = (f'WorkerContext._call_pickled({data!r}, '
+                          f'{self.resultsid}, {self.argsid})')
+            else:
+                script = (f'WorkerContext._call_pickled({data!r}, '
+                          f'{self.resultsid})')
         else:
             raise NotImplementedError(kind)
 
@@ -221,11 +389,14 @@ class InterpreterPoolExecutor(_thread.ThreadPoolExecutor):
     BROKEN = BrokenInterpreterPool
 
     @classmethod
-    def prepare_context(cls, initializer, initargs, shared):
-        return WorkerContext.prepare(initializer, initargs, shared)
+    def prepare_context(cls, initializer, initargs, shared, preload=(),
+                        reuse_interpreters=False):
+        return WorkerContext.prepare(initializer, initargs, shared, preload,
+                                     reuse_interpreters)
 
     def __init__(self, max_workers=None, thread_name_prefix='',
-                 initializer=None, initargs=(), shared=None):
+                 initializer=None, initargs=(), shared=None, preload=(),
+                 reuse_interpreters=False):
         """Initializes a new InterpreterPoolExecutor instance.
 
         Args:
@@ -237,6 +408,14 @@ def __init__(self, max_workers=None, thread_name_prefix='',
             initargs: A tuple of arguments to pass to the initializer.
             shared: A mapping of shareabled objects to be inserted into
                 each worker interpreter.
+            preload: An iterable of names of modules to import in each
+                worker interpreter before it runs the initializer.
+            reuse_interpreters: If true, worker interpreters are kept when
+                the executor shuts down and reused by later executors
+                created with the same preload, initializer, initargs and
+                shared arguments.
         """
         super().__init__(max_workers, thread_name_prefix,
-                         initializer, initargs, shared=shared)
+                         initializer, initargs, shared=shared,
+                         preload=preload,
+                         reuse_interpreters=reuse_interpreters)
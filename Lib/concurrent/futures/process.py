@@ -53,11 +53,18 @@
 # so that it can be accessed later as `mp.connection`
 import multiprocessing.connection
 from multiprocessing.queues import Queue
+from multiprocessing.reduction import ForkingPickler
 import threading
 import weakref
 from functools import partial
+import array
+import io
 import itertools
+import math
+import operator
+import pickle
 import sys
+import time
 from traceback import format_exception
 
 
@@ -124,6 +131,10 @@ def _python_exit():
 # - the thread wakeup reader
 _MAX_WINDOWS_WORKERS = 63 - 2
 
+# With chunksize='auto', map() aims for chunks taking about this many seconds
+# to process, which keeps the per-chunk IPC overhead small.
+_AUTO_CHUNK_TIME = 0.02
+
 # Hack to embed stringification of remote traceback in local traceback
 
 class _RemoteTraceback(Exception):
@@ -161,6 +172,132 @@ def __init__(self, work_id, exception=None, result=None, exit_pid=None):
         self.result = result
         self.exit_pid = exit_pid
 
+class _SharedMemoryPickler(ForkingPickler):
+    """Pickler which stores large buffers in shared memory segments.
+
+    The data of bytes, bytearray and array.array objects, and the
+    out-of-band buffers of objects supporting pickle protocol 5, which are
+    at least *threshold* bytes are copied into new SharedMemory segments
+    instead of being serialized in the pickle.  The names and sizes of the
+    segments are collected in the *segments* attribute.
+    """
+    def __init__(self, file, threshold):
+        super().__init__(file, 5, True, self._buffer_callback)
+        self.threshold = threshold
+        self.segments = []
+
+    def persistent_id(self, obj):
+        # bytes and bytearray are pickled in-band before reducer_override()
+        # or __reduce_ex__() is looked up, so use persistent ids for them.
+        cls = type(obj)
+        if cls is bytes or cls is bytearray:
+            if len(obj) >= self.threshold:
+                return (cls.__name__, self._add_segment(obj, False))
+        elif cls is array.array:
+            if len(obj) * obj.itemsize >= self.threshold:
+                return ('array', obj.typecode, self._add_segment(obj, False))
+        return None
+
+    def _buffer_callback(self, buf):
+        try:
+            raw = buf.raw()
+        except BufferError:
+            # Non-contiguous buffer
+            return True
+        if raw.nbytes < self.threshold:
+            return True
+        self._add_segment(raw, True)
+        return False
+
+    def _add_segment(self, data, out_of_band):
+        from multiprocessing.shared_memory import SharedMemory
+        with memoryview(data) as view, view.cast('B') as view:
+            size = view.nbytes
+            shm = SharedMemory(create=True, size=size)
+            self.segments.append((shm.name, size, out_of_band))
+            try:
+                shm.buf[:size] = view
+            finally:
+                # The segment is unlinked by the process reading the result.
+                # The resource tracker unlinks it if that never happens.
+                shm.close()
+        return len(self.segments) - 1
+
+class _SharedMemoryUnpickler(pickle.Unpickler):
+    def __init__(self, file, segments, views):
+        self.views = views
+        buffers = [view for view, (_, _, out_of_band) in
+                   zip(self.views, segments) if out_of_band]
+        super().__init__(file, buffers=buffers)
+
+    def persistent_load(self, pid):
+        # These types own their data, so it is copied out of the segment
+        # once more: only the copy through the result pipe is saved.
+        view = self.views[pid[-1]]
+        if pid[0] == 'bytes':
+            return bytes(view)
+        elif pid[0] == 'bytearray':
+            return bytearray(view)
+        elif pid[0] == 'array':
+            a = array.array(pid[1])
+            a.frombytes(view)
+            return a
+        raise pickle.UnpicklingError(f"unsupported persistent id: {pid!r}")
+
+class _SharedMemoryResult(object):
+    """A result pickled with its large buffers in shared memory."""
+    def __init__(self, data, segments):
+        self.data = data
+        self.segments = segments
+
+    @classmethod
+    def dump(cls, obj, threshold):
+        f = io.BytesIO()
+        pickler = _SharedMemoryPickler(f, threshold)
+        try:
+            pickler.dump(obj)
+        except BaseException:
+            cls(None, pickler.segments).discard()
+            raise
+        return cls(f.getvalue(), pickler.segments)
+
+    def _open_segments(self, mapping):
+        # Unlink all the segments, opening them first if *mapping* is true.
+        # Return a memoryview of each opened segment.  The segment is closed
+        # once the last object using its view is gone.
+        from multiprocessing import resource_tracker
+        from multiprocessing.shared_memory import SharedMemory
+        views = []
+        error = None
+        for name, size, _ in self.segments:
+            try:
+                shm = SharedMemory(name, track=False)
+                shm.unlink()
+                if mapping:
+                    view = shm.buf[:size]
+                    weakref.finalize(view, shm.close).atexit = False
+                    views.append(view)
+                else:
+                    shm.close()
+            except OSError as exc:
+                error = error or exc
+            resource_tracker.unregister('/' + name, "shared_memory")
+        if error is not None:
+            raise error
+        return views
+
+    def load(self):
+        unpickler = _SharedMemoryUnpickler(io.BytesIO(self.data),
+                                           self.segments,
+                                           self._open_segments(mapping=True))
+        return unpickler.load()
+
+    def discard(self):
+        try:
+            self._open_segments(mapping=False)
+        except OSError:
+            pass
+
 class _CallItem(object):
     def __init__(self, work_id, fn, args, kwargs):
         self.work_id = work_id
@@ -203,10 +340,72 @@ def _process_chunk(fn, chunk):
     return [fn(*args) for args in chunk]
 
 
+def _process_timed_chunk(fn, chunk):
+    """ Processes a chunk of an iterable passed to map(chunksize='auto').
+
+    Like _process_chunk(), but also returns the time spent running fn.
+
+    This function is run in a separate process.
+
+    """
+    start = time.perf_counter()
+    results = [fn(*args) for args in chunk]
+    return time.perf_counter() - start, results
+
+
+class _AutoChunker(object):
+    """Chops the iterable passed to map(chunksize='auto') into chunks.
+
+    The chunk sizes follow guided self-scheduling: starting with single
+    items, each chunk is sized to take about _AUTO_CHUNK_TIME according to
+    the measured time per item, but never more than the remaining items
+    divided by the number of workers (when the length of the input is
+    known), so that the last chunks are spread over all the workers.
+    """
+    def __init__(self, iterables, num_workers):
+        self.num_workers = num_workers
+        self.iterator = zip(*iterables)
+        lengths = [operator.length_hint(it, -1) for it in iterables]
+        self.remaining = min(lengths) if lengths and min(lengths) >= 0 else None
+        self.item_time = None
+        self.size = 1
+
+    def __iter__(self):
+        while chunk := tuple(itertools.islice(self.iterator,
+                                              self._next_size())):
+            if self.remaining is not None:
+                self.remaining = max(0, self.remaining - len(chunk))
+            yield chunk
+
+    def _next_size(self):
+        if self.item_time is not None:
+            if self.item_time > 0:
+                size = int(_AUTO_CHUNK_TIME / self.item_time)
+            else:
+                size = self.size * 2
+            # Grow gradually in case the measures were not representative.
+            self.size = max(1, min(size, self.size * 2))
+        if self.remaining:
+            return min(self.size,
+                       math.ceil(self.remaining / self.num_workers))
+        return self.size
+
+    def record(self, elapsed, count):
+        # Exponentially weighted moving average of the time per item
+        if count:
+            item_time = elapsed / count
+            if self.item_time is None:
+                self.item_time = item_time
+            else:
+                self.item_time = 0.5 * (self.item_time + item_time)
+
+
 def _sendback_result(result_queue, work_id, result=None, exception=None,
-                     exit_pid=None):
+                     exit_pid=None, shared_memory_threshold=None):
     """Safely send back the given result or exception"""
     try:
+        if shared_memory_threshold is not None and exception is None:
+            result = _SharedMemoryResult.dump(result, shared_memory_threshold)
         result_queue.put(_ResultItem(work_id, result=result,
                                      exception=exception, exit_pid=exit_pid))
     except BaseException as e:
@@ -215,7 +414,8 @@ def _sendback_result(result_queue, work_id, result=None, exception=None,
                                      exit_pid=exit_pid))
 
 
-def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None):
+def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None,
+                    shared_memory_threshold=None):
     """Evaluates calls from call_queue and places the results in result_queue.
 
     This worker is run in a separate process.
@@ -227,6 +427,9 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
             to by the worker.
         initializer: A callable initializer, or None
         initargs: A tuple of args for the initializer
+        max_tasks: The maximum number of tasks to run, or None
+        shared_memory_threshold: The minimum size of the buffers of a result
+            sent through shared memory, or None to pickle results in-band
     """
     if initializer is not None:
         try:
@@ -258,7 +461,8 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
                              exit_pid=exit_pid)
         else:
             _sendback_result(result_queue, call_item.work_id, result=r,
-                             exit_pid=exit_pid)
+                             exit_pid=exit_pid,
+                             shared_memory_threshold=shared_memory_threshold)
             del r
 
         # Liberate the resource as soon as possible, to avoid holding onto
@@ -438,12 +642,23 @@ def process_result_item(self, result_item):
 
         # Received a _ResultItem so mark the future as completed.
         work_item = self.pending_work_items.pop(result_item.work_id, None)
+        result = result_item.result
+        if isinstance(result, _SharedMemoryResult):
+            if work_item is None or work_item.future.cancelled():
+                result.discard()
+                result = None
+            else:
+                try:
+                    result = result.load()
+                except BaseException as exc:
+                    result_item.exception = exc
+                    result = None
         # work_item can be None if another process terminated (see above)
         if work_item is not None:
             if result_item.exception is not None:
                 work_item.future.set_exception(result_item.exception)
             else:
-                work_item.future.set_result(result_item.result)
+                work_item.future.set_result(result)
 
     def is_shutting_down(self):
         # Check whether we should start shutting down the executor.
@@ -620,6 +835,18 @@ def _chain_from_iterable_of_lists(iterable):
             yield element.pop()
 
 
+def _chain_from_iterable_of_timed_lists(iterable, chunker):
+    """
+    Like _chain_from_iterable_of_lists() for the results of
+    _process_timed_chunk(), whose timings are recorded in *chunker*.
+    """
+    for elapsed, element in iterable:
+        chunker.record(elapsed, len(element))
+        element.reverse()
+        while element:
+            yield element.pop()
+
+
 class BrokenProcessPool(_base.BrokenExecutor):
     """
     Raised when a process in a ProcessPoolExecutor terminated abruptly
@@ -637,7 +864,8 @@ class BrokenProcessPool(_base.BrokenExecutor):
 
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=(), *, max_tasks_per_child=None):
+                 initializer=None, initargs=(), *, max_tasks_per_child=None,
+                 shared_memory_threshold=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -655,6 +883,10 @@ def __init__(self, max_workers=None, mp_context=None,
                 live as long as the executor. Requires a non-'fork' mp_context
                 start method. When given, we default to using 'spawn' if no
                 mp_context is supplied.
+            shared_memory_threshold: If not None, results are pickled with
+                protocol 5 and their buffers of at least this many bytes are
+                sent through shared memory segments instead of the result
+                pipe. Not supported on Windows.
         """
         _check_system_limits()
 
@@ -701,6 +933,20 @@ def __init__(self, max_workers=None, mp_context=None,
                                  " supply a different mp_context.")
         self._max_tasks_per_child = max_tasks_per_child
 
+        if shared_memory_threshold is not None:
+            if not isinstance(shared_memory_threshold, int):
+                raise TypeError("shared_memory_threshold must be an integer")
+            elif shared_memory_threshold <= 0:
+                raise ValueError("shared_memory_threshold must be >= 1")
+            if sys.platform == 'win32':
+                raise NotImplementedError(
+                    "shared_memory_threshold is not supported on Windows")
+            # Share the resource tracker with the workers, which register
+            # the segments they create.
+            from multiprocessing import resource_tracker
+            resource_tracker.ensure_running()
+        self._shared_memory_threshold = shared_memory_threshold
+
         # Management thread
         self._executor_manager_thread = None
 
@@ -784,7 +1030,8 @@ def _spawn_process(self):
                   self._result_queue,
                   self._initializer,
                   self._initargs,
-                  self._max_tasks_per_child))
+                  self._max_tasks_per_child,
+                  self._shared_memory_threshold))
         p.start()
         self._processes[p.pid] = p
 
@@ -813,7 +1060,8 @@ def submit(self, fn, /, *args, **kwargs):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None,
+            unordered=False):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -824,28 +1072,46 @@ def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+                If set to 'auto', the size of the chunks is adapted to the
+                measured time per item.
             buffersize: The number of submitted tasks whose results have not
                 yet been yielded. If the buffer is full, iteration over the
                 iterables pauses until a result is yielded from the buffer.
                 If None, all input elements are eagerly collected, and a task is
-                submitted for each.
+                submitted for each. If chunksize is 'auto', None means twice
+                the number of workers.
+            unordered: If true, the results of each chunk are yielded as soon
+                as it completes instead of in the order of the iterables.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
-            be evaluated out-of-order.
+            be evaluated out-of-order, and the results are yielded
+            out-of-order if unordered is true.
 
         Raises:
             TimeoutError: If the entire result iterator could not be generated
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if chunksize == 'auto':
+            chunker = _AutoChunker(iterables, self._max_workers)
+            if buffersize is None:
+                buffersize = 2 * self._max_workers
+            results = super().map(partial(_process_timed_chunk, fn),
+                                  chunker,
+                                  timeout=timeout,
+                                  buffersize=buffersize,
+                                  unordered=unordered)
+            return _chain_from_iterable_of_timed_lists(results, chunker)
+
         if chunksize < 1:
             raise ValueError("chunksize must be >= 1.")
 
         results = super().map(partial(_process_chunk, fn),
                               itertools.batched(zip(*iterables), chunksize),
                               timeout=timeout,
-                              buffersize=buffersize)
+                              buffersize=buffersize,
+                              unordered=unordered)
         return _chain_from_iterable_of_lists(results)
 
     def shutdown(self, wait=True, *, cancel_futures=False):
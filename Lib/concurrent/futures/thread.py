@@ -6,6 +6,7 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 from concurrent.futures import _base
+import collections
 import itertools
 import queue
 import threading
@@ -19,6 +20,11 @@
 # Lock that ensures that new workers are not created while the interpreter is
 # shutting down. Must be held while mutating _threads_queues and _shutdown.
 _global_shutdown_lock = threading.Lock()
+# Put in the work queue of a work-stealing executor to wake up an idle worker
+# after a work item was pushed to one of the worker inboxes or deques.
+_WAKEUP = object()
+# Per-thread state of the worker threads of work-stealing executors.
+_worker_local = threading.local()
 
 def _python_exit():
     global _shutdown
@@ -141,6 +147,98 @@ def _worker(executor_reference, ctx, work_queue):
         ctx.finalize()
 
 
+def _steal(deques, start):
+    # Take the oldest work item from the inbox, or else from the deque, of
+    # the first worker that has one, starting at index *start*.  Return None
+    # if all inboxes and deques are empty.
+    n = len(deques)
+    for i in range(start, start + n):
+        inbox, local = deques[i % n]
+        try:
+            return inbox.popleft()
+        except IndexError:
+            pass
+        try:
+            return local.popleft()
+        except IndexError:
+            pass
+    return None
+
+
+def _work_stealing_worker(executor_reference, ctx, work_queue, deques, index):
+    try:
+        ctx.initialize()
+    except BaseException:
+        _base.LOGGER.critical('Exception in initializer:', exc_info=True)
+        executor = executor_reference()
+        if executor is not None:
+            executor._initializer_failed()
+        return
+    inbox, local = deques[index]
+    # Let submit() called from a task running in this thread push to the
+    # local deque.
+    _worker_local.work_queue = work_queue
+    _worker_local.deque = local
+    try:
+        while True:
+            try:
+                # Oldest work item submitted from outside the pool first
+                work_item = inbox.popleft()
+            except IndexError:
+                try:
+                    # Then newest local work item
+                    work_item = local.pop()
+                except IndexError:
+                    work_item = _steal(deques, index + 1)
+                if work_item is None:
+                    try:
+                        work_item = work_queue.get_nowait()
+                    except queue.Empty:
+                        # Announce that this worker is idle, then look again:
+                        # a work item pushed before the announcement is found
+                        # here, one pushed after it is followed by a wake-up.
+                        executor = executor_reference()
+                        if executor is not None:
+                            executor._idle_semaphore.release()
+                        work_item = _steal(deques, index)
+                        if work_item is not None and executor is not None:
+                            # Not idle after all: take the announcement back
+                            # unless submit() has already used it, in which
+                            # case the wake-up it sent is skipped later.
+                            executor._idle_semaphore.acquire(timeout=0)
+                        del executor
+                        if work_item is None:
+                            work_item = work_queue.get(block=True)
+                    if work_item is _WAKEUP:
+                        continue
+
+            if work_item is not None:
+                work_item.run(ctx)
+                # Delete references to object. See GH-60488
+                del work_item
+                continue
+
+            executor = executor_reference()
+            # Exit under the same conditions as _worker().
+            if _shutdown or executor is None or executor._shutdown:
+                if executor is not None:
+                    executor._shutdown = True
+                del executor
+                # Run the work items left in the deques before exiting
+                while (work_item := _steal(deques, index)) is not None:
+                    work_item.run(ctx)
+                    del work_item
+                # Notice other workers
+                work_queue.put(None)
+                return
+            del executor
+    except BaseException:
+        _base.LOGGER.critical('Exception in worker', exc_info=True)
+    finally:
+        _worker_local.work_queue = _worker_local.deque = None
+        ctx.finalize()
+
+
 class BrokenThreadPool(_base.BrokenExecutor):
     """
     Raised when a worker thread in a ThreadPoolExecutor failed initializing.
@@ -159,7 +257,8 @@ def prepare_context(cls, initializer, initargs):
         return WorkerContext.prepare(initializer, initargs)
 
     def __init__(self, max_workers=None, thread_name_prefix='',
-                 initializer=None, initargs=(), **ctxkwargs):
+                 initializer=None, initargs=(), *, work_stealing=False,
+                 **ctxkwargs):
         """Initializes a new ThreadPoolExecutor instance.
 
         Args:
@@ -168,6 +267,12 @@ def __init__(self, max_workers=None, thread_name_prefix='',
             thread_name_prefix: An optional name prefix to give our threads.
             initializer: A callable used to initialize worker threads.
             initargs: A tuple of arguments to pass to the initializer.
+            work_stealing: If true, each worker thread has an inbox for
+                calls submitted from outside the pool, which are spread
+                over the inboxes and run oldest first, and a deque for
+                calls submitted from the worker thread, which are run
+                newest first; idle workers steal the oldest work items
+                from the other workers.
             ctxkwargs: Additional arguments to cls.prepare_context().
         """
         if max_workers is None:
@@ -190,6 +295,11 @@ def __init__(self, max_workers=None, thread_name_prefix='',
         self._work_queue = queue.SimpleQueue()
         self._idle_semaphore = threading.Semaphore(0)
         self._threads = set()
+        # The (inbox, deque) pairs of the worker threads in work-stealing
+        # mode, and the index of the inbox that gets the next work item
+        # submitted from outside the pool.
+        self._worker_deques = [] if work_stealing else None
+        self._next_inbox = 0
         self._broken = False
         self._shutdown = False
         self._shutdown_lock = threading.Lock()
@@ -211,14 +321,34 @@ def submit(self, fn, /, *args, **kwargs):
             task = self._resolve_work_item_task(fn, args, kwargs)
             w = _WorkItem(f, task)
 
-            self._work_queue.put(w)
-            self._adjust_thread_count()
+            if self._worker_deques is None:
+                self._work_queue.put(w)
+                self._adjust_thread_count()
+            elif getattr(_worker_local, 'work_queue', None) is self._work_queue:
+                # Submitted by one of our workers: run it next there,
+                # unless an idle worker steals it first.
+                _worker_local.deque.append(w)
+                self._adjust_thread_count(wakeup=True)
+            else:
+                # Submitted from outside the pool: put it in the inbox of
+                # a worker, which runs it after the older ones there.
+                self._adjust_thread_count(work_item=w)
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def _adjust_thread_count(self):
+    def _adjust_thread_count(self, wakeup=False, work_item=None):
+        # In work-stealing mode, *work_item* is a work item submitted from
+        # outside the pool, to put in the inbox of a worker.
+
         # if idle threads are available, don't spin new threads
         if self._idle_semaphore.acquire(timeout=0):
+            if work_item is not None:
+                self._push_to_inbox(work_item)
+                wakeup = True
+            if wakeup:
+                # The work item is not in the work queue, so wake up the idle
+                # thread explicitly.
+                self._work_queue.put(_WAKEUP)
             return
 
         # When the executor gets lost, the weakref callback will wake up
@@ -230,26 +360,59 @@ def weakref_cb(_, q=self._work_queue):
         if num_threads < self._max_workers:
             thread_name = '%s_%d' % (self._thread_name_prefix or self,
                                      num_threads)
-            t = threading.Thread(name=thread_name, target=_worker,
-                                 args=(weakref.ref(self, weakref_cb),
-                                       self._create_worker_context(),
-                                       self._work_queue))
+            args = (weakref.ref(self, weakref_cb),
+                    self._create_worker_context(),
+                    self._work_queue)
+            if self._worker_deques is not None:
+                # A new worker starts with the work item it was started for.
+                inbox = collections.deque()
+                if work_item is not None:
+                    inbox.append(work_item)
+                    work_item = None
+                self._worker_deques.append((inbox, collections.deque()))
+                t = threading.Thread(name=thread_name,
+                                     target=_work_stealing_worker,
+                                     args=(*args, self._worker_deques,
+                                           num_threads))
+            else:
+                t = threading.Thread(name=thread_name, target=_worker,
+                                     args=args)
             t.start()
             self._threads.add(t)
             _threads_queues[t] = self._work_queue
 
+        if work_item is not None:
+            # All the workers are busy; one of them runs it when done.
+            self._push_to_inbox(work_item)
+
+    def _push_to_inbox(self, work_item):
+        # Spread the work items submitted from outside the pool over the
+        # worker inboxes in turn.
+        deques = self._worker_deques
+        deques[self._next_inbox % len(deques)][0].append(work_item)
+        self._next_inbox += 1
+
+    def _drain_work_items(self):
+        # Remove all pending work items from the work queue and the worker
+        # deques.
+        while True:
+            try:
+                work_item = self._work_queue.get_nowait()
+            except queue.Empty:
+                break
+            if work_item is not None and work_item is not _WAKEUP:
+                yield work_item
+        if self._worker_deques:
+            while (work_item := _steal(self._worker_deques, 0)) is not None:
+                yield work_item
+
     def _initializer_failed(self):
         with self._shutdown_lock:
             self._broken = ('A thread initializer failed, the thread pool '
                             'is not usable anymore')
             # Drain work queue and mark pending futures failed
-            while True:
-                try:
-                    work_item = self._work_queue.get_nowait()
-                except queue.Empty:
-                    break
-                if work_item is not None:
-                    work_item.future.set_exception(self.BROKEN(self._broken))
+            for work_item in self._drain_work_items():
+                work_item.future.set_exception(self.BROKEN(self._broken))
 
     def shutdown(self, wait=True, *, cancel_futures=False):
         with self._shutdown_lock:
@@ -257,13 +420,8 @@ def shutdown(self, wait=True, *, cancel_futures=False):
             if cancel_futures:
                 # Drain all work items from the queue, and then cancel their
                 # associated futures.
-                while True:
-                    try:
-                        work_item = self._work_queue.get_nowait()
-                    except queue.Empty:
-                        break
-                    if work_item is not None:
-                        work_item.future.cancel()
+                for work_item in self._drain_work_items():
+                    work_item.future.cancel()
 
             # Send a wake-up to prevent threads calling
             # _work_queue.get(block=True) from permanently blocking.
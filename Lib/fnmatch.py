@@ -8,6 +8,9 @@
 
 The function translate(PATTERN) returns a regular expression
 corresponding to PATTERN.  (It does not compile it.)
+
+The function compile_many(PATTERNS) compiles many patterns into a single
+matcher, which tells which of them a name matches.
 """
 
 import functools
@@ -16,7 +19,8 @@
 import posixpath
 import re
 
-__all__ = ["filter", "filterfalse", "fnmatch", "fnmatchcase", "translate"]
+__all__ = ["compile_many", "filter", "filterfalse", "fnmatch", "fnmatchcase",
+           "translate"]
 
 
 def fnmatch(name, pat):
@@ -92,6 +96,90 @@ def fnmatchcase(name, pat):
     return match(name) is not None
 
 
+def compile_many(pats):
+    """Compile the shell patterns PATS into a single matcher.
+
+    Return a function which takes a name and returns the first pattern of
+    PATS that matches it, as fnmatchcase() does, or None if no pattern
+    matches.  Patterns without wildcards, and patterns with wildcards only
+    at their start or end, are looked up in hash tables; the other patterns
+    are combined into one regular expression.
+    """
+    return _compile_many(tuple(pats))
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _compile_many(pats):
+    exact = {}      # literal -> index
+    prefixes = {}   # length -> {literal prefix -> index}
+    suffixes = {}   # length -> {literal suffix -> index}
+    indices = []    # indices of the patterns combined in the regex
+    regexes = []
+    kind = None
+    for index, pat in enumerate(pats):
+        if isinstance(pat, bytes):
+            pat_str = str(pat, 'ISO-8859-1')
+        else:
+            pat_str = pat
+        if kind is None:
+            kind = type(pat)
+        elif type(pat) is not kind:
+            raise TypeError("cannot mix str and bytes patterns")
+        if not _magic_check(pat_str):
+            exact.setdefault(pat, index)
+            continue
+        stripped = pat_str.lstrip('*')
+        if stripped != pat_str and not _magic_check(stripped):
+            table = suffixes.setdefault(len(stripped), {})
+            table.setdefault(pat[len(pat) - len(stripped):], index)
+            continue
+        stripped = pat_str.rstrip('*')
+        if stripped != pat_str and not _magic_check(stripped):
+            table = prefixes.setdefault(len(stripped), {})
+            table.setdefault(pat[:len(stripped)], index)
+            continue
+        indices.append(index)
+        regexes.append(f'({translate(pat_str)})')
+
+    if regexes:
+        res = '|'.join(regexes)
+        if kind is bytes:
+            res = bytes(res, 'ISO-8859-1')
+        regex_match = re.compile(res).match
+        first_regex_index = indices[0]
+    else:
+        regex_match = None
+        first_regex_index = len(pats)
+    prefixes = sorted(prefixes.items())
+    suffixes = sorted(suffixes.items())
+
+    def match(name):
+        best = exact.get(name, len(pats))
+        for length, table in prefixes:
+            index = table.get(name[:length], best)
+            if index < best:
+                best = index
+        n = len(name)
+        for length, table in suffixes:
+            if length > n:
+                break
+            index = table.get(name[n - length:], best)
+            if index < best:
+                best = index
+        # The regex tries the patterns in order, so it finds the first one.
+        if first_regex_index < best:
+            m = regex_match(name)
+            if m is not None:
+                index = indices[m.lastindex - 1]
+                if index < best:
+                    best = index
+        return pats[best] if best < len(pats) else None
+    return match
+
+
+_magic_check = re.compile('[*?[]').search
+
+
 def translate(pat):
     """Translate a shell PATTERN to a regular expression.
 
@@ -11,7 +11,7 @@
 import sys
 
 
-__all__ = ["glob", "iglob", "escape", "translate"]
+__all__ = ["glob", "iglob", "escape", "translate", "PatternSet"]
 
 def glob(pathname, *, root_dir=None, dir_fd=None, recursive=False,
         include_hidden=False):
@@ -319,6 +319,40 @@ def translate(pat, *, recursive=False, include_hidden=False, seps=None):
     return fr'(?s:{res})\z'
 
 
+class PatternSet:
+    """A set of pathname patterns with shell wildcards, matched together.
+
+    The patterns are translated like translate() does, with the same
+    keyword arguments, and combined into a single regular expression.
+    """
+
+    __slots__ = ('patterns', '_regex')
+
+    def __init__(self, patterns, *, recursive=False, include_hidden=False,
+                 seps=None):
+        self.patterns = tuple(patterns)
+        if seps:
+            seps = tuple(seps)
+        self._regex = _compile_patterns(self.patterns, seps, True,
+                                        recursive, include_hidden)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self.patterns)!r})'
+
+    def match(self, path):
+        """Return the first pattern which matches the whole path, or None if
+        no pattern matches it."""
+        m = self._regex.match(os.fspath(path))
+        if m is None:
+            return None
+        return self.patterns[m.lastindex - 1]
+
+    def filter(self, paths):
+        """Return a list of the paths which match any pattern."""
+        match = self._regex.match
+        return [path for path in paths if match(os.fspath(path))]
+
+
 @functools.lru_cache(maxsize=512)
 def _compile_pattern(pat, seps, case_sensitive, recursive=True):
     """Compile given glob pattern to a re.Pattern object (observing case
@@ -328,15 +362,35 @@ def _compile_pattern(pat, seps, case_sensitive, recursive=True):
     return re.compile(regex, flags=flags).match
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_patterns(pats, seps, case_sensitive, recursive=True,
+                      include_hidden=True):
+    """Compile given glob patterns to a single re.Pattern object (observing
+    case sensitivity), in which group n matches the n-th pattern."""
+    flags = re.NOFLAG if case_sensitive else re.IGNORECASE
+    regexes = [translate(pat, recursive=recursive,
+                         include_hidden=include_hidden, seps=seps)
+               for pat in pats]
+    # The alternatives are tried in order, so the first pattern matching a
+    # path is the one reported.
+    regex = '|'.join(f'({regex})' for regex in regexes) or '(?!)'
+    return re.compile(regex, flags=flags)
+
+
 class _GlobberBase:
     """Abstract class providing shell-style pattern matching and globbing.
     """
 
-    def __init__(self, sep, case_sensitive, case_pedantic=False, recursive=False):
+    def __init__(self, sep, case_sensitive, case_pedantic=False, recursive=False,
+                 workers=None):
         self.sep = sep
         self.case_sensitive = case_sensitive
         self.case_pedantic = case_pedantic
         self.recursive = recursive
+        self.workers = os._workers_count(workers)
+        # Pool of threads shared by the recursive selectors of a glob call,
+        # see run_selector().
+        self.executor = None
 
     # Abstract methods
 
@@ -370,6 +424,48 @@ def compile(self, pat, altsep=None):
         seps = (self.sep, altsep) if altsep else self.sep
         return _compile_pattern(pat, seps, self.case_sensitive, self.recursive)
 
+    def pattern_set_selector(self, pats):
+        """Returns a function that selects the given path and its children,
+        recursively, when their paths relative to it match one of *pats*.
+        """
+        regex = _compile_patterns(pats, self.sep, self.case_sensitive,
+                                  self.recursive)
+        if self.recursive and any('**' in pat.split(self.sep) for pat in pats):
+            return self.recursive_selector('**', [], regex.match)
+        # Optimization: without a '**' segment, no pattern can match a path
+        # with more segments than it has itself, so walk no deeper than that.
+        max_depth = max((pat.count(self.sep) + 1 for pat in pats), default=0)
+        return self.bounded_selector(max_depth, regex.match)
+
+    def bounded_selector(self, max_depth, match):
+        """Returns a function that selects the children of a given path, down
+        to *max_depth* levels, when their paths relative to it match *match*.
+        """
+
+        def select_bounded(path, exists=False):
+            match_pos = len(self.stringify_path(path))
+            stack = [(path, 1)]
+            while stack:
+                path, depth = stack.pop()
+                if depth > max_depth:
+                    continue
+                try:
+                    entries = self.scandir(path)
+                except OSError:
+                    continue
+                for entry, _entry_name, entry_path in entries:
+                    if match(self.stringify_path(entry_path), match_pos):
+                        yield entry_path
+                    if depth < max_depth:
+                        try:
+                            if not entry.is_dir():
+                                continue
+                        except OSError:
+                            continue
+                        stack.append((self.concat_path(entry_path, self.sep),
+                                      depth + 1))
+        return select_bounded
+
     def selector(self, parts):
         """Returns a function that selects from a given path, walking and
         filtering according to the glob-style pattern parts in *parts*.
@@ -448,9 +544,9 @@ def select_wildcard(path, exists=False):
                             yield entry_path
         return select_wildcard
 
-    def recursive_selector(self, part, parts):
+    def recursive_selector(self, part, parts, match=None):
         """Returns a function that selects a given path and all its children,
-        recursively, filtering by pattern.
+        recursively, filtering by pattern, or by *match* if given.
         """
         # Optimization: consume following '**' parts, which have no effect.
         while parts and parts[-1] == '**':
@@ -467,7 +563,8 @@ def recursive_selector(self, part, parts):
             while parts and parts[-1] not in _special_parts:
                 part += self.sep + parts.pop()
 
-        match = None if part == '**' else self.compile(part)
+        if match is None and part != '**':
+            match = self.compile(part)
         dir_only = bool(parts)
         select_next = self.selector(parts)
 
@@ -477,13 +574,17 @@ def select_recursive(path, exists=False):
             if match is None or match(path_str, match_pos):
                 yield from select_next(path, exists)
             stack = [path]
+            if self.executor is None:
+                scandir = self.scandir
+            else:
+                scandir = self.prefetching_scandir(stack, self.executor)
             while stack:
-                yield from select_recursive_step(stack, match_pos)
+                yield from select_recursive_step(stack, match_pos, scandir)
 
-        def select_recursive_step(stack, match_pos):
+        def select_recursive_step(stack, match_pos, scandir):
             path = stack.pop()
             try:
-                entries = self.scandir(path)
+                entries = scandir(path)
             except OSError:
                 pass
             else:
@@ -511,6 +612,43 @@ def select_recursive_step(stack, match_pos):
 
         return select_recursive
 
+    def run_selector(self, select, path):
+        """Yields the paths selected by *select* from *path*.  If workers is
+        greater than one, the recursive selectors share a pool of that many
+        threads for the duration of the call.
+        """
+        if self.workers <= 1:
+            yield from select(path)
+            return
+        from concurrent.futures import ThreadPoolExecutor
+        self.executor = ThreadPoolExecutor(self.workers,
+                                           thread_name_prefix='glob')
+        try:
+            yield from select(path)
+        finally:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def prefetching_scandir(self, stack, executor):
+        """Returns a function like scandir() that also scans the directories
+        at the top of *stack* ahead of time, using *executor*.
+        """
+        lookahead = 2 * self.workers
+        pending = {}
+
+        def scan(path):
+            return list(self.scandir(path))
+
+        def scandir(path):
+            future = pending.pop(path, None)
+            if future is None:
+                future = executor.submit(scan, path)
+            for next_path in stack[:-lookahead-1:-1]:
+                if next_path not in pending:
+                    pending[next_path] = executor.submit(scan, next_path)
+            return future.result()
+        return scandir
+
     def select_exists(self, path, exists=False):
         """Yields the given path, if it exists.
         """
@@ -28,10 +28,14 @@
 
 READ_BUFFER_SIZE = 128 * 1024
 _WRITE_BUFFER_SIZE = 4 * io.DEFAULT_BUFFER_SIZE
+# Size of the blocks of input compressed concurrently when threads are used,
+# and of the preceding data each block is primed with (the deflate window).
+_PARALLEL_BLOCK_SIZE = 128 * 1024
+_PARALLEL_DICT_SIZE = 32 * 1024
 
 
 def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, threads=None):
     """Open a gzip-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str or bytes object), or
@@ -42,8 +46,8 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
     "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the GzipFile constructor:
-    GzipFile(filename, mode, compresslevel). In this case, the encoding, errors
-    and newline arguments must not be provided.
+    GzipFile(filename, mode, compresslevel, threads=threads). In this case, the
+    encoding, errors and newline arguments must not be provided.
 
     For text mode, a GzipFile object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error handling
@@ -63,9 +67,11 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
 
     gz_mode = mode.replace("t", "")
     if isinstance(filename, (str, bytes, os.PathLike)):
-        binary_file = GzipFile(filename, gz_mode, compresslevel)
+        binary_file = GzipFile(filename, gz_mode, compresslevel,
+                               threads=threads)
     elif hasattr(filename, "read") or hasattr(filename, "write"):
-        binary_file = GzipFile(None, gz_mode, compresslevel, filename)
+        binary_file = GzipFile(None, gz_mode, compresslevel, filename,
+                               threads=threads)
     else:
         raise TypeError("filename must be a str or bytes object, or a file")
 
@@ -90,8 +96,14 @@ def __init__(self, f, prepend=b''):
         self._length = len(prepend)
         self.file = f
         self._read = 0
+        self.pos = 0  # Offset of the next byte to read, for seek checkpoints
 
     def read(self, size):
+        data = self._read_buffered(size)
+        self.pos += len(data)
+        return data
+
+    def _read_buffered(self, size):
         if self._read is None:
             return self.file.read(size)
         if self._read + size <= self._length:
@@ -105,6 +117,7 @@ def read(self, size):
                    self.file.read(size-self._length+read)
 
     def prepend(self, prepend=b''):
+        self.pos -= len(prepend)
         if self._read is None:
             self._buffer = prepend
         else:  # Assume data was read since the last prepend() call
@@ -116,6 +129,7 @@ def prepend(self, prepend=b''):
     def seek(self, off):
         self._read = None
         self._buffer = None
+        self.pos = off
         return self.file.seek(off)
 
     def seekable(self):
@@ -144,6 +158,73 @@ def writable(self):
         return True
 
 
+def _compress_block(data, compresslevel, zdict, mode):
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                  -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 0,
+                                  *((zdict,) if zdict else ()))
+    return compressor.compress(data) + compressor.flush(mode)
+
+
+class _ParallelCompressor:
+    """Raw deflate compressor with the interface of zlib.compressobj() which
+    compresses blocks of its input concurrently in a pool of threads.
+
+    Like pigz, every block is primed with the last 32 KiB of the previous
+    block and ends on a byte boundary (Z_SYNC_FLUSH), so the concatenated
+    output is a single ordinary deflate stream.  zlib releases the GIL while
+    compressing.  The number of blocks in flight is bounded.
+    """
+
+    def __init__(self, compresslevel, threads):
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+        self._compresslevel = compresslevel
+        self._executor = ThreadPoolExecutor(threads,
+                                            thread_name_prefix='gzip')
+        self._max_pending = 2 * threads
+        self._pending = deque()
+        self._buffer = bytearray()
+        self._zdict = b''
+
+    def _submit(self, block, mode, output):
+        if len(self._pending) >= self._max_pending:
+            output.append(self._pending.popleft().result())
+        self._pending.append(self._executor.submit(
+            _compress_block, block, self._compresslevel, self._zdict, mode))
+        if mode == zlib.Z_FULL_FLUSH:
+            self._zdict = b''
+        else:
+            self._zdict = block[-_PARALLEL_DICT_SIZE:]
+
+    def compress(self, data):
+        buffer = self._buffer
+        buffer += data
+        output = []
+        while len(buffer) >= _PARALLEL_BLOCK_SIZE:
+            block = bytes(buffer[:_PARALLEL_BLOCK_SIZE])
+            del buffer[:_PARALLEL_BLOCK_SIZE]
+            self._submit(block, zlib.Z_SYNC_FLUSH, output)
+        while self._pending and self._pending[0].done():
+            output.append(self._pending.popleft().result())
+        return b''.join(output)
+
+    def flush(self, mode=zlib.Z_FINISH):
+        output = []
+        if mode != zlib.Z_NO_FLUSH:
+            if mode not in (zlib.Z_FINISH, zlib.Z_FULL_FLUSH):
+                # Blocks must end on a byte boundary to be concatenated.
+                mode = zlib.Z_SYNC_FLUSH
+            if self._buffer or mode != zlib.Z_SYNC_FLUSH:
+                block = bytes(self._buffer)
+                self._buffer.clear()
+                self._submit(block, mode, output)
+            while self._pending:
+                output.append(self._pending.popleft().result())
+            if mode == zlib.Z_FINISH:
+                self._executor.shutdown()
+        return b''.join(output)
+
+
 class GzipFile(_streams.BaseStream):
     """The GzipFile class simulates most of the methods of a file object with
     the exception of the truncate() method.
@@ -158,7 +239,8 @@ class GzipFile(_streams.BaseStream):
     myfileobj = None
 
     def __init__(self, filename=None, mode=None,
-                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None):
+                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None,
+                 *, threads=None):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -191,6 +273,12 @@ def __init__(self, filename=None, mode=None,
         If mtime is omitted or None, the current time is used. Use mtime = 0
         to generate a compressed stream that does not depend on creation time.
 
+        The optional threads argument is the number of threads used to compress
+        blocks of the data concurrently when writing; 0 means the number of
+        CPUs available to the process.  If it is omitted, None or 1, data is
+        compressed in the calling thread.  Either way, a single standard gzip
+        member is written.
+
         """
 
         # Ensure attributes exist at __del__
@@ -233,11 +321,16 @@ def __init__(self, filename=None, mode=None,
                         FutureWarning, 2)
                 self.mode = WRITE
                 self._init_write(filename)
-                self.compress = zlib.compressobj(compresslevel,
-                                                 zlib.DEFLATED,
-                                                 -zlib.MAX_WBITS,
-                                                 zlib.DEF_MEM_LEVEL,
-                                                 0)
+                threads = os._workers_count(threads, "threads")
+                if threads > 1:
+                    self.compress = _ParallelCompressor(compresslevel,
+                                                        threads)
+                else:
+                    self.compress = zlib.compressobj(compresslevel,
+                                                     zlib.DEFLATED,
+                                                     -zlib.MAX_WBITS,
+                                                     zlib.DEF_MEM_LEVEL,
+                                                     0)
                 self._write_mtime = mtime
                 self._buffer_size = _WRITE_BUFFER_SIZE
                 self._buffer = io.BufferedWriter(_WriteBufferStream(self),
@@ -567,10 +660,13 @@ def read(self, size=-1):
                 # If the _new_member flag is set, we have to
                 # jump to the next member, if there is one.
                 self._init_read()
+                member_start = self._fp.pos
                 if not self._read_gzip_header():
                     self._size = self._pos
                     return b""
                 self._new_member = False
+                if self._checkpoint_due():
+                    self._add_checkpoint(member_start)
 
             # Read a chunk of data from the file
             if self._decompressor.needs_input:
@@ -593,6 +689,14 @@ def read(self, size=-1):
         self._crc = zlib.crc32(uncompress, self._crc)
         self._stream_size += len(uncompress)
         self._pos += len(uncompress)
+        if (self._decompressor.needs_input and
+                self._state_checkpoint_due() and
+                hasattr(self._decompressor, 'copy')):
+            # All the compressed data read so far has been consumed, so
+            # decompression can resume here from a copy of the decompressor.
+            self._add_checkpoint(self._fp.pos, (self._decompressor.copy(),
+                                                self._crc, self._stream_size,
+                                                self._last_mtime))
         return uncompress
 
     def _read_eof(self):
@@ -620,6 +724,19 @@ def _rewind(self):
         super()._rewind()
         self._new_member = True
 
+    def _restore_checkpoint(self, pos, fp_pos, state=None):
+        if state is None:
+            super()._restore_checkpoint(pos, fp_pos)
+            return
+        # Resume decompression inside a member.
+        decompressor, self._crc, self._stream_size, self._last_mtime = state
+        self._fp.seek(fp_pos)
+        self._eof = False
+        self._pos = pos
+        self._fp_pos = fp_pos
+        self._decompressor = decompressor.copy()
+        self._new_member = False
+
 
 def compress(data, compresslevel=_COMPRESS_LEVEL_BEST, *, mtime=0):
     """Compress data in one shot and return the compressed string.
@@ -97,7 +97,7 @@
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
+    'dump', 'dumps', 'dumpb', 'load', 'loads', 'iterload',
     'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
 ]
 
@@ -106,6 +106,8 @@
 from .decoder import JSONDecoder, JSONDecodeError
 from .encoder import JSONEncoder
 import codecs
+import errno
+import io
 
 _default_encoder = JSONEncoder(
     skipkeys=False,
@@ -160,20 +162,41 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
     ``.default()`` method to serialize additional types), specify it with
     the ``cls`` kwarg; otherwise ``JSONEncoder`` is used.
 
+    If ``fp`` is a binary file (an instance of ``io.RawIOBase`` or
+    ``io.BufferedIOBase``), the document is written to it UTF-8 encoded,
+    as produced by ``JSONEncoder.encode_bytes``.  The whole document is
+    built in memory before it is written.
+
     """
     # cached encoder
     if (not skipkeys and ensure_ascii and
         check_circular and allow_nan and
         cls is None and indent is None and separators is None and
         default is None and not sort_keys and not kw):
-        iterable = _default_encoder.iterencode(obj)
+        encoder = _default_encoder
     else:
         if cls is None:
             cls = JSONEncoder
-        iterable = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        encoder = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
-            default=default, sort_keys=sort_keys, **kw).iterencode(obj)
+            default=default, sort_keys=sort_keys, **kw)
+    if isinstance(fp, io.BufferedIOBase):
+        fp.write(encoder.encode_bytes(obj))
+        return
+    if isinstance(fp, io.RawIOBase):
+        # Raw writes may be short, so write until everything is written.
+        full = memoryview(encoder.encode_bytes(obj))
+        data = full
+        while data:
+            n = fp.write(data)
+            if n is None:
+                raise BlockingIOError(errno.EAGAIN,
+                                      "write could not complete without "
+                                      "blocking", len(full) - len(data))
+            data = data[n:]
+        return
+    iterable = encoder.iterencode(obj)
     # could accelerate with writelines in some versions of Python, at
     # a debuggability cost
     for chunk in iterable:
@@ -238,6 +261,32 @@ def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         **kw).encode(obj)
 
 
+def dumpb(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
+        allow_nan=True, cls=None, indent=None, separators=None,
+        default=None, sort_keys=False, **kw):
+    """Serialize ``obj`` to a UTF-8 encoded JSON formatted ``bytes``.
+
+    This is equivalent to ``dumps(obj, ...).encode('utf-8')``, but the C
+    accelerated encoder writes the result directly into a ``bytes`` object
+    instead of building an intermediate ``str``.
+
+    The arguments have the same meaning as in ``dumps``.
+    """
+    # cached encoder
+    if (not skipkeys and ensure_ascii and
+        check_circular and allow_nan and
+        cls is None and indent is None and separators is None and
+        default is None and not sort_keys and not kw):
+        return _default_encoder.encode_bytes(obj)
+    if cls is None:
+        cls = JSONEncoder
+    return cls(
+        skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        check_circular=check_circular, allow_nan=allow_nan, indent=indent,
+        separators=separators, default=default, sort_keys=sort_keys,
+        **kw).encode_bytes(obj)
+
+
 _default_decoder = JSONDecoder(object_hook=None, object_pairs_hook=None)
 
 
@@ -296,6 +345,68 @@ def load(fp, *, cls=None, object_hook=None, parse_float=None,
         parse_constant=parse_constant, object_pairs_hook=object_pairs_hook, **kw)
 
 
+def iterload(fp, *, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None,
+        bufsize=None, **kw):
+    """Incrementally deserialize ``fp`` (a ``.read()``-supporting file-like
+    object containing a JSON document whose top-level value is an array)
+    and return an iterator over the Python objects of the array's items.
+
+    The document is read ``bufsize`` characters (or bytes) at a time and
+    consumed input is discarded as soon as an item has been decoded, so
+    memory use is bounded by the largest item rather than the size of the
+    whole document.
+
+    ``fp`` may be a text or a binary file; binary input is decoded
+    incrementally using the same encoding detection as ``loads``.
+
+    The other arguments have the same meaning as in ``load``.
+    """
+    if bufsize is None:
+        bufsize = io.DEFAULT_BUFFER_SIZE
+    if cls is None:
+        cls = JSONDecoder
+    if object_hook is not None:
+        kw['object_hook'] = object_hook
+    if object_pairs_hook is not None:
+        kw['object_pairs_hook'] = object_pairs_hook
+    if parse_float is not None:
+        kw['parse_float'] = parse_float
+    if parse_int is not None:
+        kw['parse_int'] = parse_int
+    if parse_constant is not None:
+        kw['parse_constant'] = parse_constant
+    return cls(**kw).iterdecode(_iterchunks(fp, bufsize))
+
+
+def _iterchunks(fp, bufsize):
+    chunk = fp.read(bufsize)
+    if isinstance(chunk, str):
+        while chunk:
+            yield chunk
+            chunk = fp.read(bufsize)
+        return
+    if not isinstance(chunk, (bytes, bytearray)):
+        raise TypeError(f'the JSON object must be str, bytes or bytearray, '
+                        f'not {chunk.__class__.__name__}')
+    # detect_encoding() needs the first four bytes if there are that many
+    while 0 < len(chunk) < 4:
+        more = fp.read(bufsize)
+        if not more:
+            break
+        chunk += more
+    decoder = codecs.getincrementaldecoder(
+        detect_encoding(chunk))('surrogatepass')
+    while chunk:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+        chunk = fp.read(bufsize)
+    text = decoder.decode(b'', True)
+    if text:
+        yield text
+
+
 def loads(s, *, cls=None, object_hook=None, parse_float=None,
         parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
     """Deserialize ``s`` (a ``str``, ``bytes`` or ``bytearray`` instance
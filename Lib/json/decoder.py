@@ -259,6 +259,29 @@ def JSONArray(s_and_end, scan_once, _w=WHITESPACE.match, _ws=WHITESPACE_STR):
     return values, end
 
 
+_LITERALS = ('null', 'true', 'false', 'NaN', 'Infinity', '-Infinity')
+_NUMBER_TAIL = frozenset('0123456789.eE+-')
+
+
+def _may_continue(msg, s, pos):
+    """Return True if the decoding error *msg* at *pos* could be caused by
+    *s* ending early, i.e. if more input could make it go away."""
+    tail = s[pos:]
+    if not tail:
+        return True
+    if msg.startswith('Unterminated string'):
+        return True
+    if msg == 'Invalid \\uXXXX escape':
+        return len(tail) <= 6
+    if msg == 'Expecting value':
+        # A literal such as "true" or "-Infinity" split in the middle.
+        return any(literal.startswith(tail) for literal in _LITERALS)
+    if msg == "Expecting ',' delimiter":
+        # A number such as "1.5" or "1e5" split in a nested container.
+        return _NUMBER_TAIL.issuperset(tail)
+    return False
+
+
 class JSONDecoder(object):
     """Simple JSON <https://json.org> decoder
 
@@ -362,3 +385,101 @@ def raw_decode(self, s, idx=0):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+    def iterdecode(self, chunks, _w=WHITESPACE.match):
+        """Incrementally decode a JSON array and yield its items.
+
+        ``chunks`` is an iterable of ``str`` fragments which, concatenated,
+        form a single JSON document whose top-level value is an array.
+        Each item is decoded with the regular scanner as soon as enough
+        input is available, and consumed input is discarded, so the memory
+        needed is bounded by the largest item rather than the whole document.
+
+        Positions reported by :exc:`JSONDecodeError` are relative to the
+        portion of the document that was buffered at the time of the error.
+
+        """
+        chunks = iter(chunks)
+        s = ''
+        pos = 0
+        eof = False
+
+        def fill():
+            # Discard consumed input, then read at least as much again as is
+            # still buffered, so that re-scanning a large partial item costs
+            # amortized linear time.
+            nonlocal s, pos, eof
+            parts = [s[pos:]]
+            want = max(len(parts[0]), 1)
+            got = 0
+            for chunk in chunks:
+                if not isinstance(chunk, str):
+                    raise TypeError(f'chunks must be str, '
+                                    f'not {chunk.__class__.__name__}')
+                parts.append(chunk)
+                got += len(chunk)
+                if got >= want:
+                    break
+            else:
+                eof = True
+            s = ''.join(parts)
+            pos = 0
+
+        def skip():
+            # Skip whitespace, reading more input as needed; return the next
+            # character or '' at the end of the document.
+            nonlocal pos
+            while True:
+                pos = _w(s, pos).end()
+                if pos < len(s) or eof:
+                    return s[pos:pos + 1]
+                fill()
+
+        nextchar = skip()
+        if nextchar == '\ufeff':
+            raise JSONDecodeError("Unexpected UTF-8 BOM "
+                                  "(decode using utf-8-sig)", s, pos)
+        if nextchar != '[':
+            raise JSONDecodeError("Expecting '['", s, pos)
+        pos += 1
+        nextchar = skip()
+        if nextchar != ']':
+            while True:
+                try:
+                    value, end = self.scan_once(s, pos)
+                except StopIteration as err:
+                    if eof or not _may_continue("Expecting value", s,
+                                                err.value):
+                        raise JSONDecodeError("Expecting value", s,
+                                              err.value) from None
+                    fill()
+                    continue
+                except JSONDecodeError as err:
+                    # Only read more input if it could fix the error, not
+                    # the rest of the document after each error.
+                    if eof or not _may_continue(err.msg, s, err.pos):
+                        raise
+                    fill()
+                    continue
+                pos_after = _w(s, end).end()
+                if not eof and (pos_after == len(s) or
+                                (pos_after == end and s[end] not in ',]')):
+                    # The item may continue in input which was not read yet,
+                    # e.g. "12" or "1.5" split after "1".
+                    fill()
+                    continue
+                pos = pos_after
+                yield value
+                nextchar = s[pos:pos + 1]
+                if nextchar == ']':
+                    break
+                if nextchar != ',':
+                    raise JSONDecodeError("Expecting ',' delimiter", s, pos)
+                comma_idx = pos
+                pos += 1
+                if skip() == ']':
+                    raise JSONDecodeError("Illegal trailing comma before "
+                                          "end of array", s, comma_idx)
+        pos += 1
+        if skip():
+            raise JSONDecodeError("Extra data", s, pos)
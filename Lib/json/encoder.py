@@ -1,6 +1,7 @@
 """Implementation of JSONEncoder
 """
 import re
+import sys
 
 try:
     from _json import encode_basestring_ascii as c_encode_basestring_ascii
@@ -34,6 +35,46 @@
 
 INFINITY = float('inf')
 
+def _native_layout(cls, encoder, sort_keys):
+    """Return how instances of cls are serialized when native_types is true.
+
+    This is a tuple of (attribute name, encoded key) pairs for dataclasses,
+    a function that converts an instance to a serializable object for enums,
+    date and time objects and UUIDs, or None for any other type.
+
+    """
+    # Modules which are not imported yet cannot have instances to serialize.
+    dataclasses = sys.modules.get('dataclasses')
+    if dataclasses is not None and dataclasses.is_dataclass(cls):
+        names = [field.name for field in dataclasses.fields(cls)]
+        if sort_keys:
+            names.sort()
+        return tuple((name, encoder(name)) for name in names)
+    enum = sys.modules.get('enum')
+    if enum is not None and issubclass(cls, enum.Enum):
+        from operator import attrgetter
+        return attrgetter('value')
+    datetime = sys.modules.get('datetime')
+    if datetime is not None and issubclass(cls, (datetime.date, datetime.time)):
+        return cls.isoformat
+    uuid = sys.modules.get('uuid')
+    if uuid is not None and issubclass(cls, uuid.UUID):
+        return str
+    return None
+
+
+class _NativeLayouts(dict):
+    """Per-type cache of _native_layout() results."""
+
+    def __init__(self, encoder, sort_keys):
+        self.encoder = encoder
+        self.sort_keys = sort_keys
+
+    def __missing__(self, cls):
+        layout = self[cls] = _native_layout(cls, self.encoder, self.sort_keys)
+        return layout
+
+
 def py_encode_basestring(s):
     """Return a JSON representation of a Python string
 
@@ -104,7 +145,7 @@ class JSONEncoder(object):
     key_separator = ': '
     def __init__(self, *, skipkeys=False, ensure_ascii=True,
             check_circular=True, allow_nan=True, sort_keys=False,
-            indent=None, separators=None, default=None):
+            indent=None, separators=None, default=None, native_types=False):
         """Constructor for JSONEncoder, with sensible defaults.
 
         If skipkeys is false, then it is a TypeError to attempt
@@ -143,6 +184,11 @@ def __init__(self, *, skipkeys=False, ensure_ascii=True,
         that can't otherwise be serialized.  It should return a JSON encodable
         version of the object or raise a ``TypeError``.
 
+        If native_types is true, dataclass instances are encoded as objects
+        of their fields, enum members as their value, and date, time and
+        datetime objects and UUIDs as strings (using isoformat() and str()
+        respectively), without calling default.
+
         """
 
         self.skipkeys = skipkeys
@@ -157,6 +203,8 @@ def __init__(self, *, skipkeys=False, ensure_ascii=True,
             self.item_separator = ','
         if default is not None:
             self.default = default
+        self.native_types = native_types
+        self._layouts = None
 
     def default(self, o):
         """Implement this method in a subclass such that it returns
@@ -202,7 +250,23 @@ def encode(self, o):
             chunks = list(chunks)
         return ''.join(chunks)
 
-    def iterencode(self, o, _one_shot=False):
+    def encode_bytes(self, o):
+        """Return a UTF-8 encoded JSON representation of a Python data
+        structure as ``bytes``.
+
+        >>> from json.encoder import JSONEncoder
+        >>> JSONEncoder().encode_bytes({"foo": ["bar", "baz"]})
+        b'{"foo": ["bar", "baz"]}'
+
+        """
+        if (c_make_encoder is not None and not isinstance(o, str) and
+                type(self).encode is JSONEncoder.encode and
+                type(self).iterencode is JSONEncoder.iterencode):
+            # Let the C encoder produce bytes without an intermediate str.
+            return self.iterencode(o, _one_shot=True, _as_bytes=True)[0]
+        return self.encode(o).encode('utf-8')
+
+    def iterencode(self, o, _one_shot=False, _as_bytes=False):
         """Encode the given object and yield each string
         representation as available.
 
@@ -248,20 +312,31 @@ def floatstr(o, allow_nan=self.allow_nan,
             indent = self.indent
         else:
             indent = ' ' * self.indent
+        if self.native_types:
+            layouts = self._layouts
+            if (layouts is None or layouts.encoder is not _encoder or
+                    layouts.sort_keys != self.sort_keys):
+                layouts = self._layouts = _NativeLayouts(_encoder,
+                                                         self.sort_keys)
+        else:
+            layouts = None
         if _one_shot and c_make_encoder is not None:
             _iterencode = c_make_encoder(
                 markers, self.default, _encoder, indent,
                 self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, self.allow_nan)
+                self.skipkeys, self.allow_nan, layouts)
+            if _as_bytes:
+                return _iterencode(o, 0, _as_bytes=True)
         else:
             _iterencode = _make_iterencode(
                 markers, self.default, _encoder, indent, floatstr,
                 self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, _one_shot)
+                self.skipkeys, _one_shot, layouts)
         return _iterencode(o, 0)
 
 def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
+        _layouts=None,
         ## HACK: hand-optimized bytecode; turn globals into locals
         ValueError=ValueError,
         dict=dict,
@@ -420,6 +495,39 @@ def _iterencode_dict(dct, _current_indent_level):
         if markers is not None:
             del markers[markerid]
 
+    def _iterencode_fields(o, fields, _current_indent_level):
+        if not fields:
+            yield '{}'
+            return
+        yield '{'
+        if _indent is not None:
+            _current_indent_level += 1
+            newline_indent = '\n' + _indent * _current_indent_level
+            item_separator = _item_separator + newline_indent
+            yield newline_indent
+        else:
+            newline_indent = None
+            item_separator = _item_separator
+        first = True
+        for name, key in fields:
+            if first:
+                first = False
+            else:
+                yield item_separator
+            yield key
+            yield _key_separator
+            try:
+                yield from _iterencode(getattr(o, name), _current_indent_level)
+            except GeneratorExit:
+                raise
+            except BaseException as exc:
+                exc.add_note(f'when serializing {type(o).__name__} item {name!r}')
+                raise
+        if newline_indent is not None:
+            _current_indent_level -= 1
+            yield '\n' + _indent * _current_indent_level
+        yield '}'
+
     def _iterencode(o, _current_indent_level):
         if isinstance(o, str):
             yield _encoder(o)
@@ -445,14 +553,18 @@ def _iterencode(o, _current_indent_level):
                 if markerid in markers:
                     raise ValueError("Circular reference detected")
                 markers[markerid] = o
-            newobj = _default(o)
-            try:
-                yield from _iterencode(newobj, _current_indent_level)
-            except GeneratorExit:
-                raise
-            except BaseException as exc:
-                exc.add_note(f'when serializing {type(o).__name__} object')
-                raise
+            layout = None if _layouts is None else _layouts[type(o)]
+            if type(layout) is tuple:
+                yield from _iterencode_fields(o, layout, _current_indent_level)
+            else:
+                newobj = (layout or _default)(o)
+                try:
+                    yield from _iterencode(newobj, _current_indent_level)
+                except GeneratorExit:
+                    raise
+                except BaseException as exc:
+                    exc.add_note(f'when serializing {type(o).__name__} object')
+                    raise
             if markers is not None:
                 del markers[markerid]
     return _iterencode
@@ -293,7 +293,19 @@ def renames(old, new):
 # regular files.
 _walk_symlinks_as_files = object()
 
-def walk(top, topdown=True, onerror=None, followlinks=False):
+def _workers_count(workers, name="workers"):
+    # Validate a workers argument: None means a single thread and 0 means
+    # one thread per CPU usable by the process.  Also used by glob, gzip,
+    # shutil, tarfile and zipfile.
+    if workers is None:
+        return 1
+    if workers < 0:
+        raise ValueError(f"{name} must be a non-negative integer")
+    if workers == 0:
+        return process_cpu_count() or 1
+    return workers
+
+def walk(top, topdown=True, onerror=None, followlinks=False, *, workers=None):
     """Directory tree generator.
 
     For each directory in the directory tree rooted at top (including top
@@ -336,6 +348,12 @@ def walk(top, topdown=True, onerror=None, followlinks=False):
     systems that support them.  In order to get this functionality, set the
     optional argument 'followlinks' to true.
 
+    If optional arg 'workers' is greater than one, directories are scanned
+    ahead of time by a pool of that many threads, which helps on file
+    systems where each os.scandir() call has a high latency.  If it is 0,
+    os.process_cpu_count() threads are used.  The triples are generated in
+    the same order either way.
+
     Caution:  if you pass a relative pathname for top, don't change the
     current working directory between resumptions of walk.  walk never
     changes the current directory, and assumes that the client doesn't
@@ -355,6 +373,12 @@ def walk(top, topdown=True, onerror=None, followlinks=False):
     """
     sys.audit("os.walk", top, topdown, onerror, followlinks)
 
+    workers = _workers_count(workers)
+    if workers > 1:
+        yield from _walk_parallel(fspath(top), topdown, onerror,
+                                  followlinks, workers)
+        return
+
     stack = [fspath(top)]
     islink, join = path.islink, path.join
     while stack:
@@ -363,50 +387,13 @@ def walk(top, topdown=True, onerror=None, followlinks=False):
             yield top
             continue
 
-        dirs = []
-        nondirs = []
-        walk_dirs = []
-
         # We may not have read permission for top, in which case we can't
         # get a list of the files the directory contains.
         # We suppress the exception here, rather than blow up for a
         # minor reason when (say) a thousand readable directories are still
         # left to visit.
         try:
-            with scandir(top) as entries:
-                for entry in entries:
-                    try:
-                        if followlinks is _walk_symlinks_as_files:
-                            is_dir = entry.is_dir(follow_symlinks=False) and not entry.is_junction()
-                        else:
-                            is_dir = entry.is_dir()
-                    except OSError:
-                        # If is_dir() raises an OSError, consider the entry not to
-                        # be a directory, same behaviour as os.path.isdir().
-                        is_dir = False
-
-                    if is_dir:
-                        dirs.append(entry.name)
-                    else:
-                        nondirs.append(entry.name)
-
-                    if not topdown and is_dir:
-                        # Bottom-up: traverse into sub-directory, but exclude
-                        # symlinks to directories if followlinks is False
-                        if followlinks:
-                            walk_into = True
-                        else:
-                            try:
-                                is_symlink = entry.is_symlink()
-                            except OSError:
-                                # If is_symlink() raises an OSError, consider the
-                                # entry not to be a symbolic link, same behaviour
-                                # as os.path.islink().
-                                is_symlink = False
-                            walk_into = not is_symlink
-
-                        if walk_into:
-                            walk_dirs.append(entry.path)
+            dirs, nondirs, walk_dirs = _walk_scandir(top, topdown, followlinks)
         except OSError as error:
             if onerror is not None:
                 onerror(error)
@@ -431,6 +418,114 @@ def walk(top, topdown=True, onerror=None, followlinks=False):
             for new_path in reversed(walk_dirs):
                 stack.append(new_path)
 
+def _walk_scandir(top, topdown, followlinks, skip_link=False):
+    """Scan the directory top for walk().
+
+    Return the names of its subdirectories and of its other files, and when
+    going bottom up, the paths of the subdirectories to walk into.  Return
+    None instead if skip_link is true and top is a symbolic link.
+    """
+    if skip_link and path.islink(top):
+        return None
+    dirs = []
+    nondirs = []
+    walk_dirs = []
+    with scandir(top) as entries:
+        for entry in entries:
+            try:
+                if followlinks is _walk_symlinks_as_files:
+                    is_dir = entry.is_dir(follow_symlinks=False) and not entry.is_junction()
+                else:
+                    is_dir = entry.is_dir()
+            except OSError:
+                # If is_dir() raises an OSError, consider the entry not to
+                # be a directory, same behaviour as os.path.isdir().
+                is_dir = False
+
+            if is_dir:
+                dirs.append(entry.name)
+            else:
+                nondirs.append(entry.name)
+
+            if not topdown and is_dir:
+                # Bottom-up: traverse into sub-directory, but exclude
+                # symlinks to directories if followlinks is False
+                if followlinks:
+                    walk_into = True
+                else:
+                    try:
+                        is_symlink = entry.is_symlink()
+                    except OSError:
+                        # If is_symlink() raises an OSError, consider the
+                        # entry not to be a symbolic link, same behaviour
+                        # as os.path.islink().
+                        is_symlink = False
+                    walk_into = not is_symlink
+
+                if walk_into:
+                    walk_dirs.append(entry.path)
+    return dirs, nondirs, walk_dirs
+
+def _walk_parallel(top, topdown, onerror, followlinks, workers):
+    # walk() with the next 2*workers directories on the stack scanned ahead
+    # of time by a thread pool.  Results are only kept for directories on
+    # the stack, and at most 2*workers per level of the tree.  When going top
+    # down, the pool also does the os.path.islink() check of bpo-23605, which
+    # still happens after the parent directory has been yielded.
+    from concurrent.futures import ThreadPoolExecutor
+
+    skip_links = topdown and not followlinks
+    lookahead = 2 * workers
+    pending = {}
+    executor = ThreadPoolExecutor(workers, thread_name_prefix='os.walk')
+    try:
+        # The top directory is walked even if it is a symbolic link.
+        pending[top] = executor.submit(_walk_scandir, top, topdown,
+                                       followlinks)
+        stack = [top]
+        join = path.join
+        while stack:
+            top = stack.pop()
+            if isinstance(top, tuple):
+                yield top
+                continue
+
+            future = pending.pop(top, None)
+            if future is None:
+                future = executor.submit(_walk_scandir, top, topdown,
+                                         followlinks, skip_links)
+            ahead = 0
+            for new_path in reversed(stack):
+                if isinstance(new_path, tuple):
+                    continue
+                if ahead == lookahead:
+                    break
+                ahead += 1
+                if new_path not in pending:
+                    pending[new_path] = executor.submit(
+                        _walk_scandir, new_path, topdown, followlinks,
+                        skip_links)
+
+            try:
+                result = future.result()
+            except OSError as error:
+                if onerror is not None:
+                    onerror(error)
+                continue
+            if result is None:
+                continue
+            dirs, nondirs, walk_dirs = result
+
+            if topdown:
+                yield top, dirs, nondirs
+                for dirname in reversed(dirs):
+                    stack.append(join(top, dirname))
+            else:
+                stack.append((top, dirs, nondirs))
+                stack.extend(reversed(walk_dirs))
+    finally:
+        executor.shutdown(cancel_futures=True)
+
 __all__.append("walk")
 
 if {open, stat} <= supports_dir_fd and {scandir, stat} <= supports_fd:
@@ -7,12 +7,11 @@
 
 import io
 import ntpath
-import operator
 import os
 import posixpath
 import sys
 from errno import *
-from glob import _StringGlobber, _no_recurse_symlinks
+from glob import PatternSet, _StringGlobber, _no_recurse_symlinks
 from itertools import chain
 from stat import S_ISDIR, S_ISREG, S_ISSOCK, S_ISBLK, S_ISCHR, S_ISFIFO
 from _collections_abc import Sequence
@@ -47,6 +46,29 @@ class UnsupportedOperation(NotImplementedError):
     pass
 
 
+class _DirEntryGlobber(_StringGlobber):
+    """Provides shell-style pattern matching and globbing for Path.glob().
+
+    Paths found by scanning a directory are generated as os.DirEntry
+    objects, so that their status information can be reused; other paths
+    are generated as strings.
+    """
+
+    @staticmethod
+    def scandir(path):
+        # We must close the scandir() object before proceeding to
+        # avoid exhausting file descriptors when globbing deep trees.
+        with os.scandir(path) as scandir_it:
+            entries = list(scandir_it)
+        return ((entry, entry.name, entry) for entry in entries)
+
+    @staticmethod
+    def concat_path(path, text):
+        return os.fspath(path) + text
+
+    stringify_path = staticmethod(os.fspath)
+
+
 class _PathParents(Sequence):
     """This object provides sequence-like access to the logical ancestors
     of a path.  Don't try to construct it yourself."""
@@ -815,16 +837,21 @@ def write_text(self, data, encoding=None, errors=None, newline=None):
         with self.open(mode='w', encoding=encoding, errors=errors, newline=newline) as f:
             return f.write(data)
 
-    _remove_leading_dot = operator.itemgetter(slice(2, None))
-    _remove_trailing_slash = operator.itemgetter(slice(-1))
-
-    def _filter_trailing_slash(self, paths):
+    def _from_glob_results(self, paths, strip, last_part):
+        # Normalize the strings and directory entries generated by a globber.
         sep = self.parser.sep
         anchor_len = len(self.anchor)
-        for path_str in paths:
-            if len(path_str) > anchor_len and path_str[-1] == sep:
+        for path in paths:
+            if not isinstance(path, str):
+                yield self._from_dir_entry(path, path.path[strip:])
+                continue
+            path_str = path[strip:]
+            if last_part == '':
                 path_str = path_str[:-1]
-            yield path_str
+            elif last_part == '**':
+                if len(path_str) > anchor_len and path_str[-1] == sep:
+                    path_str = path_str[:-1]
+            yield self._from_parsed_string(path_str)
 
     def _from_dir_entry(self, dir_entry, path_str):
         path = self.with_segments(path_str)
@@ -846,7 +873,8 @@ def iterdir(self):
         else:
             return (self._from_dir_entry(e, e.path) for e in entries)
 
-    def glob(self, pattern, *, case_sensitive=None, recurse_symlinks=False):
+    def glob(self, pattern, *, case_sensitive=None, recurse_symlinks=False,
+             workers=None):
         """Iterate over this subtree and yield all existing files (of any
         kind, including directories) matching the given relative pattern.
         """
@@ -859,39 +887,53 @@ def glob(self, pattern, *, case_sensitive=None, recurse_symlinks=False):
             # know the case sensitivity of the underlying filesystem, so we
             # must use scandir() for everything, including non-wildcard parts.
             case_pedantic = True
-        parts = self._parse_pattern(pattern)
         recursive = True if recurse_symlinks else _no_recurse_symlinks
-        globber = _StringGlobber(self.parser.sep, case_sensitive, case_pedantic, recursive)
-        select = globber.selector(parts[::-1])
+        globber = _DirEntryGlobber(self.parser.sep, case_sensitive,
+                                   case_pedantic, recursive, workers)
+        if isinstance(pattern, PatternSet):
+            # Walk the tree once, matching all the patterns together.
+            pats = []
+            for pat in pattern.patterns:
+                parts = self._parse_pattern(pat)
+                if parts[-1] == '':
+                    raise ValueError(
+                        f"Unacceptable pattern in PatternSet: {pat!r}")
+                pats.append(self.parser.sep.join(parts))
+            select = globber.pattern_set_selector(tuple(pats))
+            last_part = '**'
+        else:
+            parts = self._parse_pattern(pattern)
+            select = globber.selector(parts[::-1])
+            last_part = parts[-1]
         root = str(self)
-        paths = select(self.parser.join(root, ''))
-
-        # Normalize results
-        if root == '.':
-            paths = map(self._remove_leading_dot, paths)
-        if parts[-1] == '':
-            paths = map(self._remove_trailing_slash, paths)
-        elif parts[-1] == '**':
-            paths = self._filter_trailing_slash(paths)
-        paths = map(self._from_parsed_string, paths)
-        return paths
-
-    def rglob(self, pattern, *, case_sensitive=None, recurse_symlinks=False):
+        paths = globber.run_selector(select, self.parser.join(root, ''))
+        return self._from_glob_results(paths, 2 if root == '.' else 0,
+                                       last_part)
+
+    def rglob(self, pattern, *, case_sensitive=None, recurse_symlinks=False,
+              workers=None):
         """Recursively yield all existing files (of any kind, including
         directories) matching the given relative pattern, anywhere in
         this subtree.
         """
         sys.audit("pathlib.Path.rglob", self, pattern)
-        pattern = self.parser.join('**', pattern)
-        return self.glob(pattern, case_sensitive=case_sensitive, recurse_symlinks=recurse_symlinks)
+        if isinstance(pattern, PatternSet):
+            pattern = PatternSet([self.parser.join('**', pat)
+                                  for pat in pattern.patterns])
+        else:
+            pattern = self.parser.join('**', pattern)
+        return self.glob(pattern, case_sensitive=case_sensitive,
+                         recurse_symlinks=recurse_symlinks, workers=workers)
 
-    def walk(self, top_down=True, on_error=None, follow_symlinks=False):
+    def walk(self, top_down=True, on_error=None, follow_symlinks=False, *,
+             workers=None):
         """Walk the directory tree from this directory, similar to os.walk()."""
         sys.audit("pathlib.Path.walk", self, on_error, follow_symlinks)
         root_dir = str(self)
         if not follow_symlinks:
             follow_symlinks = os._walk_symlinks_as_files
-        results = os.walk(root_dir, top_down, on_error, follow_symlinks)
+        results = os.walk(root_dir, top_down, on_error, follow_symlinks,
+                          workers=workers)
         for path_str, dirnames, filenames in results:
             if root_dir == '.':
                 path_str = path_str[2:]
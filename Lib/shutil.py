@@ -57,6 +57,8 @@
 _USE_CP_SENDFILE = (hasattr(os, "sendfile")
                     and sys.platform.startswith(("linux", "android", "sunos")))
 _USE_CP_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+# FICLONE is only tried on Linux; fcntl is imported on first use.
+_USE_CP_CLONE = sys.platform == "linux"
 _HAS_FCOPYFILE = posix and hasattr(posix, "_fcopyfile")  # macOS
 
 # CMD defaults in Windows 10
@@ -226,6 +228,43 @@ def _fastcopy_sendfile(fsrc, fdst):
                 break  # EOF
             offset += sent
 
+def _fastcopy_clone(fsrc, fdst):
+    """Make fdst share the data blocks of fsrc by using the FICLONE
+    ioctl(2) (reflink), which copies no data at all.
+
+    This works on Linux with file systems supporting reflinks, such as
+    Btrfs, XFS or OCFS2, when both files are on the same file system.
+    """
+    global _USE_CP_CLONE
+    try:
+        infd = fsrc.fileno()
+        outfd = fdst.fileno()
+    except Exception as err:
+        raise _GiveupOnFastCopy(err)  # not a regular file
+
+    try:
+        import fcntl
+        FICLONE = fcntl.FICLONE
+    except (ImportError, AttributeError) as err:
+        _USE_CP_CLONE = False
+        raise _GiveupOnFastCopy(err)
+    try:
+        fcntl.ioctl(outfd, FICLONE, infd)
+    except OSError as err:
+        # ...in order to have a more informative exception.
+        err.filename = fsrc.name
+        err.filename2 = fdst.name
+        # The file system or the pair of files does not support cloning
+        # (for example they are on different file systems).
+        if err.errno in _CLONE_UNSUPPORTED_ERRNOS:
+            raise _GiveupOnFastCopy(err)
+        raise err from None
+
+_CLONE_UNSUPPORTED_ERRNOS = frozenset({
+    errno.EBADF, errno.EINVAL, errno.ENOSYS, errno.ENOTTY, errno.EOPNOTSUPP,
+    errno.ENOTSUP, errno.EXDEV, errno.EPERM,
+})
+
 def _copyfileobj_readinto(fsrc, fdst, length=COPY_BUFSIZE):
     """readinto()/memoryview() based variant of copyfileobj().
     *fsrc* must support readinto() method and both files must be
@@ -280,15 +319,84 @@ def _stat(fn):
 def _islink(fn):
     return fn.is_symlink() if isinstance(fn, os.DirEntry) else os.path.islink(fn)
 
-def copyfile(src, dst, *, follow_symlinks=True):
+_COPY_STRATEGIES = frozenset({'auto', 'clone', 'fastcopy', 'readwrite'})
+
+def _copyfile_data(fsrc, fdst, copy_strategy, file_size):
+    # Copy the data of fsrc to fdst and return the name of the method used.
+    if copy_strategy == 'clone':
+        if not _USE_CP_CLONE:
+            raise OSError(errno.EOPNOTSUPP,
+                          'cloning files is not supported on this platform',
+                          fsrc.name, None, fdst.name)
+        try:
+            _fastcopy_clone(fsrc, fdst)
+        except _GiveupOnFastCopy as err:
+            if err.args and isinstance(err.args[0], OSError):
+                raise err.args[0] from None
+            raise OSError(errno.EOPNOTSUPP, 'cannot clone file',
+                          fsrc.name, None, fdst.name) from None
+        return 'clone'
+    if copy_strategy == 'auto' and _USE_CP_CLONE:
+        try:
+            _fastcopy_clone(fsrc, fdst)
+            return 'clone'
+        except _GiveupOnFastCopy:
+            pass
+    if copy_strategy != 'readwrite':
+        # macOS
+        if _HAS_FCOPYFILE:
+            try:
+                _fastcopy_fcopyfile(fsrc, fdst, posix._COPYFILE_DATA)
+                return 'fcopyfile'
+            except _GiveupOnFastCopy:
+                pass
+        # Linux / Android / Solaris
+        elif _USE_CP_SENDFILE or _USE_CP_COPY_FILE_RANGE:
+            # reflink may be implicit in copy_file_range.
+            if _USE_CP_COPY_FILE_RANGE:
+                try:
+                    _fastcopy_copy_file_range(fsrc, fdst)
+                    return 'copy_file_range'
+                except _GiveupOnFastCopy:
+                    pass
+            if _USE_CP_SENDFILE:
+                try:
+                    _fastcopy_sendfile(fsrc, fdst)
+                    return 'sendfile'
+                except _GiveupOnFastCopy:
+                    pass
+    # Windows, see:
+    # https://github.com/python/cpython/pull/7160#discussion_r195405230
+    if _WINDOWS and file_size > 0:
+        _copyfileobj_readinto(fsrc, fdst, min(file_size, COPY_BUFSIZE))
+        return 'readinto'
+
+    copyfileobj(fsrc, fdst)
+    return 'read'
+
+def copyfile(src, dst, *, follow_symlinks=True, copy_strategy='auto',
+             report_strategy=None):
     """Copy data from src to dst in the most efficient way possible.
 
     If follow_symlinks is not set and src is a symbolic link, a new
     symlink will be created instead of copying the file it points to.
 
+    copy_strategy selects how the data is copied: 'auto' (the default)
+    tries to clone the file, then the platform fast-copy system calls, then
+    read() and write(); 'clone' only clones the file and raises OSError if
+    that is not possible; 'fastcopy' does not try to clone; and 'readwrite'
+    only uses read() and write().
+
+    If report_strategy is given, it is called with the name of the method
+    that copied the data: 'clone', 'fcopyfile', 'copy_file_range',
+    'sendfile', 'readinto', 'read' or 'symlink'.
+
     """
     sys.audit("shutil.copyfile", src, dst)
 
+    if copy_strategy not in _COPY_STRATEGIES:
+        raise ValueError(f"invalid copy_strategy: {copy_strategy!r}")
+
     if _samefile(src, dst):
         raise SameFileError("{!r} and {!r} are the same file".format(src, dst))
 
@@ -309,39 +417,13 @@ def copyfile(src, dst, *, follow_symlinks=True):
 
     if not follow_symlinks and _islink(src):
         os.symlink(os.readlink(src), dst)
+        strategy = 'symlink'
     else:
         with open(src, 'rb') as fsrc:
             try:
                 with open(dst, 'wb') as fdst:
-                    # macOS
-                    if _HAS_FCOPYFILE:
-                        try:
-                            _fastcopy_fcopyfile(fsrc, fdst, posix._COPYFILE_DATA)
-                            return dst
-                        except _GiveupOnFastCopy:
-                            pass
-                    # Linux / Android / Solaris
-                    elif _USE_CP_SENDFILE or _USE_CP_COPY_FILE_RANGE:
-                        # reflink may be implicit in copy_file_range.
-                        if _USE_CP_COPY_FILE_RANGE:
-                            try:
-                                _fastcopy_copy_file_range(fsrc, fdst)
-                                return dst
-                            except _GiveupOnFastCopy:
-                                pass
-                        if _USE_CP_SENDFILE:
-                            try:
-                                _fastcopy_sendfile(fsrc, fdst)
-                                return dst
-                            except _GiveupOnFastCopy:
-                                pass
-                    # Windows, see:
-                    # https://github.com/python/cpython/pull/7160#discussion_r195405230
-                    elif _WINDOWS and file_size > 0:
-                        _copyfileobj_readinto(fsrc, fdst, min(file_size, COPY_BUFSIZE))
-                        return dst
-
-                    copyfileobj(fsrc, fdst)
+                    strategy = _copyfile_data(fsrc, fdst, copy_strategy,
+                                              file_size)
 
             # Issue 43219, raise a less confusing exception
             except IsADirectoryError as e:
@@ -350,6 +432,8 @@ def copyfile(src, dst, *, follow_symlinks=True):
                 else:
                     raise
 
+    if report_strategy is not None:
+        report_strategy(strategy)
     return dst
 
 def copymode(src, dst, *, follow_symlinks=True):
@@ -472,7 +556,8 @@ def lookup(name):
             else:
                 raise
 
-def copy(src, dst, *, follow_symlinks=True):
+def copy(src, dst, *, follow_symlinks=True, copy_strategy='auto',
+         report_strategy=None):
     """Copy data and mode bits ("cp src dst"). Return the file's destination.
 
     The destination may be a directory.
@@ -483,14 +568,18 @@ def copy(src, dst, *, follow_symlinks=True):
     If source and destination are the same file, a SameFileError will be
     raised.
 
+    copy_strategy and report_strategy are passed to copyfile().
+
     """
     if os.path.isdir(dst):
         dst = os.path.join(dst, os.path.basename(src))
-    copyfile(src, dst, follow_symlinks=follow_symlinks)
+    copyfile(src, dst, follow_symlinks=follow_symlinks,
+             copy_strategy=copy_strategy, report_strategy=report_strategy)
     copymode(src, dst, follow_symlinks=follow_symlinks)
     return dst
 
-def copy2(src, dst, *, follow_symlinks=True):
+def copy2(src, dst, *, follow_symlinks=True, copy_strategy='auto',
+          report_strategy=None):
     """Copy data and metadata. Return the file's destination.
 
     Metadata is copied with copystat(). Please see the copystat function
@@ -500,11 +589,14 @@ def copy2(src, dst, *, follow_symlinks=True):
 
     If follow_symlinks is false, symlinks won't be followed. This
     resembles GNU's "cp -P src dst".
+
+    copy_strategy and report_strategy are passed to copyfile().
     """
     if os.path.isdir(dst):
         dst = os.path.join(dst, os.path.basename(src))
 
-    if hasattr(_winapi, "CopyFile2"):
+    if (hasattr(_winapi, "CopyFile2")
+            and copy_strategy in ('auto', 'fastcopy')):
         src_ = os.fsdecode(src)
         dst_ = os.fsdecode(dst)
         flags = _winapi.COPY_FILE_ALLOW_DECRYPTED_DESTINATION # for compat
@@ -512,6 +604,8 @@ def copy2(src, dst, *, follow_symlinks=True):
             flags |= _winapi.COPY_FILE_COPY_SYMLINK
         try:
             _winapi.CopyFile2(src_, dst_, flags)
+            if report_strategy is not None:
+                report_strategy('CopyFile2')
             return dst
         except OSError as exc:
             if (exc.winerror == _winapi.ERROR_PRIVILEGE_NOT_HELD
@@ -526,7 +620,8 @@ def copy2(src, dst, *, follow_symlinks=True):
             else:
                 raise
 
-    copyfile(src, dst, follow_symlinks=follow_symlinks)
+    copyfile(src, dst, follow_symlinks=follow_symlinks,
+             copy_strategy=copy_strategy, report_strategy=report_strategy)
     copystat(src, dst, follow_symlinks=follow_symlinks)
     return dst
 
@@ -535,15 +630,110 @@ def ignore_patterns(*patterns):
 
     Patterns is a sequence of glob-style patterns
     that are used to exclude files"""
+    # All the patterns are matched at once.
+    match = fnmatch.compile_many([os.path.normcase(pattern)
+                                  for pattern in patterns])
+    normcase = os.path.normcase
     def _ignore_patterns(path, names):
-        ignored_names = []
-        for pattern in patterns:
-            ignored_names.extend(fnmatch.filter(names, pattern))
-        return set(ignored_names)
+        return {name for name in names if match(normcase(name)) is not None}
     return _ignore_patterns
 
+def _copytree_copystat(src, dst, errors):
+    try:
+        copystat(src, dst)
+    except OSError as why:
+        # Copying file access times may fail on Windows
+        if getattr(why, 'winerror', None) is None:
+            errors.append((src, dst, str(why)))
+
+def _copytree_copy(copy_function, srcobj, srcname, dstname):
+    # Copy a file for _CopytreeJobs, returning the errors instead of raising.
+    try:
+        copy_function(srcobj, dstname)
+    except Error as err:
+        return err.args[0]
+    except OSError as why:
+        return [(srcname, dstname, str(why))]
+    return None
+
+class _CopytreeDir:
+    __slots__ = ('src', 'dst', 'items', 'errors')
+
+    def __init__(self, src, dst, items):
+        self.src = src
+        self.dst = dst
+        # Errors, futures of file copies and _CopytreeDir of subdirectories,
+        # in the order of the entries of the directory.
+        self.items = items
+        self.errors = None
+
+class _CopytreeJobs:
+    """Copies the files of a copytree() call in a pool of threads.
+
+    The tree is walked in the calling thread.  The attributes of a directory
+    are copied once everything below it was copied, subdirectories before
+    their parents, as when copying serially.
+    """
+
+    def __init__(self, workers):
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(workers,
+                                            thread_name_prefix='shutil.copytree')
+        self._max_pending = 2 * workers
+        self._pending = collections.deque()     # Futures of file copies
+        self._dirs = collections.deque()        # Directories to finish
+
+    def copytree(self, src, dst, *args):
+        sys.audit("shutil.copytree", src, dst)
+        with os.scandir(src) as itr:
+            entries = list(itr)
+        return _copytree(entries, src, dst, *args, jobs=self)
+
+    def copy(self, copy_function, srcobj, srcname, dstname):
+        # Bound the number of copies waiting for a thread.
+        pending = self._pending
+        while len(pending) >= self._max_pending:
+            pending.popleft().exception()
+        future = self._executor.submit(_copytree_copy, copy_function,
+                                       srcobj, srcname, dstname)
+        pending.append(future)
+        return future
+
+    def add_dir(self, src, dst, items):
+        d = _CopytreeDir(src, dst, items)
+        self._dirs.append(d)
+        # The oldest directories are the most likely to have been copied
+        # already; finishing them releases their futures.
+        while len(self._dirs) > self._max_pending:
+            self._finish(self._dirs.popleft())
+        return d
+
+    def _finish(self, d):
+        errors = []
+        for item in d.items:
+            if isinstance(item, tuple):
+                errors.append(item)
+            elif isinstance(item, _CopytreeDir):
+                errors.extend(item.errors)
+            else:
+                result = item.result()
+                if result:
+                    errors.extend(result)
+        _copytree_copystat(d.src, d.dst, errors)
+        d.items = None
+        d.errors = errors
+
+    def finish(self, top):
+        """Wait for all copies and return the errors of the tree."""
+        while self._dirs:
+            self._finish(self._dirs.popleft())
+        return top.errors
+
+    def shutdown(self):
+        self._executor.shutdown(cancel_futures=True)
+
 def _copytree(entries, src, dst, symlinks, ignore, copy_function,
-              ignore_dangling_symlinks, dirs_exist_ok=False):
+              ignore_dangling_symlinks, dirs_exist_ok=False, jobs=None):
     if ignore is not None:
         ignored_names = ignore(os.fspath(src), [x.name for x in entries])
     else:
@@ -581,35 +771,51 @@ def _copytree(entries, src, dst, symlinks, ignore, copy_function,
                         continue
                     # otherwise let the copy occur. copy2 will raise an error
                     if srcentry.is_dir():
-                        copytree(srcobj, dstname, symlinks, ignore,
-                                 copy_function, ignore_dangling_symlinks,
-                                 dirs_exist_ok)
-                    else:
+                        if jobs is None:
+                            copytree(srcobj, dstname, symlinks, ignore,
+                                     copy_function, ignore_dangling_symlinks,
+                                     dirs_exist_ok)
+                        else:
+                            errors.append(jobs.copytree(
+                                srcobj, dstname, symlinks, ignore,
+                                copy_function, ignore_dangling_symlinks,
+                                dirs_exist_ok))
+                    elif jobs is None:
                         copy_function(srcobj, dstname)
+                    else:
+                        errors.append(jobs.copy(copy_function, srcobj,
+                                                srcname, dstname))
             elif srcentry.is_dir():
-                copytree(srcobj, dstname, symlinks, ignore, copy_function,
-                         ignore_dangling_symlinks, dirs_exist_ok)
-            else:
+                if jobs is None:
+                    copytree(srcobj, dstname, symlinks, ignore, copy_function,
+                             ignore_dangling_symlinks, dirs_exist_ok)
+                else:
+                    errors.append(jobs.copytree(
+                        srcobj, dstname, symlinks, ignore, copy_function,
+                        ignore_dangling_symlinks, dirs_exist_ok))
+            elif jobs is None:
                 # Will raise a SpecialFileError for unsupported file types
                 copy_function(srcobj, dstname)
+            else:
+                errors.append(jobs.copy(copy_function, srcobj, srcname,
+                                        dstname))
         # catch the Error from the recursive copytree so that we can
         # continue with other files
         except Error as err:
             errors.extend(err.args[0])
         except OSError as why:
             errors.append((srcname, dstname, str(why)))
-    try:
-        copystat(src, dst)
-    except OSError as why:
-        # Copying file access times may fail on Windows
-        if getattr(why, 'winerror', None) is None:
-            errors.append((src, dst, str(why)))
+    if jobs is not None:
+        # The attributes are copied once the files are.
+        return jobs.add_dir(src, dst, errors)
+    _copytree_copystat(src, dst, errors)
     if errors:
         raise Error(errors)
     return dst
 
 def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
-             ignore_dangling_symlinks=False, dirs_exist_ok=False):
+             ignore_dangling_symlinks=False, dirs_exist_ok=False, *,
+             workers=None):
     """Recursively copy a directory tree and return the destination directory.
 
     If exception(s) occur, an Error is raised with a list of reasons.
@@ -647,7 +853,23 @@ def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
     operation will continue if it encounters existing directories, and files
     within the `dst` tree will be overwritten by corresponding files from the
     `src` tree.
+
+    If workers is greater than one, files are copied by a pool of that many
+    threads, with copy_function called from these threads.  If it is 0,
+    os.process_cpu_count() threads are used.
     """
+    workers = os._workers_count(workers)
+    if workers > 1:
+        jobs = _CopytreeJobs(workers)
+        try:
+            top = jobs.copytree(src, dst, symlinks, ignore, copy_function,
+                                ignore_dangling_symlinks, dirs_exist_ok)
+            errors = jobs.finish(top)
+        finally:
+            jobs.shutdown()
+        if errors:
+            raise Error(errors)
+        return dst
     sys.audit("shutil.copytree", src, dst)
     with os.scandir(src) as itr:
         entries = list(itr)
@@ -666,7 +888,7 @@ def _rmtree_islink(st):
         return stat.S_ISLNK(st.st_mode)
 
 # version vulnerable to race conditions
-def _rmtree_unsafe(path, dir_fd, onexc):
+def _rmtree_unsafe(path, dir_fd, onexc, workers=1):
     if dir_fd is not None:
         raise NotImplementedError("dir_fd unavailable on this platform")
     try:
@@ -685,16 +907,47 @@ def _rmtree_unsafe(path, dir_fd, onexc):
     def onerror(err):
         if not isinstance(err, FileNotFoundError):
             onexc(os.scandir, err.filename, err)
-    results = os.walk(path, topdown=False, onerror=onerror, followlinks=os._walk_symlinks_as_files)
+    if workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(workers, thread_name_prefix='shutil.rmtree')
+        try:
+            _rmtree_unsafe_walk(path, onerror, onexc, executor, workers)
+        finally:
+            executor.shutdown(cancel_futures=True)
+    else:
+        _rmtree_unsafe_walk(path, onerror, onexc)
+    try:
+        os.rmdir(path)
+    except FileNotFoundError:
+        pass
+    except OSError as err:
+        onexc(os.rmdir, path, err)
+
+def _rmtree_unsafe_walk(path, onerror, onexc, executor=None, workers=None):
+    # With an executor, files are unlinked concurrently, and pending maps
+    # each directory to the unlinks to wait for before removing it.
+    pending = {}
+    if executor is not None:
+        queued = collections.deque(maxlen=2 * workers)
+    results = os.walk(path, topdown=False, onerror=onerror,
+                      followlinks=os._walk_symlinks_as_files, workers=workers)
     for dirpath, dirnames, filenames in results:
         for name in dirnames:
             fullname = os.path.join(dirpath, name)
+            _rmtree_wait(pending.pop(fullname, ()), onexc)
             try:
                 os.rmdir(fullname)
             except FileNotFoundError:
                 continue
             except OSError as err:
                 onexc(os.rmdir, fullname, err)
+        if executor is not None and filenames:
+            unlinks = pending[dirpath] = []
+            for name in filenames:
+                fullname = os.path.join(dirpath, name)
+                future = _rmtree_submit(executor, queued, os.unlink, fullname)
+                unlinks.append((future, fullname))
+            continue
         for name in filenames:
             fullname = os.path.join(dirpath, name)
             try:
@@ -703,23 +956,50 @@ def onerror(err):
                 continue
             except OSError as err:
                 onexc(os.unlink, fullname, err)
-    try:
-        os.rmdir(path)
-    except FileNotFoundError:
-        pass
-    except OSError as err:
-        onexc(os.rmdir, path, err)
+    for unlinks in pending.values():
+        _rmtree_wait(unlinks, onexc)
+
+def _rmtree_submit(executor, queued, func, *args, **kwargs):
+    # Bound the number of unlinks waiting for a thread, like copytree() does
+    # with copies: wait for the oldest when the queued deque is full.
+    if len(queued) == queued.maxlen:
+        queued.popleft().exception()
+    future = executor.submit(func, *args, **kwargs)
+    queued.append(future)
+    return future
+
+def _rmtree_wait(unlinks, onexc):
+    # Wait for the unlinks submitted for a directory and report their errors.
+    for future, fullname in unlinks:
+        try:
+            future.result()
+        except FileNotFoundError:
+            continue
+        except OSError as err:
+            onexc(os.unlink, fullname, err)
 
 # Version using fd-based APIs to protect against races
-def _rmtree_safe_fd(path, dir_fd, onexc):
+def _rmtree_safe_fd(path, dir_fd, onexc, workers=1):
     # While the unsafe rmtree works fine on bytes, the fd based does not.
     if isinstance(path, bytes):
         path = os.fsdecode(path)
     stack = [(os.lstat, dir_fd, path, None)]
+    executor = None
+    # Maps the file descriptors of directories to the unlinks in them still
+    # running in the executor; they are waited for before closing the fd.
+    pending = {}
+    queued = collections.deque(maxlen=2 * workers)
     try:
+        if workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor(workers,
+                                          thread_name_prefix='shutil.rmtree')
         while stack:
-            _rmtree_safe_fd_step(stack, onexc)
+            _rmtree_safe_fd_step(stack, onexc, executor, pending, queued)
     finally:
+        if executor is not None:
+            # Wait for the unlinks before their directory fds are closed.
+            executor.shutdown(cancel_futures=True)
         # Close any file descriptors still on the stack.
         while stack:
             func, fd, path, entry = stack.pop()
@@ -730,7 +1010,8 @@ def _rmtree_safe_fd(path, dir_fd, onexc):
             except OSError as err:
                 onexc(os.close, path, err)
 
-def _rmtree_safe_fd_step(stack, onexc):
+def _rmtree_safe_fd_step(stack, onexc, executor=None, pending=None,
+                         queued=None):
     # Each stack item has four elements:
     # * func: The first operation to perform: os.lstat, os.close or os.rmdir.
     #   Walking a directory starts with an os.lstat() to detect symlinks; in
@@ -747,7 +1028,11 @@ def _rmtree_safe_fd_step(stack, onexc):
     name = path if orig_entry is None else orig_entry.name
     try:
         if func is os.close:
-            os.close(dirfd)
+            try:
+                if pending:
+                    _rmtree_wait(pending.pop(dirfd, ()), onexc)
+            finally:
+                os.close(dirfd)
             return
         if func is os.rmdir:
             os.rmdir(name, dir_fd=dirfd)
@@ -787,6 +1072,12 @@ def _rmtree_safe_fd_step(stack, onexc):
                 continue
             except OSError:
                 pass
+            if executor is not None:
+                # The unlink is relative to topfd, like in the serial case.
+                future = _rmtree_submit(executor, queued, os.unlink,
+                                        entry.name, dir_fd=topfd)
+                pending.setdefault(topfd, []).append((future, fullname))
+                continue
             try:
                 os.unlink(entry.name, dir_fd=topfd)
             except FileNotFoundError:
@@ -807,7 +1098,8 @@ def _rmtree_safe_fd_step(stack, onexc):
                      os.stat in os.supports_follow_symlinks)
 _rmtree_impl = _rmtree_safe_fd if _use_fd_functions else _rmtree_unsafe
 
-def rmtree(path, ignore_errors=False, onerror=None, *, onexc=None, dir_fd=None):
+def rmtree(path, ignore_errors=False, onerror=None, *, onexc=None, dir_fd=None,
+           workers=None):
     """Recursively delete a directory tree.
 
     If dir_fd is not None, it should be a file descriptor open to a directory;
@@ -826,6 +1118,9 @@ def rmtree(path, ignore_errors=False, onerror=None, *, onexc=None, dir_fd=None):
 
     onerror is deprecated and only remains for backwards compatibility.
     If both onerror and onexc are set, onerror is ignored and onexc is used.
+
+    If workers is greater than one, files are removed by a pool of that many
+    threads.  If it is 0, os.process_cpu_count() threads are used.
     """
 
     sys.audit("shutil.rmtree", path, dir_fd)
@@ -849,7 +1144,7 @@ def onexc(*args):
                     exc_info = type(exc), exc, exc.__traceback__
                 return onerror(func, path, exc_info)
 
-    _rmtree_impl(path, dir_fd, onexc)
+    _rmtree_impl(path, dir_fd, onexc, os._workers_count(workers))
 
 # Allow introspection of whether or not the hardening against symlink
 # attacks is supported on the current platform
@@ -45,6 +45,7 @@
 import struct
 import copy
 import re
+import marshal
 
 try:
     import pwd
@@ -142,6 +143,23 @@
     "size": int
 }
 
+# Regular files up to this size are read into memory and written by a worker
+# thread when extracting with TarFile.extractall(workers=...).
+_PIPELINE_MAX_SIZE = 4 * 1024 * 1024
+
+# Format of the index cache files, see TarFile(index_cache=...).
+_INDEX_CACHE_VERSION = 1
+# The TarInfo attributes stored in the index cache.
+_INDEX_CACHE_FIELDS = ("name", "mode", "uid", "gid", "size", "mtime",
+                       "chksum", "type", "linkname", "uname", "gname",
+                       "devmajor", "devminor", "offset", "offset_data",
+                       "pax_headers", "sparse")
+# The types of the TarInfo attributes stored in the index cache.
+_INDEX_CACHE_TYPES = (str, int, int, int, int, (int, float),
+                      int, bytes, str, str, str,
+                      int, int, int, int,
+                      dict, (list, type(None)))
+
 #---------------------------------------------------------
 # initialization
 #---------------------------------------------------------
@@ -1675,6 +1693,30 @@ def isdev(self):
         return self.type in (CHRTYPE, BLKTYPE, FIFOTYPE)
 # class TarInfo
 
+def _valid_index_record(record):
+    """Return True if record has the types and values of a record written to
+       the index cache by TarFile._index_record().
+    """
+    if type(record) is not tuple or len(record) != len(_INDEX_CACHE_TYPES):
+        return False
+    if not all(isinstance(value, types) and type(value) is not bool
+               for value, types in zip(record, _INDEX_CACHE_TYPES)):
+        return False
+    (name, mode, uid, gid, size, mtime, chksum, type_, linkname, uname, gname,
+     devmajor, devminor, offset, offset_data, pax_headers, sparse) = record
+    if size < 0 or offset < 0 or offset_data < offset or len(type_) != 1:
+        return False
+    if not all(type(k) is str and type(v) is str
+               for k, v in pax_headers.items()):
+        return False
+    if sparse is not None:
+        for block in sparse:
+            if (type(block) is not tuple or len(block) != 2
+                or not all(type(n) is int and n >= 0 for n in block)):
+                return False
+    return True
+
+
 class TarFile(object):
     """The TarFile Class provides an interface to tar archives.
     """
@@ -1706,7 +1748,8 @@ class TarFile(object):
     def __init__(self, name=None, mode="r", fileobj=None, format=None,
             tarinfo=None, dereference=None, ignore_zeros=None, encoding=None,
             errors="surrogateescape", pax_headers=None, debug=None,
-            errorlevel=None, copybufsize=None, stream=False):
+            errorlevel=None, copybufsize=None, stream=False,
+            index_cache=None):
         """Open an (uncompressed) tar archive 'name'. 'mode' is either 'r' to
            read from an existing archive, 'a' to append data to an existing
            file or 'w' to create a new file overwriting an existing one. 'mode'
@@ -1714,10 +1757,20 @@ def __init__(self, name=None, mode="r", fileobj=None, format=None,
            If 'fileobj' is given, it is used for reading or writing data. If it
            can be determined, 'mode' is overridden by 'fileobj's mode.
            'fileobj' is not closed, when TarFile is closed.
+           If 'index_cache' is given, it is the path of a file in which the
+           list of members is stored once read, so that opening the
+           unchanged archive again does not need to scan it.
         """
         modes = {"r": "rb", "a": "r+b", "w": "wb", "x": "xb"}
         if mode not in modes:
             raise ValueError("mode must be 'r', 'a', 'w' or 'x'")
+        if index_cache is not None:
+            if mode != "r":
+                raise ValueError(
+                    "index_cache is only supported for reading archives")
+            if stream or isinstance(fileobj, _Stream):
+                raise ValueError("index_cache is not supported for streams")
+            index_cache = os.fspath(index_cache)
         self.mode = mode
         self._mode = modes[mode]
 
@@ -1774,11 +1827,19 @@ def __init__(self, name=None, mode="r", fileobj=None, format=None,
                                 # archive members already added
         self._unames = {}       # Cached mappings of uid -> uname
         self._gnames = {}       # Cached mappings of gid -> gname
+        self._names = {}        # Mapping of member names -> members
+        self._names_count = 0   # number of members in _names
+        self._index_cache = index_cache
+        self._index_cache_key = None
+        self._index_records = []
 
         try:
             if self.mode == "r":
                 self.firstmember = None
-                self.firstmember = self.next()
+                if index_cache is not None:
+                    self._index_cache_key = self._get_index_cache_key()
+                if not self._read_index_cache():
+                    self.firstmember = self.next()
 
             if self.mode == "a":
                 # Move to the end of the archive,
@@ -2366,7 +2427,7 @@ def _get_filter_function(self, filter):
             raise ValueError(f"filter {filter!r} not found") from None
 
     def extractall(self, path=".", members=None, *, numeric_owner=False,
-                   filter=None):
+                   filter=None, workers=None):
         """Extract all members from the archive to the current working
            directory and set owner, modification time and permissions on
            directories afterwards. 'path' specifies a different directory
@@ -2378,24 +2439,35 @@ def extractall(self, path=".", members=None, *, numeric_owner=False,
            before extraction.
            It can return a changed TarInfo or None to skip the member.
            String names of common filters are accepted.
+
+           If 'workers' is greater than 1, regular files are written by
+           that many threads while the archive is read; 0 means one thread
+           per usable CPU.
         """
+        workers = os._workers_count(workers)
         directories = []
 
         filter_function = self._get_filter_function(filter)
         if members is None:
             members = self
 
-        for member in members:
-            tarinfo = self._get_extract_tarinfo(member, filter_function, path)
-            if tarinfo is None:
-                continue
-            if tarinfo.isdir():
-                # For directories, delay setting attributes until later,
-                # since permissions can interfere with extraction and
-                # extracting contents can reset mtime.
-                directories.append(tarinfo)
-            self._extract_one(tarinfo, path, set_attrs=not tarinfo.isdir(),
-                              numeric_owner=numeric_owner)
+        if workers > 1:
+            self._extract_pipelined(members, path, filter_function,
+                                    numeric_owner, workers, directories)
+        else:
+            for member in members:
+                tarinfo = self._get_extract_tarinfo(member, filter_function,
+                                                    path)
+                if tarinfo is None:
+                    continue
+                if tarinfo.isdir():
+                    # For directories, delay setting attributes until later,
+                    # since permissions can interfere with extraction and
+                    # extracting contents can reset mtime.
+                    directories.append(tarinfo)
+                self._extract_one(tarinfo, path,
+                                  set_attrs=not tarinfo.isdir(),
+                                  numeric_owner=numeric_owner)
 
         # Reverse sort directories.
         directories.sort(key=lambda a: a.name, reverse=True)
@@ -2410,6 +2482,67 @@ def extractall(self, path=".", members=None, *, numeric_owner=False,
             except ExtractError as e:
                 self._handle_nonfatal_error(e)
 
+    def _extract_pipelined(self, members, path, filter_function,
+                           numeric_owner, workers, directories):
+        """Extract members like extractall() does, with a pool of threads
+           writing the regular files. This thread reads the archive and
+           calls the filter in archive order, and extracts the other members.
+        """
+        # Regular files are only buffered if reading them is not customized.
+        buffer_files = type(self).makefile is TarFile.makefile
+        # Normalized target path -> future of the buffered file.  Different
+        # names of the same file, such as "x" and "./x", share a key.
+        pending = {}
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(workers) as executor:
+            try:
+                for member in members:
+                    tarinfo = self._get_extract_tarinfo(member,
+                                                        filter_function, path)
+                    if tarinfo is None:
+                        continue
+                    targetpath = os.path.normcase(os.path.normpath(
+                        os.path.join(path, tarinfo.name)))
+                    # A file written concurrently must be complete before
+                    # it is replaced.
+                    if targetpath in pending:
+                        pending.pop(targetpath).result()
+                    if (buffer_files and tarinfo.isreg()
+                            and tarinfo.sparse is None
+                            and tarinfo.size <= _PIPELINE_MAX_SIZE):
+                        data = self._read_data(tarinfo)
+                        # Bound the memory used by the buffered files.
+                        while len(pending) >= 2 * workers:
+                            pending.pop(next(iter(pending))).result()
+                        pending[targetpath] = executor.submit(
+                            self._extract_one, tarinfo, path, True,
+                            numeric_owner, data=data)
+                        continue
+                    if tarinfo.islnk() or tarinfo.issym():
+                        # Links can point to the pending files, or make
+                        # later members be written elsewhere.
+                        while pending:
+                            pending.pop(next(iter(pending))).result()
+                    if tarinfo.isdir():
+                        directories.append(tarinfo)
+                    self._extract_one(tarinfo, path,
+                                      set_attrs=not tarinfo.isdir(),
+                                      numeric_owner=numeric_owner)
+                while pending:
+                    pending.pop(next(iter(pending))).result()
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+
+    def _read_data(self, tarinfo):
+        """Return the data of the regular file tarinfo.
+        """
+        self.fileobj.seek(tarinfo.offset_data)
+        data = self.fileobj.read(tarinfo.size)
+        if len(data) < tarinfo.size:
+            raise ReadError("unexpected end of data")
+        return data
+
     def extract(self, member, path="", set_attrs=True, *, numeric_owner=False,
                 filter=None):
         """Extract a member from the archive to the current working directory,
@@ -2452,14 +2585,15 @@ def _get_extract_tarinfo(self, member, filter_function, path):
             tarinfo._link_target = os.path.join(path, tarinfo.linkname)
         return tarinfo
 
-    def _extract_one(self, tarinfo, path, set_attrs, numeric_owner):
+    def _extract_one(self, tarinfo, path, set_attrs, numeric_owner,
+                     data=None):
         """Extract from filtered tarinfo to disk"""
         self._check("r")
 
         try:
             self._extract_member(tarinfo, os.path.join(path, tarinfo.name),
                                  set_attrs=set_attrs,
-                                 numeric_owner=numeric_owner)
+                                 numeric_owner=numeric_owner, data=data)
         except (OSError, UnicodeEncodeError) as e:
             self._handle_fatal_error(e)
         except ExtractError as e:
@@ -2517,9 +2651,10 @@ def extractfile(self, member):
             return None
 
     def _extract_member(self, tarinfo, targetpath, set_attrs=True,
-                        numeric_owner=False):
+                        numeric_owner=False, data=None):
         """Extract the TarInfo object tarinfo to a physical
-           file called targetpath.
+           file called targetpath. If data is given, it is the content
+           of the regular file tarinfo, already read from the archive.
         """
         # Fetch the TarInfo object for the given name
         # and build the destination pathname, replacing
@@ -2539,7 +2674,10 @@ def _extract_member(self, tarinfo, targetpath, set_attrs=True,
         else:
             self._dbg(1, tarinfo.name)
 
-        if tarinfo.isreg():
+        if data is not None:
+            with bltn_open(targetpath, "wb") as target:
+                target.write(data)
+        elif tarinfo.isreg():
             self.makefile(tarinfo, targetpath)
         elif tarinfo.isdir():
             self.makedir(tarinfo, targetpath)
@@ -2772,8 +2910,13 @@ def next(self):
             # if streaming the file we do not want to cache the tarinfo
             if not self.stream:
                 self.members.append(tarinfo)
+            if self._index_cache_key is not None:
+                # Record the member as read, before the caller can modify it.
+                self._index_records.append(self._index_record(tarinfo))
         else:
             self._loaded = True
+            if self._index_cache_key is not None:
+                self._write_index_cache()
 
         return tarinfo
 
@@ -2787,6 +2930,19 @@ def _getmember(self, name, tarinfo=None, normalize=False):
         # Ensure that all members have been loaded.
         members = self.getmembers()
 
+        if tarinfo is None and not normalize:
+            # Look the name up in the index of member names, which is
+            # extended with the members added since the last lookup.
+            names = self._names
+            for member in members[self._names_count:]:
+                names[member.name] = member
+            self._names_count = len(members)
+            member = names.get(name)
+            if member is not None and member.name == name:
+                return member
+            # The name was not found, or the member has been renamed since
+            # it was indexed.  Fall back to searching all members.
+
         # Limit the member search list up to tarinfo.
         skipping = False
         if tarinfo is not None:
@@ -2829,6 +2985,102 @@ def _load(self):
                 pass
             self._loaded = True
 
+    def _get_index_cache_key(self):
+        """Return the key identifying the archive in the index cache, or
+           None if the index cannot be cached.
+        """
+        if self.tarinfo is not TarInfo:
+            # A subclass may keep state that is not in the cache.
+            return None
+        try:
+            st = os.fstat(self.fileobj.fileno())
+        except (AttributeError, OSError, ValueError):
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        return (_INDEX_CACHE_VERSION, st.st_size, st.st_mtime_ns,
+                type(self.fileobj).__name__, self.offset, self.encoding,
+                self.errors, self.ignore_zeros)
+
+    def _read_index_cache(self):
+        """Load the members from the index cache. Return True if the cache
+           matched the archive.
+        """
+        key = self._index_cache_key
+        if key is None:
+            return False
+        try:
+            with bltn_open(self._index_cache, "rb") as f:
+                cached = marshal.loads(f.read())
+            if type(cached) is not tuple or len(cached) != 3:
+                return False
+            cached_key, offset, records = cached
+            if cached_key != key:
+                return False
+            if (type(offset) is not int or type(records) is not list
+                or not all(map(_valid_index_record, records))):
+                return False
+            # The members must follow each other, and the next header
+            # must come after the last one.
+            end = 0
+            for record in records:
+                if record[13] < end:
+                    return False
+                end = record[14]
+            if offset < end:
+                return False
+            fields = _INDEX_CACHE_FIELDS
+            members = []
+            for record in records:
+                tarinfo = TarInfo()
+                for field, value in zip(fields, record, strict=True):
+                    setattr(tarinfo, field, value)
+                members.append(tarinfo)
+        except (OSError, EOFError, ValueError, TypeError):
+            # A missing or unusable cache is rebuilt.
+            return False
+        self.members = members
+        self.offset = offset
+        self._loaded = True
+        # The index is up to date, there is no need to write it again.
+        self._index_cache_key = None
+        return True
+
+    def _index_record(self, tarinfo):
+        *record, pax_headers, sparse = [getattr(tarinfo, field)
+                                        for field in _INDEX_CACHE_FIELDS]
+        # Copy the mutable attributes, the others cannot be changed in place.
+        if sparse is not None:
+            sparse = list(sparse)
+        return (*record, dict(pax_headers), sparse)
+
+    def _write_index_cache(self):
+        """Store the members in the index cache.
+        """
+        key = self._index_cache_key
+        records = self._index_records
+        self._index_cache_key = None
+        self._index_records = []
+        data = marshal.dumps((key, self.offset, records))
+        # Write to a temporary file and rename it, so that a concurrent
+        # reader never sees a partially written cache.
+        import tempfile
+        dirname, basename = os.path.split(os.fsdecode(self._index_cache))
+        try:
+            fd, tmp = tempfile.mkstemp(prefix=basename + ".",
+                                       dir=dirname or os.curdir)
+        except OSError:
+            return
+        try:
+            with bltn_open(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._index_cache)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
     def _check(self, mode=None):
         """Check if TarFile is still open, and if the operation's mode
            corresponds to TarFile's mode.
@@ -181,8 +181,9 @@ def put(self, obj, timeout=None, *,
 
         If "syncobj" is true then the object must be "shareable".
         Examples of "shareable" objects include the builtin singletons,
-        str, and memoryview.  One benefit is that such objects are
-        passed through the queue efficiently.
+        str, tuples and frozensets of shareable objects, and memoryview.
+        One benefit is that such objects are passed through the queue
+        efficiently.
 
         The key difference, though, is conceptual: the corresponding
         object returned from Queue.get() will be strictly equivalent
@@ -1,4 +1,6 @@
+import array
 import contextlib
+import gc
 import os
 import pickle
 from textwrap import dedent
@@ -12,6 +14,7 @@
 
 
 _interpreters = import_helper.import_module('_interpreters')
+_interpqueues = import_helper.import_module('_interpqueues')
 from _interpreters import InterpreterNotFoundError
 
 
@@ -105,6 +108,11 @@ def test_default_shareables(self):
                 False,
                 100.0,
                 (1, ('spam', 'eggs')),
+                frozenset({1, 'spam', (2.0, None)}),
+                # buffers
+                memoryview(b'spam'),
+                memoryview(bytearray(b'spam')),
+                memoryview(array.array('i', [1, 2, 3])),
                 ]
         for obj in shareables:
             with self.subTest(obj):
@@ -467,6 +475,89 @@ def test_still_running(self):
             self.assertTrue(_interpreters.is_running(interp))
 
 
+class SharedBufferTests(TestBase):
+
+    def setUp(self):
+        super().setUp()
+        self.queueid = _interpqueues.create(0, 0, 2)
+        self.addCleanup(_interpqueues.destroy, self.queueid)
+
+    def share_from(self, interpid, expr):
+        _interpreters.exec(interpid, dedent(f"""
+            import _interpqueues, array
+            obj = {expr}
+            _interpqueues.put({self.queueid}, obj, 0, 2)
+            del obj
+            """))
+        obj, _, _ = _interpqueues.get(self.queueid)
+        return obj
+
+    def test_buffers(self):
+        interpid = _interpreters.create()
+        view = self.share_from(interpid, "memoryview(bytearray(b'spam'))")
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(view, b'spam')
+        self.assertFalse(view.readonly)
+        view = self.share_from(interpid,
+                               "memoryview(array.array('d', [1.5, -2.0]))")
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(view.format, 'd')
+        self.assertEqual(view.tolist(), [1.5, -2.0])
+        self.assertEqual(self.share_from(interpid, "memoryview(b'eggs')"),
+                         b'eggs')
+        del view
+
+    def test_buffers_not_shared_implicitly(self):
+        # Only explicit memoryviews are shared without copying.
+        for obj in [bytearray(b'spam'), array.array('i', [1, 2, 3])]:
+            with self.subTest(obj):
+                self.assertFalse(_interpreters.is_shareable(obj))
+
+    def test_frozenset(self):
+        interpid = _interpreters.create()
+        obj = self.share_from(interpid, "frozenset({1, 'spam', (2.0,)})")
+        self.assertEqual(obj, frozenset({1, 'spam', (2.0,)}))
+
+    def test_owner_kept_alive(self):
+        # A buffer holds a reference on the interpreter that owns it.
+        interpid = _interpreters.create(reqrefs=True)
+        _interpreters.incref(interpid)
+        view = self.share_from(interpid,
+                               "memoryview(bytearray(b'spam' * 1000))")
+        _interpreters.decref(interpid)
+
+        ids = [id for id, *_ in _interpreters.list_all()]
+        self.assertIn(interpid, ids)
+        self.assertEqual(view[:8], b'spamspam')
+        view[:4] = b'eggs'
+        self.assertEqual(view[:8], b'eggsspam')
+
+        del view
+        gc.collect()
+        ids = [id for id, *_ in _interpreters.list_all()]
+        self.assertNotIn(interpid, ids)
+
+    def test_owner_releases_last_reference(self):
+        # The owner dropping the last reference from inside itself
+        # destroys it once the main interpreter gets to it.
+        interpid = _interpreters.create(reqrefs=True)
+        _interpreters.incref(interpid)
+        _interpreters.exec(interpid, dedent(f"""
+            import _interpqueues
+            _interpqueues.put({self.queueid}, memoryview(bytearray(10)), 0, 2)
+            view, _, _ = _interpqueues.get({self.queueid})
+            """))
+        _interpreters.decref(interpid)
+        ids = [id for id, *_ in _interpreters.list_all()]
+        self.assertIn(interpid, ids)
+
+        _interpreters.exec(interpid, 'del view')
+        for _ in support.sleeping_retry(support.SHORT_TIMEOUT):
+            ids = [id for id, *_ in _interpreters.list_all()]
+            if interpid not in ids:
+                break
+
+
 class CommonTests(TestBase):
     def setUp(self):
         super().setUp()
@@ -2008,6 +2008,61 @@ async def stop_loop_coro(loop):
                          "^Executing <Task.*stop_loop_coro.*> "
                          "took .* seconds$")
 
+    def test_task_stats(self):
+        async def busy():
+            for _ in range(3):
+                time.sleep(0.01)
+                await asyncio.sleep(0)
+
+        async def idle():
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+        self.assertEqual(self.loop.get_task_stats(), {})
+        self.loop.set_task_stats(True)
+        self.addCleanup(self.loop.set_task_stats, False)
+        busy_task = self.loop.create_task(busy(), name='busy')
+        idle_task = self.loop.create_task(idle(), name='idle')
+        self.loop.call_soon(lambda: None)
+        self.loop.run_until_complete(asyncio.gather(busy_task, idle_task))
+
+        stats = self.loop.get_task_stats()
+        self.assertEqual(stats[busy_task].steps, 4)
+        self.assertEqual(stats[idle_task].steps, 6)
+        self.assertGreaterEqual(stats[busy_task].run_time, 0.03)
+        self.assertGreaterEqual(stats[busy_task].cpu_time, 0.0)
+        self.assertLess(stats[busy_task].cpu_time, 0.03)
+        # idle() waited in the ready queue while busy() was sleeping.
+        self.assertGreaterEqual(stats[idle_task].wait_time, 0.03)
+        self.assertGreaterEqual(stats[idle_task].max_wait_time, 0.01)
+        self.assertLessEqual(stats[idle_task].max_wait_time,
+                             stats[idle_task].wait_time)
+
+        rows = base_events._get_task_stats_rows()
+        row = next(row for row in rows if row[1] == id(busy_task))
+        self.assertEqual(row[:4], (None, id(busy_task), 'busy',
+                                   busy.__qualname__))
+        self.assertEqual(row[4:], tuple(stats[busy_task]))
+
+        self.loop.set_task_stats(False)
+        self.assertEqual(self.loop.get_task_stats(), {})
+        self.assertNotIn(self.loop, base_events._task_stats_loops)
+        self.loop.run_until_complete(idle())
+
+    def test_task_stats_debug(self):
+        async def coro():
+            pass
+
+        self.loop.set_debug(True)
+        self.loop.slow_callback_duration = 0.0
+        self.loop.set_task_stats(True)
+        self.addCleanup(self.loop.set_task_stats, False)
+        with mock.patch('asyncio.base_events.logger') as m_logger:
+            task = self.loop.create_task(coro())
+            self.loop.run_until_complete(task)
+        self.assertTrue(m_logger.warning.called)
+        self.assertEqual(self.loop.get_task_stats()[task].steps, 1)
+
 
 class RunningLoopTests(unittest.TestCase):
 
@@ -2206,6 +2261,46 @@ def test_negative_offset(self):
             self.run_loop(self.loop.sock_sendfile(sock, self.file, -1))
 
 
+class BaseLoopFileTests(test_utils.TestCase):
+    DATA = b"12345abcde" * 1024
+
+    def setUp(self):
+        super().setUp()
+        from asyncio.selector_events import BaseSelectorEventLoop
+        # BaseSelectorEventLoop() only has the executor implementation.
+        self.loop = BaseSelectorEventLoop()
+        self.set_event_loop(self.loop)
+        with open(os_helper.TESTFN, 'wb') as fp:
+            fp.write(self.DATA)
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        self.file = open(os_helper.TESTFN, 'r+b')
+        self.addCleanup(self.file.close)
+
+    def run_loop(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_read_file(self):
+        read_file = self.loop.read_file
+        self.assertEqual(self.run_loop(read_file(self.file)), self.DATA)
+        self.assertEqual(self.run_loop(read_file(self.file.fileno(), 10, 5)),
+                         b"abcde12345")
+        self.assertEqual(self.run_loop(read_file(self.file, 10, 10235)),
+                         b"abcde")
+        self.assertEqual(self.file.tell(), 0)
+
+    def test_write_file(self):
+        self.assertEqual(
+            self.run_loop(self.loop.write_file(self.file, b"xyz", 5)), 3)
+        self.assertEqual(self.file.tell(), 0)
+        self.assertEqual(self.file.read(), b"12345xyzde" + self.DATA[10:])
+
+    def test_file_invalid(self):
+        with self.assertRaises(TypeError):
+            self.run_loop(self.loop.read_file(object()))
+        with self.assertRaises(ValueError):
+            self.run_loop(self.loop.write_file(self.file, b"data", -1))
+
+
 class TestSelectorUtils(test_utils.TestCase):
     def check_set_nodelay(self, sock):
         opt = sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
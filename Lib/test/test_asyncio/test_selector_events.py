@@ -1311,6 +1311,52 @@ def test_read_ready(self):
         self.protocol.datagram_received.assert_called_with(
             b'data', ('0.0.0.0', 1234))
 
+    @unittest.skipUnless(hasattr(socket.socket, 'recvmmsg'),
+                         'requires recvmmsg()')
+    def test_read_ready_mmsg(self):
+        self.sock.family = socket.AF_INET
+        transport = self.datagram_transport()
+
+        self.sock.recvfrom.return_value = (b'data1', ('0.0.0.0', 1))
+        transport._read_ready()
+        self.sock.recvmmsg.return_value = [(b'data2', ('0.0.0.0', 2)),
+                                           (b'data3', ('0.0.0.0', 3))]
+        transport._read_ready()
+        self.sock.recvmmsg.assert_called_with(
+            transport.max_datagram_size, 2, socket.MSG_WAITFORONE)
+        # A full batch doubles the size of the next one.
+        self.sock.recvmmsg.return_value = [(b'data4', ('0.0.0.0', 4))]
+        transport._read_ready()
+        self.sock.recvmmsg.assert_called_with(
+            transport.max_datagram_size, 4, socket.MSG_WAITFORONE)
+
+        self.assertEqual(self.protocol.datagram_received.call_args_list, [
+            mock.call(b'data1', ('0.0.0.0', 1)),
+            mock.call(b'data2', ('0.0.0.0', 2)),
+            mock.call(b'data3', ('0.0.0.0', 3)),
+            mock.call(b'data4', ('0.0.0.0', 4)),
+        ])
+        self.assertEqual(self.sock.recvfrom.call_count, 1)
+
+        # No datagram waiting: go back to recvfrom().
+        self.sock.recvmmsg.side_effect = BlockingIOError
+        transport._read_ready()
+        self.assertEqual(transport._recv_count, 1)
+        transport._read_ready()
+        self.assertEqual(self.sock.recvfrom.call_count, 2)
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'requires AF_UNIX')
+    def test_read_ready_no_mmsg_for_unix(self):
+        # Unix datagrams can be larger than max_datagram_size.
+        self.sock.family = socket.AF_UNIX
+        transport = self.datagram_transport()
+        self.sock.recvfrom.return_value = (b'data', 'path')
+        transport._read_ready()
+        transport._read_ready()
+        self.assertEqual(self.sock.recvfrom.call_count, 2)
+        self.sock.recvfrom.assert_called_with(transport.max_size)
+        self.sock.recvmmsg.assert_not_called()
+
     def test_transport_inheritance(self):
         transport = self.datagram_transport()
         self.assertIsInstance(transport, asyncio.DatagramTransport)
@@ -1533,6 +1579,8 @@ def test_sendto_ready_no_data(self):
 
     def test_sendto_ready_tryagain(self):
         self.sock.sendto.side_effect = BlockingIOError
+        if hasattr(socket.socket, 'sendmmsg'):
+            self.sock.sendmmsg.side_effect = BlockingIOError
 
         transport = self.datagram_transport()
         transport._buffer.extend([(b'data1', ()), (b'data2', ())])
@@ -1544,6 +1592,58 @@ def test_sendto_ready_tryagain(self):
             [(b'data1', ()), (b'data2', ())],
             list(transport._buffer))
 
+    @unittest.skipUnless(hasattr(socket.socket, 'sendmmsg'),
+                         'requires sendmmsg()')
+    def test_sendto_ready_mmsg(self):
+        self.sock.sendmmsg.return_value = 2
+
+        transport = self.datagram_transport()
+        transport._buffer.extend([(b'data1', ('0.0.0.0', 1)),
+                                  (b'data2', ('0.0.0.0', 2)),
+                                  (b'data3', ('0.0.0.0', 3))])
+        transport._buffer_size = 15
+        self.loop._add_writer(7, transport._sendto_ready)
+        transport._sendto_ready()
+
+        # Only two datagrams were sent: the last one is sent on its own.
+        self.sock.sendmmsg.assert_called_once_with(
+            [(b'data1', ('0.0.0.0', 1)),
+             (b'data2', ('0.0.0.0', 2)),
+             (b'data3', ('0.0.0.0', 3))])
+        self.sock.sendto.assert_called_once_with(b'data3', ('0.0.0.0', 3))
+        self.assertFalse(transport._buffer)
+        self.assertEqual(transport._buffer_size, 0)
+        self.assertFalse(self.loop.writers)
+
+    @unittest.skipUnless(hasattr(socket.socket, 'sendmmsg'),
+                         'requires sendmmsg()')
+    def test_sendto_ready_mmsg_connected(self):
+        self.sock.sendmmsg.return_value = 2
+
+        transport = self.datagram_transport(address=('0.0.0.0', 1))
+        transport._buffer.extend([(b'data1', ('0.0.0.0', 1)),
+                                  (b'data2', ('0.0.0.0', 1))])
+        self.loop._add_writer(7, transport._sendto_ready)
+        transport._sendto_ready()
+
+        self.sock.sendmmsg.assert_called_once_with([b'data1', b'data2'])
+        self.assertFalse(transport._buffer)
+        self.assertFalse(self.loop.writers)
+
+    @unittest.skipUnless(hasattr(socket.socket, 'sendmmsg'),
+                         'requires sendmmsg()')
+    def test_sendto_ready_mmsg_error_received(self):
+        self.sock.sendmmsg.side_effect = ConnectionRefusedError
+
+        transport = self.datagram_transport()
+        transport._fatal_error = mock.Mock()
+        transport._buffer.extend([(b'data1', ()), (b'data2', ())])
+        transport._sendto_ready()
+
+        self.assertFalse(transport._fatal_error.called)
+        self.assertTrue(self.protocol.error_received.called)
+        self.assertEqual([(b'data2', ())], list(transport._buffer))
+
     def test_sendto_ready_exception(self):
         err = self.sock.sendto.side_effect = RuntimeError()
 
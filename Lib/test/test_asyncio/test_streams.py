@@ -583,6 +583,201 @@ def test_readexactly_exception(self):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readexactly(2))
 
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+
+        buf = bytearray(5)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 5)
+        self.assertEqual(buf, b'line1')
+        self.assertEqual(b'\nline2\nline3\n', stream._buffer)
+
+        buf = bytearray(100)
+        n = self.loop.run_until_complete(stream.readinto(memoryview(buf)))
+        self.assertEqual(n, 13)
+        self.assertEqual(buf[:n], b'\nline2\nline3\n')
+        self.assertEqual(b'', stream._buffer)
+
+        n = self.loop.run_until_complete(stream.readinto(bytearray()))
+        self.assertEqual(n, 0)
+
+        stream.feed_eof()
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 0)
+
+        with self.assertRaises(TypeError):
+            self.loop.run_until_complete(stream.readinto(b'data'))
+
+    def test_readinto_wait(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(100)
+        read_task = self.loop.create_task(stream.readinto(buf))
+
+        def cb():
+            stream.feed_data(self.DATA)
+        self.loop.call_soon(cb)
+
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(buf[:n], self.DATA)
+
+    def test_readinto_buffered_protocol(self):
+        # The protocol receives the data directly into the buffer passed
+        # to a waiting readinto() call.
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.streams._BufferedStreamReaderProtocol(
+            stream, loop=self.loop)
+        self.assertIsInstance(protocol, asyncio.BufferedProtocol)
+        buf = bytearray(100)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+
+        view = protocol.get_buffer(-1)
+        self.assertIs(view.obj, buf)
+        view[:5] = b'line1'
+        protocol.buffer_updated(5)
+        view = protocol.get_buffer(-1)
+        view[:2] = b'\nl'
+        protocol.buffer_updated(2)
+
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(n, 7)
+        self.assertEqual(buf[:n], b'line1\nl')
+        self.assertEqual(b'', stream._buffer)
+        # The stream no longer exports the buffer.
+        del view
+        buf.clear()
+
+        # Without a pending readinto() call, the data is received into a
+        # buffer of the stream.
+        view = protocol.get_buffer(-1)
+        self.assertIsNot(view.obj, buf)
+        view[:5] = b'ine2\n'
+        protocol.buffer_updated(5)
+        self.assertEqual(b'ine2\n', stream._buffer)
+        view = protocol.get_buffer(-1)
+        view[:6] = b'line3\n'
+        protocol.buffer_updated(6)
+        self.assertEqual(b'ine2\nline3\n', stream._buffer)
+        data = self.loop.run_until_complete(stream.readline())
+        self.assertEqual(data, b'ine2\n')
+
+    def test_buffered_protocol_idle_buffer(self):
+        # The receive buffer is only kept while it is being filled up.
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.streams._BufferedStreamReaderProtocol(
+            stream, loop=self.loop)
+        view = protocol.get_buffer(-1)
+        size = len(view)
+        view[:] = b'x' * size
+        stream._buffer += b'y'  # don't adopt the receive buffer
+        protocol.buffer_updated(size)
+        self.assertIsNotNone(stream._recv_buffer)
+        view = protocol.get_buffer(-1)
+        view[:3] = b'end'
+        protocol.buffer_updated(3)
+        self.assertIsNone(stream._recv_buffer)
+        self.assertEqual(len(stream._buffer), size + 4)
+
+        view = protocol.get_buffer(10)
+        self.assertEqual(len(view), 10)
+
+    def test_buffered_protocol_large_chunk(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.streams._BufferedStreamReaderProtocol(
+            stream, loop=self.loop)
+        view = protocol.get_buffer(-1)
+        size = len(view)
+        view[:] = b'x' * size
+        protocol.buffer_updated(size)
+        self.assertEqual(len(stream._buffer), size)
+        # The next chunk is received into a new buffer.
+        view = protocol.get_buffer(-1)
+        self.assertIsNot(view.obj, stream._buffer)
+        view[:3] = b'end'
+        protocol.buffer_updated(3)
+        data = self.loop.run_until_complete(stream.read(size + 3))
+        self.assertEqual(data, b'x' * size + b'end')
+
+    def test_buffered_protocol_small_then_large_chunk(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.streams._BufferedStreamReaderProtocol(
+            stream, loop=self.loop)
+        stream._buffer += b'y'  # don't adopt the receive buffer
+        get_buffer = mock.Mock(wraps=protocol.get_buffer)
+        protocol.get_buffer = get_buffer
+        asyncio.protocols._feed_data_to_buffered_proto(protocol, b'x' * 10)
+        self.assertEqual(get_buffer.call_count, 1)
+        # A larger chunk does not go through the small receive buffer.
+        get_buffer.reset_mock()
+        data = b'z' * 100_000
+        asyncio.protocols._feed_data_to_buffered_proto(protocol, data)
+        self.assertLessEqual(get_buffer.call_count, 2)
+        self.assertEqual(stream._buffer, b'y' + b'x' * 10 + data)
+
+    def test_readinto_buffered_protocol_cancel(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.streams._BufferedStreamReaderProtocol(
+            stream, loop=self.loop)
+        buf = bytearray(100)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+
+        view = protocol.get_buffer(-1)
+        view[:5] = b'line1'
+        protocol.buffer_updated(5)
+        read_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(read_task)
+        # The data received into buf is kept in the stream.
+        self.assertEqual(b'line1', stream._buffer)
+
+    def test_readexactly_into(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(2 * len(self.DATA))
+        read_task = self.loop.create_task(stream.readexactly_into(buf))
+
+        def cb():
+            stream.feed_data(self.DATA)
+            stream.feed_data(self.DATA)
+            stream.feed_data(self.DATA)
+        self.loop.call_soon(cb)
+
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(n, len(buf))
+        self.assertEqual(self.DATA + self.DATA, buf)
+        self.assertEqual(self.DATA, stream._buffer)
+
+    def test_readexactly_into_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(2 * len(self.DATA))
+        read_task = self.loop.create_task(stream.readexactly_into(buf))
+
+        def cb():
+            stream.feed_data(self.DATA)
+            stream.feed_eof()
+        self.loop.call_soon(cb)
+
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(read_task)
+        self.assertEqual(cm.exception.partial, self.DATA)
+        self.assertEqual(cm.exception.expected, len(buf))
+        self.assertEqual(buf[:len(self.DATA)], self.DATA)
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readexactly_into_cancel(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(2 * len(self.DATA))
+        read_task = self.loop.create_task(stream.readexactly_into(buf))
+        stream.feed_data(self.DATA)
+        test_utils.run_briefly(self.loop)
+
+        read_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(read_task)
+        # Like readexactly(), a cancelled call does not consume data.
+        self.assertEqual(self.DATA, stream._buffer)
+
     def test_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
         self.assertIsNone(stream.exception())
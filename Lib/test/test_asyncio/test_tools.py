@@ -1,4 +1,7 @@
+import os
+import runpy
 import unittest
+from unittest import mock
 
 from asyncio import tools
 
@@ -844,3 +847,53 @@ def test_tree_rendering_with_custom_emojis(self):
         self.assertIn("🔁 f1", flat)
         self.assertIn("🔁 f2", flat)
         self.assertIn("🧵 SubTask", flat)
+
+
+class TestAsyncioToolsTaskStats(unittest.TestCase):
+
+    def test_task_stats_table(self):
+        input_ = [
+            (1, 0x10, "idle", "idle", 6, 0.0002, 0.0001, 0.03, 0.012),
+            (1, 0x20, "busy", "busy", 4, 0.04, 0.035, 0.0, 0.0),
+            (1, 0x30, "new", "coro", 0, 0.0, 0.0, 0.0, 0.0),
+        ]
+        self.assertEqual(
+            tools.build_task_stats_table(input_),
+            [
+                [1, "0x20", "busy", "busy", 4, "35.000", "40.000",
+                 "0.000", "0.000"],
+                [1, "0x10", "idle", "idle", 6, "0.100", "0.200",
+                 "5.000", "12.000"],
+                [1, "0x30", "new", "coro", 0, "0.000", "0.000",
+                 "0.000", "0.000"],
+            ],
+        )
+
+    def test_empty_task_stats_table(self):
+        self.assertEqual(tools.build_task_stats_table([]), [])
+
+    def test_get_task_stats(self):
+        def remote_exec(pid, script):
+            runpy.run_path(script)
+        with mock.patch.object(tools.sys, "remote_exec",
+                               side_effect=remote_exec) as m:
+            self.assertEqual(tools.get_task_stats(os.getpid()), [])
+        m.assert_called_once()
+
+    def test_get_task_stats_timeout(self):
+        # The script is never run, for example by an idle event loop.
+        with mock.patch.object(tools.sys, "remote_exec"):
+            with self.assertRaisesRegex(TimeoutError, "idle"):
+                tools.get_task_stats(os.getpid(), timeout=0.05)
+
+    @unittest.skipUnless(hasattr(os, "geteuid"), "requires os.geteuid()")
+    def test_get_task_stats_other_user(self):
+        owner = (os.geteuid() + 1, os.getegid())
+        with (mock.patch.object(tools, "_process_owner", return_value=owner),
+              mock.patch.object(tools.os, "chown",
+                                side_effect=PermissionError) as chown,
+              mock.patch.object(tools.sys, "remote_exec") as remote_exec):
+            with self.assertRaisesRegex(PermissionError, "another user"):
+                tools.get_task_stats(12345)
+        chown.assert_called_once()
+        remote_exec.assert_not_called()
@@ -1,5 +1,6 @@
 """Tests for unix_events.py."""
 
+import array
 import contextlib
 import errno
 import io
@@ -656,6 +657,103 @@ def test_sock_sendfile_exception(self):
         self.assertEqual(1000, self.file.tell())
 
 
+class SelectorEventLoopUnixFileTests(test_utils.TestCase):
+    DATA = b"12345abcde" * 16 * 1024  # 160 KiB
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+        with open(os_helper.TESTFN, 'wb') as fp:
+            fp.write(self.DATA)
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        self.file = open(os_helper.TESTFN, 'r+b')
+        self.addCleanup(self.file.close)
+
+    def run_loop(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def check_read_file(self):
+        read_file = self.loop.read_file
+        self.assertEqual(self.run_loop(read_file(self.file)), self.DATA)
+        self.assertEqual(self.run_loop(read_file(self.file.fileno())),
+                         self.DATA)
+        self.assertEqual(self.run_loop(read_file(self.file, 10, 5)),
+                         b"abcde12345")
+        self.assertEqual(self.run_loop(read_file(self.file, offset=10)),
+                         self.DATA[10:])
+        self.assertEqual(self.run_loop(read_file(self.file, 10, 163835)),
+                         b"abcde")
+        self.assertEqual(self.run_loop(read_file(self.file, 10, 10**6)), b"")
+        self.assertEqual(self.run_loop(read_file(self.file, 0)), b"")
+        self.assertEqual(self.file.tell(), 0)
+
+    def test_read_file(self):
+        self.check_read_file()
+
+    def test_read_file_executor(self):
+        # Data which is not cached is read by the executor.
+        with mock.patch('os.preadv', side_effect=BlockingIOError):
+            self.check_read_file()
+
+    @unittest.skipUnless(hasattr(os, 'RWF_NOWAIT'), 'requires RWF_NOWAIT')
+    def test_read_file_nowait(self):
+        # Cached data is read without the executor, if the file system
+        # supports it.
+        buf = bytearray(1)
+        try:
+            os.preadv(self.file.fileno(), [buf], 0, os.RWF_NOWAIT)
+        except OSError:
+            self.skipTest('RWF_NOWAIT is not supported')
+        self.run_loop(self.loop.read_file(self.file))
+        with mock.patch.object(self.loop, 'run_in_executor',
+                               side_effect=AssertionError):
+            self.assertEqual(self.run_loop(self.loop.read_file(self.file)),
+                             self.DATA)
+            self.assertEqual(
+                self.run_loop(self.loop.read_file(self.file, 10, 5)),
+                b"abcde12345")
+
+    def test_read_file_grown(self):
+        # The file grows after its size has been read.
+        fstat = os.fstat
+        def fake_fstat(fd):
+            st = fstat(fd)
+            return os.stat_result((st.st_mode, *([0] * 5), 100, *st[7:]))
+        with mock.patch('os.fstat', fake_fstat):
+            self.assertEqual(self.run_loop(self.loop.read_file(self.file)),
+                             self.DATA)
+
+    def test_write_file(self):
+        write_file = self.loop.write_file
+        self.assertEqual(self.run_loop(write_file(self.file, b"xyz", 5)), 3)
+        self.assertEqual(
+            self.run_loop(write_file(self.file.fileno(),
+                                     memoryview(b"ABC"), 163840)),
+            3)
+        self.assertEqual(self.file.tell(), 0)
+        self.assertEqual(self.file.read(),
+                         b"12345xyzde" + self.DATA[10:] + b"ABC")
+        data = array.array('i', range(1000))
+        self.assertEqual(self.run_loop(write_file(self.file, data)),
+                         len(data) * data.itemsize)
+
+    def test_file_invalid(self):
+        with self.assertRaises(TypeError):
+            self.run_loop(self.loop.read_file(io.BytesIO(b"data")))
+        with self.assertRaises(TypeError):
+            self.run_loop(self.loop.write_file(object(), b"data"))
+        with self.assertRaises(ValueError):
+            self.run_loop(self.loop.read_file(self.file, 10, -1))
+        with self.assertRaises(ValueError):
+            self.run_loop(self.loop.write_file(self.file, b"data", -1))
+        r, w = os.pipe()
+        self.addCleanup(os.close, r)
+        self.addCleanup(os.close, w)
+        with self.assertRaises(OSError):
+            self.run_loop(self.loop.read_file(r))
+
+
 class UnixReadPipeTransportTests(test_utils.TestCase):
 
     def setUp(self):
@@ -328,6 +328,23 @@ def testSeekBackwardsAcrossStreams(self):
             bz2f.seek(-150, 1)
             self.assertEqual(bz2f.read(), self.TEXT[100-150:] + self.TEXT)
 
+    def testSeekIndex(self):
+        self.createTempFile(streams=5)
+        with support.swap_attr(_streams, 'CHECKPOINT_INTERVAL', 1):
+            with BZ2File(self.filename) as bz2f:
+                bz2f.seek(0, 2)
+                index = bz2f.get_seek_index()
+                self.assertEqual(index, [(i * len(self.TEXT), i * len(self.DATA))
+                                         for i in range(1, 5)])
+                bz2f.seek(3 * len(self.TEXT) + 7)
+                self.assertEqual(bz2f.read(), self.TEXT[7:] + self.TEXT)
+            with BZ2File(self.filename) as bz2f:
+                bz2f.set_seek_index(index[2:])
+                bz2f.seek(4 * len(self.TEXT) - 1)
+                self.assertEqual(bz2f.read(), self.TEXT[-1:] + self.TEXT)
+                bz2f.seek(1)
+                self.assertEqual(bz2f.read(2), self.TEXT[1:3])
+
     def testSeekBackwardsFromEnd(self):
         self.createTempFile()
         with BZ2File(self.filename) as bz2f:
@@ -29,6 +29,13 @@ def raiser(exception, msg='std'):
     raise exception(msg)
 
 
+# Used in test_map_unordered_completion_order
+def wait_and_return(event, x):
+    if event is not None:
+        event.wait(support.SHORT_TIMEOUT)
+    return x
+
+
 class FalseyBoolException(Exception):
     def __bool__(self):
         return False
@@ -158,6 +165,42 @@ def test_map_buffersize_when_buffer_is_full(self):
             msg="should have fetched only `buffersize` elements from `ints`.",
         )
 
+    def test_map_unordered(self):
+        self.assertCountEqual(
+            self.executor.map(pow, range(10), range(10), unordered=True),
+            map(pow, range(10), range(10)))
+        self.assertCountEqual(
+            self.executor.map(pow, range(10), range(10), chunksize=3,
+                              unordered=True),
+            map(pow, range(10), range(10)))
+        self.assertEqual(list(self.executor.map(str, [], unordered=True)), [])
+
+    def test_map_unordered_completion_order(self):
+        # The first call only completes once the result of the second one
+        # has been received.
+        event = self.create_event()
+        res = self.executor.map(wait_and_return, [event, None],
+                                ['slow', 'fast'], unordered=True)
+        self.assertEqual(next(res), 'fast')
+        event.set()
+        self.assertEqual(list(res), ['slow'])
+
+    def test_map_unordered_exception(self):
+        res = self.executor.map(divmod, [1, 1, 1, 1], [2, 3, 0, 5],
+                                unordered=True)
+        with self.assertRaises(ZeroDivisionError):
+            list(res)
+
+    def test_map_unordered_buffersize(self):
+        res = self.executor.map(str, itertools.count(), buffersize=2,
+                                unordered=True)
+        self.assertLessEqual({next(res), next(res), next(res)},
+                             {"0", "1", "2", "3"})
+        ints = iter(range(4))
+        self.executor.map(str, ints, buffersize=2, unordered=True)
+        self.executor.shutdown(wait=True)
+        self.assertEqual(next(ints), 2)
+
     def test_shutdown_race_issue12456(self):
         # Issue #12456: race condition at shutdown where trying to post a
         # sentinel in the call queue blocks (the queue is full while processes
@@ -1,10 +1,13 @@
+import array
 import asyncio
 import contextlib
 import io
 import os
 import pickle
+import sys
 import time
 import unittest
+from concurrent.futures import interpreter
 from concurrent.futures.interpreter import (
     ExecutionFailed, BrokenInterpreterPool,
 )
@@ -33,6 +36,12 @@ def read_msg(fd):
         msg += ch
 
 
+def read_and_return(fd, x):
+    if fd is not None:
+        read_msg(fd)
+    return x
+
+
 def get_current_name():
     return __name__
 
@@ -46,6 +55,19 @@ def get_current_interpid(*extra):
     return (interpid, *extra)
 
 
+def is_imported(name):
+    return name in sys.modules
+
+
+def describe_buffers(*args, **kwargs):
+    return [(type(arg).__name__, bytes(arg))
+            for arg in (*args, *kwargs.values())]
+
+
+def fill_buffer(buf, value):
+    buf[:] = bytes([value]) * len(buf)
+
+
 class InterpretersMixin(InterpreterPoolMixin):
 
     def pipe(self):
@@ -94,6 +116,16 @@ def test_init_script(self):
         self.assertEqual(after_init, msg1)
         self.assertEqual(after_run, msg2)
 
+    def test_map_unordered_completion_order(self):
+        # Interpreters can't share an event, so the first call waits for
+        # a message sent once the result of the second one is received.
+        r, w = self.pipe()
+        res = self.executor.map(read_and_return, [r, None],
+                                ['slow', 'fast'], unordered=True)
+        self.assertEqual(next(res), 'fast')
+        write_msg(w, b'go')
+        self.assertEqual(list(res), ['slow'])
+
     @unittest.expectedFailure
     def test_init_script_args(self):
         with self.assertRaises(ValueError):
@@ -296,6 +328,108 @@ def test_pickle_errors_propagate(self):
         with self.assertRaisesRegex(RuntimeError, "gotcha"):
             fut.result()
 
+    def test_preload(self):
+        with self.executor_type(1, preload=['fractions', 'xml.dom']) as ex:
+            self.assertTrue(ex.submit(is_imported, 'fractions').result())
+            self.assertTrue(ex.submit(is_imported, 'xml.dom').result())
+
+    def test_preload_invalid(self):
+        with self.assertRaises(TypeError):
+            self.executor_type(1, preload='fractions')
+        with self.assertRaises(TypeError):
+            self.executor_type(1, preload=[1])
+        with self.assertRaises(ValueError):
+            self.executor_type(1, preload=['os; import sys'])
+
+    def test_preload_missing_module(self):
+        executor = self.executor_type(1, preload=['nonexistent_module_xyz'])
+        with contextlib.redirect_stderr(io.StringIO()):
+            fut = executor.submit(mul, 2, 3)
+            with self.assertRaises(BrokenInterpreterPool):
+                fut.result()
+        executor.shutdown()
+
+    def test_reuse_interpreters(self):
+        self.addCleanup(interpreter._clear_idle_interpreters)
+        r, w = self.pipe()
+        kwargs = dict(initializer=write_msg, initargs=(w, b'init'),
+                      reuse_interpreters=True)
+
+        with self.executor_type(1, **kwargs) as executor:
+            interpid1, = executor.submit(get_current_interpid).result()
+        self.assertEqual(read_msg(r), b'init')
+        with self.executor_type(1, **kwargs) as executor:
+            interpid2, = executor.submit(get_current_interpid).result()
+        # The initializer doesn't run again for a reused interpreter.
+        os.write(w, b'end\0')
+        self.assertEqual(read_msg(r), b'end')
+        self.assertEqual(interpid2, interpid1)
+
+        # A different configuration gets a different interpreter.
+        with self.executor_type(1, reuse_interpreters=True) as executor:
+            interpid3, = executor.submit(get_current_interpid).result()
+        self.assertNotEqual(interpid3, interpid1)
+        # Without reuse_interpreters, new interpreters are always created.
+        with self.executor_type(1) as executor:
+            interpid4, = executor.submit(get_current_interpid).result()
+        self.assertNotIn(interpid4, (interpid1, interpid3))
+
+        interpreter._clear_idle_interpreters()
+        ids = {interpid for interpid, *_ in _interpreters.list_all()}
+        self.assertNotIn(interpid1, ids)
+        self.assertNotIn(interpid3, ids)
+
+    def test_submit_buffer_args(self):
+        size = interpreter._SHARED_BUFFER_MIN_SIZE
+        arr = array.array('d', range(size))
+        args = (b'a' * size, bytearray(b'b' * size), arr,
+                memoryview(b'c' * size), b'small', bytearray(b'small'))
+        fut = self.executor.submit(describe_buffers, *args, kw=b'd' * size)
+        self.assertEqual(fut.result(), [
+            ('bytes', b'a' * size),
+            ('bytearray', b'b' * size),
+            ('array', arr.tobytes()),
+            ('memoryview', b'c' * size),
+            ('bytes', b'small'),
+            ('bytearray', b'small'),
+            ('bytes', b'd' * size),
+        ])
+
+    def test_submit_buffer_args_copied(self):
+        # Changing a bytearray or an array after submit() does not affect
+        # the task, even when the worker is still busy with another one.
+        size = interpreter._SHARED_BUFFER_MIN_SIZE
+        r, w = self.pipe()
+        with self.executor_type(1) as executor:
+            blocker = executor.submit(os.read, r, 1)
+            buf = bytearray(b'b' * size)
+            arr = array.array('B', b'a' * size)
+            fut = executor.submit(describe_buffers, buf, arr)
+            buf[:] = b'x' * size
+            buf.extend(b'more')
+            arr[0] = ord('y')
+            arr.extend(b'more')
+            os.write(w, b'\0')
+            blocker.result()
+        self.assertEqual(fut.result(), [
+            ('bytearray', b'b' * size),
+            ('array', b'a' * size),
+        ])
+
+    def test_submit_buffer_result(self):
+        # Bytearrays and arrays are pickled and keep their type.
+        fut = self.executor.submit(bytearray, b'spam')
+        self.assertEqual(fut.result(), bytearray(b'spam'))
+        self.assertIs(type(fut.result()), bytearray)
+        fut = self.executor.submit(array.array, 'd', [1.5, 2.5])
+        self.assertEqual(fut.result(), array.array('d', [1.5, 2.5]))
+
+    def test_submit_memoryview_shared(self):
+        # Memoryviews are passed without copying.
+        buf = bytearray(10)
+        self.executor.submit(fill_buffer, memoryview(buf), 42).result()
+        self.assertEqual(buf, bytearray([42]) * 10)
+
 
 class AsyncioTest(InterpretersMixin, testasyncio_utils.TestCase):
 
@@ -1,4 +1,6 @@
+import array
 import os
+import pickle
 import queue
 import sys
 import threading
@@ -41,6 +43,27 @@ def _put_wait_put(queue, event):
     queue.put('finished')
 
 
+class _OutOfBand:
+    """ Used as part of test_shared_memory_threshold """
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        return type(self), (pickle.PickleBuffer(self.data),)
+
+    def __eq__(self, other):
+        return bytes(self.data) == bytes(other.data)
+
+def _make_buffers(size):
+    """ Used as part of test_shared_memory_threshold """
+    return [b'x' * size, bytearray(b'y' * size), b'small',
+            {'array': array.array('d', range(size))},
+            _OutOfBand(bytearray(b'z' * size)), _OutOfBand(b'tiny')]
+
+def _shared_memory_segments():
+    return {name for name in os.listdir('/dev/shm') if name.startswith('psm_')}
+
+
 class ProcessPoolExecutorTest(ExecutorTest):
 
     @unittest.skipUnless(sys.platform=='win32', 'Windows-only process limit')
@@ -77,6 +100,50 @@ def bad_map():
             ref)
         self.assertRaises(ValueError, bad_map)
 
+    def test_map_chunksize_auto(self):
+        ref = list(map(pow, range(400), range(400)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(400), range(400),
+                                   chunksize='auto')),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, iter(range(400)), range(400),
+                                   chunksize='auto', buffersize=1)),
+            ref)
+        self.assertCountEqual(
+            self.executor.map(pow, range(400), range(400), chunksize='auto',
+                              unordered=True),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, [], chunksize='auto')), [])
+        with self.assertRaises(ZeroDivisionError):
+            list(self.executor.map(divmod, [1, 1, 1], [1, 0, 1],
+                                   chunksize='auto'))
+
+    def test_auto_chunker(self):
+        # Guided self-scheduling: the chunks grow with the measured time per
+        # item, but not beyond the remaining items divided by the workers.
+        chunker = futures.process._AutoChunker([range(10_000)], 4)
+        chunks = iter(chunker)
+        self.assertEqual(len(next(chunks)), 1)
+        chunker.record(1e-6, 1)
+        sizes = []
+        for chunk in chunks:
+            sizes.append(len(chunk))
+            chunker.record(len(chunk) * 1e-6, len(chunk))
+        self.assertEqual(sum(sizes), 10_000 - 1)
+        self.assertEqual(sizes[:4], [2, 4, 8, 16])
+        self.assertLessEqual(max(sizes), 10_000 // 4)
+        # The last chunks get smaller to spread them over the workers.
+        self.assertLess(sizes[-1], max(sizes))
+
+        # An unknown length does not limit the chunk size.
+        chunker = futures.process._AutoChunker([iter(range(100))], 4)
+        chunks = iter(chunker)
+        self.assertEqual(len(next(chunks)), 1)
+        chunker.record(0.001, 1)
+        self.assertEqual(len(next(chunks)), 2)
+
     @classmethod
     def _test_traceback(cls):
         raise RuntimeError(123) # some comment
@@ -236,6 +303,33 @@ def mock_start_new_thread(func, *args, **kwargs):
                     list(executor.map(mul, [(2, 3)] * 10))
             executor.shutdown()
 
+    @unittest.skipIf(sys.platform == 'win32', 'not supported on Windows')
+    def test_shared_memory_threshold(self):
+        has_dev_shm = os.path.isdir('/dev/shm')
+        if has_dev_shm:
+            segments = _shared_memory_segments()
+        executor = self.executor_type(
+            2, mp_context=self.get_context(), shared_memory_threshold=1000)
+        with executor:
+            self.assertEqual(executor.submit(_make_buffers, 2000).result(),
+                             _make_buffers(2000))
+            self.assertEqual(executor.submit(bytes, 5000).result(),
+                             bytes(5000))
+            self.assertEqual(
+                list(executor.map(bytes, [10, 2000, 3000], chunksize=2)),
+                [bytes(10), bytes(2000), bytes(3000)])
+            with self.assertRaises(ZeroDivisionError):
+                executor.submit(divmod, 1, 0).result()
+        if has_dev_shm:
+            # All the segments have been unlinked
+            self.assertEqual(_shared_memory_segments(), segments)
+
+    def test_shared_memory_threshold_invalid(self):
+        with self.assertRaises(TypeError):
+            self.executor_type(1, shared_memory_threshold=1.5)
+        with self.assertRaises(ValueError):
+            self.executor_type(1, shared_memory_threshold=0)
+
     def test_terminate_workers(self):
         mock_fn = unittest.mock.Mock()
         with self.executor_type(max_workers=1) as executor:
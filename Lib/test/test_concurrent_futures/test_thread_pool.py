@@ -113,6 +113,129 @@ def log_n_wait(ident):
         self.assertListEqual(log, ["ident='first' started", "ident='first' stopped"])
 
 
+class WorkStealingThreadPoolExecutorTest(ThreadPoolMixin, ExecutorTest,
+                                         BaseTestCase):
+    executor_kwargs = {'work_stealing': True}
+
+    def test_nested_submit(self):
+        # Tasks submitted from a worker go to its own deque and are either
+        # run by that worker or stolen by an idle one.
+        total = (3**6 - 1) // 2
+        results = []
+        done = threading.Event()
+        def spawn(depth):
+            results.append(depth)
+            if len(results) == total:
+                done.set()
+            if depth:
+                for _ in range(3):
+                    self.executor.submit(spawn, depth - 1)
+
+        self.executor.submit(spawn, 5)
+        self.assertTrue(done.wait(support.SHORT_TIMEOUT))
+        self.executor.shutdown(wait=True)
+        self.assertEqual(results.count(0), 3**5)
+
+    def test_local_submit_lifo(self):
+        executor = self.executor_type(1, work_stealing=True)
+        order = []
+        def parent():
+            for i in range(5):
+                executor.submit(order.append, i)
+        executor.submit(parent).result()
+        executor.shutdown(wait=True)
+        self.assertEqual(order, [4, 3, 2, 1, 0])
+
+    def test_outside_submit_fifo(self):
+        # Calls submitted from outside the pool are spread over the worker
+        # inboxes in turn, and each inbox is run oldest first, also by a
+        # worker other than the one it belongs to.
+        executor = self.executor_type(2, work_stealing=True)
+        started = [threading.Event(), threading.Event()]
+        gates = [threading.Event(), threading.Event()]
+        def block(i):
+            started[i].set()
+            gates[i].wait()
+        try:
+            for i in range(2):
+                executor.submit(block, i)
+            for event in started:
+                self.assertTrue(event.wait(support.SHORT_TIMEOUT))
+            order = []
+            futs = [executor.submit(order.append, i) for i in range(10)]
+            gates[0].set()
+            futures.wait(futs, timeout=support.SHORT_TIMEOUT)
+            self.assertEqual(order, [0, 2, 4, 6, 8, 1, 3, 5, 7, 9])
+        finally:
+            for gate in gates:
+                gate.set()
+            executor.shutdown(wait=True)
+
+    def test_stealing(self):
+        # The second worker steals the child submitted by the first worker,
+        # which is blocked waiting for it.
+        executor = self.executor_type(2, work_stealing=True)
+        def parent():
+            return executor.submit(threading.current_thread).result()
+        blocker = threading.Event()
+        executor.submit(blocker.wait)
+        try:
+            fut = executor.submit(parent)
+            blocker.set()
+            self.assertIsNot(fut.result(timeout=support.SHORT_TIMEOUT),
+                             None)
+        finally:
+            blocker.set()
+            executor.shutdown(wait=True)
+        self.assertLessEqual(len(executor._threads), 2)
+
+    def test_shutdown_runs_pending_work_items(self):
+        executor = self.executor_type(2, work_stealing=True)
+        submitted = threading.Event()
+        results = []
+        def parent():
+            for i in range(10):
+                executor.submit(results.append, i)
+            submitted.set()
+        executor.submit(parent)
+        futs = [executor.submit(results.append, -1) for _ in range(10)]
+        submitted.wait()
+        executor.shutdown(wait=True)
+        self.assertEqual(sorted(results), [-1] * 10 + list(range(10)))
+        self.assertTrue(all(f.done() for f in futs))
+
+    def test_shutdown_cancel_futures(self):
+        executor = self.executor_type(1, work_stealing=True)
+        submitted = threading.Event()
+        event = threading.Event()
+        def parent():
+            futs = [executor.submit(mul, i, 2) for i in range(5)]
+            submitted.set()
+            event.wait()
+            return futs
+        fut = executor.submit(parent)
+        submitted.wait()
+        others = [executor.submit(mul, i, 3) for i in range(5)]
+        executor.shutdown(wait=False, cancel_futures=True)
+        event.set()
+        children = fut.result(timeout=support.SHORT_TIMEOUT)
+        executor.shutdown(wait=True)
+        self.assertTrue(all(f.cancelled() for f in children + others))
+
+    def test_initializer_failed(self):
+        def init_fail():
+            raise ValueError('error in initializer')
+        executor = self.executor_type(2, initializer=init_fail,
+                                      work_stealing=True)
+        with self.assertLogs('concurrent.futures', 'CRITICAL'):
+            fut = executor.submit(mul, 2, 3)
+            with self.assertRaises(futures.thread.BrokenThreadPool):
+                fut.result(timeout=support.SHORT_TIMEOUT)
+        with self.assertRaises(futures.thread.BrokenThreadPool):
+            executor.submit(mul, 2, 3)
+        executor.shutdown(wait=True)
+
+
 def setUpModule():
     setup_module()
 
@@ -1,3 +1,4 @@
+import array
 import contextlib
 import importlib
 import importlib.util
@@ -220,7 +221,8 @@ def ignore_byteswarning():
     _SHAREABLE_SIMPLE = [o for o in BUILTIN_SIMPLE
                          if o not in _UNSHAREABLE_SIMPLE]
     _SHAREABLE_CONTAINERS = [
-        *(o for o in BUILTIN_CONTAINERS if type(o) is memoryview),
+        *(o for o in BUILTIN_CONTAINERS
+          if type(o) in (memoryview, frozenset)),
         *(o for o in BUILTIN_CONTAINERS
           if type(o) is tuple and o not in TUPLES_WITHOUT_EQUALITY),
     ]
@@ -1336,6 +1338,42 @@ def test_tuple(self):
             ((1, 2), (3, 4), (5, 6)),
         ])
 
+    def test_frozenset(self):
+        self.assert_roundtrip_equal([
+            frozenset(),
+            frozenset([1, 2, 3]),
+            frozenset(["hello", b"world", 1.5, None]),
+            frozenset([frozenset([1]), (2, 3)]),
+        ])
+        with self.assertRaises(NotShareableError):
+            self.get_xidata(frozenset([OBJECT]))
+
+    def test_buffers(self):
+        # The receiving interpreter gets a memoryview of the same buffer.
+        buf = bytearray(b'spam')
+        arr = array.array('d', [1.5, 2.5])
+        for obj in [buf, arr, b'eggs']:
+            with self.subTest(repr(obj)):
+                got = self.get_roundtrip(memoryview(obj))
+                self.assertIs(type(got), memoryview)
+                self.assertEqual(got, memoryview(obj))
+                self.assertEqual(got.format, memoryview(obj).format)
+                got.release()
+        # Other buffers are not shared implicitly.
+        for obj in [buf, arr]:
+            with self.subTest(repr(obj)):
+                with self.assertRaises(NotShareableError):
+                    self.get_xidata(obj)
+
+        got = self.get_roundtrip(memoryview(buf))
+        got[:2] = b'ha'
+        self.assertEqual(buf, bytearray(b'haam'))
+        # The buffer is exported while the view is alive.
+        with self.assertRaises(BufferError):
+            buf.append(0)
+        got.release()
+        buf.append(0)
+
     def test_tuples_containing_non_shareable_types(self):
         non_shareables = [
             EXCEPTION,
@@ -5,6 +5,7 @@
 import unittest
 import warnings
 from fnmatch import fnmatch, fnmatchcase, translate, filter, filterfalse
+from fnmatch import compile_many
 
 
 IGNORECASE = os.path.normcase('P') == os.path.normcase('p')
@@ -316,6 +317,61 @@ def test_star_indices_locations(self):
         self.assertListEqual(star_indices, [3, 8])
 
 
+class CompileManyTestCase(unittest.TestCase):
+
+    def test_compile_many(self):
+        pats = ['setup.py', '*.py', 'test_*', 'Makefile*', '*.[ch]',
+                'a?c', '[!a]*.txt', '*', 'never']
+        match = compile_many(pats)
+        names = ['setup.py', 'foo.py', 'test_foo', 'test_foo.py',
+                 'Makefile', 'Makefile.pre.in', 'x.c', 'x.h', 'abc',
+                 'a.c', 'b.txt', 'a.txt', 'README', '', 'never']
+        for name in names:
+            with self.subTest(name=name):
+                expected = next((pat for pat in pats
+                                 if fnmatchcase(name, pat)), None)
+                self.assertEqual(match(name), expected)
+
+    def test_first_match(self):
+        match = compile_many(['*.txt', 'a*', 'abc.txt', 'a?c.txt'])
+        self.assertEqual(match('abc.txt'), '*.txt')
+        self.assertEqual(match('abc.py'), 'a*')
+        match = compile_many(['a?c.txt', 'abc.txt', 'a*', '*.txt'])
+        self.assertEqual(match('abc.txt'), 'a?c.txt')
+        self.assertEqual(match('axc.txt'), 'a?c.txt')
+        self.assertEqual(match('ab.txt'), 'a*')
+        self.assertEqual(match('b.txt'), '*.txt')
+        self.assertIsNone(match('b.py'))
+
+    def test_case_sensitive(self):
+        match = compile_many(['*.PY', 'Abc', 'X*'])
+        self.assertIsNone(match('a.py'))
+        self.assertIsNone(match('abc'))
+        self.assertIsNone(match('xyz'))
+        self.assertEqual(match('a.PY'), '*.PY')
+
+    def test_bytes(self):
+        match = compile_many([b'*.py', b'abc', b'x*', b'?.c'])
+        self.assertEqual(match(b'a.py'), b'*.py')
+        self.assertEqual(match(b'abc'), b'abc')
+        self.assertEqual(match(b'xyz'), b'x*')
+        self.assertEqual(match(b'a.c'), b'?.c')
+        self.assertIsNone(match(b'ab.c'))
+
+    def test_mix_bytes_str(self):
+        self.assertRaises(TypeError, compile_many, ['*', b'*'])
+        self.assertRaises(TypeError, compile_many, [b'*', '*'])
+
+    def test_empty(self):
+        match = compile_many([])
+        self.assertIsNone(match(''))
+        self.assertIsNone(match('abc'))
+
+    def test_iterable(self):
+        match = compile_many(pat for pat in ['*.py', '*.c'])
+        self.assertEqual(match('a.c'), '*.c')
+
+
 class FilterTestCase(unittest.TestCase):
 
     def test_filter(self):
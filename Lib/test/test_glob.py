@@ -8,7 +8,8 @@
 
 from test.support import is_wasi, Py_DEBUG
 from test.support.os_helper import (TESTFN, skip_unless_symlink,
-                                    can_symlink, create_empty_file, change_cwd)
+                                    can_symlink, create_empty_file, change_cwd,
+                                    FakePath)
 
 
 class GlobTests(unittest.TestCase):
@@ -513,6 +514,47 @@ def fn(pat):
         self.assertEqual(fn('foo/bar\\baz'), r'(?s:foo[/\\]bar[/\\]baz)\z')
         self.assertEqual(fn('**/*'), r'(?s:(?:.+[/\\])?[^/\\]+)\z')
 
+    def test_pattern_set(self):
+        ps = glob.PatternSet(['*.py', 'src/*.c', 'docs/**'], recursive=True)
+        self.assertEqual(ps.patterns, ('*.py', 'src/*.c', 'docs/**'))
+        self.assertEqual(repr(ps), "PatternSet(['*.py', 'src/*.c', 'docs/**'])")
+        self.assertEqual(ps.match('setup.py'), '*.py')
+        self.assertEqual(ps.match(os.path.join('src', 'a.c')), 'src/*.c')
+        self.assertEqual(ps.match(os.path.join('docs', 'a', 'b.py')), 'docs/**')
+        self.assertIsNone(ps.match(os.path.join('lib', 'a.py')))
+        self.assertIsNone(ps.match('.hidden.py'))
+        self.assertEqual(ps.match(FakePath('a.py')), '*.py')
+        self.assertEqual(ps.filter(['a.py', 'a.c', os.path.join('src', 'a.c')]),
+                         ['a.py', os.path.join('src', 'a.c')])
+
+    def test_pattern_set_matches_translate(self):
+        pats = ['*', '*.py', '**/*.c', 'a/**', '?b', '[ab]*', 'x/y']
+        paths = ['a', 'a.py', '.a.py', 'a/b.c', 'a/b/c.c', 'b/.c.c', 'ab',
+                 'x/y', 'x/z', 'a/b', '.b']
+        for kwargs in ({}, {'recursive': True}, {'include_hidden': True},
+                       {'recursive': True, 'include_hidden': True}):
+            ps = glob.PatternSet(pats, seps='/', **kwargs)
+            regexes = [re.compile(glob.translate(pat, seps='/', **kwargs))
+                       for pat in pats]
+            for path in paths:
+                with self.subTest(path=path, **kwargs):
+                    expected = next((pat for pat, regex in zip(pats, regexes)
+                                     if regex.match(path)), None)
+                    self.assertEqual(ps.match(path), expected)
+
+    def test_pattern_set_first_match(self):
+        ps = glob.PatternSet(['a*', '*'], seps='/')
+        self.assertEqual(ps.match('ab'), 'a*')
+        self.assertEqual(ps.match('b'), '*')
+        ps = glob.PatternSet(['*', 'a*'], seps='/')
+        self.assertEqual(ps.match('ab'), '*')
+
+    def test_pattern_set_empty(self):
+        ps = glob.PatternSet([])
+        self.assertIsNone(ps.match(''))
+        self.assertIsNone(ps.match('a'))
+        self.assertEqual(ps.filter(['a', 'b']), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,8 +9,10 @@
 import struct
 import sys
 import unittest
+import unittest.mock
 import warnings
 from subprocess import PIPE, Popen
+from test import support
 from test.support import catch_unraisable_exception
 from test.support import import_helper
 from test.support import os_helper
@@ -19,6 +21,7 @@
 
 gzip = import_helper.import_module('gzip')
 zlib = import_helper.import_module('zlib')
+from compression._common import _streams
 
 data1 = b"""  int length=DEFAULTALLOC, err = Z_OK;
   PyObject *RetVal;
@@ -893,6 +896,162 @@ def test_write_seek_write(self):
         data = b.getvalue()
         self.assertEqual(gzip.decompress(data), message * 2)
 
+    def test_write_threads(self):
+        block = gzip._PARALLEL_BLOCK_SIZE
+        chunks = [data1 * 50, os.urandom(block), data2 * 5000,
+                  b'', data1 * (block // len(data1) + 1)]
+        for threads in (2, 3):
+            for size in (0, 1, block - 1, block, block + 1, 3 * block):
+                message = b''.join(chunks)[:size]
+                with self.subTest(threads=threads, size=size):
+                    b = io.BytesIO()
+                    with gzip.GzipFile(fileobj=b, mode='wb', mtime=0,
+                                       threads=threads) as f:
+                        self.assertEqual(f.write(message), size)
+                        self.assertEqual(f.tell(), size)
+                    compressed = b.getvalue()
+                    self.assertEqual(gzip.decompress(compressed), message)
+                    self.assertEqual(zlib.decompress(compressed, 31),
+                                     message)
+                    with gzip.GzipFile(fileobj=io.BytesIO(compressed)) as f:
+                        self.assertEqual(f.read(), message)
+
+    def test_write_threads_single_member(self):
+        # A few MB, i.e. a couple of dozen blocks.
+        message = b''.join(data1 * i + data2 for i in range(200))
+        self.assertGreater(len(message), 10 * gzip._PARALLEL_BLOCK_SIZE)
+        b = io.BytesIO()
+        with gzip.GzipFile(fileobj=b, mode='wb', threads=4) as f:
+            for i in range(0, len(message), 1000):
+                f.write(message[i:i+1000])
+        compressed = b.getvalue()
+        d = zlib.decompressobj(31)
+        self.assertEqual(d.decompress(compressed), message)
+        self.assertTrue(d.eof)
+        self.assertEqual(d.unused_data, b'')
+        # Priming each block with the previous one keeps the ratio close to
+        # that of single threaded compression.
+        self.assertLess(len(compressed), len(gzip.compress(message)) * 1.1)
+
+    def test_write_threads_flush(self):
+        b = io.BytesIO()
+        message = b"important message here."
+        with gzip.GzipFile(fileobj=b, mode='w', threads=2) as f:
+            f.write(message)
+            f.flush()
+            partial_data = b.getvalue()
+            f.write(message)
+            f.flush(zlib.Z_FULL_FLUSH)
+            f.write(message)
+            f.flush(zlib.Z_PARTIAL_FLUSH)
+            f.write(message)
+        self.assertEqual(gzip.decompress(b.getvalue()), message * 4)
+        d = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+        f = io.BytesIO(partial_data)
+        gzip._read_gzip_header(f)
+        self.assertEqual(d.decompress(f.read()), message)
+
+    def test_write_threads_open(self):
+        message = data1 * 10000
+        with gzip.open(self.filename, 'wb', threads=0) as f:
+            f.write(message)
+        with gzip.open(self.filename, 'rb', threads=2) as f:
+            self.assertEqual(f.read(), message)
+        with gzip.open(self.filename, 'wt', threads=2,
+                       encoding='ascii') as f:
+            f.write(message.decode())
+        with gzip.open(self.filename, 'rt', encoding='ascii') as f:
+            self.assertEqual(f.read(), message.decode())
+
+    def test_write_threads_invalid(self):
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(fileobj=io.BytesIO(), mode='wb', threads=-1)
+
+    def test_seek_index(self):
+        members = [data1 * 50, data2 * 50, data1 + data2]
+        compressed = [gzip.compress(m) for m in members]
+        compressed[1] += b'\0' * 5  # padding between members
+        with open(self.filename, 'wb') as f:
+            f.write(b''.join(compressed))
+        expected = [(len(members[0]), len(compressed[0])),
+                    (len(members[0]) + len(members[1]),
+                     len(compressed[0]) + len(compressed[1]))]
+        data = b''.join(members)
+        with support.swap_attr(_streams, 'CHECKPOINT_INTERVAL', 1):
+            with gzip.GzipFile(self.filename) as f:
+                self.assertEqual(f.read(), data)
+                self.assertEqual(f.get_seek_index(), expected)
+                for offset in (len(data) - 3, 10, len(members[0]) + 3, 0):
+                    f.seek(offset)
+                    self.assertEqual(f.read(), data[offset:])
+            with gzip.GzipFile(self.filename) as f:
+                f.set_seek_index(expected)
+                f.seek(len(members[0]) + len(members[1]) + 1)
+                self.assertEqual(f.read(), members[2][1:])
+                self.assertEqual(f.mtime, 0)
+            with gzip.GzipFile(self.filename, 'wb') as f:
+                self.assertRaises(OSError, f.get_seek_index)
+
+    @unittest.skipUnless(hasattr(zlib._ZlibDecompressor, 'copy'),
+                         'requires _ZlibDecompressor.copy()')
+    def test_seek_index_single_member(self):
+        # Checkpoints inside a member hold a copy of the decompressor and
+        # are not part of the seek index.  They are taken when all the
+        # compressed data read so far has been consumed, so the data must
+        # not compress well.  They are only taken once a seek index has
+        # been asked for, or after a backward seek.
+        data = os.urandom(1024 * 1024)
+        with open(self.filename, 'wb') as f:
+            f.write(gzip.compress(data))
+        with support.swap_attr(_streams, 'STATE_CHECKPOINT_INTERVAL', 10000):
+            with gzip.GzipFile(self.filename) as f:
+                self.assertEqual(f.get_seek_index(), [])
+                self.assertEqual(f.read(), data)
+                self.assertEqual(f.get_seek_index(), [])
+                raw = f._buffer.raw
+                checkpoints = [pos for pos, *_ in raw._checkpoints]
+                self.assertGreater(len(checkpoints), 5)
+                rewind = raw._rewind
+                for offset in (len(data) - 3, checkpoints[2],
+                               checkpoints[2] + 1, checkpoints[0] + 10):
+                    raw._rewind = unittest.mock.Mock(wraps=rewind)
+                    f.seek(offset)
+                    # The CRC of the member is checked at the end.
+                    self.assertEqual(f.read(), data[offset:])
+                    raw._rewind.assert_not_called()
+                f.seek(10)
+                self.assertEqual(f.read(), data[10:])
+                f.set_seek_index([])
+                f.seek(checkpoints[2])
+                self.assertEqual(f.read(), data[checkpoints[2]:])
+
+    @unittest.skipUnless(hasattr(zlib._ZlibDecompressor, 'copy'),
+                         'requires _ZlibDecompressor.copy()')
+    def test_state_checkpoints_bounded(self):
+        data = os.urandom(1024 * 1024)
+        with open(self.filename, 'wb') as f:
+            f.write(gzip.compress(data))
+        with support.swap_attr(_streams, 'STATE_CHECKPOINT_INTERVAL', 10000), \
+             support.swap_attr(_streams, 'MAX_STATE_CHECKPOINTS', 8):
+            # A sequential read does not keep copies of the decompressor.
+            with gzip.GzipFile(self.filename) as f:
+                self.assertEqual(f.read(), data)
+                raw = f._buffer.raw
+                self.assertEqual(len(raw._checkpoints), 0)
+
+            # After a backward seek, their number is bounded.
+            with gzip.GzipFile(self.filename) as f:
+                f.read(500000)
+                f.seek(10)
+                self.assertEqual(f.read(), data[10:])
+                raw = f._buffer.raw
+                checkpoints = [pos for pos, *_ in raw._checkpoints]
+                self.assertGreater(len(checkpoints), 2)
+                self.assertLess(len(checkpoints), 8)
+                self.assertEqual(checkpoints, sorted(checkpoints))
+                for offset in (checkpoints[1] + 1, len(data) - 3, 20):
+                    f.seek(offset)
+                    self.assertEqual(f.read(), data[offset:])
 
     def test_refloop_unraisable(self):
         # Ensure a GzipFile referring to a temporary fileobj deletes cleanly.
@@ -1,4 +1,4 @@
-from io import StringIO
+from io import BytesIO, RawIOBase, StringIO
 from test.test_json import PyTest, CTest
 
 from test.support import bigmemtest, _1G
@@ -12,6 +12,74 @@ def test_dump(self):
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
+    def test_dump_binary(self):
+        bio = BytesIO()
+        self.json.dump({'a': ['\xe9', 1.5]}, bio)
+        self.assertEqual(bio.getvalue(), b'{"a": ["\\u00e9", 1.5]}')
+        bio = BytesIO()
+        self.json.dump({'a': ['\xe9', 1.5]}, bio, ensure_ascii=False,
+                       separators=(',', ':'))
+        self.assertEqual(bio.getvalue(), b'{"a":["\xc3\xa9",1.5]}')
+
+    def test_dump_raw_short_writes(self):
+        class ShortWriter(RawIOBase):
+            def __init__(self):
+                self.data = bytearray()
+            def writable(self):
+                return True
+            def write(self, b):
+                self.data += bytes(b[:3])
+                return min(len(b), 3)
+        obj = {'a': ['\xe9', 1.5], 'b': list(range(10))}
+        raw = ShortWriter()
+        self.json.dump(obj, raw, ensure_ascii=False)
+        self.assertEqual(bytes(raw.data),
+                         self.dumps(obj, ensure_ascii=False).encode())
+
+        class NonBlockingWriter(RawIOBase):
+            def __init__(self, limit):
+                self.limit = limit
+            def writable(self):
+                return True
+            def write(self, b):
+                if self.limit <= 0:
+                    return None
+                n = min(len(b), 3, self.limit)
+                self.limit -= n
+                return n
+        with self.assertRaises(BlockingIOError) as cm:
+            self.json.dump(obj, NonBlockingWriter(0))
+        self.assertEqual(cm.exception.characters_written, 0)
+        with self.assertRaises(BlockingIOError) as cm:
+            self.json.dump(obj, NonBlockingWriter(7))
+        self.assertEqual(cm.exception.characters_written, 7)
+
+    def test_dumpb(self):
+        self.assertEqual(self.json.dumpb({}), b'{}')
+        self.assertEqual(self.json.dumpb('\xe9'), b'"\\u00e9"')
+        self.assertEqual(self.json.dumpb('\xe9', ensure_ascii=False),
+                         b'"\xc3\xa9"')
+        for obj in [None, True, 1, 1.5, float('nan'), 'abc', '\u20ac',
+                    '\U0001f600', [], [1, [2, {'3': None}]],
+                    {'\u20ac': ['\xe9', '\U0001f600'], 'b': 2.0}]:
+            for kw in [{}, {'ensure_ascii': False}, {'indent': 2},
+                       {'sort_keys': True, 'separators': (',', ':')}]:
+                with self.subTest(obj=obj, kw=kw):
+                    self.assertEqual(self.json.dumpb(obj, **kw),
+                                     self.dumps(obj, **kw).encode('utf-8'))
+
+    def test_dumpb_lone_surrogate(self):
+        self.assertEqual(self.json.dumpb(['\ud800']), b'["\\ud800"]')
+        with self.assertRaises(UnicodeEncodeError):
+            self.json.dumpb(['\ud800'], ensure_ascii=False)
+
+    def test_encode_bytes_subclass(self):
+        class Encoder(self.json.JSONEncoder):
+            def iterencode(self, o, _one_shot=False):
+                return super().iterencode([x.upper() for x in o], _one_shot)
+        self.assertEqual(Encoder().encode_bytes(['a']), b'["A"]')
+        self.assertEqual(self.json.dumpb(['a'], cls=Encoder), b'["A"]')
+
     def test_dump_skipkeys(self):
         v = {b'invalid_key': False, 'valid_key': True}
         with self.assertRaises(TypeError):
@@ -0,0 +1,152 @@
+from io import BytesIO, StringIO
+from test.test_json import PyTest, CTest
+
+
+class TestIterload:
+    def iterload(self, s, **kw):
+        fp = StringIO(s) if isinstance(s, str) else BytesIO(s)
+        return list(self.json.iterload(fp, **kw))
+
+    def test_items(self):
+        doc = '[1, 2.5, "three", null, true, false, [4, [5]], {"six": 6}]'
+        expected = self.loads(doc)
+        for bufsize in (1, 2, 3, 7, 100):
+            with self.subTest(bufsize=bufsize):
+                self.assertEqual(self.iterload(doc, bufsize=bufsize), expected)
+
+    def test_empty_array(self):
+        for doc in ('[]', '  [ ]  ', '[\n]\n'):
+            with self.subTest(doc=doc):
+                self.assertEqual(self.iterload(doc, bufsize=1), [])
+
+    def test_numbers_split_across_chunks(self):
+        doc = '[12345, -6789e3, 1.25, -Infinity, NaN]'
+        for bufsize in range(1, len(doc) + 1):
+            with self.subTest(bufsize=bufsize):
+                items = self.iterload(doc, bufsize=bufsize)
+                self.assertEqual(items[:3], [12345, -6789e3, 1.25])
+                self.assertEqual(items[3], float('-inf'))
+                self.assertNotEqual(items[4], items[4])
+
+    def test_lazy(self):
+        fp = StringIO('[1, 2, ' + 'x' * 100)
+        it = self.json.iterload(fp, bufsize=4)
+        self.assertEqual(next(it), 1)
+        self.assertEqual(next(it), 2)
+        self.assertRaises(self.JSONDecodeError, next, it)
+
+    def test_bounded_buffer(self):
+        item = {'key': 'value' * 20}
+        n = 1000
+        doc = self.dumps([item] * n)
+
+        class Reader(StringIO):
+            total = 0
+            def read(self, size=-1):
+                chunk = super().read(size)
+                self.total += len(chunk)
+                return chunk
+
+        fp = Reader(doc)
+        it = self.json.iterload(fp, bufsize=64)
+        self.assertEqual(next(it), item)
+        self.assertLess(fp.total, len(doc) // 10)
+        self.assertEqual(sum(1 for _ in it), n - 1)
+        self.assertEqual(fp.total, len(doc))
+
+    def test_bytes(self):
+        doc = '["€", {"\U0001f600": [1, 2]}, "abc"]'
+        expected = self.loads(doc)
+        for encoding in ('utf-8', 'utf-16-le', 'utf-16-be',
+                         'utf-32-le', 'utf-32-be', 'utf-8-sig', 'utf-16'):
+            for bufsize in (1, 3, 1024):
+                with self.subTest(encoding=encoding, bufsize=bufsize):
+                    data = doc.encode(encoding)
+                    self.assertEqual(self.iterload(data, bufsize=bufsize),
+                                     expected)
+
+    def test_hooks(self):
+        doc = '[{"a": 1, "b": 2.5}, {}]'
+        self.assertEqual(
+            self.iterload(doc, object_pairs_hook=list, parse_float=str),
+            [[('a', 1), ('b', '2.5')], []])
+        self.assertEqual(
+            self.iterload(doc, object_hook=len, parse_int=str),
+            [2, 0])
+
+    def test_cls(self):
+        class Decoder(self.json.JSONDecoder):
+            def __init__(self, **kw):
+                super().__init__(parse_int=lambda s: -int(s), **kw)
+        self.assertEqual(self.iterload('[1, [2]]', cls=Decoder), [-1, [-2]])
+
+    def test_iterdecode(self):
+        decoder = self.json.JSONDecoder()
+        chunks = ['[', '"a', 'b"', ',', ' 1', '0', ']']
+        self.assertEqual(list(decoder.iterdecode(chunks)), ['ab', 10])
+        self.assertEqual(list(decoder.iterdecode(iter(chunks))), ['ab', 10])
+        with self.assertRaises(TypeError):
+            list(decoder.iterdecode([b'[]']))
+
+    def test_errors(self):
+        test_cases = [
+            ('', "Expecting '['"),
+            ('{}', "Expecting '['"),
+            ('1', "Expecting '['"),
+            ('[', 'Expecting value'),
+            ('[1', "Expecting ',' delimiter"),
+            ('[1 2]', "Expecting ',' delimiter"),
+            ('[1,]', 'Illegal trailing comma before end of array'),
+            ('[1,', 'Expecting value'),
+            ('[1, "abc', 'Unterminated string starting at'),
+            ('[1, {"a" 1}]', "Expecting ':' delimiter"),
+            ('[1] 2', 'Extra data'),
+            ('[] []', 'Extra data'),
+            ('\ufeff[]', 'Unexpected UTF-8 BOM'),
+        ]
+        for doc, msg in test_cases:
+            for bufsize in (1, 1024):
+                with self.subTest(doc=doc, bufsize=bufsize):
+                    with self.assertRaises(self.JSONDecodeError) as cm:
+                        self.iterload(doc, bufsize=bufsize)
+                    self.assertStartsWith(cm.exception.msg, msg)
+
+    def test_error_stops_reading(self):
+        # An error which more input cannot fix is raised without reading
+        # the rest of the document.
+        decoder = self.json.JSONDecoder()
+        for item in ('x', '[1 2]', '{"a" 1}', '{1: 2}', '"\\x"', 'tx',
+                     '[1.5.]'):
+            with self.subTest(item=item):
+                chunks = iter(['[1, ', item, ', 2' * 10, ']'] + ['  '] * 100)
+                it = decoder.iterdecode(chunks)
+                self.assertEqual(next(it), 1)
+                self.assertRaises(self.JSONDecodeError, next, it)
+                self.assertGreater(len(list(chunks)), 90)
+
+    def test_truncated_items(self):
+        # Items split anywhere are still decoded.
+        decoder = self.json.JSONDecoder()
+        doc = ('[[1.5e3], [-Infinity, true], {"a": null}, "\\u00e9\\ud83d'
+               '\\ude00", [[-12]]]')
+        expected = self.loads(doc)
+        for i in range(1, len(doc)):
+            with self.subTest(i=i):
+                self.assertEqual(list(decoder.iterdecode([doc[:i], doc[i:]])),
+                                 expected)
+
+    def test_invalid_input_type(self):
+        with self.assertRaises(TypeError):
+            list(self.json.iterload(StringIO('[]'), bufsize=None,
+                                    cls=self.json.JSONDecoder,
+                                    nonexistent=1))
+
+        class Reader:
+            def read(self, size):
+                return 1
+        with self.assertRaises(TypeError):
+            list(self.json.iterload(Reader()))
+
+
+class TestPyIterload(TestIterload, PyTest): pass
+class TestCIterload(TestIterload, CTest): pass
@@ -0,0 +1,139 @@
+import dataclasses
+import datetime
+import enum
+import uuid
+from test.test_json import PyTest, CTest
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+@dataclasses.dataclass
+class Node:
+    name: str
+    children: list = dataclasses.field(default_factory=list)
+    parent: object = None
+
+@dataclasses.dataclass
+class Empty:
+    pass
+
+class Color(enum.Enum):
+    RED = 'red'
+    GREEN = 2
+    BLUE = (0, 0, 255)
+
+class Priority(enum.IntEnum):
+    LOW = 1
+
+
+class TestNativeTypes:
+    def dumps(self, obj, **kw):
+        return super().dumps(obj, native_types=True, **kw)
+
+    def test_disabled_by_default(self):
+        for obj in [Point(1, 2), Color.RED, datetime.date(2020, 1, 2),
+                    uuid.UUID(int=1)]:
+            with self.subTest(obj=obj):
+                with self.assertRaises(TypeError):
+                    self.json.dumps(obj)
+
+    def test_dataclass(self):
+        self.assertEqual(self.dumps(Point(1, 2)), '{"x": 1, "y": 2}')
+        self.assertEqual(self.dumps(Empty()), '{}')
+        self.assertEqual(self.dumps([Point(1, 2), Point(3, 4)]),
+                         '[{"x": 1, "y": 2}, {"x": 3, "y": 4}]')
+        node = Node('a', [Node('b'), Node('c', [Node('d')])])
+        self.assertEqual(self.json.loads(self.dumps(node)),
+                         dataclasses.asdict(node))
+
+    def test_dataclass_formatting(self):
+        point = Point(y=1, x=2)
+        self.assertEqual(self.dumps(point, sort_keys=True),
+                         '{"x": 2, "y": 1}')
+        self.assertEqual(self.dumps(point, indent=2),
+                         '{\n  "x": 2,\n  "y": 1\n}')
+        self.assertEqual(self.dumps([Empty()], indent=2), '[\n  {}\n]')
+        self.assertEqual(self.dumps(point, separators=(',', ':')),
+                         '{"x":2,"y":1}')
+
+        @dataclasses.dataclass
+        class D:
+            é: int = 1
+        self.assertEqual(self.dumps(D()), '{"\\u00e9": 1}')
+        self.assertEqual(self.dumps(D(), ensure_ascii=False), '{"é": 1}')
+
+    def test_encoder_reuse(self):
+        encoder = self.json.JSONEncoder(native_types=True)
+        point = Point(y=1, x=2)
+        self.assertEqual(encoder.encode(point), '{"x": 2, "y": 1}')
+        encoder.sort_keys = False
+        self.assertEqual(encoder.encode(point), '{"x": 2, "y": 1}')
+        encoder.sort_keys = True
+        point = Point(2, 1)
+        point.x, point.y = 'b', 'a'
+        self.assertEqual(encoder.encode(point), '{"x": "b", "y": "a"}')
+        self.assertEqual(''.join(encoder.iterencode(point)),
+                         '{"x": "b", "y": "a"}')
+
+    def test_enum(self):
+        self.assertEqual(self.dumps(Color.RED), '"red"')
+        self.assertEqual(self.dumps(Color.GREEN), '2')
+        self.assertEqual(self.dumps(Color.BLUE), '[0, 0, 255]')
+        self.assertEqual(self.dumps(Priority.LOW), '1')
+        self.assertEqual(self.dumps({'c': [Color.RED, Point(Color.GREEN, 0)]}),
+                         '{"c": ["red", {"x": 2, "y": 0}]}')
+
+    def test_datetime(self):
+        self.assertEqual(self.dumps(datetime.date(2020, 1, 2)),
+                         '"2020-01-02"')
+        self.assertEqual(self.dumps(datetime.time(12, 30, 15, 500)),
+                         '"12:30:15.000500"')
+        self.assertEqual(
+            self.dumps(datetime.datetime(2020, 1, 2, 3, 4, 5,
+                                         tzinfo=datetime.timezone.utc)),
+            '"2020-01-02T03:04:05+00:00"')
+
+    def test_uuid(self):
+        u = uuid.UUID('12345678-1234-5678-1234-567812345678')
+        self.assertEqual(self.dumps([u]),
+                         '["12345678-1234-5678-1234-567812345678"]')
+
+    def test_default(self):
+        calls = []
+        def default(obj):
+            calls.append(obj)
+            return repr(obj)
+        self.assertEqual(self.dumps([Point(1, 2), {1}], default=default),
+                         '[{"x": 1, "y": 2}, "{1}"]')
+        self.assertEqual(calls, [{1}])
+        self.assertEqual(self.dumps(Point, default=default),
+                         '"' + repr(Point) + '"')
+
+    def test_circular(self):
+        node = Node('a')
+        node.children.append(node)
+        with self.assertRaises(ValueError) as cm:
+            self.dumps(node)
+        self.assertIn('Circular reference detected', str(cm.exception))
+        node.children.clear()
+        node.parent = node
+        with self.assertRaises(ValueError):
+            self.dumps(node)
+        # The same instance twice is not circular.
+        point = Point(1, 2)
+        self.assertEqual(self.dumps([point, point]),
+                         '[{"x": 1, "y": 2}, {"x": 1, "y": 2}]')
+
+    def test_error_notes(self):
+        with self.assertRaises(TypeError) as cm:
+            self.dumps([Point(1, {1})])
+        self.assertEqual(cm.exception.__notes__,
+                         ["when serializing Point item 'y'",
+                          'when serializing list item 0'])
+
+
+class TestPyNativeTypes(TestNativeTypes, PyTest): pass
+class TestCNativeTypes(TestNativeTypes, CTest): pass
@@ -1304,6 +1304,31 @@ def test_seek_past_end(self):
             self.assertEqual(f.tell(), len(INPUT))
             self.assertEqual(f.read(), b"")
 
+    def test_seek_index(self):
+        with support.swap_attr(_streams, 'CHECKPOINT_INTERVAL', 1):
+            with LZMAFile(BytesIO(COMPRESSED_XZ * 3)) as f:
+                self.assertEqual(f.get_seek_index(), [])
+                f.seek(0, 2)
+                index = f.get_seek_index()
+                self.assertEqual(index,
+                                 [(len(INPUT), len(COMPRESSED_XZ)),
+                                  (2 * len(INPUT), 2 * len(COMPRESSED_XZ))])
+                f.seek(2 * len(INPUT) + 10)
+                self.assertEqual(f.read(), INPUT[10:])
+                f.seek(len(INPUT) - 5)
+                self.assertEqual(f.read(10), INPUT[-5:] + INPUT[:5])
+                self.assertEqual(f.get_seek_index(), index)
+            with LZMAFile(BytesIO(COMPRESSED_XZ * 3)) as f:
+                f.set_seek_index(index)
+                f.seek(len(INPUT) + 20)
+                self.assertEqual(f.read(), INPUT[20:] + INPUT)
+                self.assertRaises(ValueError, f.set_seek_index, index[::-1])
+                self.assertRaises(ValueError, f.set_seek_index, [(0, 0)])
+                self.assertRaises(TypeError, f.set_seek_index, [(1.0, 0)])
+        with LZMAFile(BytesIO(), "w") as f:
+            self.assertRaises(UnsupportedOperation, f.get_seek_index)
+            self.assertRaises(UnsupportedOperation, f.set_seek_index, [])
+
     def test_seek_past_start(self):
         with LZMAFile(BytesIO(COMPRESSED_XZ)) as f:
             f.seek(-88)
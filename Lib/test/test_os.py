@@ -35,6 +35,7 @@
 from test.support import import_helper
 from test.support import os_helper
 from test.support import socket_helper
+from test.support import threading_helper
 from test.support import infinite_recursion
 from test.support import warnings_helper
 from platform import win32_is_iot
@@ -1883,6 +1884,31 @@ def walk(self, top, **kwargs):
             bdirs[:] = list(map(os.fsencode, dirs))
             bfiles[:] = list(map(os.fsencode, files))
 
+@threading_helper.requires_working_threading()
+class ParallelWalkTests(WalkTests):
+    """Tests for os.walk() with workers."""
+    def walk(self, top, **kwargs):
+        if 'follow_symlinks' in kwargs:
+            kwargs['followlinks'] = kwargs.pop('follow_symlinks')
+        return os.walk(top, workers=3, **kwargs)
+
+    def test_same_order(self):
+        for i in range(5):
+            for j in range(4):
+                os.makedirs(os.path.join(self.walk_path, f'd{i}', f'e{j}', 'f'))
+        for topdown in (True, False):
+            with self.subTest(topdown=topdown):
+                expected = list(os.walk(self.walk_path, topdown=topdown))
+                for workers in (0, 2, 8):
+                    self.assertEqual(list(os.walk(self.walk_path, topdown,
+                                                  workers=workers)),
+                                     expected)
+
+    def test_bad_workers(self):
+        with self.assertRaises(ValueError):
+            next(os.walk(self.walk_path, workers=-1))
+
+
 @unittest.skipUnless(hasattr(os, 'fwalk'), "Test needs os.fwalk()")
 class BytesFwalkTests(FwalkTests):
     """Tests for os.walk() with bytes."""
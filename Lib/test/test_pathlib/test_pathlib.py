@@ -12,6 +12,7 @@
 import stat
 import tempfile
 import unittest
+from glob import PatternSet
 from unittest import mock
 from urllib.request import pathname2url
 
@@ -2971,6 +2972,85 @@ def test_rglob_pathlike(self):
         self.assertEqual(expect, set(p.rglob(P(pattern))))
         self.assertEqual(expect, set(p.rglob(FakePath(pattern))))
 
+    def test_glob_workers(self):
+        P = self.cls
+        p = P(self.base)
+        for pattern in ["**/*", "**/", "dir*/**/file*", "*/*"]:
+            with self.subTest(pattern=pattern):
+                self.assertEqual(list(p.glob(pattern, workers=3)),
+                                 list(p.glob(pattern)))
+        self.assertEqual(list(p.rglob("file*", workers=0)),
+                         list(p.rglob("file*")))
+        with self.assertRaises(ValueError):
+            p.glob("**/*", workers=-1)
+
+    def test_glob_workers_single_pool(self):
+        # The recursive selectors of a glob call share one pool of threads.
+        from concurrent.futures import ThreadPoolExecutor
+        P = self.cls
+        p = P(self.base)
+        init = ThreadPoolExecutor.__init__
+        pools = []
+        def counting_init(self, *args, **kwargs):
+            pools.append(self)
+            init(self, *args, **kwargs)
+        with mock.patch.object(ThreadPoolExecutor, '__init__', counting_init):
+            self.assertEqual(list(p.glob("dir*/**/file*", workers=3)),
+                             list(p.glob("dir*/**/file*")))
+        self.assertEqual(len(pools), 1)
+
+    def test_glob_info(self):
+        P = self.cls
+        p = P(self.base)
+        for pattern in ["**/*", "*", "dir*/*", "dirC/**/file*"]:
+            with self.subTest(pattern=pattern):
+                paths = list(p.glob(pattern))
+                expected = [(path.is_dir(follow_symlinks=False),
+                             path.is_file(follow_symlinks=False),
+                             path.is_symlink()) for path in paths]
+                # The status found while scanning the directories is reused.
+                with mock.patch('os.stat', side_effect=AssertionError), \
+                     mock.patch('os.lstat', side_effect=AssertionError):
+                    actual = [(path.info.is_dir(follow_symlinks=False),
+                               path.info.is_file(follow_symlinks=False),
+                               path.info.is_symlink()) for path in paths]
+                self.assertEqual(actual, expected)
+
+    def test_glob_pattern_set(self):
+        P = self.cls
+        p = P(self.base)
+        pats = ["*A", "dirC/**/file*", "dir*/fileB", "**/fileD"]
+        ps = PatternSet(pats)
+        expected = set()
+        for pat in pats:
+            expected.update(p.glob(pat))
+        self.assertEqual(set(p.glob(ps)), expected)
+        self.assertEqual(set(p.rglob(PatternSet(["fileC", "file*D"]))),
+                         {p / "dirC" / "fileC", p / "dirC" / "dirD" / "fileD"})
+        self.assertEqual(list(p.glob(PatternSet([]))), [])
+        with self.assertRaises(ValueError):
+            p.glob(PatternSet(["*", "dirC/"]))
+
+    def test_glob_pattern_set_depth(self):
+        P = self.cls
+        p = P(self.base)
+        scanned = []
+        scandir = os.scandir
+        def counting_scandir(path):
+            scanned.append(os.fspath(path))
+            return scandir(path)
+        expected = set(p.glob("file*")) | set(p.glob("*A"))
+        with mock.patch('os.scandir', counting_scandir):
+            self.assertEqual(set(p.glob(PatternSet(["file*", "*A"]))),
+                             expected)
+            self.assertEqual(len(scanned), 1)
+            scanned.clear()
+            self.assertEqual(set(p.glob(PatternSet(["dirC/dirD/*"]))),
+                             {p / "dirC" / "dirD" / "fileD"})
+            depths = {os.path.relpath(path, p).count(os.sep)
+                      for path in scanned}
+            self.assertLessEqual(max(depths), 1)
+
     @needs_symlinks
     def test_glob_recurse_symlinks_common(self):
         def _check(path, glob, expected):
@@ -3547,6 +3627,17 @@ def test_walk_bad_dir(self):
         finally:
             path1new.rename(path1)
 
+    def test_walk_workers(self):
+        for top_down in (True, False):
+            for follow_symlinks in (True, False):
+                with self.subTest(top_down=top_down,
+                                  follow_symlinks=follow_symlinks):
+                    expected = list(self.walk_path.walk(
+                        top_down, follow_symlinks=follow_symlinks))
+                    actual = list(self.walk_path.walk(
+                        top_down, follow_symlinks=follow_symlinks, workers=3))
+                    self.assertEqual(actual, expected)
+
     def test_walk_many_open_files(self):
         depth = 30
         base = self.cls(self.base, 'deep')
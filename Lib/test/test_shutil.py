@@ -30,6 +30,7 @@
 
 from test import support
 from test.support import os_helper
+from test.support import threading_helper
 from test.support.os_helper import TESTFN, FakePath
 
 TESTFN2 = TESTFN + "2"
@@ -156,6 +157,36 @@ def supports_file2file_sendfile():
 
 SUPPORTS_SENDFILE = supports_file2file_sendfile()
 
+
+def supports_clone():
+    # Whether the file system of the current directory supports FICLONE.
+    if not shutil._USE_CP_CLONE:
+        return False
+    srcname = None
+    dstname = None
+    try:
+        with tempfile.NamedTemporaryFile("wb", dir=os.getcwd(), delete=False) as f:
+            srcname = f.name
+            f.write(b"0123456789")
+
+        with open(srcname, "rb") as src:
+            with tempfile.NamedTemporaryFile("wb", dir=os.getcwd(), delete=False) as dst:
+                dstname = dst.name
+                try:
+                    shutil._fastcopy_clone(src, dst)
+                except (OSError, _GiveupOnFastCopy):
+                    return False
+                else:
+                    return True
+    finally:
+        if srcname is not None:
+            os_helper.unlink(srcname)
+        if dstname is not None:
+            os_helper.unlink(dstname)
+
+
+SUPPORTS_CLONE = supports_clone()
+
 # AIX 32-bit mode, by default, lacks enough memory for the xz/lzma compiler test
 # The AIX command 'dump -o program' gives XCOFF header information
 # The second word of the last line in the maxdata value
@@ -192,6 +223,89 @@ def test_rmtree_works_on_bytes(self):
         self.assertIsInstance(victim, bytes)
         shutil.rmtree(victim)
 
+    @os_helper.skip_unless_symlink
+    def test_rmtree_stale_path_info(self):
+        # The status cached by Path.info is not trusted: a directory
+        # replaced by a symlink is still detected.
+        import pathlib
+        tmp = self.mkdtemp()
+        victim = os.path.join(tmp, 'killme')
+        target = os.path.join(tmp, 'target')
+        os.mkdir(victim)
+        os.mkdir(target)
+        create_file(os.path.join(target, 'somefile'), 'foo')
+        path, = pathlib.Path(tmp).glob('kill*')
+        self.assertTrue(path.info.is_dir(follow_symlinks=False))
+        os.rmdir(victim)
+        os.symlink(target, victim, target_is_directory=True)
+        with self.assertRaises(OSError):
+            shutil.rmtree(path)
+        self.assertTrue(os.path.exists(os.path.join(target, 'somefile')))
+
+    @threading_helper.requires_working_threading()
+    def test_rmtree_workers(self):
+        tmp = self.mkdtemp()
+        victim = os.path.join(tmp, 'killme')
+        for i in range(3):
+            sub = os.path.join(victim, f'dir{i}', 'nested')
+            os.makedirs(sub)
+            for j in range(5):
+                create_file((sub, f'file{j}'), 'foo')
+                create_file((victim, f'dir{i}', f'file{j}'), 'bar')
+        shutil.rmtree(victim, workers=3)
+        self.assertFalse(os.path.exists(victim))
+        self.assertEqual(os.listdir(tmp), [])
+
+        with self.assertRaises(ValueError):
+            shutil.rmtree(tmp, workers=-1)
+        self.assertTrue(os.path.exists(tmp))
+
+    @threading_helper.requires_working_threading()
+    def test_rmtree_workers_bounded(self):
+        # Like copies in copytree(), at most twice as many unlinks as there
+        # are workers are queued at a time.
+        for impl in (shutil._rmtree_impl, shutil._rmtree_unsafe):
+            with self.subTest(impl=impl.__name__), \
+                 unittest.mock.patch.object(shutil, '_rmtree_impl', impl):
+                self.check_rmtree_workers_bounded()
+
+    def check_rmtree_workers_bounded(self):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        tmp = self.mkdtemp()
+        victim = os.path.join(tmp, 'killme')
+        os.makedirs(os.path.join(victim, 'sub'))
+        for i in range(20):
+            create_file((victim, f'file{i}'), 'foo')
+            create_file((victim, 'sub', f'file{i}'), 'bar')
+
+        started = threading.Event()
+        timer = threading.Timer(0.1, started.set)
+        unlink = os.unlink
+        def slow_unlink(*args, **kwargs):
+            started.wait(support.SHORT_TIMEOUT)
+            unlink(*args, **kwargs)
+        submit = ThreadPoolExecutor.submit
+        futures = []
+        max_queued = 0
+        def counting_submit(self, *args, **kwargs):
+            nonlocal max_queued
+            futures[:] = [f for f in futures if not f.done()]
+            future = submit(self, *args, **kwargs)
+            futures.append(future)
+            max_queued = max(max_queued, len(futures))
+            return future
+        with unittest.mock.patch('os.unlink', slow_unlink), \
+             unittest.mock.patch.object(ThreadPoolExecutor, 'submit',
+                                        counting_submit):
+            timer.start()
+            try:
+                shutil.rmtree(victim, workers=2)
+            finally:
+                timer.cancel()
+        self.assertFalse(os.path.exists(victim))
+        self.assertLessEqual(max_queued, 4)
+
     @os_helper.skip_unless_symlink
     def test_rmtree_fails_on_symlink_onerror(self):
         tmp = self.mkdtemp()
@@ -768,6 +882,60 @@ def test_copytree_simple(self):
         actual = read_file((dst_dir, 'test_dir', 'test.txt'))
         self.assertEqual(actual, '456')
 
+    @threading_helper.requires_working_threading()
+    def test_copytree_workers(self):
+        src_dir = self.mkdtemp()
+        dst_dir = os.path.join(self.mkdtemp(), 'destination')
+        for i in range(3):
+            sub = os.path.join(src_dir, f'dir{i}')
+            os.makedirs(os.path.join(sub, 'nested'))
+            for j in range(5):
+                create_file((sub, f'file{j}.txt'), f'{i}-{j}')
+                create_file((sub, 'nested', f'file{j}.txt'), f'{j}-{i}')
+        create_file((src_dir, 'top.txt'), 'top')
+        for dirpath, dirnames, filenames in os.walk(src_dir):
+            os.utime(dirpath, ns=(10**9, 2 * 10**9))
+
+        shutil.copytree(src_dir, dst_dir, workers=4)
+        self.assertEqual(rlistdir(dst_dir), rlistdir(src_dir))
+        for dirpath, dirnames, filenames in os.walk(src_dir):
+            rel = os.path.relpath(dirpath, src_dir)
+            for name in filenames:
+                self.assertEqual(read_file((dst_dir, rel, name)),
+                                 read_file((dirpath, name)))
+            # Directories are finalized after their contents are copied.
+            self.assertEqual(os.stat(os.path.join(dst_dir, rel)).st_mtime_ns,
+                             2 * 10**9)
+
+    @threading_helper.requires_working_threading()
+    def test_copytree_workers_errors(self):
+        src_dir = self.mkdtemp()
+        dst_dir = os.path.join(self.mkdtemp(), 'destination')
+        os.mkdir(os.path.join(src_dir, 'sub'))
+        for name in 'abc':
+            create_file((src_dir, 'sub', name), name)
+
+        def copy_function(src, dst):
+            if os.path.basename(src) == 'b':
+                raise OSError('cannot copy b')
+            shutil.copy2(src, dst)
+
+        with self.assertRaises(shutil.Error) as cm:
+            shutil.copytree(src_dir, dst_dir, copy_function=copy_function,
+                            workers=2)
+        errors = cm.exception.args[0]
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0][0], os.path.join(src_dir, 'sub', 'b'))
+        self.assertEqual(sorted(os.listdir(os.path.join(dst_dir, 'sub'))),
+                         ['a', 'c'])
+
+    def test_copytree_workers_invalid(self):
+        src_dir = self.mkdtemp()
+        dst_dir = os.path.join(self.mkdtemp(), 'destination')
+        with self.assertRaises(ValueError):
+            shutil.copytree(src_dir, dst_dir, workers=-1)
+        self.assertFalse(os.path.exists(dst_dir))
+
     def test_copytree_dirs_exist_ok(self):
         src_dir = self.mkdtemp()
         dst_dir = self.mkdtemp()
@@ -1401,6 +1569,18 @@ def test_copy2(self):
             self.assertEqual(getattr(file1_stat, 'st_flags'),
                              getattr(file2_stat, 'st_flags'))
 
+    def test_copy2_stale_path_info(self):
+        # The source is stat()ed afresh, not through Path.info.
+        import pathlib
+        tmp_dir = self.mkdtemp()
+        create_file((tmp_dir, 'foo'), 'foo')
+        dst = os.path.join(tmp_dir, 'bar')
+        src, = pathlib.Path(tmp_dir).glob('f*')
+        self.assertTrue(src.info.is_file())
+        os.utime(src, ns=(10**9, 2 * 10**9))
+        shutil.copy2(src, dst)
+        self.assertEqual(os.stat(dst).st_mtime_ns, 2 * 10**9)
+
     @os_helper.skip_unless_symlink
     def test_copy2_symlinks(self):
         tmp_dir = self.mkdtemp()
@@ -3337,6 +3517,7 @@ def test_blocksize_arg(self):
 
 @unittest.skipIf(not SUPPORTS_SENDFILE, 'os.sendfile() not supported')
 @unittest.mock.patch.object(shutil, "_USE_CP_COPY_FILE_RANGE", False)
+@unittest.mock.patch.object(shutil, "_USE_CP_CLONE", False)
 class TestZeroCopySendfile(_ZeroCopyFileLinuxTest, unittest.TestCase):
     PATCHPOINT = "os.sendfile"
     BLOCKSIZE_INDEX = 3
@@ -3367,6 +3548,7 @@ def test_file2file_not_supported(self):
 
 
 @unittest.skipUnless(shutil._USE_CP_COPY_FILE_RANGE, "os.copy_file_range() not supported")
+@unittest.mock.patch.object(shutil, "_USE_CP_CLONE", False)
 class TestZeroCopyCopyFileRange(_ZeroCopyFileLinuxTest, unittest.TestCase):
     PATCHPOINT = "os.copy_file_range"
     BLOCKSIZE_INDEX = 2
@@ -3397,6 +3579,100 @@ def zerocopy_fun(self, src, dst):
         return shutil._fastcopy_fcopyfile(src, dst, posix._COPYFILE_DATA)
 
 
+@unittest.skipUnless(SUPPORTS_CLONE, 'FICLONE not supported')
+class TestZeroCopyClone(_ZeroCopyFileTest, unittest.TestCase):
+    PATCHPOINT = "fcntl.ioctl"
+
+    def zerocopy_fun(self, fsrc, fdst):
+        return shutil._fastcopy_clone(fsrc, fdst)
+
+
+class TestCopyStrategy(BaseTest, unittest.TestCase):
+
+    def setUp(self):
+        tmp = self.mkdtemp()
+        self.src = os.path.join(tmp, 'src')
+        self.dst = os.path.join(tmp, 'dst')
+        create_file(self.src, b'x' * 100_000)
+
+    def copy(self, func=shutil.copyfile, **kwargs):
+        strategies = []
+        func(self.src, self.dst, report_strategy=strategies.append, **kwargs)
+        self.assertEqual(read_file(self.dst, binary=True), b'x' * 100_000)
+        self.assertEqual(len(strategies), 1)
+        return strategies[0]
+
+    def test_report_strategy(self):
+        readwrite = {'readinto', 'read'}
+        fastcopy = {'fcopyfile', 'copy_file_range', 'sendfile'} | readwrite
+        self.assertIn(self.copy(), {'clone'} | fastcopy)
+        self.assertIn(self.copy(copy_strategy='fastcopy'), fastcopy)
+        self.assertIn(self.copy(copy_strategy='readwrite'), readwrite)
+        self.assertIn(self.copy(shutil.copy), {'clone'} | fastcopy)
+        self.assertIn(self.copy(shutil.copy2, copy_strategy='readwrite'),
+                      readwrite)
+
+    @os_helper.skip_unless_symlink
+    def test_report_strategy_symlink(self):
+        os_helper.unlink(self.src)
+        os.symlink('target', self.src)
+        strategies = []
+        shutil.copyfile(self.src, self.dst, follow_symlinks=False,
+                        report_strategy=strategies.append)
+        self.assertEqual(strategies, ['symlink'])
+
+    def test_invalid_strategy(self):
+        for strategy in ('', 'reflink', None, 1):
+            with self.subTest(strategy=strategy):
+                with self.assertRaises(ValueError):
+                    shutil.copyfile(self.src, self.dst,
+                                    copy_strategy=strategy)
+        self.assertFalse(os.path.exists(self.dst))
+
+    @unittest.skipUnless(shutil._USE_CP_CLONE, 'FICLONE not supported')
+    def test_clone_first(self):
+        def clone(fsrc, fdst):
+            fdst.write(fsrc.read())
+        with unittest.mock.patch('shutil._fastcopy_clone',
+                                 side_effect=clone) as m:
+            self.assertEqual(self.copy(), 'clone')
+            self.assertEqual(m.call_count, 1)
+            self.assertEqual(self.copy(copy_strategy='clone'), 'clone')
+            self.assertEqual(m.call_count, 2)
+            self.assertNotEqual(self.copy(copy_strategy='fastcopy'), 'clone')
+            self.assertEqual(self.copy(copy_strategy='readwrite'), 'read')
+            self.assertEqual(m.call_count, 2)
+
+    @unittest.skipUnless(shutil._USE_CP_CLONE, 'FICLONE not supported')
+    def test_clone_not_supported(self):
+        for code in (errno.EOPNOTSUPP, errno.EXDEV, errno.ENOTTY):
+            with self.subTest(errno=errno.errorcode[code]):
+                with unittest.mock.patch('fcntl.ioctl',
+                                         side_effect=OSError(code, 'yo')):
+                    self.assertNotEqual(self.copy(), 'clone')
+                    with self.assertRaises(OSError) as cm:
+                        shutil.copyfile(self.src, self.dst,
+                                        copy_strategy='clone')
+                self.assertEqual(cm.exception.errno, code)
+                self.assertEqual(cm.exception.filename, self.src)
+                self.assertEqual(cm.exception.filename2, self.dst)
+
+    @unittest.skipUnless(shutil._USE_CP_CLONE, 'FICLONE not supported')
+    def test_clone_error(self):
+        with unittest.mock.patch('fcntl.ioctl',
+                                 side_effect=OSError(errno.ENOSPC, 'yo')):
+            with self.assertRaises(OSError) as cm:
+                shutil.copyfile(self.src, self.dst)
+        self.assertEqual(cm.exception.errno, errno.ENOSPC)
+
+    @unittest.mock.patch.object(shutil, '_USE_CP_CLONE', False)
+    def test_clone_unavailable(self):
+        with self.assertRaises(OSError) as cm:
+            shutil.copyfile(self.src, self.dst, copy_strategy='clone')
+        self.assertEqual(cm.exception.errno, errno.EOPNOTSUPP)
+        self.assertNotEqual(self.copy(), 'clone')
+
+
 class TestGetTerminalSize(unittest.TestCase):
     def test_does_not_crash(self):
         """Check if get_terminal_size() returns a meaningful value.
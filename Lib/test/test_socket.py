@@ -3107,6 +3107,58 @@ def _testRecvFromNegative(self):
         self.cli.sendto(MSG, 0, (HOST, self.port))
 
 
+@unittest.skipUnless(hasattr(socket.socket, 'recvmmsg'),
+                     'recvmmsg() and sendmmsg() required for this test.')
+class MultipleMessagesUDPTest(SocketUDPTest):
+
+    def setUp(self):
+        super().setUp()
+        self.cli = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(self.cli.close)
+        self.cli.bind((HOST, 0))
+        self.addr = (HOST, self.port)
+
+    def testSendmmsgAndRecvmmsg(self):
+        sent = self.cli.sendmmsg([(b'one', self.addr),
+                                  (bytearray(b'two'), self.addr),
+                                  (memoryview(b'three'), self.addr)])
+        self.assertEqual(sent, 3)
+        self.serv.settimeout(support.SHORT_TIMEOUT)
+        msgs = self.serv.recvmmsg(1024, 3)
+        cli_addr = self.cli.getsockname()
+        self.assertEqual(msgs, [(b'one', cli_addr), (b'two', cli_addr),
+                                (b'three', cli_addr)])
+
+    def testSendmmsgConnected(self):
+        self.cli.connect(self.addr)
+        self.assertEqual(self.cli.sendmmsg(iter([b'one', b'two'])), 2)
+        self.assertEqual(self.cli.sendmmsg([]), 0)
+        self.serv.settimeout(support.SHORT_TIMEOUT)
+        self.assertEqual([data for data, addr in self.serv.recvmmsg(2, 2)],
+                         [b'on', b'tw'])
+
+    def testRecvmmsgWaitForOne(self):
+        self.cli.sendto(MSG, self.addr)
+        self.serv.settimeout(support.SHORT_TIMEOUT)
+        msgs = self.serv.recvmmsg(1024, 10, socket.MSG_WAITFORONE)
+        self.assertEqual(msgs, [(MSG, self.cli.getsockname())])
+
+    def testRecvmmsgNonBlocking(self):
+        self.serv.setblocking(False)
+        self.assertRaises(BlockingIOError, self.serv.recvmmsg, 1024, 10)
+
+    def testRecvmmsgBadArgs(self):
+        self.assertRaises(ValueError, self.serv.recvmmsg, -1, 1)
+        self.assertRaises(ValueError, self.serv.recvmmsg, 1024, 0)
+        self.assertRaises(TypeError, self.serv.recvmmsg)
+
+    def testSendmmsgBadArgs(self):
+        self.assertRaises(TypeError, self.cli.sendmmsg, 42)
+        self.assertRaises(TypeError, self.cli.sendmmsg, ['data'])
+        self.assertRaises(TypeError, self.cli.sendmmsg, [(b'data',)])
+        self.assertRaises(TypeError, self.cli.sendmmsg, [(b'data', 42)])
+
+
 @unittest.skipUnless(HAVE_SOCKET_UDPLITE,
           'UDPLITE sockets required for this test.')
 class BasicUDPLITETest(ThreadedUDPLITESocketTest):
@@ -9,7 +9,9 @@
 import shutil
 import re
 import warnings
+import marshal
 import stat
+import time
 
 import unittest
 import unittest.mock
@@ -781,6 +783,145 @@ def test_extractall_pathlike_dir(self):
                 path = os.path.join(DIR, tarinfo.name)
                 self.assertEqual(os.path.getmtime(path), tarinfo.mtime)
 
+    def _tree(self, root, members):
+        names = {os.path.normpath(t.name) for t in members}
+        tree = {}
+        for dirpath, dirnames, filenames in os.walk(root):
+            for name in dirnames + filenames:
+                path = os.path.join(dirpath, name)
+                key = os.path.relpath(path, root)
+                if os.path.islink(path):
+                    tree[key] = ('link', os.readlink(path))
+                elif os.path.isdir(path):
+                    # Only the directories in the archive have their mtime.
+                    tree[key] = ('dir', key in names and os.path.getmtime(path))
+                else:
+                    with open(path, 'rb') as f:
+                        tree[key] = ('file', f.read(), os.path.getmtime(path))
+        return tree
+
+    def test_extractall_workers(self):
+        DIR = os.path.join(TEMPDIR, "extractall")
+        with tarfile.open(self.tarname, encoding="iso8859-1") as tar:
+            members = [t for t in tar
+                       if t.isreg() or t.isdir() or t.islnk()
+                       or (t.issym() and os_helper.can_symlink())]
+            with os_helper.temp_dir(DIR):
+                tar.extractall(DIR, members, filter='fully_trusted')
+                expected = self._tree(DIR, members)
+            for max_size in (tarfile._PIPELINE_MAX_SIZE, 1000):
+                with self.subTest(max_size=max_size), \
+                     os_helper.temp_dir(DIR), \
+                     unittest.mock.patch.object(tarfile, '_PIPELINE_MAX_SIZE',
+                                                max_size):
+                    tar.extractall(DIR, members, filter='fully_trusted',
+                                   workers=3)
+                    self.assertEqual(self._tree(DIR, members), expected)
+            with self.assertRaises(ValueError):
+                tar.extractall(DIR, members, workers=-1)
+
+    def test_index_cache(self):
+        cache = os.path.join(TEMPDIR, "index-cache")
+        self.addCleanup(os_helper.unlink, cache)
+        with tarfile.open(self.tarname, self.mode, encoding="iso8859-1",
+                          index_cache=cache) as tar:
+            expected = [t.get_info() for t in tar.getmembers()]
+            # Modifying the members does not change the cached index.
+            tar.getmembers()[0].name = "renamed"
+            self.assertEqual(tar.getmember("renamed").name, "renamed")
+        self.assertTrue(os.path.exists(cache))
+        with unittest.mock.patch("tarfile.TarInfo.fromtarfile",
+                                 side_effect=AssertionError):
+            with tarfile.open(self.tarname, self.mode, encoding="iso8859-1",
+                              index_cache=cache) as tar:
+                self.assertEqual([t.get_info() for t in tar.getmembers()],
+                                 expected)
+                with tar.extractfile("ustar/regtype") as f:
+                    self.assertEqual(sha256sum(f.read()), sha256_regtype)
+
+        # The cache is not used for another archive.
+        with tarfile.open(self.tarname, self.mode, encoding="iso8859-1",
+                          index_cache=cache) as tar:
+            count = len(tar.getmembers())
+        with tarfile.open(tmpname, "w") as tar:
+            tar.addfile(tarfile.TarInfo("foo"))
+        with tarfile.open(tmpname, "r:", index_cache=cache) as tar:
+            self.assertEqual(tar.getnames(), ["foo"])
+        self.assertNotEqual(count, 1)
+
+        # An invalid cache is ignored and replaced.
+        with open(cache, "wb") as f:
+            f.write(b"garbage")
+        with tarfile.open(tmpname, "r:", index_cache=cache) as tar:
+            self.assertEqual(tar.getnames(), ["foo"])
+        with unittest.mock.patch("tarfile.TarInfo.fromtarfile",
+                                 side_effect=AssertionError):
+            with tarfile.open(tmpname, "r:", index_cache=cache) as tar:
+                self.assertEqual(tar.getnames(), ["foo"])
+
+    def test_index_cache_corrupt(self):
+        # A cache with a valid key but inconsistent content is not used.
+        cache = os.path.join(TEMPDIR, "index-cache")
+        self.addCleanup(os_helper.unlink, cache)
+        with tarfile.open(self.tarname, self.mode, encoding="iso8859-1",
+                          index_cache=cache) as tar:
+            expected = [t.get_info() for t in tar.getmembers()]
+        with open(cache, "rb") as f:
+            key, offset, records = marshal.loads(f.read())
+        def replace(i, **fields):
+            record = list(records[i])
+            for field, value in fields.items():
+                record[tarfile._INDEX_CACHE_FIELDS.index(field)] = value
+            return [*records[:i], tuple(record), *records[i + 1:]]
+        for cached in [
+            [key, offset, records],
+            (key, offset, records, None),
+            (key, str(offset), records),
+            (key, offset, tuple(records)),
+            (key, offset, [*records, None]),
+            (key, offset, [*records, records[0][:-1]]),
+            (key, offset, records[::-1]),
+            (key, 0, records),
+            (key, offset, replace(0, name=b"name")),
+            (key, offset, replace(0, size=-1)),
+            (key, offset, replace(0, offset=-1)),
+            (key, offset, replace(0, offset_data=0, offset=512)),
+            (key, offset, replace(0, type=b"")),
+            (key, offset, replace(0, pax_headers={1: "x"})),
+            (key, offset, replace(0, sparse=[(0,)])),
+            (key, offset, replace(0, sparse=[(0, -1)])),
+        ]:
+            with self.subTest(cached=cached):
+                with open(cache, "wb") as f:
+                    f.write(marshal.dumps(cached))
+                with tarfile.open(self.tarname, self.mode,
+                                  encoding="iso8859-1",
+                                  index_cache=cache) as tar:
+                    self.assertEqual([t.get_info() for t in tar.getmembers()],
+                                     expected)
+
+    def test_index_cache_temporary_file(self):
+        DIR = os.path.join(TEMPDIR, "index-cache-dir")
+        with os_helper.temp_dir(DIR):
+            for cache in ("index", os.fsencode("bindex")):
+                with tarfile.open(self.tarname, self.mode,
+                                  encoding="iso8859-1",
+                                  index_cache=os.path.join(
+                                      os.fsencode(DIR)
+                                      if isinstance(cache, bytes) else DIR,
+                                      cache)) as tar:
+                    tar.getmembers()
+            # The temporary files are renamed over the caches.
+            self.assertEqual(sorted(os.listdir(DIR)), ["bindex", "index"])
+
+    def test_index_cache_invalid_mode(self):
+        cache = os.path.join(TEMPDIR, "index-cache")
+        with self.assertRaises(ValueError):
+            tarfile.open(tmpname, "w", index_cache=cache)
+        with self.assertRaises(ValueError):
+            tarfile.open(self.tarname, "r|" + self.suffix, index_cache=cache)
+        self.assertFalse(os.path.exists(cache))
+
     def test_extract_pathlike_dir(self):
         dirtype = "ustar/dirtype"
         DIR = os.path.join(TEMPDIR, "extractall")
@@ -1613,6 +1754,57 @@ def test_extractall_symlinks(self):
             os_helper.unlink(temparchive)
             os_helper.rmtree(tempdir)
 
+    def test_extractall_workers_order(self):
+        # Members extracted concurrently still replace each other, and
+        # links see their targets, in archive order.
+        tempdir = os.path.join(TEMPDIR, "testworkers")
+        temparchive = os.path.join(TEMPDIR, "testworkers.tar")
+        self.addCleanup(os_helper.unlink, temparchive)
+        with tarfile.open(temparchive, 'w') as tar:
+            for name, data in [("a", b"first"), ("b", b"other"),
+                               ("a", b"second")]:
+                t = tarfile.TarInfo(name)
+                t.size = len(data)
+                tar.addfile(t, io.BytesIO(data))
+            t = tarfile.TarInfo("c")
+            t.type = tarfile.LNKTYPE
+            t.linkname = "a"
+            tar.addfile(t)
+        with os_helper.temp_dir(tempdir), tarfile.open(temparchive) as tar:
+            tar.extractall(tempdir, filter='data', workers=4)
+            for name, data in [("a", b"second"), ("b", b"other"),
+                               ("c", b"second")]:
+                with open(os.path.join(tempdir, name), 'rb') as f:
+                    self.assertEqual(f.read(), data)
+
+    def test_extractall_workers_same_file(self):
+        # Different names of the same file are still extracted in order,
+        # even if writing the earlier member takes longer.
+        tempdir = os.path.join(TEMPDIR, "testworkers")
+        temparchive = os.path.join(TEMPDIR, "testworkers.tar")
+        self.addCleanup(os_helper.unlink, temparchive)
+        members = [("a", b"first"), ("./a", b"second"),
+                   ("d//b", b"first"), ("d/b", b"second")]
+        with tarfile.open(temparchive, 'w') as tar:
+            for name, data in members:
+                t = tarfile.TarInfo(name)
+                t.size = len(data)
+                tar.addfile(t, io.BytesIO(data))
+
+        extract_one = tarfile.TarFile._extract_one
+        def slow_extract_one(self, tarinfo, *args, data=None, **kwargs):
+            if data == b"first":
+                time.sleep(0.1)
+            return extract_one(self, tarinfo, *args, data=data, **kwargs)
+
+        with (os_helper.temp_dir(tempdir), tarfile.open(temparchive) as tar,
+              unittest.mock.patch.object(tarfile.TarFile, '_extract_one',
+                                         slow_extract_one)):
+            tar.extractall(tempdir, filter='data', workers=4)
+            for name in ("a", os.path.join("d", "b")):
+                with open(os.path.join(tempdir, name), 'rb') as f:
+                    self.assertEqual(f.read(), b"second")
+
     def test_pathnames(self):
         self._test_pathname("foo")
         self._test_pathname(os.path.join("foo", ".", "bar"))
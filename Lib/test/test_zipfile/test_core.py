@@ -4,6 +4,7 @@
 import importlib.util
 import io
 import itertools
+import marshal
 import os
 import posixpath
 import stat
@@ -478,6 +479,49 @@ def test_zipextfile_attrs(self):
             self.assertIs(fid.writable(), False)
             self.assertRaises(ValueError, fid.seekable)
 
+    def test_writeall(self):
+        self.addCleanup(rmtree, TESTFNDIR)
+        os.mkdir(TESTFNDIR)
+        filenames = [TESTFN, TESTFNDIR, (TESTFN, 'another.name')]
+        for i in range(5):
+            name = os.path.join(TESTFNDIR, f'file{i}')
+            with open(name, 'wb') as f:
+                f.write(self.data[i*1000:] * i)
+            filenames.append(name)
+
+        # The archive doesn't depend on the number of workers, and is the
+        # same as when writing the files one by one.
+        with zipfile.ZipFile(TESTFN2, 'w', self.compression) as zipfp:
+            for item in filenames:
+                if not isinstance(item, tuple):
+                    item = (item,)
+                zipfp.write(*item)
+        with open(TESTFN2, 'rb') as f:
+            expected = f.read()
+        for workers in None, 1, 3, 0:
+            with self.subTest(workers=workers):
+                with zipfile.ZipFile(TESTFN2, 'w', self.compression) as zipfp:
+                    zipfp.writeall(filenames, workers=workers)
+                with open(TESTFN2, 'rb') as f:
+                    self.assertEqual(f.read(), expected)
+
+        with zipfile.ZipFile(TESTFN2) as zipfp:
+            self.assertIsNone(zipfp.testzip())
+            self.assertEqual(zipfp.namelist()[:3],
+                             [TESTFN, TESTFNDIR + '/', 'another.name'])
+            self.assertEqual(zipfp.read('another.name'), self.data)
+            self.assertTrue(zipfp.getinfo(TESTFNDIR + '/').is_dir())
+
+    def test_writeall_compress_type(self):
+        with zipfile.ZipFile(TESTFN2, 'w') as zipfp:
+            zipfp.writeall([(TESTFN, 'a'), (TESTFN, 'b')], self.compression,
+                           workers=2)
+        with zipfile.ZipFile(TESTFN2) as zipfp:
+            for name in 'a', 'b':
+                zinfo = zipfp.getinfo(name)
+                self.assertEqual(zinfo.compress_type, self.compression)
+                self.assertEqual(zipfp.read(name), self.data)
+
     def tearDown(self):
         unlink(TESTFN)
         unlink(TESTFN2)
@@ -1637,6 +1681,60 @@ def test_extract_all_with_target(self):
         with temp_dir() as extdir:
             self._test_extract_all_with_target(extdir)
 
+    def test_extract_all_workers(self):
+        with temp_cwd():
+            with zipfile.ZipFile(TESTFN2, "w", zipfile.ZIP_STORED) as zipfp:
+                for fpath, fdata in SMALL_TEST_DATA:
+                    zipfp.writestr(fpath, fdata)
+                zipfp.mkdir('emptydir')
+                # Later duplicates win.
+                with self.assertWarns(UserWarning):
+                    zipfp.writestr(SMALL_TEST_DATA[0][0], 'duplicate')
+            with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+                for workers in 3, 0:
+                    with self.subTest(workers=workers):
+                        zipfp.extractall('target', workers=workers)
+                        for fpath, fdata in SMALL_TEST_DATA[1:]:
+                            self.check_file(os.path.join('target', fpath),
+                                            fdata.encode())
+                        self.check_file(
+                            os.path.join('target', SMALL_TEST_DATA[0][0]),
+                            b'duplicate')
+                        self.assertTrue(os.path.isdir(
+                            os.path.join('target', 'emptydir')))
+                        rmtree('target')
+
+                zipfp.extractall('target', [SMALL_TEST_DATA[1][0]],
+                                 workers=2)
+                self.assertEqual(os.listdir('target'), ['ziptest2dir'])
+                with self.assertRaises(KeyError):
+                    zipfp.extractall('target', ['missing'], workers=2)
+                with self.assertRaises(ValueError):
+                    zipfp.extractall('target', workers=-1)
+
+    def test_extract_all_workers_same_file(self):
+        # Different names of the same file are still extracted in order,
+        # even if writing the earlier member takes longer.
+        members = [('a', b'first'), ('./a', b'second'),
+                   ('d//b', b'first'), ('d/b', b'second'),
+                   ('x/../y', b'first'), ('x/y', b'second')]
+        extract_member = zipfile.ZipFile._extract_member
+        def slow_extract_member(self, member, targetpath, pwd):
+            if self.read(member) == b'first':
+                time.sleep(0.1)
+            return extract_member(self, member, targetpath, pwd)
+
+        with temp_cwd():
+            with zipfile.ZipFile(TESTFN2, "w") as zipfp:
+                for name, data in members:
+                    zipfp.writestr(name, data)
+            with (zipfile.ZipFile(TESTFN2, "r") as zipfp,
+                  mock.patch.object(zipfile.ZipFile, '_extract_member',
+                                    slow_extract_member)):
+                zipfp.extractall('target', workers=4)
+            for name in 'a', os.path.join('d', 'b'), os.path.join('x', 'y'):
+                self.check_file(os.path.join('target', name), b'second')
+
     def test_extract_all_with_target_pathlike(self):
         with temp_dir() as extdir:
             self._test_extract_all_with_target(FakePath(extdir))
@@ -3016,6 +3114,23 @@ def test_write(self):
                     with zipf.open('twos') as zopen:
                         self.assertEqual(zopen.read(), b'222')
 
+    def test_writeall(self):
+        self.addCleanup(unlink, TESTFN)
+        with open(TESTFN, 'wb') as f:
+            f.write(b'111')
+        for wrapper in (lambda f: f), Tellable, Unseekable:
+            with self.subTest(wrapper=wrapper):
+                f = io.BytesIO()
+                f.write(b'abc')
+                bf = io.BufferedWriter(f)
+                with zipfile.ZipFile(wrapper(bf), 'w', zipfile.ZIP_STORED) as zipfp:
+                    zipfp.writeall([(TESTFN, 'ones'), (TESTFN, 'twos')],
+                                   workers=2)
+                self.assertEqual(f.getvalue()[:5], b'abcPK')
+                with zipfile.ZipFile(f) as zipf:
+                    self.assertEqual(zipf.read('ones'), b'111')
+                    self.assertEqual(zipf.read('twos'), b'111')
+
     def test_open_write(self):
         for wrapper in (lambda f: f), Tellable, Unseekable:
             with self.subTest(wrapper=wrapper):
@@ -3033,7 +3148,221 @@ def test_open_write(self):
                     self.assertEqual(zipf.read('twos'), b'222')
 
 
+class OpenBufferTests(unittest.TestCase):
+    def setUp(self):
+        self.data1 = b'111' + randbytes(10000)
+        self.data2 = b'222' + randbytes(10000)
+        # Prepend some data to check that offsets are handled.
+        with open(TESTFN2, 'wb') as f:
+            f.write(b'prefix')
+        with zipfile.ZipFile(TESTFN2, 'a') as zipfp:
+            zipfp.writestr('ones', self.data1)
+            zipfp.writestr('twos', self.data2)
+            zipfp.writestr('empty', b'')
+        self.addCleanup(unlink, TESTFN2)
+
+    def test_open_buffer(self):
+        with zipfile.ZipFile(TESTFN2) as zipfp:
+            with zipfp.open_buffer('ones') as view:
+                self.assertIsInstance(view, memoryview)
+                self.assertTrue(view.readonly)
+                self.assertEqual(view, self.data1)
+            view = zipfp.open_buffer(zipfp.getinfo('twos'))
+            self.assertEqual(view, self.data2)
+            self.assertEqual(zipfp.open_buffer('empty'), b'')
+            with self.assertRaises(KeyError):
+                zipfp.open_buffer('missing')
+        # The view outlives the archive.
+        self.assertEqual(view, self.data2)
+        view.release()
+        with self.assertRaises(ValueError):
+            zipfp.open_buffer('ones')
+
+    @requires_zlib()
+    def test_compressed_member(self):
+        with zipfile.ZipFile(TESTFN2, 'a') as zipfp:
+            zipfp.writestr('deflated', self.data1, zipfile.ZIP_DEFLATED)
+        with zipfile.ZipFile(TESTFN2) as zipfp:
+            with self.assertRaisesRegex(ValueError, 'stored'):
+                zipfp.open_buffer('deflated')
+
+    def test_unsupported_file(self):
+        with open(TESTFN2, 'rb') as f:
+            data = f.read()
+        with zipfile.ZipFile(io.BytesIO(data)) as zipfp:
+            with self.assertRaises(io.UnsupportedOperation):
+                zipfp.open_buffer('ones')
+        with zipfile.ZipFile(TESTFN2, 'a') as zipfp:
+            with self.assertRaises(ValueError):
+                zipfp.open_buffer('ones')
+
+    def test_bad_header(self):
+        with zipfile.ZipFile(TESTFN2) as zipfp:
+            offset = zipfp.getinfo('twos').header_offset
+        with open(TESTFN2, 'r+b') as f:
+            f.seek(offset)
+            f.write(b'XX')
+        with zipfile.ZipFile(TESTFN2) as zipfp:
+            self.assertEqual(zipfp.open_buffer('ones'), self.data1)
+            with self.assertRaises(zipfile.BadZipFile):
+                zipfp.open_buffer('twos')
+
+
 @requires_zlib()
+class IndexCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache = TESTFN + '-index'
+        with zipfile.ZipFile(TESTFN2, 'w') as zipfp:
+            zipfp.writestr('a/one', b'1')
+            zinfo = zipfile.ZipInfo('a/two', date_time=(2000, 1, 2, 3, 4, 6))
+            # An extra field with an unknown id.
+            zinfo.extra = struct.pack('<HH', 0xabcd, 3) + b'xyz'
+            zinfo.comment = b'comment'
+            zipfp.writestr(zinfo, b'22')
+            zipfp.writestr('b/three', b'333')
+        self.addCleanup(unlink, TESTFN2)
+        self.addCleanup(unlink, self.cache)
+
+    def assertSameInfos(self, infos, expected):
+        self.assertEqual(len(infos), len(expected))
+        for zinfo, other in zip(infos, expected):
+            for attr in zipfile.ZipInfo.__slots__:
+                self.assertEqual(getattr(zinfo, attr), getattr(other, attr),
+                                 f'{zinfo.filename}: {attr}')
+
+    def test_cache(self):
+        with zipfile.ZipFile(TESTFN2) as zipfp:
+            expected = zipfp.infolist()
+        with zipfile.ZipFile(TESTFN2, index_cache=self.cache) as zipfp:
+            self.assertSameInfos(zipfp.infolist(), expected)
+        self.assertTrue(os.path.exists(self.cache))
+        with zipfile.ZipFile(FakePath(TESTFN2),
+                             index_cache=FakePath(self.cache)) as zipfp:
+            self.assertEqual(zipfp.namelist(), ['a/one', 'a/two', 'b/three'])
+            self.assertEqual(zipfp.read('b/three'), b'333')
+            self.assertSameInfos(zipfp.infolist(), expected)
+
+    def test_cache_temporary_file(self):
+        # The cache is written through a uniquely named temporary file
+        # in the same directory, which doesn't remain afterwards.
+        with os_helper.temp_dir() as tmpdir:
+            for cache in (os.path.join(tmpdir, 'index'),
+                          os.fsencode(os.path.join(tmpdir, 'bindex'))):
+                with zipfile.ZipFile(TESTFN2, index_cache=cache) as zipfp:
+                    self.assertEqual(zipfp.read('a/one'), b'1')
+            self.assertEqual(sorted(os.listdir(tmpdir)), ['bindex', 'index'])
+
+    def test_getinfo_after_close(self):
+        with zipfile.ZipFile(TESTFN2, index_cache=self.cache):
+            pass
+        with zipfile.ZipFile(TESTFN2, index_cache=self.cache) as zipfp:
+            pass
+        self.assertEqual(zipfp.getinfo('a/two').comment, b'comment')
+
+    def test_stale_cache(self):
+        with zipfile.ZipFile(TESTFN2, index_cache=self.cache):
+            pass
+        with zipfile.ZipFile(TESTFN2, 'a') as zipfp:
+            zipfp.writestr('c/four', b'4444')
+        with zipfile.ZipFile(TESTFN2, index_cache=self.cache) as zipfp:
+            self.assertEqual(zipfp.read('c/four'), b'4444')
+            self.assertEqual(len(zipfp.infolist()), 4)
+
+    def test_bad_cache(self):
+        for data in (b'', b'garbage', marshal.dumps((1, 2, 3, 4))):
+            with self.subTest(data=data):
+                with open(self.cache, 'wb') as f:
+                    f.write(data)
+                with zipfile.ZipFile(TESTFN2,
+                                     index_cache=self.cache) as zipfp:
+                    self.assertEqual(zipfp.read('a/one'), b'1')
+                # The cache was rebuilt.
+                with open(self.cache, 'rb') as f:
+                    self.assertNotEqual(f.read(), data)
+
+    def test_corrupt_cache(self):
+        # A cache with a valid key but inconsistent content is not used.
+        with zipfile.ZipFile(TESTFN2, index_cache=self.cache):
+            pass
+        with open(self.cache, 'rb') as f:
+            key, names, positions, end_offsets = marshal.loads(f.read())
+        positions = array.array('q', positions)
+        end_offsets = array.array('q', end_offsets)
+        bad_positions = array.array('q', positions)
+        bad_positions[-1] = 10**6
+        bad_end_offsets = array.array('q', end_offsets)
+        bad_end_offsets[0] = -1
+        for cached in [
+            {key: 1, 2: 3, 4: 5, 6: 7},
+            [key, names, positions.tobytes(), end_offsets.tobytes()],
+            (key, names, positions.tobytes(), end_offsets.tobytes(), None),
+            (key, tuple(names), positions.tobytes(), end_offsets.tobytes()),
+            (key, [1, 2, 3], positions.tobytes(), end_offsets.tobytes()),
+            (key, names, positions.tobytes()[:-1], end_offsets.tobytes()),
+            (key, names, positions.tobytes()[:-8], end_offsets.tobytes()),
+            (key, names, positions[::-1].tobytes(), end_offsets.tobytes()),
+            (key, names, bad_positions.tobytes(), end_offsets.tobytes()),
+            (key, names, positions.tobytes(), bad_end_offsets.tobytes()),
+            (key, names, positions.tobytes(), end_offsets),
+        ]:
+            with self.subTest(cached=cached):
+                with open(self.cache, 'wb') as f:
+                    f.write(marshal.dumps(cached))
+                with zipfile.ZipFile(TESTFN2,
+                                     index_cache=self.cache) as zipfp:
+                    self.assertEqual(zipfp.namelist(),
+                                     ['a/one', 'a/two', 'b/three'])
+                    self.assertEqual(zipfp.getinfo('a/two').comment,
+                                     b'comment')
+                    self.assertEqual(zipfp.read('b/three'), b'333')
+
+    def test_swapped_names(self):
+        # An archive rebuilt with the same layout and modification time
+        # matches the key of the cache, but not the cached names.
+        def write(names):
+            with zipfile.ZipFile(TESTFN2, 'w') as zipfp:
+                for name, data in zip(names, (b'1', b'2')):
+                    zipfp.writestr(name, data)
+        write(['x/one', 'y/one'])
+        st = os.stat(TESTFN2)
+        with zipfile.ZipFile(TESTFN2, index_cache=self.cache):
+            pass
+        write(['y/one', 'x/one'])
+        os.utime(TESTFN2, ns=(st.st_atime_ns, st.st_mtime_ns))
+        with zipfile.ZipFile(TESTFN2, index_cache=self.cache) as zipfp:
+            self.assertEqual(zipfp.getinfo('x/one').filename, 'x/one')
+            self.assertEqual(zipfp.read('x/one'), b'2')
+            self.assertEqual(zipfp.namelist(), ['y/one', 'x/one'])
+        # The cache was rebuilt.
+        with zipfile.ZipFile(TESTFN2, index_cache=self.cache) as zipfp:
+            self.assertEqual(zipfp.namelist(), ['y/one', 'x/one'])
+            self.assertEqual(zipfp.read('y/one'), b'1')
+        write(['x/one', 'y/one'])
+        os.utime(TESTFN2, ns=(st.st_atime_ns, st.st_mtime_ns))
+        with zipfile.ZipFile(TESTFN2, index_cache=self.cache) as zipfp:
+            self.assertEqual([zinfo.filename for zinfo in zipfp.infolist()],
+                             ['x/one', 'y/one'])
+            self.assertEqual(zipfp.read('x/one'), b'1')
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            zipfile.ZipFile(TESTFN2, 'a', index_cache=self.cache)
+        # Without a file descriptor there is nothing to key the cache on.
+        with open(TESTFN2, 'rb') as f:
+            data = io.BytesIO(f.read())
+        with zipfile.ZipFile(data, index_cache=self.cache) as zipfp:
+            self.assertEqual(zipfp.read('a/one'), b'1')
+        self.assertFalse(os.path.exists(self.cache))
+
+    def test_lazy_infos(self):
+        with zipfile.ZipFile(TESTFN2) as zipfp:
+            self.assertEqual(zipfp.namelist(), ['a/one', 'a/two', 'b/three'])
+            zinfo = zipfp.getinfo('b/three')
+            self.assertIs(zipfp.infolist()[2], zinfo)
+            self.assertIs(zipfp.NameToInfo['b/three'], zinfo)
+            self.assertEqual(zinfo._end_offset, zipfp.start_dir)
+
+
 class TestsWithMultipleOpens(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -981,6 +981,27 @@ def testEOFError(self):
         self.assertRaises(EOFError, zlibd.decompress, b"anything")
         self.assertRaises(EOFError, zlibd.decompress, b"")
 
+    @requires_Decompress_copy
+    def testCopy(self):
+        half = len(self.DATA) // 2
+        zlibd = zlib._ZlibDecompressor()
+        # Keep unconsumed input in the input buffer.
+        head = zlibd.decompress(self.DATA[:half], 10)
+        self.assertFalse(zlibd.needs_input)
+        copy = zlibd.copy()
+        self.assertEqual(head + zlibd.decompress(self.DATA[half:]), self.TEXT)
+        self.assertTrue(zlibd.eof)
+        self.assertFalse(copy.eof)
+        self.assertFalse(copy.needs_input)
+        rest = copy.decompress(b'', 10)
+        rest += copy.decompress(self.DATA[half:] + b'unused')
+        self.assertEqual(head + rest, self.TEXT)
+        self.assertEqual(copy.unused_data, b'unused')
+        copy = copy.copy()
+        self.assertTrue(copy.eof)
+        self.assertEqual(copy.unused_data, b'unused')
+        self.assertRaises(EOFError, copy.decompress, b'')
+
     @support.skip_if_pgo_task
     @bigmemtest(size=_4G + 100, memuse=3.3)
     def testDecompress4G(self, size):
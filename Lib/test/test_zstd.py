@@ -1,6 +1,7 @@
 import array
 import gc
 import io
+import itertools
 import pathlib
 import random
 import re
@@ -20,7 +21,9 @@
 from compression.zstd import (
     open,
     compress,
+    compress_batch,
     decompress,
+    decompress_batch,
     ZstdCompressor,
     ZstdDecompressor,
     ZstdDict,
@@ -182,6 +185,61 @@ def test_decompress_2x130_1K(self):
         dat = decompress(DAT_130K_C + DAT_130K_C)
         self.assertEqual(len(dat), 2 * _130_1K)
 
+    def test_batch_roundtrip(self):
+        buffers = [b'', THIS_FILE_BYTES[:200], b'a' * 1000,
+                   bytearray(b'xyz'), memoryview(THIS_FILE_BYTES)[100:5000]]
+        for zd in (None, TRAINED_DICT, TRAINED_DICT.as_undigested_dict):
+            with self.subTest(zstd_dict=zd):
+                dat, offsets = compress_batch(buffers, zstd_dict=zd)
+                self.assertIsInstance(dat, bytes)
+                self.assertEqual(len(offsets), len(buffers) + 1)
+                self.assertEqual(offsets[0], 0)
+                self.assertEqual(offsets[-1], len(dat))
+                for i, buf in enumerate(buffers):
+                    frame = dat[offsets[i]:offsets[i+1]]
+                    self.assertEqual(decompress(frame, zd), buf)
+
+                out, out_offsets = decompress_batch(dat, offsets, zd)
+                self.assertEqual(out, b''.join(buffers))
+                self.assertEqual(out_offsets[1:],
+                                 list(itertools.accumulate(map(len, buffers))))
+
+        self.assertEqual(compress_batch([]), (b'', [0]))
+        self.assertEqual(decompress_batch(b'', [0]), (b'', [0]))
+
+    def test_batch_errors(self):
+        with self.assertRaises(TypeError):
+            compress_batch([b'a', 'b'])
+        with self.assertRaises(TypeError):
+            compress_batch(42)
+
+        dat, offsets = compress_batch([b'a' * 100, b'b' * 100])
+        with self.assertRaises(ValueError):
+            decompress_batch(dat, [])
+        with self.assertRaises(ValueError):
+            decompress_batch(dat, [0, len(dat) + 1])
+        with self.assertRaises(ValueError):
+            decompress_batch(dat, [offsets[1], 0])
+        with self.assertRaises(ZstdError):
+            decompress_batch(dat, [0, offsets[1] - 1])
+        with self.assertRaises(ZstdError):
+            decompress_batch(b'x' * 100, [0, 100])
+
+        # frames without a recorded content size
+        c = ZstdCompressor()
+        frame = c.compress(b'abc') + c.flush()
+        with self.assertRaisesRegex(ZstdError, 'decompressed size'):
+            decompress_batch(frame, [0, len(frame)])
+
+        # a forged frame header claiming a huge decompressed size
+        dat, offsets = compress_batch([b'abc'])
+        # single segment frame with a 1-byte content size field
+        self.assertEqual(dat[4] & 0xe3, 0x20)
+        forged = (dat[:4] + bytes([dat[4] | 0xc0]) +
+                  (2**40).to_bytes(8, 'little') + dat[6:])
+        with self.assertRaisesRegex(ZstdError, 'larger than its frame'):
+            decompress_batch(forged, [0, len(forged)])
+
 
 class CompressorTestCase(unittest.TestCase):
 
@@ -275,6 +333,18 @@ def test_compress_parameters(self):
                 ZstdCompressor(options={CompressionParameter.job_size:4})
             with self.assertRaises(ZstdError):
                 ZstdCompressor(options={CompressionParameter.overlap_log:4})
+            with self.assertRaises(ZstdError):
+                ZstdCompressor(threads=4)
+
+        # threads
+        ZstdCompressor(threads=1)
+        ZstdCompressor(level=3, threads=None)
+        with self.assertRaises(ValueError):
+            ZstdCompressor(threads=-1)
+        with self.assertRaises(TypeError):
+            ZstdCompressor(threads=2.0)
+        with self.assertRaises(TypeError):
+            ZstdCompressor(3, None, None, 2)
 
         # out of bounds error msg
         option = {CompressionParameter.window_log:100}
@@ -319,6 +389,33 @@ def test_zstd_multithread_compress(self):
         with ZstdFile(io.BytesIO(), 'w', options=options) as f:
             f.write(b)
 
+        # threads
+        dat1 = compress(b, level=4, threads=2)
+        self.assertEqual(decompress(dat1), b)
+        c = ZstdCompressor(options={CompressionParameter.nb_workers: 4},
+                           threads=0)
+        dat1 = c.compress(b, c.FLUSH_FRAME)
+        self.assertEqual(decompress(dat1), b)
+        bio = io.BytesIO()
+        with ZstdFile(bio, 'w', level=4, threads=2) as f:
+            f.write(b)
+        self.assertEqual(decompress(bio.getvalue()), b)
+
+    def test_compress_batch(self):
+        c = ZstdCompressor(level=5)
+        dat, offsets = c.compress_batch([b'abc', b'def'])
+        self.assertEqual(decompress(dat), b'abcdef')
+        # the compressor is reusable, both in batch and streaming mode
+        dat2, offsets2 = c.compress_batch([b'abc', b'def'])
+        self.assertEqual((dat2, offsets2), (dat, offsets))
+        self.assertEqual(decompress(c.compress(b'ghi', c.FLUSH_FRAME)), b'ghi')
+
+        c.compress(b'abc')
+        with self.assertRaises(ValueError):
+            c.compress_batch([b'def'])
+        c.flush()
+        c.compress_batch([b'def'])
+
     def test_compress_flushblock(self):
         point = len(THIS_FILE_BYTES) // 2
 
@@ -399,6 +496,18 @@ def test_simple_decompress_bad_args(self):
         self.assertRaises(TypeError, lzd.decompress, "str")
         lzd.decompress(empty)
 
+    def test_decompress_batch(self):
+        dat, offsets = compress_batch([b'abc', b'', b'def'])
+        d = ZstdDecompressor()
+        self.assertEqual(d.decompress_batch(dat, offsets),
+                         (b'abcdef', [0, 3, 3, 6]))
+        self.assertEqual(d.decompress_batch(dat, offsets),
+                         (b'abcdef', [0, 3, 3, 6]))
+
+        d.decompress(dat[:offsets[1]])
+        with self.assertRaises(ValueError):
+            d.decompress_batch(dat, offsets)
+
     def test_decompress_parameters(self):
         d = {DecompressionParameter.window_log_max : 15}
         ZstdDecompressor(options=d)
@@ -1434,6 +1543,8 @@ def test_init_bad_mode(self):
 
         with self.assertRaises(TypeError):
             ZstdFile(io.BytesIO(COMPRESSED_100_PLUS_32KB), "r", level=12)
+        with self.assertRaises(TypeError):
+            ZstdFile(io.BytesIO(COMPRESSED_100_PLUS_32KB), "r", threads=2)
 
     def test_init_bad_check(self):
         with self.assertRaises(TypeError):
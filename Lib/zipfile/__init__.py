@@ -3,9 +3,11 @@
 
 XXX references to utf-8 need further investigation.
 """
+import array
 import binascii
 import importlib.util
 import io
+import marshal
 import os
 import shutil
 import stat
@@ -58,6 +60,11 @@ class LargeZipFile(Exception):
 ZIP_FILECOUNT_LIMIT = (1 << 16) - 1
 ZIP_MAX_COMMENT = (1 << 16) - 1
 
+# ZipFile.writeall() compresses files into temporary files, kept in memory
+# while smaller than _WRITEALL_SPOOL_SIZE.
+_WRITEALL_SPOOL_SIZE = 1 << 24
+_WRITEALL_CHUNK_SIZE = 1 << 20
+
 # constants for Zip file compression methods
 ZIP_STORED = 0
 ZIP_DEFLATED = 8
@@ -74,6 +81,9 @@ class LargeZipFile(Exception):
 # we recognize (but not necessarily support) all features up to that version
 MAX_EXTRACT_VERSION = 63
 
+# Format of the index cache files, see ZipFile(index_cache=...)
+_INDEX_CACHE_VERSION = 1
+
 # Below are some formats and associated data for reading/writing headers using
 # the struct module.  The names and structures of headers/records are those used
 # in the PKWARE description of the ZIP file format:
@@ -407,6 +417,51 @@ def _sanitize_filename(filename):
     return filename
 
 
+def _decode_filename(filename, flags, metadata_encoding):
+    """Decode a file name read from the central directory."""
+    if flags & _MASK_UTF_FILENAME:
+        # UTF-8 file names extension
+        return filename.decode('utf-8')
+    if metadata_encoding is None and filename.isascii():
+        # The common case; cp437 agrees with ASCII here, and decoding ASCII
+        # is much faster.
+        return filename.decode('ascii')
+    # Historical ZIP filename encoding
+    return filename.decode(metadata_encoding or 'cp437')
+
+def _info_from_centdir(centdir, data, pos, concat, metadata_encoding):
+    """Create a ZipInfo from the central directory record at data[pos:].
+
+    centdir is the unpacked fixed-size part of the record.
+    """
+    start = pos + sizeCentralDir
+    end = start + centdir[_CD_FILENAME_LENGTH]
+    filename = data[start:end]
+    orig_filename_crc = crc32(filename)
+    filename = _decode_filename(filename, centdir[_CD_FLAG_BITS],
+                                metadata_encoding)
+    # Create ZipInfo instance to store file information
+    x = ZipInfo(filename)
+    start, end = end, end + centdir[_CD_EXTRA_FIELD_LENGTH]
+    x.extra = data[start:end]
+    x.comment = data[end:end + centdir[_CD_COMMENT_LENGTH]]
+    x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
+    (x.create_version, x.create_system, x.extract_version, x.reserved,
+     x.flag_bits, x.compress_type, t, d,
+     x.CRC, x.compress_size, x.file_size) = centdir[1:12]
+    if x.extract_version > MAX_EXTRACT_VERSION:
+        raise NotImplementedError("zip file version %.1f" %
+                                  (x.extract_version / 10))
+    x.volume, x.internal_attr, x.external_attr = centdir[15:18]
+    # Convert date/time code to (year, month, day, hour, min, sec)
+    x._raw_time = t
+    x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
+                    t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
+    x._decodeExtra(orig_filename_crc)
+    x.header_offset = x.header_offset + concat
+    return x
+
+
 class ZipInfo:
     """Class with attributes describing each file in the ZIP archive."""
 
@@ -1367,6 +1422,79 @@ def close(self):
             self._zipfile._writing = False
 
 
+def _compress_file(filename, compress_type, compresslevel):
+    """Compress a file into a temporary file, for ZipFile.writeall().
+
+    Return the temporary file, the uncompressed and compressed sizes and the
+    CRC.  This runs in worker threads; zlib, bz2, lzma and zstd release the
+    GIL while compressing.
+    """
+    import tempfile
+    spool = tempfile.SpooledTemporaryFile(max_size=_WRITEALL_SPOOL_SIZE)
+    try:
+        compressor = _get_compressor(compress_type, compresslevel)
+        file_size = crc = 0
+        with open(filename, "rb") as src:
+            while data := src.read(_WRITEALL_CHUNK_SIZE):
+                file_size += len(data)
+                crc = crc32(data, crc)
+                if compressor:
+                    data = compressor.compress(data)
+                spool.write(data)
+        if compressor:
+            spool.write(compressor.flush())
+        return spool, file_size, spool.tell(), crc
+    except:
+        spool.close()
+        raise
+
+
+class _CentralDirectory:
+    """Compact index of the central directory of an archive being read.
+
+    Only the member names and the positions of their records are kept;
+    ZipInfo instances are created from the raw records on demand.  When
+    the index comes from an index cache, data is None until the raw
+    central directory is read from the archive.
+    """
+
+    def __init__(self, names, positions, end_offsets, concat,
+                 metadata_encoding, size, data=None, infos=None):
+        self.names = names
+        self.positions = positions          # array of record offsets in data
+        self.end_offsets = end_offsets      # array of ZipInfo._end_offset
+        self.concat = concat
+        self.metadata_encoding = metadata_encoding
+        self.size = size
+        self.data = data
+        self._index = None
+        if infos is None:
+            infos = [None] * len(names)
+        self.infos = infos
+
+    @property
+    def index(self):
+        """Mapping of file names to entry numbers."""
+        if self._index is None:
+            self._index = dict(zip(self.names, range(len(self.names))))
+        return self._index
+
+    def info(self, i):
+        zinfo = self.infos[i]
+        if zinfo is None:
+            pos = self.positions[i]
+            centdir = struct.unpack_from(structCentralDir, self.data, pos)
+            if centdir[_CD_SIGNATURE] != stringCentralDir:
+                raise BadZipFile("Bad magic number for central directory")
+            zinfo = _info_from_centdir(centdir, self.data, pos, self.concat,
+                                       self.metadata_encoding)
+            if zinfo.filename != self.names[i]:
+                # The index comes from an outdated index cache.
+                return None
+            zinfo._end_offset = self.end_offsets[i]
+            self.infos[i] = zinfo
+        return zinfo
+
 
 class ZipFile:
     """ Class with methods to open, read, write, close, list zip files.
@@ -1392,14 +1520,20 @@ class ZipFile:
                    When using ZIP_ZSTANDARD integers -7 though 22 are common,
                    see the CompressionParameter enum in compression.zstd for
                    details.
+    index_cache: None or the path of a file in which the index of the
+                 central directory is cached between openings of the archive
+                 in mode 'r'.
 
     """
 
     fp = None                   # Set here since __del__ checks it
+    _mmap = None                # Memory map of the archive, see open_buffer()
+    _cd = None                  # _CentralDirectory not yet turned into ZipInfos
     _windows_illegal_name_trans_table = None
 
     def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
-                 compresslevel=None, *, strict_timestamps=True, metadata_encoding=None):
+                 compresslevel=None, *, strict_timestamps=True, metadata_encoding=None,
+                 index_cache=None):
         """Open the ZIP file with mode read 'r', write 'w', exclusive create 'x',
         or append 'a'."""
         if mode not in ('r', 'w', 'x', 'a'):
@@ -1419,11 +1553,17 @@ def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
         self._comment = b''
         self._strict_timestamps = strict_timestamps
         self.metadata_encoding = metadata_encoding
+        if index_cache is not None:
+            index_cache = os.fspath(index_cache)
+        self._index_cache = index_cache
 
         # Check that we don't try to write with nonconforming codecs
         if self.metadata_encoding and mode != 'r':
             raise ValueError(
                 "metadata_encoding is only supported for reading files")
+        if index_cache is not None and mode != 'r':
+            raise ValueError(
+                "index_cache is only supported for reading files")
 
         # Check if we were passed a file-like object
         if isinstance(file, os.PathLike):
@@ -1541,63 +1681,215 @@ def _RealGetContents(self):
 
         if self.start_dir < 0:
             raise BadZipFile("Bad offset for central directory")
-        fp.seek(self.start_dir, 0)
         size_cd = endrec[_ECD_SIZE]
+        cache_key = None
+        if self._index_cache is not None:
+            cache_key = self._index_cache_key(size_cd)
+            if cache_key is not None:
+                self._cd = self._read_index_cache(cache_key, size_cd)
+                if self._cd is not None:
+                    return
+        fp.seek(self.start_dir, 0)
         data = fp.read(size_cd)
-        fp = io.BytesIO(data)
-        total = 0
-        while total < size_cd:
-            centdir = fp.read(sizeCentralDir)
-            if len(centdir) != sizeCentralDir:
+        self._cd = self._build_index(data, size_cd)
+        if cache_key is not None:
+            self._write_index_cache(cache_key, self._cd)
+
+    def _build_index(self, data, size_cd):
+        """Return the index of the raw central directory data."""
+        concat = self._data_offset
+        metadata_encoding = self.metadata_encoding
+        names = []
+        positions = array.array('q')
+        header_offsets = []
+        infos = []
+        pos = 0
+        while pos < size_cd:
+            if len(data) - pos < sizeCentralDir:
                 raise BadZipFile("Truncated central directory")
-            centdir = struct.unpack(structCentralDir, centdir)
+            centdir = struct.unpack_from(structCentralDir, data, pos)
             if centdir[_CD_SIGNATURE] != stringCentralDir:
                 raise BadZipFile("Bad magic number for central directory")
             if self.debug > 2:
                 print(centdir)
-            filename = fp.read(centdir[_CD_FILENAME_LENGTH])
-            orig_filename_crc = crc32(filename)
-            flags = centdir[_CD_FLAG_BITS]
-            if flags & _MASK_UTF_FILENAME:
-                # UTF-8 file names extension
-                filename = filename.decode('utf-8')
+            if centdir[_CD_EXTRA_FIELD_LENGTH]:
+                # The extra field can change the file name and the header
+                # offset, and has to be validated.
+                x = _info_from_centdir(centdir, data, pos, concat,
+                                       metadata_encoding)
+                filename = x.filename
+                header_offset = x.header_offset
             else:
-                # Historical ZIP filename encoding
-                filename = filename.decode(self.metadata_encoding or 'cp437')
-            # Create ZipInfo instance to store file information
-            x = ZipInfo(filename)
-            x.extra = fp.read(centdir[_CD_EXTRA_FIELD_LENGTH])
-            x.comment = fp.read(centdir[_CD_COMMENT_LENGTH])
-            x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
-            (x.create_version, x.create_system, x.extract_version, x.reserved,
-             x.flag_bits, x.compress_type, t, d,
-             x.CRC, x.compress_size, x.file_size) = centdir[1:12]
-            if x.extract_version > MAX_EXTRACT_VERSION:
-                raise NotImplementedError("zip file version %.1f" %
-                                          (x.extract_version / 10))
-            x.volume, x.internal_attr, x.external_attr = centdir[15:18]
-            # Convert date/time code to (year, month, day, hour, min, sec)
-            x._raw_time = t
-            x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
-                            t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
-            x._decodeExtra(orig_filename_crc)
-            x.header_offset = x.header_offset + concat
-            self.filelist.append(x)
-            self.NameToInfo[x.filename] = x
+                # Defer creating the ZipInfo until it is asked for.
+                x = None
+                if centdir[_CD_EXTRACT_VERSION] > MAX_EXTRACT_VERSION:
+                    raise NotImplementedError("zip file version %.1f" %
+                                              (centdir[_CD_EXTRACT_VERSION] / 10))
+                start = pos + sizeCentralDir
+                filename = data[start:start + centdir[_CD_FILENAME_LENGTH]]
+                filename = _sanitize_filename(_decode_filename(
+                    filename, centdir[_CD_FLAG_BITS], metadata_encoding))
+                header_offset = centdir[_CD_LOCAL_HEADER_OFFSET] + concat
+            names.append(filename)
+            positions.append(pos)
+            header_offsets.append(header_offset)
+            infos.append(x)
 
             # update total bytes read from central directory
-            total = (total + sizeCentralDir + centdir[_CD_FILENAME_LENGTH]
-                     + centdir[_CD_EXTRA_FIELD_LENGTH]
-                     + centdir[_CD_COMMENT_LENGTH])
+            pos = (pos + sizeCentralDir + centdir[_CD_FILENAME_LENGTH]
+                   + centdir[_CD_EXTRA_FIELD_LENGTH]
+                   + centdir[_CD_COMMENT_LENGTH])
 
             if self.debug > 2:
-                print("total", total)
+                print("total", pos)
 
+        end_offsets = array.array('q', bytes(8 * len(names)))
         end_offset = self.start_dir
-        for zinfo in reversed(sorted(self.filelist,
-                                     key=lambda zinfo: zinfo.header_offset)):
-            zinfo._end_offset = end_offset
-            end_offset = zinfo.header_offset
+        for i in reversed(sorted(range(len(names)),
+                                 key=header_offsets.__getitem__)):
+            end_offsets[i] = end_offset
+            if infos[i] is not None:
+                infos[i]._end_offset = end_offset
+            end_offset = header_offsets[i]
+        return _CentralDirectory(names, positions, end_offsets, concat,
+                                 metadata_encoding, size_cd, data, infos)
+
+    def _index_cache_key(self, size_cd):
+        try:
+            st = os.fstat(self.fp.fileno())
+        except (AttributeError, OSError, ValueError):
+            return None
+        return (_INDEX_CACHE_VERSION, sys.byteorder, st.st_size,
+                st.st_mtime_ns, self.start_dir, size_cd, self._data_offset,
+                self.metadata_encoding)
+
+    def _read_index_cache(self, key, size_cd):
+        try:
+            with io.open(self._index_cache, 'rb') as f:
+                cached = marshal.loads(f.read())
+            if type(cached) is not tuple or len(cached) != 4:
+                return None
+            cached_key, names, positions, end_offsets = cached
+            if cached_key != key:
+                return None
+            if type(names) is not list or type(positions) is not bytes \
+                    or type(end_offsets) is not bytes:
+                return None
+            positions = array.array('q', positions)
+            end_offsets = array.array('q', end_offsets)
+            if not (len(names) == len(positions) == len(end_offsets)):
+                return None
+            if not all(type(name) is str for name in names):
+                return None
+            # Every record must lie within the central directory, in
+            # order, and every member before it.
+            pos = 0
+            for p in positions:
+                if p < pos:
+                    return None
+                pos = p + sizeCentralDir
+            if pos > size_cd:
+                return None
+            if not all(0 <= offset <= self.start_dir
+                       for offset in end_offsets):
+                return None
+        except (OSError, EOFError, ValueError, TypeError):
+            # A missing or unusable cache is rebuilt.
+            return None
+        return _CentralDirectory(names, positions, end_offsets,
+                                 self._data_offset, self.metadata_encoding,
+                                 size_cd)
+
+    def _write_index_cache(self, key, cd):
+        data = marshal.dumps((key, cd.names, cd.positions.tobytes(),
+                              cd.end_offsets.tobytes()))
+        # Write to a temporary file and rename it, so that a concurrent
+        # reader never sees a partially written cache.
+        import tempfile
+        dirname, basename = os.path.split(os.fsdecode(self._index_cache))
+        try:
+            fd, tmp = tempfile.mkstemp(prefix=basename + '.',
+                                       dir=dirname or os.curdir)
+        except OSError:
+            return
+        try:
+            with io.open(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, self._index_cache)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    def _cd_info(self, cd, i):
+        """Return the ZipInfo of entry i of the central directory index."""
+        with self._lock:
+            if cd.data is None:
+                if not self.fp:
+                    raise ValueError(
+                        "Attempt to use ZIP archive that was already closed")
+                self.fp.seek(self.start_dir)
+                data = self.fp.read(cd.size)
+                if len(data) != cd.size:
+                    raise BadZipFile("Truncated central directory")
+                cd.data = data
+            info = cd.info(i)
+            if info is None:
+                # The index cache does not match the archive although its
+                # key does: rebuild the index and look the name up again.
+                name = cd.names[i]
+                if self._cd is cd:
+                    self._cd = self._build_index(cd.data, cd.size)
+                    cache_key = self._index_cache_key(cd.size)
+                    if cache_key is not None:
+                        self._write_index_cache(cache_key, self._cd)
+                cd = self._cd
+                if cd is None:
+                    return self._NameToInfo.get(name)
+                i = cd.index.get(name)
+                info = None if i is None else cd.info(i)
+            return info
+
+    def _load_infos(self):
+        """Create the ZipInfo instances of all members not created yet."""
+        with self._lock:
+            cd = self._cd
+            if cd is None:
+                return
+            filelist = [self._cd_info(cd, i) for i in range(len(cd.names))]
+            if self._cd is not cd:
+                # The index was rebuilt.
+                return self._load_infos()
+            self._filelist = filelist
+            self._NameToInfo = {x.filename: x for x in filelist}
+            self._cd = None
+
+    @property
+    def filelist(self):
+        """List of ZipInfo instances for archive."""
+        if self._cd is not None:
+            self._load_infos()
+        return self._filelist
+
+    @filelist.setter
+    def filelist(self, value):
+        if self._cd is not None:
+            self._load_infos()
+        self._filelist = value
+
+    @property
+    def NameToInfo(self):
+        """Mapping of file names to ZipInfo instances."""
+        if self._cd is not None:
+            self._load_infos()
+        return self._NameToInfo
+
+    @NameToInfo.setter
+    def NameToInfo(self, value):
+        if self._cd is not None:
+            self._load_infos()
+        self._NameToInfo = value
 
     @property
     def data_offset(self):
@@ -1607,6 +1899,9 @@ def data_offset(self):
 
     def namelist(self):
         """Return a list of file names in the archive."""
+        cd = self._cd
+        if cd is not None:
+            return cd.names.copy()
         return [data.filename for data in self.filelist]
 
     def infolist(self):
@@ -1641,7 +1936,12 @@ def testzip(self):
 
     def getinfo(self, name):
         """Return the instance of ZipInfo given 'name'."""
-        info = self.NameToInfo.get(name)
+        cd = self._cd
+        if cd is not None:
+            i = cd.index.get(name)
+            info = None if i is None else self._cd_info(cd, i)
+        else:
+            info = self.NameToInfo.get(name)
         if info is None:
             raise KeyError(
                 'There is no item named %r in the archive' % name)
@@ -1726,7 +2026,8 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
                     "Close the writing handle before trying to read.")
 
         # Open for reading:
-        self._fileRefCnt += 1
+        with self._lock:
+            self._fileRefCnt += 1
         zef_file = _SharedFile(self.fp, zinfo.header_offset,
                                self._fpclose, self._lock, lambda: self._writing)
         try:
@@ -1792,6 +2093,68 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
             zef_file.close()
             raise
 
+    def open_buffer(self, name):
+        """Return a read-only memoryview of the data of a stored member.
+
+        name is a string for the file name within the ZIP file, or a ZipInfo
+        object.  The member must be stored without compression or
+        encryption, and the archive must be open for reading from a file
+        with a file descriptor.  The data is not copied: the view refers to
+        a memory map of the archive.  The CRC of the member is not checked.
+        """
+        if self.mode != 'r':
+            raise ValueError('open_buffer() requires mode "r"')
+        if not self.fp:
+            raise ValueError(
+                "Attempt to use ZIP archive that was already closed")
+
+        if isinstance(name, ZipInfo):
+            zinfo = name
+        else:
+            zinfo = self.getinfo(name)
+        if zinfo.compress_type != ZIP_STORED:
+            raise ValueError("open_buffer() requires a stored member, "
+                             f"{zinfo.filename!r} is compressed")
+        if zinfo.flag_bits & _MASK_ENCRYPTED:
+            raise ValueError("open_buffer() does not support encrypted "
+                             f"member {zinfo.filename!r}")
+
+        with self._lock:
+            if self._mmap is None:
+                import mmap
+                self._mmap = mmap.mmap(self.fp.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+            buf = memoryview(self._mmap)
+
+        # Check the file header, as open() does.
+        offset = zinfo.header_offset
+        fheader = buf[offset:offset + sizeFileHeader]
+        if len(fheader) != sizeFileHeader:
+            raise BadZipFile("Truncated file header")
+        fheader = struct.unpack(structFileHeader, fheader)
+        if fheader[_FH_SIGNATURE] != stringFileHeader:
+            raise BadZipFile("Bad magic number for file header")
+
+        offset += sizeFileHeader
+        fname = bytes(buf[offset:offset + fheader[_FH_FILENAME_LENGTH]])
+        if fheader[_FH_GENERAL_PURPOSE_FLAG_BITS] & _MASK_UTF_FILENAME:
+            fname_str = fname.decode("utf-8")
+        else:
+            fname_str = fname.decode(self.metadata_encoding or "cp437")
+        if fname_str != zinfo.orig_filename:
+            raise BadZipFile(
+                'File name in directory %r and header %r differ.'
+                % (zinfo.orig_filename, fname))
+
+        offset += (fheader[_FH_FILENAME_LENGTH] +
+                   fheader[_FH_EXTRA_FIELD_LENGTH])
+        end = offset + zinfo.compress_size
+        if zinfo._end_offset is not None and end > zinfo._end_offset:
+            raise BadZipFile(f"Overlapped entries: {zinfo.orig_filename!r}")
+        if end > len(buf):
+            raise BadZipFile("Truncated file data")
+        return buf[offset:end]
+
     def _open_to_write(self, zinfo, force_zip64=False):
         if force_zip64 and not self._allowZip64:
             raise ValueError(
@@ -1848,13 +2211,16 @@ def extract(self, member, path=None, pwd=None):
 
         return self._extract_member(member, path, pwd)
 
-    def extractall(self, path=None, members=None, pwd=None):
+    def extractall(self, path=None, members=None, pwd=None, *, workers=None):
         """Extract all members from the archive to the current working
            directory. 'path' specifies a different directory to extract to.
            'members' is optional and must be a subset of the list returned
            by namelist(). You can specify the password to decrypt all files
-           using 'pwd'.
+           using 'pwd'. If 'workers' is greater than 1, members are
+           extracted concurrently by that many threads; 0 means one thread
+           per usable CPU.
         """
+        workers = os._workers_count(workers)
         if members is None:
             members = self.namelist()
 
@@ -1863,8 +2229,31 @@ def extractall(self, path=None, members=None, pwd=None):
         else:
             path = os.fspath(path)
 
+        if workers <= 1:
+            for zipinfo in members:
+                self._extract_member(zipinfo, path, pwd)
+            return
+
+        # When a target path occurs more than once, only extract its last
+        # occurrence, which is what wins when extracting serially.
+        # Different names of the same file, such as "x" and "./x", share
+        # a key.
+        pending = {}
         for zipinfo in members:
-            self._extract_member(zipinfo, path, pwd)
+            if not isinstance(zipinfo, ZipInfo):
+                zipinfo = self.getinfo(zipinfo)
+            targetpath = os.path.join(path, self._member_arcname(zipinfo))
+            pending[os.path.normcase(os.path.normpath(targetpath))] = zipinfo
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(workers) as executor:
+            futures = [executor.submit(self._extract_member, zipinfo, path, pwd)
+                       for zipinfo in pending.values()]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
 
     @classmethod
     def _sanitize_windows_name(cls, arcname, pathsep):
@@ -1881,13 +2270,10 @@ def _sanitize_windows_name(cls, arcname, pathsep):
         arcname = pathsep.join(x for x in arcname if x)
         return arcname
 
-    def _extract_member(self, member, targetpath, pwd):
-        """Extract the ZipInfo object 'member' to a physical
-           file on the path targetpath.
+    def _member_arcname(self, member):
+        """Return the sanitized path of the ZipInfo object 'member'
+           relative to the extraction directory.
         """
-        if not isinstance(member, ZipInfo):
-            member = self.getinfo(member)
-
         # build the destination pathname, replacing
         # forward slashes to platform specific separators.
         arcname = member.filename.replace('/', os.path.sep)
@@ -1903,7 +2289,16 @@ def _extract_member(self, member, targetpath, pwd):
         if os.path.sep == '\\':
             # filter illegal characters on Windows
             arcname = self._sanitize_windows_name(arcname, os.path.sep)
+        return arcname
 
+    def _extract_member(self, member, targetpath, pwd):
+        """Extract the ZipInfo object 'member' to a physical
+           file on the path targetpath.
+        """
+        if not isinstance(member, ZipInfo):
+            member = self.getinfo(member)
+
+        arcname = self._member_arcname(member)
         if not arcname and not member.is_dir():
             raise ValueError("Empty filename.")
 
@@ -1986,6 +2381,108 @@ def write(self, filename, arcname=None,
             with open(filename, "rb") as src, self.open(zinfo, 'w') as dest:
                 shutil.copyfileobj(src, dest, 1024*8)
 
+    def writeall(self, filenames, compress_type=None, compresslevel=None, *,
+                 workers=None):
+        """Put the bytes from each of filenames into the archive.
+
+        Each item of filenames is either a filename, archived under the same
+        name as with write(), or a (filename, arcname) pair.  If workers is
+        greater than 1, files are compressed concurrently by that many
+        threads; 0 means one thread per usable CPU.  Members are always
+        written in the order given, so the archive does not depend on the
+        number of workers.
+        """
+        workers = os._workers_count(workers)
+        items = [item if isinstance(item, tuple) else (item, None)
+                 for item in filenames]
+        if workers <= 1:
+            for filename, arcname in items:
+                self.write(filename, arcname, compress_type, compresslevel)
+            return
+
+        if not self.fp:
+            raise ValueError(
+                "Attempt to write to ZIP archive that was already closed")
+        if self._writing:
+            raise ValueError(
+                "Can't write to ZIP archive while an open writing handle exists"
+            )
+
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+        pending = deque()
+        with ThreadPoolExecutor(workers) as executor:
+            try:
+                for filename, arcname in items:
+                    zinfo = ZipInfo.from_file(
+                        filename, arcname,
+                        strict_timestamps=self._strict_timestamps)
+                    if zinfo.is_dir():
+                        zinfo.compress_size = 0
+                        zinfo.CRC = 0
+                        pending.append((zinfo, None))
+                    else:
+                        if compress_type is not None:
+                            zinfo.compress_type = compress_type
+                        else:
+                            zinfo.compress_type = self.compression
+                        if compresslevel is not None:
+                            zinfo.compress_level = compresslevel
+                        else:
+                            zinfo.compress_level = self.compresslevel
+                        _check_compression(zinfo.compress_type)
+                        future = executor.submit(_compress_file, filename,
+                                                 zinfo.compress_type,
+                                                 zinfo.compress_level)
+                        pending.append((zinfo, future))
+                    # Bound the number of compressed files waiting to be
+                    # written.
+                    while len(pending) > 2 * workers:
+                        self._write_compressed(*pending.popleft())
+                while pending:
+                    self._write_compressed(*pending.popleft())
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                for zinfo, future in pending:
+                    if (future is not None and not future.cancelled()
+                            and future.exception() is None):
+                        future.result()[0].close()
+                raise
+
+    def _write_compressed(self, zinfo, future):
+        """Write a member compressed by _compress_file()."""
+        if future is None:
+            self.mkdir(zinfo)
+            return
+        spool, file_size, compress_size, crc = future.result()
+        with spool:
+            # As in _open_to_write(), so that the output is the same as
+            # with write() for a seekable file.
+            zip64 = (zinfo.file_size * 1.05 > ZIP64_LIMIT or
+                     file_size > ZIP64_LIMIT or compress_size > ZIP64_LIMIT)
+            if not self._allowZip64 and zip64:
+                raise LargeZipFile("Filesize would require ZIP64 extensions")
+            zinfo.file_size = file_size
+            zinfo.compress_size = compress_size
+            zinfo.CRC = crc
+            zinfo.flag_bits = 0x00
+            if zinfo.compress_type == ZIP_LZMA:
+                # Compressed data includes an end-of-stream (EOS) marker
+                zinfo.flag_bits |= _MASK_COMPRESS_OPTION_1
+
+            with self._lock:
+                if self._seekable:
+                    self.fp.seek(self.start_dir)
+                zinfo.header_offset = self.fp.tell()
+                self._writecheck(zinfo)
+                self._didModify = True
+                self.fp.write(zinfo.FileHeader(zip64))
+                spool.seek(0)
+                shutil.copyfileobj(spool, self.fp)
+                self.start_dir = self.fp.tell()
+                self.filelist.append(zinfo)
+                self.NameToInfo[zinfo.filename] = zinfo
+
     def writestr(self, zinfo_or_arcname, data,
                  compress_type=None, compresslevel=None):
         """Write a file into the archive.  The contents is 'data', which
@@ -2070,6 +2567,13 @@ def close(self):
                              "Close the writing handle before closing the zip.")
 
         try:
+            cd = self._cd
+            if cd is not None and cd.data is None and cd.names:
+                # Keep getinfo() working after the archive is closed.
+                try:
+                    self._cd_info(cd, 0)
+                except (OSError, ValueError, BadZipFile):
+                    pass
             if self.mode in ('w', 'x', 'a') and self._didModify: # write ending records
                 with self._lock:
                     if self._seekable:
@@ -2079,6 +2583,15 @@ def close(self):
             fp = self.fp
             self.fp = None
             self._fpclose(fp)
+            if self._mmap is not None:
+                mm = self._mmap
+                self._mmap = None
+                try:
+                    mm.close()
+                except BufferError:
+                    # Views returned by open_buffer() are still alive; the
+                    # map is released with the last of them.
+                    pass
 
     def _write_end_record(self):
         for zinfo in self.filelist:         # write central directory
@@ -2177,10 +2690,12 @@ def _write_end_record(self):
         self.fp.flush()
 
     def _fpclose(self, fp):
-        assert self._fileRefCnt > 0
-        self._fileRefCnt -= 1
-        if not self._fileRefCnt and not self._filePassed:
-            fp.close()
+        with self._lock:
+            assert self._fileRefCnt > 0
+            self._fileRefCnt -= 1
+            if self._fileRefCnt or self._filePassed:
+                return
+        fp.close()
 
 
 class PyZipFile(ZipFile):
@@ -112,7 +112,13 @@ class CompleteDirs(InitializedState, zipfile.ZipFile):
 
     @staticmethod
     def _implied_dirs(names):
-        parents = itertools.chain.from_iterable(map(_parents, names))
+        parents = {}
+        for name in names:
+            for parent in _parents(name):
+                if parent in parents:
+                    # Its ancestors were already added along with it.
+                    break
+                parents[parent] = None
         as_dirs = (p + posixpath.sep for p in parents)
         return _dedupe(_difference(as_dirs, names))
 
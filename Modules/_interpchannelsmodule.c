@@ -3526,6 +3526,11 @@ module_exec(PyObject *mod)
         goto error;
     }
 
+    /* Make sure buffers can be sent through channels. */
+    if (ensure_buffers_shareable() < 0) {
+        goto error;
+    }
+
     /* Make sure chnnels drop objects owned by this interpreter. */
     PyInterpreterState *interp = _get_current_interp();
     PyUnstable_AtExit(interp, clear_interpreter, (void *)interp);
@@ -14,6 +14,19 @@ ensure_xid_class(PyTypeObject *cls, _PyXIData_getdata_t getdata)
     return _PyXIData_RegisterClass(tstate, cls, getdata);
 }
 
+// The _interpreters module registers memoryview as shareable
+// in the interpreter that imports it.
+static inline int
+ensure_buffers_shareable(void)
+{
+    PyObject *mod = PyImport_ImportModule("_interpreters");
+    if (mod == NULL) {
+        return -1;
+    }
+    Py_DECREF(mod);
+    return 0;
+}
+
 #ifdef REGISTERS_HEAP_TYPES
 static int
 clear_xid_class(PyTypeObject *cls)
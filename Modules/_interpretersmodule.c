@@ -6,6 +6,7 @@
 #endif
 
 #include "Python.h"
+#include "pycore_ceval.h"         // _PyEval_AddPendingCall()
 #include "pycore_code.h"          // _PyCode_HAS_EXECUTORS()
 #include "pycore_crossinterp.h"   // _PyXIData_t
 #include "pycore_interp.h"        // _PyInterpreterState_IDIncref()
@@ -101,11 +102,59 @@ is_running_main(PyInterpreterState *interp)
  * buffer in a cross-interpreter-safe way.
  */
 
+/* Each shared buffer also holds an ID reference on the interpreter that
+ * owns the original object, taken when the buffer is shared and dropped
+ * once it has been released.  That keeps an interpreter created with
+ * reqrefs=True alive for as long as other interpreters use its buffers,
+ * even after everyone else has dropped their references to it.
+ */
+
 // XXX Note that there is still an issue to sort out, where the original
-// interpreter is destroyed but code in another interpreter is still
-// using dependent buffers.  Using such buffers segfaults.  This will
-// require a careful fix.  In the meantime, users will have to be
-// diligent about avoiding the problematic situation.
+// interpreter is explicitly destroyed but code in another interpreter
+// is still using dependent buffers.  Using such buffers segfaults.
+// In the meantime, users will have to be diligent about avoiding
+// the problematic situation.
+
+static int
+_release_buffer_owner_pending(void *arg)
+{
+    int64_t interpid = *(int64_t *)arg;
+    PyInterpreterState *interp = _PyInterpreterState_LookUpID(interpid);
+    if (interp == NULL) {
+        /* The interpreter was destroyed explicitly in the meantime. */
+        PyErr_Clear();
+        return 0;
+    }
+    _PyInterpreterState_IDDecref(interp);
+    return 0;
+}
+
+static void
+_release_buffer_owner(PyInterpreterState *interp)
+{
+    if (interp != PyInterpreterState_Get() || _Py_IsMainInterpreter(interp)) {
+        _PyInterpreterState_IDDecref(interp);
+        return;
+    }
+    /* An interpreter can't be finalized from inside itself, so let the
+       main interpreter drop the reference at its next safe point.  That
+       destroys the interpreter if this was its last reference. */
+    int64_t *interpid = PyMem_RawMalloc(sizeof(int64_t));
+    if (interpid != NULL) {
+        *interpid = PyInterpreterState_GetID(interp);
+        if (_PyEval_AddPendingCall(_PyInterpreterState_Main(),
+                                   _release_buffer_owner_pending, interpid,
+                                   _Py_PENDING_RAWFREE)
+            == _Py_ADD_PENDING_SUCCESS)
+        {
+            return;
+        }
+        PyMem_RawFree(interpid);
+    }
+    /* The interpreter is then only destroyed if someone else drops
+       the next reference, or at runtime finalization. */
+    _Py_atomic_add_ssize(&interp->id_refcount, -1);
+}
 
 typedef struct {
     PyObject base;
@@ -158,6 +207,9 @@ xibufferview_dealloc(PyObject *op)
                 // XXX Emit a warning?
                 PyErr_Clear();
             }
+            /* If this was the last reference, the pending release
+               runs while the interpreter is finalized. */
+            _release_buffer_owner(interp);
         }
     }
 
@@ -208,6 +260,9 @@ static PyTypeObject * _get_current_xibufferview_type(void);
 struct xibuffer {
     Py_buffer view;
     int used;
+    /* The interpreter that owns view.obj, on which we hold an ID
+       reference until the view is released. */
+    PyInterpreterState *interp;
 };
 
 static PyObject *
@@ -229,12 +284,14 @@ _memoryview_from_xid(_PyXIData_t *data)
     if (obj == NULL) {
         return NULL;
     }
+    /* The xibufferview now owns the buffer and the reference on
+       its interpreter. */
+    view->used = 1;
     PyObject *res = PyMemoryView_FromObject(obj);
     if (res == NULL) {
         Py_DECREF(obj);
         return NULL;
     }
-    view->used = 1;
     return res;
 }
 
@@ -244,6 +301,7 @@ _pybuffer_shared_free(void* data)
     struct xibuffer *view = (struct xibuffer *)data;
     if (!view->used) {
         PyBuffer_Release(&view->view);
+        _release_buffer_owner(view->interp);
     }
     PyMem_RawFree(data);
 }
@@ -256,12 +314,15 @@ _pybuffer_shared(PyThreadState *tstate, PyObject *obj, _PyXIData_t *data)
         return -1;
     }
     view->used = 0;
-    /* This will increment the memoryview's export count, which won't get
-     * decremented until the view sent to other interpreters is released. */
+    /* This will increment the object's export count, which won't get
+     * decremented until the view sent to other interpreters is released.
+     * Meanwhile a bytearray or an array can't be resized. */
     if (PyObject_GetBuffer(obj, &view->view, PyBUF_FULL_RO) < 0) {
         PyMem_RawFree(view);
         return -1;
     }
+    view->interp = tstate->interp;
+    _PyInterpreterState_IDIncref(view->interp);
     /* The view holds a reference to the object, so we don't worry
      * about also tracking it on the cross-interpreter data. */
     _PyXIData_Init(data, tstate->interp, view, NULL, _memoryview_from_xid);
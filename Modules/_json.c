@@ -48,6 +48,7 @@ typedef struct _PyEncoderObject {
     PyObject *indent;
     PyObject *key_separator;
     PyObject *item_separator;
+    PyObject *layouts;
     char sort_keys;
     char skipkeys;
     int allow_nan;
@@ -63,6 +64,7 @@ static PyMemberDef encoder_members[] = {
     {"indent", _Py_T_OBJECT, offsetof(PyEncoderObject, indent), Py_READONLY, "indent"},
     {"key_separator", _Py_T_OBJECT, offsetof(PyEncoderObject, key_separator), Py_READONLY, "key_separator"},
     {"item_separator", _Py_T_OBJECT, offsetof(PyEncoderObject, item_separator), Py_READONLY, "item_separator"},
+    {"layouts", _Py_T_OBJECT, offsetof(PyEncoderObject, layouts), Py_READONLY, "layouts"},
     {"sort_keys", Py_T_BOOL, offsetof(PyEncoderObject, sort_keys), Py_READONLY, "sort_keys"},
     {"skipkeys", Py_T_BOOL, offsetof(PyEncoderObject, skipkeys), Py_READONLY, "skipkeys"},
     {NULL}
@@ -98,6 +100,8 @@ static int
 encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer, PyObject *obj, Py_ssize_t indent_level, PyObject *indent_cache);
 static int
 encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer, PyObject *dct, Py_ssize_t indent_level, PyObject *indent_cache);
+static int
+encoder_listencode_fields(PyEncoderObject *s, PyUnicodeWriter *writer, PyObject *obj, PyObject *fields, Py_ssize_t indent_level, PyObject *indent_cache);
 static PyObject *
 _encoded_const(PyObject *obj);
 static void
@@ -1225,18 +1229,25 @@ static PyType_Spec PyScannerType_spec = {
 static PyObject *
 encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    static char *kwlist[] = {"markers", "default", "encoder", "indent", "key_separator", "item_separator", "sort_keys", "skipkeys", "allow_nan", NULL};
+    static char *kwlist[] = {"markers", "default", "encoder", "indent", "key_separator", "item_separator", "sort_keys", "skipkeys", "allow_nan", "layouts", NULL};
 
     PyEncoderObject *s;
     PyObject *markers = Py_None, *defaultfn, *encoder, *indent, *key_separator;
-    PyObject *item_separator;
+    PyObject *item_separator, *layouts = Py_None;
     int sort_keys, skipkeys, allow_nan;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O!?OOOUUppp:make_encoder", kwlist,
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O!?OOOUUppp|O:make_encoder", kwlist,
         &PyDict_Type, &markers, &defaultfn, &encoder, &indent,
         &key_separator, &item_separator,
-        &sort_keys, &skipkeys, &allow_nan))
+        &sort_keys, &skipkeys, &allow_nan, &layouts))
+        return NULL;
+
+    if (layouts != Py_None && !PyDict_Check(layouts)) {
+        PyErr_Format(PyExc_TypeError,
+                     "make_encoder() argument 10 must be dict or None, not %.200s",
+                     Py_TYPE(layouts)->tp_name);
         return NULL;
+    }
 
     s = (PyEncoderObject *)type->tp_alloc(type, 0);
     if (s == NULL)
@@ -1248,6 +1259,7 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     s->indent = Py_NewRef(indent);
     s->key_separator = Py_NewRef(key_separator);
     s->item_separator = Py_NewRef(item_separator);
+    s->layouts = Py_NewRef(layouts);
     s->sort_keys = sort_keys;
     s->skipkeys = skipkeys;
     s->allow_nan = allow_nan;
@@ -1349,17 +1361,43 @@ write_newline_indent(PyUnicodeWriter *writer,
 }
 
 
+/* Finish the writer and return its content encoded to UTF-8.
+ *
+ * If everything written was ASCII, which is always the case with
+ * ensure_ascii=True, the bytes object is created directly from the
+ * writer's buffer without creating an intermediate str object.
+ */
+static PyObject *
+writer_finish_utf8(PyUnicodeWriter *writer_pub)
+{
+    _PyUnicodeWriter *writer = (_PyUnicodeWriter*)writer_pub;
+    if (writer->kind == PyUnicode_1BYTE_KIND && writer->maxchar < 128) {
+        PyObject *bytes = PyBytes_FromStringAndSize((const char *)writer->data,
+                                                    writer->pos);
+        PyUnicodeWriter_Discard(writer_pub);
+        return bytes;
+    }
+    PyObject *str = PyUnicodeWriter_Finish(writer_pub);
+    if (str == NULL) {
+        return NULL;
+    }
+    PyObject *bytes = PyUnicode_AsUTF8String(str);
+    Py_DECREF(str);
+    return bytes;
+}
+
 static PyObject *
 encoder_call(PyObject *op, PyObject *args, PyObject *kwds)
 {
     /* Python callable interface to encode_listencode_obj */
-    static char *kwlist[] = {"obj", "_current_indent_level", NULL};
+    static char *kwlist[] = {"obj", "_current_indent_level", "_as_bytes", NULL};
     PyObject *obj;
     Py_ssize_t indent_level;
+    int as_bytes = 0;
     PyEncoderObject *self = PyEncoderObject_CAST(op);
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:_iterencode", kwlist,
-                                     &obj, &indent_level))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On|$p:_iterencode", kwlist,
+                                     &obj, &indent_level, &as_bytes))
         return NULL;
 
     PyUnicodeWriter *writer = PyUnicodeWriter_Create(0);
@@ -1382,7 +1420,13 @@ encoder_call(PyObject *op, PyObject *args, PyObject *kwds)
     }
     Py_XDECREF(indent_cache);
 
-    PyObject *str = PyUnicodeWriter_Finish(writer);
+    PyObject *str;
+    if (as_bytes) {
+        str = writer_finish_utf8(writer);
+    }
+    else {
+        str = PyUnicodeWriter_Finish(writer);
+    }
     if (str == NULL) {
         return NULL;
     }
@@ -1466,6 +1510,22 @@ _steal_accumulate(PyUnicodeWriter *writer, PyObject *stolen)
     return rval;
 }
 
+/* Return a new reference to the native layout of the type of obj:
+ * a tuple of (attribute name, encoded key) pairs for dataclasses,
+ * a callable converting obj to a serializable object, or None.
+ * Layouts missing from the cache are computed by its __missing__().
+ */
+static PyObject *
+encoder_get_layout(PyEncoderObject *s, PyObject *obj)
+{
+    PyObject *layout;
+    int rc = PyDict_GetItemRef(s->layouts, (PyObject *)Py_TYPE(obj), &layout);
+    if (rc == 0) {
+        layout = PyObject_GetItem(s->layouts, (PyObject *)Py_TYPE(obj));
+    }
+    return layout;
+}
+
 static int
 encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer,
                        PyObject *obj,
@@ -1539,25 +1599,57 @@ encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer,
                 return -1;
             }
         }
-        newobj = PyObject_CallOneArg(s->defaultfn, obj);
-        if (newobj == NULL) {
-            Py_XDECREF(ident);
-            return -1;
+        PyObject *layout = NULL;
+        if (s->layouts != Py_None) {
+            layout = encoder_get_layout(s, obj);
+            if (layout == NULL) {
+                Py_XDECREF(ident);
+                return -1;
+            }
         }
-
-        if (_Py_EnterRecursiveCall(" while encoding a JSON object")) {
-            Py_DECREF(newobj);
-            Py_XDECREF(ident);
-            return -1;
+        if (layout != NULL && PyTuple_Check(layout)) {
+            /* A dataclass: encode its fields without an intermediate dict */
+            if (_Py_EnterRecursiveCall(" while encoding a JSON object")) {
+                Py_DECREF(layout);
+                Py_XDECREF(ident);
+                return -1;
+            }
+            rv = encoder_listencode_fields(s, writer, obj, layout,
+                                           indent_level, indent_cache);
+            _Py_LeaveRecursiveCall();
+            Py_DECREF(layout);
+            if (rv) {
+                Py_XDECREF(ident);
+                return -1;
+            }
         }
-        rv = encoder_listencode_obj(s, writer, newobj, indent_level, indent_cache);
-        _Py_LeaveRecursiveCall();
+        else {
+            if (layout != NULL && layout != Py_None) {
+                newobj = PyObject_CallOneArg(layout, obj);
+            }
+            else {
+                newobj = PyObject_CallOneArg(s->defaultfn, obj);
+            }
+            Py_XDECREF(layout);
+            if (newobj == NULL) {
+                Py_XDECREF(ident);
+                return -1;
+            }
 
-        Py_DECREF(newobj);
-        if (rv) {
-            _PyErr_FormatNote("when serializing %T object", obj);
-            Py_XDECREF(ident);
-            return -1;
+            if (_Py_EnterRecursiveCall(" while encoding a JSON object")) {
+                Py_DECREF(newobj);
+                Py_XDECREF(ident);
+                return -1;
+            }
+            rv = encoder_listencode_obj(s, writer, newobj, indent_level, indent_cache);
+            _Py_LeaveRecursiveCall();
+
+            Py_DECREF(newobj);
+            if (rv) {
+                _PyErr_FormatNote("when serializing %T object", obj);
+                Py_XDECREF(ident);
+                return -1;
+            }
         }
         if (ident != NULL) {
             if (PyDict_DelItem(s->markers, ident)) {
@@ -1738,6 +1830,83 @@ encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer,
     return -1;
 }
 
+static int
+encoder_listencode_fields(PyEncoderObject *s, PyUnicodeWriter *writer,
+                          PyObject *obj, PyObject *fields,
+                          Py_ssize_t indent_level, PyObject *indent_cache)
+{
+    /* Encode the fields of obj as a JSON object.  fields is a tuple of
+       (attribute name, encoded key) pairs. */
+    Py_ssize_t nfields = PyTuple_GET_SIZE(fields);
+
+    if (nfields == 0) {
+        return PyUnicodeWriter_WriteUTF8(writer, "{}", 2);
+    }
+
+    if (PyUnicodeWriter_WriteChar(writer, '{')) {
+        return -1;
+    }
+
+    PyObject *separator = s->item_separator; // borrowed reference
+    if (s->indent != Py_None) {
+        indent_level++;
+        separator = get_item_separator(s, indent_level, indent_cache);
+        if (separator == NULL ||
+            write_newline_indent(writer, indent_level, indent_cache) < 0)
+        {
+            return -1;
+        }
+    }
+
+    for (Py_ssize_t i = 0; i < nfields; i++) {
+        PyObject *field = PyTuple_GET_ITEM(fields, i);
+        if (!PyTuple_Check(field) || PyTuple_GET_SIZE(field) != 2 ||
+            !PyUnicode_Check(PyTuple_GET_ITEM(field, 1)))
+        {
+            PyErr_SetString(PyExc_ValueError,
+                            "fields must be (name, encoded key) 2-tuples");
+            return -1;
+        }
+        PyObject *name = PyTuple_GET_ITEM(field, 0);
+        PyObject *key = PyTuple_GET_ITEM(field, 1);
+
+        if (i) {
+            if (PyUnicodeWriter_WriteStr(writer, separator) < 0) {
+                return -1;
+            }
+        }
+        if (PyUnicodeWriter_WriteStr(writer, key) < 0 ||
+            PyUnicodeWriter_WriteStr(writer, s->key_separator) < 0)
+        {
+            return -1;
+        }
+        PyObject *value = PyObject_GetAttr(obj, name);
+        if (value == NULL) {
+            return -1;
+        }
+        int rv = encoder_listencode_obj(s, writer, value,
+                                        indent_level, indent_cache);
+        Py_DECREF(value);
+        if (rv < 0) {
+            _PyErr_FormatNote("when serializing %s item %R",
+                              _PyType_Name(Py_TYPE(obj)), name);
+            return -1;
+        }
+    }
+
+    if (s->indent != Py_None) {
+        indent_level--;
+        if (write_newline_indent(writer, indent_level, indent_cache) < 0) {
+            return -1;
+        }
+    }
+
+    if (PyUnicodeWriter_WriteChar(writer, '}')) {
+        return -1;
+    }
+    return 0;
+}
+
 static int
 encoder_listencode_list(PyEncoderObject *s, PyUnicodeWriter *writer,
                         PyObject *seq,
@@ -1844,6 +2013,7 @@ encoder_traverse(PyObject *op, visitproc visit, void *arg)
     Py_VISIT(self->indent);
     Py_VISIT(self->key_separator);
     Py_VISIT(self->item_separator);
+    Py_VISIT(self->layouts);
     return 0;
 }
 
@@ -1858,10 +2028,11 @@ encoder_clear(PyObject *op)
     Py_CLEAR(self->indent);
     Py_CLEAR(self->key_separator);
     Py_CLEAR(self->item_separator);
+    Py_CLEAR(self->layouts);
     return 0;
 }
 
-PyDoc_STRVAR(encoder_doc, "Encoder(markers, default, encoder, indent, key_separator, item_separator, sort_keys, skipkeys, allow_nan)");
+PyDoc_STRVAR(encoder_doc, "Encoder(markers, default, encoder, indent, key_separator, item_separator, sort_keys, skipkeys, allow_nan, layouts=None)");
 
 static PyType_Slot PyEncoderType_slots[] = {
     {Py_tp_doc, (void *)encoder_doc},
@@ -9,7 +9,8 @@ preserve
 #include "pycore_modsupport.h"    // _PyArg_UnpackKeywords()
 
 PyDoc_STRVAR(_zstd_ZstdCompressor_new__doc__,
-"ZstdCompressor(level=None, options=None, zstd_dict=None)\n"
+"ZstdCompressor(level=None, options=None, zstd_dict=None, *,\n"
+"               threads=None)\n"
 "--\n"
 "\n"
 "Create a compressor object for compressing data incrementally.\n"
@@ -20,13 +21,17 @@ PyDoc_STRVAR(_zstd_ZstdCompressor_new__doc__,
 "    A dict object that contains advanced compression parameters.\n"
 "  zstd_dict\n"
 "    A ZstdDict object, a pre-trained Zstandard dictionary.\n"
+"  threads\n"
+"    The number of threads to compress with. 0 means the number of CPUs\n"
+"    usable by the current process. Overrides the nb_workers option.\n"
 "\n"
 "Thread-safe at method level. For one-shot compression, use the compress()\n"
 "function instead.");
 
 static PyObject *
 _zstd_ZstdCompressor_new_impl(PyTypeObject *type, PyObject *level,
-                              PyObject *options, PyObject *zstd_dict);
+                              PyObject *options, PyObject *zstd_dict,
+                              PyObject *threads);
 
 static PyObject *
 _zstd_ZstdCompressor_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
@@ -34,7 +39,7 @@ _zstd_ZstdCompressor_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
     PyObject *return_value = NULL;
     #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
 
-    #define NUM_KEYWORDS 3
+    #define NUM_KEYWORDS 4
     static struct {
         PyGC_Head _this_is_not_used;
         PyObject_VAR_HEAD
@@ -43,7 +48,7 @@ _zstd_ZstdCompressor_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
     } _kwtuple = {
         .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
         .ob_hash = -1,
-        .ob_item = { &_Py_ID(level), &_Py_ID(options), &_Py_ID(zstd_dict), },
+        .ob_item = { &_Py_ID(level), &_Py_ID(options), &_Py_ID(zstd_dict), &_Py_ID(threads), },
     };
     #undef NUM_KEYWORDS
     #define KWTUPLE (&_kwtuple.ob_base.ob_base)
@@ -52,20 +57,21 @@ _zstd_ZstdCompressor_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
     #  define KWTUPLE NULL
     #endif  // !Py_BUILD_CORE
 
-    static const char * const _keywords[] = {"level", "options", "zstd_dict", NULL};
+    static const char * const _keywords[] = {"level", "options", "zstd_dict", "threads", NULL};
     static _PyArg_Parser _parser = {
         .keywords = _keywords,
         .fname = "ZstdCompressor",
         .kwtuple = KWTUPLE,
     };
     #undef KWTUPLE
-    PyObject *argsbuf[3];
+    PyObject *argsbuf[4];
     PyObject * const *fastargs;
     Py_ssize_t nargs = PyTuple_GET_SIZE(args);
     Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 0;
     PyObject *level = Py_None;
     PyObject *options = Py_None;
     PyObject *zstd_dict = Py_None;
+    PyObject *threads = Py_None;
 
     fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser,
             /*minpos*/ 0, /*maxpos*/ 3, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
@@ -87,9 +93,19 @@ _zstd_ZstdCompressor_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
             goto skip_optional_pos;
         }
     }
-    zstd_dict = fastargs[2];
+    if (fastargs[2]) {
+        zstd_dict = fastargs[2];
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
 skip_optional_pos:
-    return_value = _zstd_ZstdCompressor_new_impl(type, level, options, zstd_dict);
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    threads = fastargs[3];
+skip_optional_kwonly:
+    return_value = _zstd_ZstdCompressor_new_impl(type, level, options, zstd_dict, threads);
 
 exit:
     return return_value;
@@ -252,4 +268,38 @@ skip_optional_pos:
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=ee2d1dc298de790c input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(_zstd_ZstdCompressor_compress_batch__doc__,
+"compress_batch($self, data, /)\n"
+"--\n"
+"\n"
+"Compress each buffer of data into its own frame.\n"
+"\n"
+"  data\n"
+"    An iterable of bytes-like objects.\n"
+"\n"
+"Return a tuple (compressed, offsets).  compressed is a bytes object holding\n"
+"all the frames back to back, and offsets is a list of len(data) + 1 ints\n"
+"such that frame i is compressed[offsets[i]:offsets[i+1]].\n"
+"\n"
+"All buffers are compressed in a single call with the GIL released, reusing\n"
+"this compressor\'s parameters and dictionary.  The compressor must not be in\n"
+"the middle of a frame.");
+
+#define _ZSTD_ZSTDCOMPRESSOR_COMPRESS_BATCH_METHODDEF    \
+    {"compress_batch", (PyCFunction)_zstd_ZstdCompressor_compress_batch, METH_O, _zstd_ZstdCompressor_compress_batch__doc__},
+
+static PyObject *
+_zstd_ZstdCompressor_compress_batch_impl(ZstdCompressor *self,
+                                         PyObject *data);
+
+static PyObject *
+_zstd_ZstdCompressor_compress_batch(PyObject *self, PyObject *data)
+{
+    PyObject *return_value = NULL;
+
+    return_value = _zstd_ZstdCompressor_compress_batch_impl((ZstdCompressor *)self, data);
+
+    return return_value;
+}
+/*[clinic end generated code: output=cce8bac3c4ddfad3 input=a9049054013a1b77]*/
@@ -227,4 +227,58 @@ exit:
 
     return return_value;
 }
-/*[clinic end generated code: output=7a4d278f9244e684 input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(_zstd_ZstdDecompressor_decompress_batch__doc__,
+"decompress_batch($self, data, offsets, /)\n"
+"--\n"
+"\n"
+"Decompress n independent items of data in a single call.\n"
+"\n"
+"  data\n"
+"    A bytes-like object holding Zstandard frames back to back.\n"
+"  offsets\n"
+"    An iterable of n + 1 ints delimiting n compressed items in data.\n"
+"\n"
+"Item i is data[offsets[i]:offsets[i+1]], as returned by\n"
+"ZstdCompressor.compress_batch().  Return a tuple (decompressed, offsets)\n"
+"in the same layout: decompressed items are stored back to back in a bytes\n"
+"object, delimited by a list of n + 1 ints.\n"
+"\n"
+"All items are decompressed with the GIL released, reusing this\n"
+"decompressor\'s parameters and dictionary.  Every frame must record its\n"
+"decompressed size, which is the default when compressing.  This method\n"
+"cannot be used after decompress() has been called.");
+
+#define _ZSTD_ZSTDDECOMPRESSOR_DECOMPRESS_BATCH_METHODDEF    \
+    {"decompress_batch", _PyCFunction_CAST(_zstd_ZstdDecompressor_decompress_batch), METH_FASTCALL, _zstd_ZstdDecompressor_decompress_batch__doc__},
+
+static PyObject *
+_zstd_ZstdDecompressor_decompress_batch_impl(ZstdDecompressor *self,
+                                             Py_buffer *data,
+                                             PyObject *offsets);
+
+static PyObject *
+_zstd_ZstdDecompressor_decompress_batch(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    Py_buffer data = {NULL, NULL};
+    PyObject *offsets;
+
+    if (!_PyArg_CheckPositional("decompress_batch", nargs, 2, 2)) {
+        goto exit;
+    }
+    if (PyObject_GetBuffer(args[0], &data, PyBUF_SIMPLE) != 0) {
+        goto exit;
+    }
+    offsets = args[1];
+    return_value = _zstd_ZstdDecompressor_decompress_batch_impl((ZstdDecompressor *)self, &data, offsets);
+
+exit:
+    /* Cleanup for data */
+    if (data.obj) {
+       PyBuffer_Release(&data);
+    }
+
+    return return_value;
+}
+/*[clinic end generated code: output=82ccac1a64a6d5fc input=a9049054013a1b77]*/
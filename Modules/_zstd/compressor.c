@@ -139,6 +139,65 @@ _zstd_set_c_parameters(ZstdCompressor *self, PyObject *level_or_options,
     return -1;
 }
 
+static int
+_zstd_set_c_threads(ZstdCompressor *self, PyObject *threads)
+{
+    _zstd_state* const mod_state = PyType_GetModuleState(Py_TYPE(self));
+    if (mod_state == NULL) {
+        return -1;
+    }
+
+    if (!PyLong_Check(threads)) {
+        PyErr_Format(PyExc_TypeError,
+                     "threads must be an int or None, not %T", threads);
+        return -1;
+    }
+    int nb_workers = PyLong_AsInt(threads);
+    if (nb_workers == -1 && PyErr_Occurred()) {
+        return -1;
+    }
+    if (nb_workers < 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "threads must be a non-negative integer");
+        return -1;
+    }
+    if (nb_workers == 0) {
+        /* Use the number of CPUs usable by the current process. */
+        PyObject *cpu_count = PyImport_ImportModuleAttrString(
+            "os", "process_cpu_count");
+        if (cpu_count == NULL) {
+            return -1;
+        }
+        PyObject *count = PyObject_CallNoArgs(cpu_count);
+        Py_DECREF(cpu_count);
+        if (count == NULL) {
+            return -1;
+        }
+        nb_workers = 1;
+        if (count != Py_None) {
+            nb_workers = PyLong_AsInt(count);
+        }
+        Py_DECREF(count);
+        if (nb_workers == -1 && PyErr_Occurred()) {
+            return -1;
+        }
+    }
+    /* A single thread means compressing in the caller's thread, which is
+       zstd's nbWorkers == 0 mode. */
+    if (nb_workers == 1) {
+        nb_workers = 0;
+    }
+
+    size_t zstd_ret = ZSTD_CCtx_setParameter(self->cctx, ZSTD_c_nbWorkers,
+                                             nb_workers);
+    if (ZSTD_isError(zstd_ret)) {
+        set_parameter_error(mod_state, 1, ZSTD_c_nbWorkers, nb_workers);
+        return -1;
+    }
+    self->use_multithread = (nb_workers != 0);
+    return 0;
+}
+
 static void
 capsule_free_cdict(PyObject *capsule)
 {
@@ -320,6 +379,10 @@ _zstd.ZstdCompressor.__new__ as _zstd_ZstdCompressor_new
         A dict object that contains advanced compression parameters.
     zstd_dict: object = None
         A ZstdDict object, a pre-trained Zstandard dictionary.
+    *
+    threads: object = None
+        The number of threads to compress with. 0 means the number of CPUs
+        usable by the current process. Overrides the nb_workers option.
 
 Create a compressor object for compressing data incrementally.
 
@@ -329,8 +392,9 @@ function instead.
 
 static PyObject *
 _zstd_ZstdCompressor_new_impl(PyTypeObject *type, PyObject *level,
-                              PyObject *options, PyObject *zstd_dict)
-/*[clinic end generated code: output=cdef61eafecac3d7 input=92de0211ae20ffdc]*/
+                              PyObject *options, PyObject *zstd_dict,
+                              PyObject *threads)
+/*[clinic end generated code: output=8e010bcf00e3db12 input=9dfe739a3e757948]*/
 {
     ZstdCompressor* self = PyObject_GC_New(ZstdCompressor, type);
     if (self == NULL) {
@@ -339,6 +403,8 @@ _zstd_ZstdCompressor_new_impl(PyTypeObject *type, PyObject *level,
 
     self->use_multithread = 0;
     self->dict = NULL;
+    /* 0 selects zstd's default level when creating a ZSTD_CDict */
+    self->compression_level = 0;
 
     /* Compression context */
     self->cctx = ZSTD_createCCtx();
@@ -372,6 +438,14 @@ _zstd_ZstdCompressor_new_impl(PyTypeObject *type, PyObject *level,
         }
     }
 
+    /* Set the number of worker threads after options, so that it takes
+       precedence over CompressionParameter.nb_workers */
+    if (threads != Py_None) {
+        if (_zstd_set_c_threads(self, threads) < 0) {
+            goto error;
+        }
+    }
+
     /* Load Zstandard dictionary to compression context */
     if (zstd_dict != Py_None) {
         if (_zstd_load_c_dict(self, zstd_dict) < 0) {
@@ -659,9 +733,140 @@ _zstd_ZstdCompressor_flush_impl(ZstdCompressor *self, int mode)
     return ret;
 }
 
+/*[clinic input]
+_zstd.ZstdCompressor.compress_batch
+
+    data: object
+        An iterable of bytes-like objects.
+    /
+
+Compress each buffer of data into its own frame.
+
+Return a tuple (compressed, offsets).  compressed is a bytes object holding
+all the frames back to back, and offsets is a list of len(data) + 1 ints
+such that frame i is compressed[offsets[i]:offsets[i+1]].
+
+All buffers are compressed in a single call with the GIL released, reusing
+this compressor's parameters and dictionary.  The compressor must not be in
+the middle of a frame.
+[clinic start generated code]*/
+
+static PyObject *
+_zstd_ZstdCompressor_compress_batch_impl(ZstdCompressor *self,
+                                         PyObject *data)
+/*[clinic end generated code: output=e173560b71243d99 input=f3e30b324abeb9da]*/
+{
+    PyObject *seq, *out = NULL, *offsets = NULL, *ret = NULL;
+    Py_buffer *views = NULL;
+    size_t *sizes = NULL;
+    Py_ssize_t i, n, nviews = 0;
+    size_t bound = 0, pos = 0, zstd_ret = 0;
+
+    _zstd_state* const mod_state = PyType_GetModuleState(Py_TYPE(self));
+    if (mod_state == NULL) {
+        return NULL;
+    }
+
+    seq = PySequence_Fast(data, "data must be an iterable of bytes-like "
+                                "objects");
+    if (seq == NULL) {
+        return NULL;
+    }
+    n = PySequence_Fast_GET_SIZE(seq);
+
+    views = PyMem_New(Py_buffer, n);
+    sizes = PyMem_New(size_t, n);
+    if (views == NULL || sizes == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    for (i = 0; i < n; i++) {
+        if (PyObject_GetBuffer(PySequence_Fast_GET_ITEM(seq, i),
+                               &views[i], PyBUF_SIMPLE) < 0) {
+            goto done;
+        }
+        nviews++;
+        size_t frame_bound = ZSTD_compressBound(views[i].len);
+        if (frame_bound == 0 || frame_bound > (size_t)PY_SSIZE_T_MAX - bound) {
+            PyErr_NoMemory();
+            goto done;
+        }
+        bound += frame_bound;
+    }
+
+    out = PyBytes_FromStringAndSize(NULL, (Py_ssize_t)bound);
+    if (out == NULL) {
+        goto done;
+    }
+    char *dst = PyBytes_AS_STRING(out);
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    if (self->last_mode != ZSTD_e_end) {
+        PyErr_SetString(PyExc_ValueError,
+                        "compress_batch() cannot be called in the middle "
+                        "of a frame; call flush() first.");
+    }
+    else {
+        Py_BEGIN_ALLOW_THREADS
+        for (i = 0; i < n; i++) {
+            /* ZSTD_compress2() resets the session but keeps the parameters
+               and the dictionary, so the context is reused as is. */
+            zstd_ret = ZSTD_compress2(self->cctx, dst + pos, bound - pos,
+                                      views[i].buf, views[i].len);
+            if (ZSTD_isError(zstd_ret)) {
+                break;
+            }
+            sizes[i] = zstd_ret;
+            pos += zstd_ret;
+        }
+        Py_END_ALLOW_THREADS
+        if (ZSTD_isError(zstd_ret)) {
+            set_zstd_error(mod_state, ERR_COMPRESS, zstd_ret);
+            /* Resetting cctx's session never fail */
+            ZSTD_CCtx_reset(self->cctx, ZSTD_reset_session_only);
+        }
+    }
+    Py_END_CRITICAL_SECTION();
+    if (PyErr_Occurred()) {
+        goto done;
+    }
+
+    offsets = PyList_New(n + 1);
+    if (offsets == NULL) {
+        goto done;
+    }
+    pos = 0;
+    for (i = 0; i <= n; i++) {
+        PyObject *offset = PyLong_FromSize_t(pos);
+        if (offset == NULL) {
+            goto done;
+        }
+        PyList_SET_ITEM(offsets, i, offset);
+        if (i < n) {
+            pos += sizes[i];
+        }
+    }
+    if (_PyBytes_Resize(&out, (Py_ssize_t)pos) < 0) {
+        goto done;
+    }
+    ret = PyTuple_Pack(2, out, offsets);
+
+done:
+    for (i = 0; i < nviews; i++) {
+        PyBuffer_Release(&views[i]);
+    }
+    PyMem_Free(views);
+    PyMem_Free(sizes);
+    Py_XDECREF(out);
+    Py_XDECREF(offsets);
+    Py_DECREF(seq);
+    return ret;
+}
+
 static PyMethodDef ZstdCompressor_methods[] = {
     _ZSTD_ZSTDCOMPRESSOR_COMPRESS_METHODDEF
     _ZSTD_ZSTDCOMPRESSOR_FLUSH_METHODDEF
+    _ZSTD_ZSTDCOMPRESSOR_COMPRESS_BATCH_METHODDEF
     {NULL, NULL}
 };
 
@@ -45,6 +45,10 @@ typedef struct {
     /* For ZstdDecompressor, 0 or 1.
        1 means the end of the first frame has been reached. */
     bool eof;
+
+    /* 1 if decompress() has been called since the last session reset.
+       decompress_batch() would clobber the frame being streamed. */
+    bool streaming;
 } ZstdDecompressor;
 
 #define ZstdDecompressor_CAST(op) ((ZstdDecompressor *)op)
@@ -353,6 +357,7 @@ decompressor_reset_session(ZstdDecompressor *self)
     /* Reset variables in one operation */
     self->needs_input = 1;
     self->eof = 0;
+    self->streaming = 0;
 
     /* Resetting session is guaranteed to never fail */
     ZSTD_DCtx_reset(self->dctx, ZSTD_reset_session_only);
@@ -371,6 +376,7 @@ stream_decompress(ZstdDecompressor *self, Py_buffer *data, Py_ssize_t max_length
         assert(ret == NULL);
         return NULL;
     }
+    self->streaming = 1;
 
     /* Prepare input buffer w/wo unconsumed data */
     if (self->in_begin == self->in_end) {
@@ -554,6 +560,7 @@ _zstd_ZstdDecompressor_new_impl(PyTypeObject *type, PyObject *zstd_dict,
     self->in_end = -1;
     self->unused_data = NULL;
     self->eof = 0;
+    self->streaming = 0;
     self->dict = NULL;
 
     /* needs_input flag */
@@ -700,8 +707,195 @@ _zstd_ZstdDecompressor_decompress_impl(ZstdDecompressor *self,
     return ret;
 }
 
+/*[clinic input]
+_zstd.ZstdDecompressor.decompress_batch
+
+    data: Py_buffer
+        A bytes-like object holding Zstandard frames back to back.
+    offsets: object
+        An iterable of n + 1 ints delimiting n compressed items in data.
+    /
+
+Decompress n independent items of data in a single call.
+
+Item i is data[offsets[i]:offsets[i+1]], as returned by
+ZstdCompressor.compress_batch().  Return a tuple (decompressed, offsets)
+in the same layout: decompressed items are stored back to back in a bytes
+object, delimited by a list of n + 1 ints.
+
+All items are decompressed with the GIL released, reusing this
+decompressor's parameters and dictionary.  Every frame must record its
+decompressed size, which is the default when compressing.  This method
+cannot be used after decompress() has been called.
+[clinic start generated code]*/
+
+static PyObject *
+_zstd_ZstdDecompressor_decompress_batch_impl(ZstdDecompressor *self,
+                                             Py_buffer *data,
+                                             PyObject *offsets)
+/*[clinic end generated code: output=21b9c8a0d15416e6 input=02429d8a9794d4dc]*/
+{
+    PyObject *seq, *out = NULL, *out_offsets = NULL, *ret = NULL;
+    size_t *bounds = NULL, *sizes = NULL;
+    Py_ssize_t i, n;
+    size_t total = 0, pos = 0, zstd_ret = 0;
+    const char *src = (const char *)data->buf;
+
+    _zstd_state* const mod_state = PyType_GetModuleState(Py_TYPE(self));
+    if (mod_state == NULL) {
+        return NULL;
+    }
+
+    seq = PySequence_Fast(offsets, "offsets must be an iterable of ints");
+    if (seq == NULL) {
+        return NULL;
+    }
+    n = PySequence_Fast_GET_SIZE(seq) - 1;
+    if (n < 0) {
+        PyErr_SetString(PyExc_ValueError, "offsets must not be empty");
+        goto done;
+    }
+
+    bounds = PyMem_New(size_t, n + 1);
+    sizes = PyMem_New(size_t, n + 1);
+    if (bounds == NULL || sizes == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    for (i = 0; i <= n; i++) {
+        Py_ssize_t offset = PyNumber_AsSsize_t(
+            PySequence_Fast_GET_ITEM(seq, i), PyExc_OverflowError);
+        if (offset == -1 && PyErr_Occurred()) {
+            goto done;
+        }
+        if (offset < 0 || offset > data->len ||
+            (i > 0 && (size_t)offset < bounds[i-1]))
+        {
+            PyErr_SetString(PyExc_ValueError,
+                            "offsets must be non-decreasing and within "
+                            "the bounds of data");
+            goto done;
+        }
+        bounds[i] = (size_t)offset;
+    }
+
+    /* Compute the size of the output from the frame headers.  An item may
+       consist of several frames.  The sizes are not trusted further than
+       the frames can hold: every block has a 3-byte header and decompresses
+       to at most ZSTD_DStreamOutSize() (the maximum block size) bytes. */
+    const size_t block_size_max = ZSTD_DStreamOutSize();
+    for (i = 0; i < n; i++) {
+        const char *frame = src + bounds[i];
+        size_t remaining = bounds[i+1] - bounds[i];
+        sizes[i] = 0;
+        while (remaining > 0) {
+            unsigned long long size = ZSTD_getFrameContentSize(frame,
+                                                               remaining);
+            size_t frame_size = ZSTD_findFrameCompressedSize(frame,
+                                                             remaining);
+            if (size == ZSTD_CONTENTSIZE_ERROR || ZSTD_isError(frame_size)) {
+                PyErr_Format(mod_state->ZstdError,
+                             "Item %zd is not valid Zstandard data.", i);
+                goto done;
+            }
+            if (size == ZSTD_CONTENTSIZE_UNKNOWN) {
+                PyErr_Format(mod_state->ZstdError,
+                             "Item %zd does not record its decompressed "
+                             "size; use decompress() instead.", i);
+                goto done;
+            }
+            if (size / block_size_max + (size % block_size_max != 0) >
+                frame_size / 3)
+            {
+                PyErr_Format(mod_state->ZstdError,
+                             "Item %zd records a decompressed size larger "
+                             "than its frame can hold.", i);
+                goto done;
+            }
+            if (size > (unsigned long long)(PY_SSIZE_T_MAX - total)) {
+                PyErr_NoMemory();
+                goto done;
+            }
+            sizes[i] += (size_t)size;
+            total += (size_t)size;
+            frame += frame_size;
+            remaining -= frame_size;
+        }
+    }
+
+    out = PyBytes_FromStringAndSize(NULL, (Py_ssize_t)total);
+    if (out == NULL) {
+        goto done;
+    }
+    char *dst = PyBytes_AS_STRING(out);
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    if (self->streaming) {
+        PyErr_SetString(PyExc_ValueError,
+                        "decompress_batch() cannot be used after "
+                        "decompress() has been called.");
+    }
+    else {
+        Py_BEGIN_ALLOW_THREADS
+        for (i = 0; i < n; i++) {
+            /* ZSTD_decompressDCtx() uses the parameters and the dictionary
+               of the context, and starts a new frame every time. */
+            zstd_ret = ZSTD_decompressDCtx(self->dctx, dst + pos, sizes[i],
+                                           src + bounds[i],
+                                           bounds[i+1] - bounds[i]);
+            if (ZSTD_isError(zstd_ret) || zstd_ret != sizes[i]) {
+                break;
+            }
+            pos += zstd_ret;
+        }
+        Py_END_ALLOW_THREADS
+        if (i < n) {
+            if (ZSTD_isError(zstd_ret)) {
+                set_zstd_error(mod_state, ERR_DECOMPRESS, zstd_ret);
+            }
+            else {
+                PyErr_Format(mod_state->ZstdError,
+                             "Item %zd decompressed to a different size than "
+                             "recorded in its frame header.", i);
+            }
+            /* Resetting session is guaranteed to never fail */
+            ZSTD_DCtx_reset(self->dctx, ZSTD_reset_session_only);
+        }
+    }
+    Py_END_CRITICAL_SECTION();
+    if (PyErr_Occurred()) {
+        goto done;
+    }
+
+    out_offsets = PyList_New(n + 1);
+    if (out_offsets == NULL) {
+        goto done;
+    }
+    pos = 0;
+    for (i = 0; i <= n; i++) {
+        PyObject *offset = PyLong_FromSize_t(pos);
+        if (offset == NULL) {
+            goto done;
+        }
+        PyList_SET_ITEM(out_offsets, i, offset);
+        if (i < n) {
+            pos += sizes[i];
+        }
+    }
+    ret = PyTuple_Pack(2, out, out_offsets);
+
+done:
+    PyMem_Free(bounds);
+    PyMem_Free(sizes);
+    Py_XDECREF(out);
+    Py_XDECREF(out_offsets);
+    Py_DECREF(seq);
+    return ret;
+}
+
 static PyMethodDef ZstdDecompressor_methods[] = {
     _ZSTD_ZSTDDECOMPRESSOR_DECOMPRESS_METHODDEF
+    _ZSTD_ZSTDDECOMPRESSOR_DECOMPRESS_BATCH_METHODDEF
     {NULL, NULL}
 };
 
@@ -995,6 +995,31 @@ exit:
     return return_value;
 }
 
+#if defined(HAVE_ZLIB_COPY)
+
+PyDoc_STRVAR(zlib_ZlibDecompressor_copy__doc__,
+"copy($self, /)\n"
+"--\n"
+"\n"
+"Return a copy of the decompressor object.\n"
+"\n"
+"The copy resumes decompression where this object is, so it can be kept\n"
+"to decompress the rest of the stream again later.");
+
+#define ZLIB_ZLIBDECOMPRESSOR_COPY_METHODDEF    \
+    {"copy", (PyCFunction)zlib_ZlibDecompressor_copy, METH_NOARGS, zlib_ZlibDecompressor_copy__doc__},
+
+static PyObject *
+zlib_ZlibDecompressor_copy_impl(ZlibDecompressor *self);
+
+static PyObject *
+zlib_ZlibDecompressor_copy(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return zlib_ZlibDecompressor_copy_impl((ZlibDecompressor *)self);
+}
+
+#endif /* defined(HAVE_ZLIB_COPY) */
+
 PyDoc_STRVAR(zlib_adler32__doc__,
 "adler32($module, data, value=1, /)\n"
 "--\n"
@@ -1121,4 +1146,8 @@ exit:
 #ifndef ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
     #define ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
 #endif /* !defined(ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF) */
-/*[clinic end generated code: output=33938c7613a8c1c7 input=a9049054013a1b77]*/
+
+#ifndef ZLIB_ZLIBDECOMPRESSOR_COPY_METHODDEF
+    #define ZLIB_ZLIBDECOMPRESSOR_COPY_METHODDEF
+#endif /* !defined(ZLIB_ZLIBDECOMPRESSOR_COPY_METHODDEF) */
+/*[clinic end generated code: output=648787d39425ba27 input=a9049054013a1b77]*/
@@ -5096,6 +5096,276 @@ the message.  The return value is the number of bytes of non-ancillary\n\
 data sent.");
 #endif    /* CMSG_LEN */
 
+
+/* The recvmmsg() and sendmmsg() methods receive or send several messages
+   with a single system call.  Systems which provide them also define
+   MSG_WAITFORONE. */
+#if defined(MSG_WAITFORONE) && !defined(MS_WINDOWS)
+#define HAVE_MMSG
+#endif
+
+#ifdef HAVE_MMSG
+struct sock_mmsg {
+    struct mmsghdr *msgvec;
+    unsigned int vlen;
+    int flags;
+    int result;
+};
+
+static int
+sock_recvmmsg_impl(PySocketSockObject *s, void *data)
+{
+    struct sock_mmsg *ctx = data;
+
+    ctx->result = recvmmsg(get_sock_fd(s), ctx->msgvec, ctx->vlen,
+                           ctx->flags, NULL);
+    return (ctx->result >= 0);
+}
+
+/* s.recvmmsg(bufsize, maxcount[, flags]) method */
+
+static PyObject *
+sock_recvmmsg(PyObject *self, PyObject *args)
+{
+    PySocketSockObject *s = _PySocketSockObject_CAST(self);
+
+    Py_ssize_t bufsize, maxcount, i;
+    int flags = 0;
+    socklen_t addrlen;
+    struct mmsghdr *msgvec = NULL;
+    struct iovec *iovs = NULL;
+    sock_addr_t *addrbufs = NULL;
+    PyObject **bufs = NULL;
+    PyObject *retval = NULL;
+    struct sock_mmsg ctx;
+
+    if (!PyArg_ParseTuple(args, "nn|i:recvmmsg", &bufsize, &maxcount, &flags))
+        return NULL;
+
+    if (bufsize < 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "negative buffersize in recvmmsg");
+        return NULL;
+    }
+    if (maxcount <= 0 || maxcount > INT_MAX) {
+        PyErr_SetString(PyExc_ValueError,
+                        "maxcount must be a positive integer");
+        return NULL;
+    }
+
+    if (!getsockaddrlen(s, &addrlen))
+        return NULL;
+
+    if (!IS_SELECTABLE(s)) {
+        select_error();
+        return NULL;
+    }
+
+    msgvec = PyMem_New(struct mmsghdr, maxcount);
+    iovs = PyMem_New(struct iovec, maxcount);
+    addrbufs = PyMem_New(sock_addr_t, maxcount);
+    bufs = PyMem_Calloc(maxcount, sizeof(PyObject *));
+    if (msgvec == NULL || iovs == NULL || addrbufs == NULL || bufs == NULL) {
+        PyErr_NoMemory();
+        goto finally;
+    }
+
+    for (i = 0; i < maxcount; i++) {
+        bufs[i] = PyBytes_FromStringAndSize(NULL, bufsize);
+        if (bufs[i] == NULL)
+            goto finally;
+        iovs[i].iov_base = PyBytes_AS_STRING(bufs[i]);
+        iovs[i].iov_len = bufsize;
+        memset(&addrbufs[i], 0, addrlen);
+        memset(&msgvec[i], 0, sizeof(msgvec[i]));
+        msgvec[i].msg_hdr.msg_name = SAS2SA(&addrbufs[i]);
+        msgvec[i].msg_hdr.msg_namelen = addrlen;
+        msgvec[i].msg_hdr.msg_iov = &iovs[i];
+        msgvec[i].msg_hdr.msg_iovlen = 1;
+    }
+
+    ctx.msgvec = msgvec;
+    ctx.vlen = (unsigned int)maxcount;
+    ctx.flags = flags;
+    if (sock_call(s, 0, sock_recvmmsg_impl, &ctx) < 0)
+        goto finally;
+
+    retval = PyList_New(ctx.result);
+    if (retval == NULL)
+        goto finally;
+    for (i = 0; i < ctx.result; i++) {
+        PyObject *addr, *item;
+
+        if ((Py_ssize_t)msgvec[i].msg_len != bufsize &&
+            _PyBytes_Resize(&bufs[i], msgvec[i].msg_len) < 0)
+        {
+            Py_CLEAR(retval);
+            goto finally;
+        }
+        addr = makesockaddr(get_sock_fd(s),
+                            SAS2SA(&addrbufs[i]),
+                            msgvec[i].msg_hdr.msg_namelen,
+                            s->sock_proto);
+        if (addr == NULL) {
+            Py_CLEAR(retval);
+            goto finally;
+        }
+        item = PyTuple_Pack(2, bufs[i], addr);
+        Py_DECREF(addr);
+        if (item == NULL) {
+            Py_CLEAR(retval);
+            goto finally;
+        }
+        PyList_SET_ITEM(retval, i, item);
+    }
+
+finally:
+    if (bufs != NULL) {
+        for (i = 0; i < maxcount; i++) {
+            Py_XDECREF(bufs[i]);
+        }
+    }
+    PyMem_Free(bufs);
+    PyMem_Free(addrbufs);
+    PyMem_Free(iovs);
+    PyMem_Free(msgvec);
+    return retval;
+}
+
+PyDoc_STRVAR(recvmmsg_doc,
+"recvmmsg(bufsize, maxcount[, flags]) -> list of (data, address info)\n\
+\n\
+Receive up to maxcount messages from the socket with a single system\n\
+call, each of them up to bufsize bytes long.  Return a list of\n\
+(data, address) pairs, like recvfrom().  On a blocking socket, the call\n\
+waits for maxcount messages unless flags includes MSG_WAITFORONE.");
+
+static int
+sock_sendmmsg_impl(PySocketSockObject *s, void *data)
+{
+    struct sock_mmsg *ctx = data;
+
+    ctx->result = sendmmsg(get_sock_fd(s), ctx->msgvec, ctx->vlen,
+                           ctx->flags);
+    return (ctx->result >= 0);
+}
+
+/* s.sendmmsg(messages[, flags]) method */
+
+static PyObject *
+sock_sendmmsg(PyObject *self, PyObject *args)
+{
+    PySocketSockObject *s = _PySocketSockObject_CAST(self);
+
+    Py_ssize_t nmsgs, nbufs = 0, i;
+    int flags = 0;
+    PyObject *msgs_arg, *msgs_fast = NULL;
+    struct mmsghdr *msgvec = NULL;
+    struct iovec *iovs = NULL;
+    sock_addr_t *addrbufs = NULL;
+    Py_buffer *databufs = NULL;
+    PyObject *retval = NULL;
+    struct sock_mmsg ctx;
+
+    if (!PyArg_ParseTuple(args, "O|i:sendmmsg", &msgs_arg, &flags))
+        return NULL;
+
+    if (!IS_SELECTABLE(s)) {
+        select_error();
+        return NULL;
+    }
+
+    msgs_fast = PySequence_Fast(msgs_arg,
+                                "sendmmsg() argument 1 must be an iterable");
+    if (msgs_fast == NULL)
+        return NULL;
+    nmsgs = PySequence_Fast_GET_SIZE(msgs_fast);
+    if (nmsgs > INT_MAX) {
+        /* The messages after the first INT_MAX are not sent, as if the
+           system call had sent fewer messages. */
+        nmsgs = INT_MAX;
+    }
+    if (nmsgs == 0) {
+        retval = PyLong_FromLong(0);
+        goto finally;
+    }
+
+    if (PySys_Audit("socket.sendmmsg", "OO", s, msgs_fast) < 0)
+        goto finally;
+
+    msgvec = PyMem_New(struct mmsghdr, nmsgs);
+    iovs = PyMem_New(struct iovec, nmsgs);
+    addrbufs = PyMem_New(sock_addr_t, nmsgs);
+    databufs = PyMem_New(Py_buffer, nmsgs);
+    if (msgvec == NULL || iovs == NULL || addrbufs == NULL ||
+        databufs == NULL)
+    {
+        PyErr_NoMemory();
+        goto finally;
+    }
+
+    for (i = 0; i < nmsgs; i++) {
+        PyObject *item = PySequence_Fast_GET_ITEM(msgs_fast, i);
+        PyObject *data = item, *addr_arg = NULL;
+
+        if (PyTuple_Check(item) &&
+            !PyArg_ParseTuple(item, "OO;sendmmsg() messages must be "
+                              "bytes-like objects or (data, address) pairs",
+                              &data, &addr_arg))
+        {
+            goto finally;
+        }
+        if (PyObject_GetBuffer(data, &databufs[i], PyBUF_SIMPLE) < 0)
+            goto finally;
+        nbufs = i + 1;
+
+        memset(&msgvec[i], 0, sizeof(msgvec[i]));
+        if (addr_arg != NULL && addr_arg != Py_None) {
+            int addrlen;
+            if (!getsockaddrarg(s, addr_arg, &addrbufs[i], &addrlen,
+                                "sendmmsg"))
+            {
+                goto finally;
+            }
+            msgvec[i].msg_hdr.msg_name = SAS2SA(&addrbufs[i]);
+            msgvec[i].msg_hdr.msg_namelen = addrlen;
+        }
+        iovs[i].iov_base = databufs[i].buf;
+        iovs[i].iov_len = databufs[i].len;
+        msgvec[i].msg_hdr.msg_iov = &iovs[i];
+        msgvec[i].msg_hdr.msg_iovlen = 1;
+    }
+
+    ctx.msgvec = msgvec;
+    ctx.vlen = (unsigned int)nmsgs;
+    ctx.flags = flags;
+    if (sock_call(s, 1, sock_sendmmsg_impl, &ctx) < 0)
+        goto finally;
+
+    retval = PyLong_FromLong(ctx.result);
+
+finally:
+    for (i = 0; i < nbufs; i++) {
+        PyBuffer_Release(&databufs[i]);
+    }
+    PyMem_Free(databufs);
+    PyMem_Free(addrbufs);
+    PyMem_Free(iovs);
+    PyMem_Free(msgvec);
+    Py_XDECREF(msgs_fast);
+    return retval;
+}
+
+PyDoc_STRVAR(sendmmsg_doc,
+"sendmmsg(messages[, flags]) -> count\n\
+\n\
+Send several messages to the socket with a single system call.  Each\n\
+item of the iterable messages is either a bytes-like object, sent to\n\
+the connected peer, or a (data, address) pair.  The flags argument has\n\
+the same meaning as for send().  Return the number of messages sent,\n\
+which may be less than the number of messages given.");
+#endif    /* HAVE_MMSG */
+
 #ifdef HAVE_SOCKADDR_ALG
 static PyObject*
 sock_sendmsg_afalg(PyObject *s, PyObject *args, PyObject *kwds)
@@ -5453,6 +5723,10 @@ static PyMethodDef sock_methods[] = {
     {"recvmsg_into", sock_recvmsg_into, METH_VARARGS, recvmsg_into_doc},
     {"sendmsg", sock_sendmsg, METH_VARARGS, sendmsg_doc},
 #endif
+#ifdef HAVE_MMSG
+    {"recvmmsg", sock_recvmmsg, METH_VARARGS, recvmmsg_doc},
+    {"sendmmsg", sock_sendmmsg, METH_VARARGS, sendmmsg_doc},
+#endif
 #ifdef HAVE_SOCKADDR_ALG
     {
         "sendmsg_afalg",
@@ -8348,6 +8622,9 @@ socket_exec(PyObject *m)
 #ifdef  MSG_CMSG_CLOEXEC
     ADD_INT_MACRO(m, MSG_CMSG_CLOEXEC);
 #endif
+#ifdef  MSG_WAITFORONE
+    ADD_INT_MACRO(m, MSG_WAITFORONE);
+#endif
 #ifdef  MSG_ERRQUEUE
     ADD_INT_MACRO(m, MSG_ERRQUEUE);
 #endif
@@ -1698,6 +1698,93 @@ zlib_ZlibDecompressor_decompress_impl(ZlibDecompressor *self,
     return result;
 }
 
+#ifdef HAVE_ZLIB_COPY
+
+/*[clinic input]
+zlib.ZlibDecompressor.copy
+
+Return a copy of the decompressor object.
+
+The copy resumes decompression where this object is, so it can be kept
+to decompress the rest of the stream again later.
+[clinic start generated code]*/
+
+static PyObject *
+zlib_ZlibDecompressor_copy_impl(ZlibDecompressor *self)
+/*[clinic end generated code: output=a56b186fc62dbf68 input=cc00e1f1a4efa2ac]*/
+{
+    zlibstate *state = PyType_GetModuleState(Py_TYPE(self));
+
+    ZlibDecompressor *copy = PyObject_New(ZlibDecompressor, Py_TYPE(self));
+    if (copy == NULL) {
+        return NULL;
+    }
+    copy->is_initialised = 0;
+    copy->input_buffer = NULL;
+    copy->input_buffer_size = 0;
+    copy->zdict = NULL;
+    copy->unused_data = NULL;
+    copy->lock = PyThread_allocate_lock();
+    if (copy->lock == NULL) {
+        Py_DECREF(copy);
+        PyErr_SetString(PyExc_MemoryError, "Unable to allocate lock");
+        return NULL;
+    }
+
+    /* Copy the zstream state
+     * We use ENTER_ZLIB / LEAVE_ZLIB to make this thread-safe
+     */
+    ENTER_ZLIB(self);
+    /* The zstream state is freed once the end of the stream is reached. */
+    if (self->is_initialised) {
+        int err = inflateCopy(&copy->zst, &self->zst);
+        switch (err) {
+        case Z_OK:
+            break;
+        case Z_STREAM_ERROR:
+            PyErr_SetString(PyExc_ValueError, "Inconsistent stream state");
+            goto error;
+        case Z_MEM_ERROR:
+            PyErr_SetString(PyExc_MemoryError,
+                            "Can't allocate memory for decompression object");
+            goto error;
+        default:
+            zlib_error(state, self->zst, err,
+                       "while copying decompression object");
+            goto error;
+        }
+        copy->is_initialised = 1;
+    }
+
+    /* Unconsumed input is kept in the input buffer between calls. */
+    copy->zst.next_in = NULL;
+    if (!self->eof && self->avail_in_real > 0) {
+        copy->input_buffer = PyMem_Malloc(self->avail_in_real);
+        if (copy->input_buffer == NULL) {
+            PyErr_NoMemory();
+            goto error;
+        }
+        copy->input_buffer_size = self->avail_in_real;
+        memcpy(copy->input_buffer, self->zst.next_in, self->avail_in_real);
+        copy->zst.next_in = copy->input_buffer;
+    }
+    copy->avail_in_real = self->avail_in_real;
+    copy->unused_data = Py_NewRef(self->unused_data);
+    copy->zdict = Py_XNewRef(self->zdict);
+    copy->eof = self->eof;
+    copy->needs_input = self->needs_input;
+
+    LEAVE_ZLIB(self);
+    return (PyObject *)copy;
+
+error:
+    LEAVE_ZLIB(self);
+    Py_DECREF(copy);
+    return NULL;
+}
+
+#endif
+
 PyDoc_STRVAR(ZlibDecompressor__new____doc__,
 "_ZlibDecompressor(wbits=15, zdict=b\'\')\n"
 "--\n"
@@ -1806,6 +1893,7 @@ static PyMethodDef Decomp_methods[] =
 
 static PyMethodDef ZlibDecompressor_methods[] = {
     ZLIB_ZLIBDECOMPRESSOR_DECOMPRESS_METHODDEF
+    ZLIB_ZLIBDECOMPRESSOR_COPY_METHODDEF
     {NULL}
 };
 
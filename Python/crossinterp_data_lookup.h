@@ -612,25 +612,23 @@ _tuple_shared_free(void* data)
     PyMem_RawFree(shared);
 }
 
-static int
-_tuple_shared(PyThreadState *tstate, PyObject *obj, xidata_fallback_t fallback,
-              _PyXIData_t *xidata)
+static struct _shared_tuple_data *
+_tuple_items_shared(PyThreadState *tstate, PyObject *tuple,
+                    xidata_fallback_t fallback)
 {
-    Py_ssize_t len = PyTuple_GET_SIZE(obj);
-    if (len < 0) {
-        return -1;
-    }
+    Py_ssize_t len = PyTuple_GET_SIZE(tuple);
     struct _shared_tuple_data *shared = PyMem_RawMalloc(sizeof(struct _shared_tuple_data));
     if (shared == NULL){
         PyErr_NoMemory();
-        return -1;
+        return NULL;
     }
 
     shared->len = len;
     shared->items = (_PyXIData_t **) PyMem_Calloc(shared->len, sizeof(_PyXIData_t *));
     if (shared->items == NULL) {
+        PyMem_RawFree(shared);
         PyErr_NoMemory();
-        return -1;
+        return NULL;
     }
 
     for (Py_ssize_t i = 0; i < shared->len; i++) {
@@ -638,7 +636,7 @@ _tuple_shared(PyThreadState *tstate, PyObject *obj, xidata_fallback_t fallback,
         if (xidata_i == NULL) {
             goto error;  // PyErr_NoMemory already set
         }
-        PyObject *item = PyTuple_GET_ITEM(obj, i);
+        PyObject *item = PyTuple_GET_ITEM(tuple, i);
 
         int res = -1;
         if (!_Py_EnterRecursiveCallTstate(tstate, " while sharing a tuple")) {
@@ -651,13 +649,60 @@ _tuple_shared(PyThreadState *tstate, PyObject *obj, xidata_fallback_t fallback,
         }
         shared->items[i] = xidata_i;
     }
+    return shared;
+
+error:
+    _tuple_shared_free(shared);
+    return NULL;
+}
+
+static int
+_tuple_shared(PyThreadState *tstate, PyObject *obj, xidata_fallback_t fallback,
+              _PyXIData_t *xidata)
+{
+    struct _shared_tuple_data *shared =
+                            _tuple_items_shared(tstate, obj, fallback);
+    if (shared == NULL) {
+        return -1;
+    }
     _PyXIData_Init(xidata, tstate->interp, shared, obj, _new_tuple_object);
     _PyXIData_SET_FREE(xidata, _tuple_shared_free);
     return 0;
+}
 
-error:
-    _tuple_shared_free(shared);
-    return -1;
+// frozenset
+
+static PyObject *
+_new_frozenset_object(_PyXIData_t *xidata)
+{
+    PyObject *items = _new_tuple_object(xidata);
+    if (items == NULL) {
+        return NULL;
+    }
+    PyObject *frozenset = PyFrozenSet_New(items);
+    Py_DECREF(items);
+    return frozenset;
+}
+
+static int
+_frozenset_shared(PyThreadState *tstate, PyObject *obj,
+                  xidata_fallback_t fallback, _PyXIData_t *xidata)
+{
+    // The items are shared like those of a tuple, and put back
+    // into a new frozenset by the receiving interpreter.
+    PyObject *items = PySequence_Tuple(obj);
+    if (items == NULL) {
+        return -1;
+    }
+    struct _shared_tuple_data *shared =
+                            _tuple_items_shared(tstate, items, fallback);
+    Py_DECREF(items);
+    if (shared == NULL) {
+        return -1;
+    }
+    _PyXIData_Init(xidata, tstate->interp, shared, obj, _new_frozenset_object);
+    _PyXIData_SET_FREE(xidata, _tuple_shared_free);
+    return 0;
 }
 
 // code
@@ -784,6 +829,11 @@ _register_builtins_for_crossinterpreter_data(dlregistry_t *xidregistry)
         Py_FatalError("could not register tuple for cross-interpreter sharing");
     }
 
+    // frozenset
+    if (REGISTER_FALLBACK(&PyFrozenSet_Type, _frozenset_shared) != 0) {
+        Py_FatalError("could not register frozenset for cross-interpreter sharing");
+    }
+
     // For now, we do not register PyCode_Type or PyFunction_Type.
 #undef REGISTER
 #undef REGISTER_FALLBACK
@@ -0,0 +1,123 @@
+"""
+Show how multi-threaded compression scales with the number of threads.
+
+Compresses the same data with compression.zstd and gzip using an increasing
+number of threads, and prints the throughput, the speedup relative to one
+thread and the compression ratio for each run.
+
+To run:
+
+    python3 Tools/scripts/compression_threads_benchmark.py
+
+Options:
+
+    * `--size` to set the amount of data to compress, in MiB
+    * `--threads` to set the thread counts to try (comma separated)
+    * `--level` to set the compression level
+    * `--file` to compress the contents of a file instead of generated data
+    * `--repeat` to set how many times each measurement is repeated
+"""
+
+import argparse
+import gzip
+import io
+import os
+import random
+import time
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+
+def generate_data(size):
+    # Pseudo-random text built from a limited vocabulary, so that it
+    # compresses reasonably but not trivially.
+    rand = random.Random(12345)
+    words = [bytes(rand.choices(b'abcdefghijklmnopqrstuvwxyz',
+                                k=rand.randint(2, 10)))
+             for _ in range(5000)]
+    chunks = []
+    total = 0
+    while total < size:
+        line = b' '.join(rand.choices(words, k=12)) + b'\n'
+        chunks.append(line)
+        total += len(line)
+    return b''.join(chunks)[:size]
+
+
+def compress_zstd(data, level, threads):
+    return zstd.compress(data, level=level, threads=threads)
+
+
+def compress_gzip(data, level, threads):
+    bio = io.BytesIO()
+    with gzip.GzipFile(fileobj=bio, mode='wb', compresslevel=level,
+                       mtime=0, threads=threads) as f:
+        f.write(data)
+    return bio.getvalue()
+
+
+def measure(func, data, level, threads, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        compressed = func(data, level, threads)
+        best = min(best, time.perf_counter() - t0)
+    return best, len(compressed)
+
+
+def run(name, func, data, level, thread_counts, repeat):
+    print(f'{name} (level {level})')
+    print(f'  {"threads":>7}  {"MiB/s":>8}  {"speedup":>7}  {"ratio":>6}')
+    base = None
+    for threads in thread_counts:
+        elapsed, size = measure(func, data, level, threads, repeat)
+        if base is None:
+            base = elapsed
+        print(f'  {threads:>7}  {len(data) / elapsed / 2**20:>8.1f}  '
+              f'{base / elapsed:>6.2f}x  {len(data) / size:>6.2f}')
+    print()
+
+
+def main():
+    cpus = os.process_cpu_count() or 1
+    default_threads = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1)))
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--size', type=int, default=64,
+                        help='size of the generated data in MiB '
+                             '(default: %(default)s)')
+    parser.add_argument('--threads',
+                        default=','.join(map(str, default_threads)),
+                        help='comma separated thread counts to try '
+                             '(default: %(default)s)')
+    parser.add_argument('--level', type=int, default=None,
+                        help='compression level (default: the module default)')
+    parser.add_argument('--file', help='compress this file instead')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of repetitions (default: %(default)s)')
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, 'rb') as f:
+            data = f.read()
+    else:
+        data = generate_data(args.size * 2**20)
+    thread_counts = [int(n) for n in args.threads.split(',')]
+    print(f'{len(data) / 2**20:.1f} MiB of data, {cpus} CPUs\n')
+
+    if zstd is not None:
+        level = (args.level if args.level is not None
+                 else zstd.COMPRESSION_LEVEL_DEFAULT)
+        run('compression.zstd', compress_zstd, data, level,
+            thread_counts, args.repeat)
+    else:
+        print('compression.zstd is not available\n')
+    level = args.level if args.level is not None else 6
+    run('gzip', compress_gzip, data, level, thread_counts, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+Compare the shared queue and the work-stealing mode of ThreadPoolExecutor.
+
+Runs the same workloads on a ThreadPoolExecutor using the default shared
+work queue and on one created with ``work_stealing=True``, for an increasing
+number of worker threads, and prints the number of tasks run per second.
+The difference is mostly visible on the free-threaded build, where the
+workers really run in parallel and contend on the shared queue.
+
+Workloads:
+
+    * ``flat``: many small tasks submitted from the main thread
+    * ``nested``: a tree of small tasks, each submitting its children from
+      inside the executor
+
+To run:
+
+    python3 Tools/scripts/thread_pool_benchmark.py
+
+Options:
+
+    * `--tasks` to set the number of tasks per run
+    * `--threads` to set the worker counts to try (comma separated)
+    * `--work` to set the amount of work done by each task
+    * `--repeat` to set how many times each measurement is repeated
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def work(n):
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+def run_flat(executor, tasks, amount):
+    futures = [executor.submit(work, amount) for _ in range(tasks)]
+    for f in futures:
+        f.result()
+
+
+def run_nested(executor, tasks, amount):
+    # Each task submits up to 4 children, which gives a complete 4-ary tree
+    # of *tasks* nodes.
+    done = threading.Event()
+    lock = threading.Lock()
+    remaining = tasks
+
+    def node(i):
+        nonlocal remaining
+        for child in range(4 * i + 1, min(4 * i + 5, tasks)):
+            executor.submit(node, child)
+        work(amount)
+        with lock:
+            remaining -= 1
+            if not remaining:
+                done.set()
+
+    executor.submit(node, 0)
+    done.wait()
+
+
+WORKLOADS = {
+    'flat': run_flat,
+    'nested': run_nested,
+}
+
+
+def measure(func, threads, work_stealing, tasks, amount, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        with ThreadPoolExecutor(threads, work_stealing=work_stealing) as ex:
+            # Start all worker threads before measuring
+            run_flat(ex, threads * 4, 0)
+            t0 = time.perf_counter()
+            func(ex, tasks, amount)
+            best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run(name, func, thread_counts, tasks, amount, repeat):
+    print(f'{name} ({tasks} tasks)')
+    print(f'  {"threads":>7}  {"shared/s":>10}  {"stealing/s":>10}  '
+          f'{"speedup":>7}')
+    for threads in thread_counts:
+        shared = measure(func, threads, False, tasks, amount, repeat)
+        stealing = measure(func, threads, True, tasks, amount, repeat)
+        print(f'  {threads:>7}  {tasks / shared:>10.0f}  '
+              f'{tasks / stealing:>10.0f}  {shared / stealing:>6.2f}x')
+    print()
+
+
+def main():
+    cpus = os.process_cpu_count() or 1
+    default_threads = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1)))
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--tasks', type=int, default=100_000,
+                        help='number of tasks per run (default: %(default)s)')
+    parser.add_argument('--threads',
+                        default=','.join(map(str, default_threads)),
+                        help='comma separated worker counts to try '
+                             '(default: %(default)s)')
+    parser.add_argument('--work', type=int, default=100,
+                        help='loop iterations done by each task '
+                             '(default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of repetitions (default: %(default)s)')
+    parser.add_argument('workloads', nargs='*', choices=WORKLOADS,
+                        help='workloads to run (default: all)')
+    args = parser.parse_args()
+
+    if not hasattr(sys, '_is_gil_enabled') or sys._is_gil_enabled():
+        print('warning: the GIL is enabled, the workers do not run '
+              'in parallel\n', file=sys.stderr)
+    thread_counts = [int(n) for n in args.threads.split(',')]
+    print(f'{cpus} CPUs\n')
+    for name in args.workloads or WORKLOADS:
+        run(name, WORKLOADS[name], thread_counts, args.tasks, args.work,
+            args.repeat)
+
+
+if __name__ == '__main__':
+    main()